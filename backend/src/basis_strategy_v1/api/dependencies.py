@@ -48,8 +48,17 @@ def get_backtest_service():
         # Import here to avoid circular dependencies
         from ..core.services.backtest_service import BacktestService
 
-        # Create new service (no dependencies needed)
-        return BacktestService()
+        from ..infrastructure.health.health_checker import (
+            BacktestRegistryHealthCheck,
+            get_health_checker,
+        )
+
+        # Create new service and expose its registry memory on /health/detailed
+        service = BacktestService()
+        get_health_checker().register_component(
+            BacktestRegistryHealthCheck("backtest_registry", service)
+        )
+        return service
 
     except (ImportError, TypeError) as e:
         logger.error("BacktestService failed to initialize", error=str(e))
@@ -68,8 +77,18 @@ def get_live_trading_service():
         # Import here to avoid circular dependencies
         from ..core.services.live_service import LiveTradingService
 
-        # Create new service (no dependencies needed)
-        return LiveTradingService()
+        from ..infrastructure.api.api_call_queue import api_call_manager
+        from ..infrastructure.health.health_checker import (
+            APICallLanesHealthCheck,
+            get_health_checker,
+        )
+
+        # Create new service and expose its venue API lanes on /health/detailed
+        service = LiveTradingService()
+        get_health_checker().register_component(
+            APICallLanesHealthCheck("api_call_lanes", api_call_manager)
+        )
+        return service
 
     except (ImportError, TypeError) as e:
         logger.warning("LiveTradingService not yet implemented, returning stub", error=str(e))
@@ -1,7 +1,8 @@
 """Backtest API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, Request
 from typing import Optional
+from uuid import UUID
 import structlog
 
 from ..models.requests import BacktestRequest
@@ -121,6 +122,93 @@ async def run_backtest(
         raise HTTPException(status_code=500, detail=f"Failed to start backtest: {str(e)}")
 
 
+@router.post(
+    "/{request_id}/resume",
+    response_model=StandardResponse[BacktestResponse],
+    summary="Resume a backtest",
+    description="Continue an interrupted backtest from its last checkpoint",
+)
+async def resume_backtest(
+    request_id: UUID, http_request: Request, service: BacktestService = Depends(get_backtest_service)
+) -> StandardResponse[BacktestResponse]:
+    """
+    Resume an interrupted backtest from its last checkpoint.
+    """
+    correlation_id = getattr(http_request.state, "correlation_id", "unknown")
+
+    try:
+        resumed_id = await service.resume_backtest(str(request_id))
+
+        logger.info("Backtest resumed", correlation_id=correlation_id, request_id=resumed_id)
+
+        return StandardResponse(
+            success=True,
+            data=BacktestResponse(
+                request_id=resumed_id,
+                status="completed",
+                strategy_name=service.get_strategy_name(resumed_id),
+                estimated_time_seconds=0,
+            ),
+        )
+
+    except ValueError as e:
+        logger.error("Invalid resume request", correlation_id=correlation_id, error=str(e))
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(
+            "Failed to resume backtest", correlation_id=correlation_id, error=str(e), exc_info=True
+        )
+        raise HTTPException(status_code=500, detail=f"Failed to resume backtest: {str(e)}")
+
+
+@router.post(
+    "/{request_id}/extend",
+    response_model=StandardResponse[BacktestResponse],
+    summary="Extend a backtest",
+    description="Extend a completed backtest by N days without recomputing its history",
+)
+async def extend_backtest(
+    request_id: UUID,
+    http_request: Request,
+    days: int = Query(..., gt=0, description="Number of days to add after the original end date"),
+    service: BacktestService = Depends(get_backtest_service),
+) -> StandardResponse[BacktestResponse]:
+    """
+    Extend a completed backtest by N new days, continuing from its final checkpoint.
+    """
+    correlation_id = getattr(http_request.state, "correlation_id", "unknown")
+
+    try:
+        extended_id = await service.extend_backtest(str(request_id), days, correlation_id)
+
+        logger.info(
+            "Backtest extended",
+            correlation_id=correlation_id,
+            request_id=extended_id,
+            extends=str(request_id),
+            days=days,
+        )
+
+        return StandardResponse(
+            success=True,
+            data=BacktestResponse(
+                request_id=extended_id,
+                status="completed",
+                strategy_name=service.get_strategy_name(extended_id),
+                estimated_time_seconds=0,
+            ),
+        )
+
+    except ValueError as e:
+        logger.error("Invalid extend request", correlation_id=correlation_id, error=str(e))
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(
+            "Failed to extend backtest", correlation_id=correlation_id, error=str(e), exc_info=True
+        )
+        raise HTTPException(status_code=500, detail=f"Failed to extend backtest: {str(e)}")
+
+
 @router.get(
     "/{request_id}/status",
     response_model=StandardResponse[BacktestStatusResponse],
@@ -1,7 +1,7 @@
 """Results retrieval endpoints."""
 
 from fastapi import APIRouter, HTTPException, Query, Request, Depends
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import structlog
@@ -11,10 +11,16 @@ import os
 
 from ..models.responses import StandardResponse, BacktestResultResponse
 from ..dependencies import get_backtest_service
+from ...infrastructure.logging.event_query_engine import (
+    EventQuery,
+    EventQueryEngine,
+    find_events_directory,
+)
 from pathlib import Path
 import re
 import csv
 import glob
+import json
 import shutil
 
 logger = structlog.get_logger()
@@ -31,11 +37,38 @@ async def get_result_events(
     request: Request,
     limit: int = Query(500, ge=1, le=10000, description="Max events to return"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    event_type: Optional[str] = Query(
+        None, description="Comma-separated domain event streams (e.g. orders,positions)"
+    ),
+    start: Optional[datetime] = Query(None, description="Only events at or after this time"),
+    end: Optional[datetime] = Query(None, description="Only events at or before this time"),
+    instrument: Optional[str] = Query(None, description="Only events touching this instrument key"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page (overrides offset)"),
     service=Depends(get_backtest_service),
 ) -> StandardResponse[Dict[str, Any]]:
     correlation_id = getattr(request.state, "correlation_id", "unknown")
     try:
         logger.info("Fetching events log", correlation_id=correlation_id, result_id=result_id)
+
+        # Preferred source: domain event JSONL streams, served through the sidecar index
+        events_dir = _resolve_events_dir(result_id, service)
+        if events_dir is not None:
+            engine = EventQueryEngine(events_dir)
+            query = _build_event_query(event_type, start, end, instrument)
+            page = engine.query(query, limit=limit, offset=offset, cursor=cursor)
+            return StandardResponse(
+                success=True,
+                data={
+                    "events": page.events,
+                    "total_events": page.total_events,
+                    "next_cursor": page.next_cursor,
+                    "event_types": engine.available_event_types(),
+                    "has_event_log": True,
+                    "component_summaries": {},
+                    "balances_by_venue": {},
+                },
+            )
+
         result = None
         if not result:
             # Fallback: try in-memory service (recent runs)
@@ -79,6 +112,8 @@ async def get_result_events(
         )
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(
             "Failed to fetch events",
@@ -89,6 +124,87 @@ async def get_result_events(
         raise HTTPException(status_code=500, detail=f"Failed to fetch events: {str(e)}")
 
 
+@router.get(
+    "/{result_id}/events/stream",
+    summary="Stream event log as NDJSON",
+    description="Stream domain events (one JSON object per line) for large exports",
+)
+async def stream_result_events(
+    result_id: str,
+    request: Request,
+    event_type: Optional[str] = Query(
+        None, description="Comma-separated domain event streams (e.g. orders,positions)"
+    ),
+    start: Optional[datetime] = Query(None, description="Only events at or after this time"),
+    end: Optional[datetime] = Query(None, description="Only events at or before this time"),
+    instrument: Optional[str] = Query(None, description="Only events touching this instrument key"),
+    cursor: Optional[str] = Query(None, description="Resume from a paginated cursor"),
+    service=Depends(get_backtest_service),
+) -> StreamingResponse:
+    """Stream the domain event JSONL files without loading them into memory."""
+    correlation_id = getattr(request.state, "correlation_id", "unknown")
+    logger.info("Streaming events log", correlation_id=correlation_id, result_id=result_id)
+
+    events_dir = _resolve_events_dir(result_id, service)
+    if events_dir is None:
+        raise HTTPException(status_code=404, detail=f"No event log found for result {result_id}")
+
+    engine = EventQueryEngine(events_dir)
+    query = _build_event_query(event_type, start, end, instrument)
+    try:
+        # Surface bad filters/cursors as 400 before the response starts streaming
+        engine.validate(query, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        engine.stream(query, cursor=cursor),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f"attachment; filename={result_id}_events.ndjson"},
+    )
+
+
+def _build_event_query(
+    event_type: Optional[str],
+    start: Optional[datetime],
+    end: Optional[datetime],
+    instrument: Optional[str],
+) -> EventQuery:
+    """Translate query-string filters into an EventQuery."""
+    event_types = [t.strip() for t in event_type.split(",") if t.strip()] if event_type else None
+    return EventQuery(event_types=event_types, start=start, end=end, instrument=instrument)
+
+
+def _resolve_events_dir(result_id: str, service) -> Optional[Path]:
+    """
+    Find the domain event directory (logs/{correlation_id}/{pid}/events) for a result.
+
+    Checks the in-memory service, then the log_dir recorded in the saved
+    summary.json, then logs/{result_id}/ for runs whose correlation ID is the result ID.
+    """
+    get_log_dir = getattr(service, "get_log_dir", None)
+    if callable(get_log_dir):
+        try:
+            log_dir = get_log_dir(result_id)
+        except Exception:
+            log_dir = None
+        if isinstance(log_dir, (str, Path)) and (Path(log_dir) / "events").is_dir():
+            return Path(log_dir) / "events"
+
+    candidates = sorted(glob.glob(str(Path("results") / f"{result_id}_*")))
+    if candidates:
+        summary_file = Path(candidates[0]) / "summary.json"
+        try:
+            with open(summary_file) as f:
+                log_dir = json.load(f).get("log_dir")
+            if log_dir and (Path(log_dir) / "events").is_dir():
+                return Path(log_dir) / "events"
+        except (OSError, ValueError):
+            pass
+
+    return find_events_directory(result_id)
+
+
 @router.get(
     "/{result_id}/export",
     summary="Get export information",
@@ -647,14 +763,15 @@ async def get_pnl_attribution(
     try:
         logger.info("Fetching P&L attribution", correlation_id=correlation_id, result_id=result_id)
 
-        # Get the engine for this result
+        # Running backtests serve the live ledger; completed ones the run-end attribution
         engine = service.get_engine(result_id)
-        if not engine or not engine.pnl_monitor:
+        if engine and engine.pnl_monitor:
+            attribution = engine.pnl_monitor.get_cumulative_attribution()
+        else:
+            attribution = service.get_pnl_attribution(result_id)
+        if attribution is None:
             raise HTTPException(status_code=404, detail="P&L data not available")
 
-        # Get cumulative attribution without calculation
-        attribution = engine.pnl_monitor.get_cumulative_attribution()
-
         return StandardResponse(success=True, data=attribution)
 
     except HTTPException:
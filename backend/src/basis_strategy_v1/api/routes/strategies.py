@@ -1,7 +1,6 @@
 """Strategy management endpoints - Config-driven approach."""
 
 from fastapi import APIRouter, HTTPException, Request, Query
-from pathlib import Path
 from typing import Optional, Dict, Any
 import structlog
 import yaml
@@ -13,6 +12,7 @@ from ...infrastructure.config.config_manager import (
 )
 from ...infrastructure.config.config_manager import (
     get_available_strategies,
+    get_config_manager,
     get_strategy_file_path,
     validate_strategy_name,
 )
@@ -25,6 +25,24 @@ router = APIRouter()
 # _load_strategy_config removed - using centralized load_strategy_config from strategy_discovery
 
 
+def _mode_info_from_config(mode_name: str, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Key mode information for the frontend."""
+    return {
+        "mode": config.get("mode", mode_name),
+        "description": config.get("description", ""),
+        "target_apy": config.get("target_apy", 0.0),
+        "max_drawdown": config.get("max_drawdown", 0.0),
+        "share_class": config.get("share_class", "USDT"),
+        "risk_level": "high" if config.get("leverage_enabled", False) else "medium",
+        "features": {
+            "lending_enabled": config.get("lending_enabled", False),
+            "staking_enabled": config.get("staking_enabled", False),
+            "leverage_enabled": config.get("leverage_enabled", False),
+            "basis_trade_enabled": config.get("basis_trade_enabled", False),
+        },
+    }
+
+
 def _derive_strategy_info_from_config(strategy_name: str, config: Dict[str, Any]) -> Dict[str, Any]:
     """Derive strategy information from config parameters."""
     # Read directly from root level (not from 'strategy' section)
@@ -142,11 +160,9 @@ async def list_strategies(
 
         # Use centralized strategy discovery
         try:
-            from ...infrastructure.config.config_manager import get_config_manager
-
             cm = get_config_manager()
             logger.info(
-                f"Config manager created, modes cache: {cm.config_cache.get('modes', 'NOT_FOUND')}"
+                f"Config manager created, modes cache: {list(cm.config_cache.get('modes', {}))}"
             )
             available_strategy_names = get_available_strategies()
             logger.info(f"get_available_strategies() returned: {available_strategy_names}")
@@ -459,31 +475,13 @@ async def get_mode_config(mode_name: str, request: Request) -> StandardResponse[
             "Getting mode configuration", correlation_id=correlation_id, mode_name=mode_name
         )
 
-        # Load mode config from YAML file
-        config_path = Path("configs/modes") / f"{mode_name}.yaml"
-        if not config_path.exists():
+        # Validated mode config from the in-memory registry
+        try:
+            config = get_config_manager().get_mode_config(mode_name)
+        except KeyError:
             raise HTTPException(status_code=404, detail=f"Mode config not found: {mode_name}.yaml")
 
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
-
-        # Extract key information for frontend
-        mode_info = {
-            "mode": config.get("mode", mode_name),
-            "description": config.get("description", ""),
-            "target_apy": config.get("target_apy", 0.0),
-            "max_drawdown": config.get("max_drawdown", 0.0),
-            "share_class": config.get("share_class", "USDT"),
-            "risk_level": "high" if config.get("leverage_enabled", False) else "medium",
-            "features": {
-                "lending_enabled": config.get("lending_enabled", False),
-                "staking_enabled": config.get("staking_enabled", False),
-                "leverage_enabled": config.get("leverage_enabled", False),
-                "basis_trade_enabled": config.get("basis_trade_enabled", False),
-            },
-        }
-
-        return StandardResponse(success=True, data=mode_info)
+        return StandardResponse(success=True, data=_mode_info_from_config(mode_name, config))
 
     except HTTPException:
         raise
@@ -517,42 +515,18 @@ async def list_modes(
             "Listing available modes", correlation_id=correlation_id, share_class_filter=share_class
         )
 
-        modes_dir = Path("configs/modes")
-        if not modes_dir.exists():
-            raise HTTPException(status_code=404, detail="Modes directory not found")
-
+        # Validated mode configs from the in-memory registry
+        config_manager = get_config_manager()
         modes = []
-        for yaml_file in modes_dir.glob("*.yaml"):
-            mode_name = yaml_file.stem
+        for mode_name in config_manager.get_available_strategies():
+            config = config_manager.get_mode_config(mode_name)
 
-            try:
-                with open(yaml_file, "r") as f:
-                    config = yaml.safe_load(f)
-
-                # Apply share class filter
-                if share_class and config.get("share_class") != share_class:
-                    continue
-
-                mode_info = {
-                    "mode": config.get("mode", mode_name),
-                    "description": config.get("description", ""),
-                    "target_apy": config.get("target_apy", 0.0),
-                    "max_drawdown": config.get("max_drawdown", 0.0),
-                    "share_class": config.get("share_class", "USDT"),
-                    "risk_level": "high" if config.get("leverage_enabled", False) else "medium",
-                    "features": {
-                        "lending_enabled": config.get("lending_enabled", False),
-                        "staking_enabled": config.get("staking_enabled", False),
-                        "leverage_enabled": config.get("leverage_enabled", False),
-                        "basis_trade_enabled": config.get("basis_trade_enabled", False),
-                    },
-                }
-                modes.append(mode_info)
-
-            except Exception as e:
-                logger.warning(f"Failed to load mode config {yaml_file}: {e}")
+            # Apply share class filter
+            if share_class and config.get("share_class") != share_class:
                 continue
 
+            modes.append(_mode_info_from_config(mode_name, config))
+
         return StandardResponse(success=True, data={"modes": modes, "total": len(modes)})
 
     except HTTPException:
@@ -115,7 +115,7 @@ class ExposureMonitor:
         timestamp = datetime.now().isoformat()
         real_utc = datetime.now(timezone.utc).isoformat()
 
-        snapshot = ExposureSnapshot(
+        snapshot = ExposureSnapshot.model_construct(
             timestamp=timestamp,
             real_utc_time=real_utc,
             correlation_id=self.correlation_id,
@@ -194,82 +194,11 @@ class ExposureMonitor:
             # Store timestamp
             self.last_calculation_timestamp = timestamp
 
-            # Get position subscriptions from position_monitor config
-            # This is the ONLY config we need - reuse what position_monitor uses
-            position_subscriptions = (
-                self.config.get("component_config", {})
-                .get("position_monitor", {})
-                .get("position_subscriptions", [])
-            )
-
-            # Calculate exposures for each position
-            exposures = {}
-            total_value_usd = 0.0
-            total_value_share_class = 0.0
-
-            # Process all subscribed positions (even if zero) + any active positions
-            all_instrument_keys = set(position_subscriptions) | set(position_snapshot.keys())
-
-            for instrument_key in all_instrument_keys:
-                amount = position_snapshot.get(instrument_key, 0.0)
-                # KEEP all positions including zeros for full record set
-
-                # Parse position key: "venue:position_type:token"
-                parts = instrument_key.split(":")
-                if len(parts) < 3:
-                    logger.warning(f"Invalid position key format: {instrument_key}")
-                    continue
-
-                venue, position_type, token = parts[0], parts[1], parts[2]
-
-                # Convert to USD and share class using utility_manager
-                try:
-                    # Use utility_manager for conversions (handles aTokens correctly)
-                    value_usd = self.utility_manager.convert_position_to_usd(
-                        instrument_key=instrument_key, amount=amount, timestamp=timestamp
-                    )
-
-                    # Convert to share class currency
-                    value_share_class = self.utility_manager.convert_position_to_share_class(
-                        instrument_key=instrument_key,
-                        amount=amount,
-                        share_class=self.share_class,
-                        timestamp=timestamp,
-                    )
-
-                    # Calculate effective price per token unit
-                    token_price_usd = value_usd / amount if amount > 0 else 0.0
-
-                    # Store exposure data with BOTH usd_value and share_class_value per instrument
-                    exposures[instrument_key] = {
-                        "venue": venue,
-                        "position_type": position_type,
-                        "token": token,
-                        "amount": amount,
-                        "PRICE_USD": token_price_usd,  # Price per unit in USD
-                        "value_usd": value_usd,  # Total value in USD
-                        "value_share_class": value_share_class,  # Total value in share class currency
-                    }
-
-                    # Accumulate totals
-                    total_value_usd += value_usd
-                    total_value_share_class += value_share_class
-
-                except Exception as e:
-                    logger.warning(f"Error converting position {instrument_key}: {e}")
-                    # Continue with other positions
-                    continue
-
-            # Build exposure result
-            exposure_result = {
-                "timestamp": timestamp,
-                "share_class": self.share_class,
-                "total_value_usd": total_value_usd,
-                "share_class_value": total_value_share_class,
-                "total_exposure": total_value_share_class,  # For compatibility
-                "exposures": exposures,
-                "EXPOSURE_COUNT": len(exposures),
-            }
+            exposure_result = self.value_positions(timestamp, position_snapshot)
+            exposures = exposure_result["exposures"]
+            total_value_usd = exposure_result["total_value_usd"]
+            total_value_share_class = exposure_result["share_class_value"]
+            position_subscriptions = self._position_subscriptions()
 
             # Store for future reference
             self.last_exposures = exposure_result
@@ -330,6 +259,94 @@ class ExposureMonitor:
                 "error": str(e),
             }
 
+    def value_positions(
+        self, timestamp: pd.Timestamp, position_snapshot: Dict[str, float]
+    ) -> Dict[str, Any]:
+        """
+        Value positions in share class currency + USD without logging or updating state.
+
+        Used by calculate_exposure and for equity points of ticks skipped by sparse
+        stepping. Returns the calculate_exposure result structure.
+        """
+        position_subscriptions = self._position_subscriptions()
+
+        # Calculate exposures for each position
+        exposures = {}
+        total_value_usd = 0.0
+        total_value_share_class = 0.0
+
+        # Process all subscribed positions (even if zero) + any active positions
+        all_instrument_keys = set(position_subscriptions) | set(position_snapshot.keys())
+
+        for instrument_key in all_instrument_keys:
+            amount = position_snapshot.get(instrument_key, 0.0)
+            # KEEP all positions including zeros for full record set
+
+            # Parse position key: "venue:position_type:token"
+            parts = instrument_key.split(":")
+            if len(parts) < 3:
+                logger.warning(f"Invalid position key format: {instrument_key}")
+                continue
+
+            venue, position_type, token = parts[0], parts[1], parts[2]
+
+            # Convert to USD and share class using utility_manager
+            try:
+                # Use utility_manager for conversions (handles aTokens correctly)
+                value_usd = self.utility_manager.convert_position_to_usd(
+                    instrument_key=instrument_key, amount=amount, timestamp=timestamp
+                )
+
+                # Convert to share class currency
+                value_share_class = self.utility_manager.convert_position_to_share_class(
+                    instrument_key=instrument_key,
+                    amount=amount,
+                    share_class=self.share_class,
+                    timestamp=timestamp,
+                )
+
+                # Calculate effective price per token unit
+                token_price_usd = value_usd / amount if amount > 0 else 0.0
+
+                # Store exposure data with BOTH usd_value and share_class_value per instrument
+                exposures[instrument_key] = {
+                    "venue": venue,
+                    "position_type": position_type,
+                    "token": token,
+                    "amount": amount,
+                    "PRICE_USD": token_price_usd,  # Price per unit in USD
+                    "value_usd": value_usd,  # Total value in USD
+                    "value_share_class": value_share_class,  # Total value in share class currency
+                }
+
+                # Accumulate totals
+                total_value_usd += value_usd
+                total_value_share_class += value_share_class
+
+            except Exception as e:
+                logger.warning(f"Error converting position {instrument_key}: {e}")
+                # Continue with other positions
+                continue
+
+        return {
+            "timestamp": timestamp,
+            "share_class": self.share_class,
+            "total_value_usd": total_value_usd,
+            "share_class_value": total_value_share_class,
+            "total_exposure": total_value_share_class,  # For compatibility
+            "exposures": exposures,
+            "EXPOSURE_COUNT": len(exposures),
+        }
+
+    def _position_subscriptions(self) -> List[str]:
+        """Position subscriptions from position_monitor config."""
+        # This is the ONLY config we need - reuse what position_monitor uses
+        return (
+            self.config.get("component_config", {})
+            .get("position_monitor", {})
+            .get("position_subscriptions", [])
+        )
+
     def get_current_exposure(self) -> Dict:
         """Get current exposure snapshot."""
         if self.last_exposures is None:
@@ -4,11 +4,23 @@ P&L Calculator Component
 Mode-agnostic P&L calculator using config-driven attribution types.
 Calculates balance-based and attribution P&L with reconciliation in share class currency.
 
+Each (timestamp, positions) book is valued once through the equity calculator and kept
+in a small rolling equity ledger, so the previous tick's equity is reused rather than
+re-valued. Attribution is incremental: every equity change is split per instrument into
+revaluation (price / index moves on held amounts) and balance changes, and added to the
+cumulative per-component ledger.
+
+Every tick's amounts and values are also kept in a columnar position history; at run
+end calculate_run_attribution() splits the whole run once with array differences
+(index growth, oracle drift, price and perp mark moves, funding, balance flows) and
+reconciles it against balance-based P&L with perps at unrealized P&L.
+
 Reference: docs/REFERENCE_ARCHITECTURE_CANONICAL.md - Mode-Agnostic Architecture
 Reference: docs/specs/04_pnl_monitor.md - Complete specification
 """
 
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 import json
 import logging
 import asyncio
@@ -24,6 +36,8 @@ from ...infrastructure.logging.domain_event_logger import DomainEventLogger
 from ...core.models.domain_events import PnLCalculation
 from ...core.errors.error_codes import ERROR_REGISTRY
 from ...core.math.equity_calculator import calculate_equity
+from ...core.math.pnl_attribution import ATTRIBUTION_COMPONENTS, PositionHistory, attribute_pnl
+from ...core.models.instruments import instrument_key_to_price_key
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +49,12 @@ ERROR_CODES = {
     "PNL-004": "Previous exposure data missing for attribution",
 }
 
+# Valuations kept in the equity ledger (current and previous tick plus repeat calls per tick)
+EQUITY_LEDGER_SIZE = 8
+
+LST_TOKENS = ("stETH", "eETH", "wstETH", "weETH")
+FUNDING_SETTLEMENT_HOURS = (0, 8, 16)
+
 
 class PnLMonitorError(Exception):
     """Custom exception for P&L calculator errors with error codes."""
@@ -136,6 +156,16 @@ class PnLMonitor:
         
         # Initialize previous positions for P&L calculation
         self.previous_positions = None
+        self.previous_timestamp = None
+
+        # Rolling equity ledger: (timestamp, positions version) -> equity breakdown
+        self.equity_ledger: "OrderedDict[Tuple[Any, Tuple], Dict[str, Any]]" = OrderedDict()
+        self.equity_valuations = 0
+
+        # Columnar per-tick book for the post-run attribution, and its baseline
+        self.position_history = PositionHistory()
+        self.history_opening_value: Optional[float] = None
+        self.history_opening_components: Dict[str, float] = {}
 
         # Get position subscriptions from config
         position_config = config.get("component_config", {}).get("position_monitor", {})
@@ -182,6 +212,7 @@ class PnLMonitor:
             "net_delta_pnl": 0.0,  # Net delta P&L (market neutrality)
             "delta_pnl": 0.0,
             "transaction_costs": 0.0,
+            "settlement_pnl": 0.0,  # Funding, realized perp P&L, rewards and costs on balances
         }
 
         # Initial value (set at t=0) - use initial_capital as default
@@ -194,6 +225,8 @@ class PnLMonitor:
         self.latest_pnl_result: Optional[Dict] = None
         self.pnl_history: List[Dict] = []
         self.calculation_timestamps: List[pd.Timestamp] = []
+        # Entries calculated before pnl_history starts (set when resuming from a checkpoint)
+        self.history_offset = 0
 
     def check_component_health(self) -> Dict[str, Any]:
         """Check component health status."""
@@ -206,6 +239,44 @@ class PnLMonitor:
             "component": self.__class__.__name__,
         }
 
+    def get_checkpoint_state(self) -> Dict[str, Any]:
+        """P&L baseline and history cursor for backtest checkpoints."""
+        return {
+            "initial_total_value": self.initial_total_value,
+            "previous_positions": dict(self.previous_positions) if self.previous_positions else None,
+            "previous_timestamp": self.previous_timestamp,
+            "previous_exposure": self.previous_exposure,
+            "cumulative": dict(self.cumulative),
+            "latest_pnl_result": self.latest_pnl_result,
+            "history_cursor": self.history_offset + len(self.pnl_history),
+        }
+
+    def restore_checkpoint_state(self, state: Dict[str, Any]) -> None:
+        """Restore P&L state from a backtest checkpoint (history before the cursor is not reloaded)."""
+        self.initial_total_value = state["initial_total_value"]
+        self.previous_positions = state["previous_positions"]
+        self.previous_timestamp = state.get("previous_timestamp")
+        self.equity_ledger = OrderedDict()
+        self.previous_exposure = state["previous_exposure"]
+        self.cumulative = dict(state["cumulative"])
+
+        # Post-run attribution continues from the checkpoint's book and components
+        self.position_history = PositionHistory()
+        self.history_opening_value = None
+        self.history_opening_components = dict(self.cumulative)
+        if self.previous_positions and self.previous_timestamp is not None and self.utility_manager:
+            previous_equity = self._get_equity(self.previous_positions, self.previous_timestamp)
+            self.history_opening_value = previous_equity["total_equity"]
+            self.position_history.record(
+                self.previous_timestamp,
+                self.previous_positions,
+                self._signed_position_values(previous_equity),
+            )
+        self.latest_pnl_result = state["latest_pnl_result"]
+        self.pnl_history = []
+        self.calculation_timestamps = []
+        self.history_offset = state["history_cursor"]
+
     def _log_pnl_calculation(self, pnl_data: Dict[str, Any]) -> None:
         """Log P&L calculation as domain event."""
         if not self.log_dir or not self.domain_event_logger:
@@ -214,7 +285,7 @@ class PnLMonitor:
         timestamp = datetime.now().isoformat()
         real_utc = datetime.now(timezone.utc).isoformat()
 
-        calculation = PnLCalculation(
+        calculation = PnLCalculation.model_construct(
             timestamp=timestamp,
             real_utc_time=real_utc,
             correlation_id=self.correlation_id,
@@ -279,7 +350,10 @@ class PnLMonitor:
 
             self.logger.info(f"P&L Calculator: Starting P&L calculation for timestamp {timestamp}")
             if period_start is None:
-                period_start = timestamp
+                # Previous book is already in the equity ledger at its own timestamp
+                period_start = (
+                    self.previous_timestamp if self.previous_timestamp is not None else timestamp
+                )
 
             # Get current positions from position_monitor
             if not self.position_monitor:
@@ -321,13 +395,10 @@ class PnLMonitor:
             )
             self.logger.info(f"P&L Calculator: Balance-based P&L calculated successfully")
 
-            # 2. Attribution P&L (breakdown) - simplified for now
-            attribution_pnl_data = {
-                "PNL_CUMULATIVE": 0.0,
-                "PNL_HOURLY": 0.0,
-                "PNL_PCT": 0.0,
-                "components": {}
-            }
+            # 2. Attribution P&L (breakdown) - incremental per-component ledger
+            attribution_pnl_data = self._calculate_attribution_pnl(
+                current_positions, period_start, current_time=timestamp
+            )
 
             # 3. Reconciliation
             reconciliation = self._reconcile_pnl(
@@ -343,8 +414,15 @@ class PnLMonitor:
                 "RECONCILIATION": reconciliation,
             }
 
+            self.position_history.record(
+                timestamp,
+                current_positions,
+                self._signed_position_values(self._get_equity(current_positions, timestamp)),
+            )
+
             # Store previous positions for next calculation
             self.previous_positions = current_positions.copy()
+            self.previous_timestamp = timestamp
 
             # Store results in cache for read-only access
             self.latest_pnl_result = pnl_data
@@ -422,12 +500,7 @@ class PnLMonitor:
                 )
 
             # Calculate current equity using equity calculator
-            equity_data = calculate_equity(
-                positions=current_positions,
-                utility_manager=self.utility_manager,
-                share_class=self.share_class,
-                timestamp=current_time
-            )
+            equity_data = self._get_equity(current_positions, current_time)
 
             current_value = equity_data['total_equity']
 
@@ -440,12 +513,7 @@ class PnLMonitor:
 
             # Calculate hourly P&L if we have previous positions
             if self.previous_positions:
-                previous_equity_data = calculate_equity(
-                    positions=self.previous_positions,
-                    utility_manager=self.utility_manager,
-                    share_class=self.share_class,
-                    timestamp=period_start
-                )
+                previous_equity_data = self._get_equity(self.previous_positions, period_start)
                 previous_value = previous_equity_data['total_equity']
                 pnl_hourly = current_value - previous_value
             else:
@@ -470,26 +538,93 @@ class PnLMonitor:
                 initial_value=self.initial_total_value,
             )
 
+    def _get_equity(self, positions: Dict[str, float], timestamp: pd.Timestamp) -> Dict[str, Any]:
+        """Equity breakdown of positions at timestamp, valued once per (timestamp, positions)."""
+        key = (timestamp, tuple(sorted(positions.items())))
+        equity_data = self.equity_ledger.get(key)
+        if equity_data is None:
+            equity_data = calculate_equity(
+                positions=positions,
+                utility_manager=self.utility_manager,
+                share_class=self.share_class,
+                timestamp=timestamp,
+            )
+            self.equity_valuations += 1
+            self.equity_ledger[key] = equity_data
+            while len(self.equity_ledger) > EQUITY_LEDGER_SIZE:
+                self.equity_ledger.popitem(last=False)
+        return equity_data
+
+    @staticmethod
+    def _attribution_component(instrument_key: str) -> str:
+        """Cumulative component that revaluation of an instrument is booked to."""
+        parts = instrument_key.split(":")
+        position_type, token = (parts[1], parts[2]) if len(parts) >= 3 else ("", instrument_key)
+        if position_type == "aToken":
+            return "supply_pnl"
+        if position_type == "debtToken":
+            return "borrow_cost"
+        if token in LST_TOKENS:
+            return "staking_yield_oracle"
+        return "delta_pnl"
+
     def _calculate_attribution_pnl(
-        self, current_exposure: Dict, previous_exposure: Optional[Dict], timestamp: pd.Timestamp
+        self, current_positions: Dict[str, float], period_start: pd.Timestamp, current_time: pd.Timestamp
     ) -> Dict:
-        """Calculate P&L from component breakdown."""
-        if previous_exposure is None:
-            # First hour, no P&L yet
-            return self._zero_attribution()
+        """
+        Split the equity change since the previous valuation into per-component P&L.
 
-        # Ensure previous_exposure is a dictionary, not a Timestamp
-        if not isinstance(previous_exposure, dict):
-            self.logger.warning(
-                f"Previous exposure is not a dict: {type(previous_exposure)}, returning zero attribution"
+        Per instrument, revaluation (previous amount at the new unit value) goes to the
+        instrument's component and the amount change at the new unit value to
+        settlement_pnl, so the components sum to the balance-based equity change. Both
+        books come from the equity ledger; nothing is re-valued.
+        """
+        current_equity = self._get_equity(current_positions, current_time)
+        current_values = self._signed_position_values(current_equity)
+        components = {name: 0.0 for name in self.cumulative}
+
+        if self.previous_positions:
+            previous_equity = self._get_equity(self.previous_positions, period_start)
+            previous_values = self._signed_position_values(previous_equity)
+
+            for instrument_key in current_values.keys() | previous_values.keys():
+                value = current_values.get(instrument_key, 0.0)
+                previous_value = previous_values.get(instrument_key, 0.0)
+                amount = current_positions.get(instrument_key, 0.0)
+                previous_amount = self.previous_positions.get(instrument_key, 0.0)
+
+                if amount:
+                    unit_value = value / amount
+                    revaluation = previous_amount * unit_value - previous_value
+                else:
+                    revaluation = 0.0  # Closed position: no current unit value
+                components[self._attribution_component(instrument_key)] += revaluation
+                components["settlement_pnl"] += value - previous_value - revaluation
+        else:
+            # Opening book against the initial capital baseline
+            components["settlement_pnl"] = (
+                current_equity["total_equity"] - self.initial_total_value
             )
-            return self._zero_attribution()
 
-        # Config-driven attribution calculation
-        # All strategies use the same attribution logic based on config-driven attribution types
-        return self._calculate_config_driven_attribution(
-            current_exposure, previous_exposure, timestamp
-        )
+        for name, value in components.items():
+            self.cumulative[name] += value
+
+        pnl_cumulative = sum(self.cumulative.values())
+        return {
+            "PNL_HOURLY": sum(components.values()),
+            "PNL_CUMULATIVE": pnl_cumulative,
+            "PNL_PCT": (pnl_cumulative / self.initial_capital) * 100,
+            "components": components,
+            "cumulative": dict(self.cumulative),
+        }
+
+    @staticmethod
+    def _signed_position_values(equity_data: Dict[str, Any]) -> Dict[str, float]:
+        """Share-class value per instrument from an equity breakdown, debts negative."""
+        values = dict(equity_data.get("asset_positions", {}))
+        for instrument_key, debt_value in equity_data.get("debt_positions", {}).items():
+            values[instrument_key] = values.get(instrument_key, 0.0) - debt_value
+        return values
 
     def _calculate_config_driven_attribution(
         self, current_exposure: Dict, previous_exposure: Dict, timestamp: pd.Timestamp
@@ -1350,12 +1485,159 @@ class PnLMonitor:
             logger.error(f"Error getting protocol token price for {token}: {e}")
             return 0.0
 
+    def calculate_run_attribution(self) -> Optional[Dict[str, float]]:
+        """
+        Attribute the whole run's P&L once from the columnar position history.
+
+        Loads the index, oracle, funding and mark series for the recorded instruments in
+        one pass each, splits the run with core.math.pnl_attribution and reconciles the
+        result against the latest balance-based P&L plus the perps' unrealized P&L.
+
+        Returns:
+            Cumulative components with pnl_cumulative, perp_unrealized_pnl,
+            balance_pnl_cumulative and reconciliation_difference, or None when no tick
+            was recorded
+        """
+        if not len(self.position_history):
+            return None
+
+        timestamps, keys, amounts, values = self.position_history.to_arrays()
+        shape = amounts.shape
+        index = np.ones(shape)
+        oracle = np.ones(shape)
+        funding_rates = np.zeros(shape)
+        mark_prices = np.zeros(shape)
+
+        for column, instrument_key in enumerate(keys):
+            parts = instrument_key.split(":")
+            if len(parts) < 3:
+                continue
+            position_type, token = parts[1], parts[2]
+            if position_type in ("aToken", "debtToken"):
+                index[:, column] = self._history_series(
+                    f"protocol_data.aave_indexes.{token}", timestamps
+                )
+            underlying = token[1:] if position_type == "aToken" else token
+            if underlying in LST_TOKENS and position_type != "debtToken":
+                oracle[:, column] = self._history_series(
+                    f"protocol_data.oracle_prices.{underlying}/ETH", timestamps
+                )
+            if position_type == "Perp":
+                price_key = instrument_key_to_price_key(instrument_key)
+                funding_rates[:, column] = self._history_series(
+                    f"market_data.funding_rates.{price_key}", timestamps
+                )
+                mark_prices[:, column] = self._history_series(
+                    f"protocol_data.perp_prices.{price_key}", timestamps
+                )
+
+        # Funding settles into venue balances only at 0/8/16 UTC when enabled
+        settlement_config = (
+            self.config.get("component_config", {}).get("position_monitor", {}).get("settlement")
+            or {}
+        )
+        settles = np.array(
+            [ts.hour in FUNDING_SETTLEMENT_HOURS and ts.minute == 0 for ts in timestamps]
+        )
+        if not settlement_config.get("funding_enabled", False):
+            settles[:] = False
+        funding_rates = np.where(settles[:, None], funding_rates, 0.0)
+
+        usd_to_share_class = None
+        if self.share_class == "ETH":
+            usd_to_share_class = 1.0 / self._history_series("market_data.prices.ETH", timestamps)
+
+        opening_value = (
+            self.history_opening_value
+            if self.history_opening_value is not None
+            else self.initial_total_value
+        )
+        result = attribute_pnl(
+            keys,
+            amounts,
+            values,
+            opening_value,
+            index=index,
+            oracle=oracle,
+            funding_rates=funding_rates,
+            mark_prices=mark_prices,
+            usd_to_share_class=usd_to_share_class,
+            perp_pnl_settled=settlement_config.get("margin_pnl_enabled", False),
+        )
+
+        attribution = {
+            name: self.history_opening_components.get(name, 0.0) for name in self.cumulative
+        }
+        for name in ATTRIBUTION_COMPONENTS:
+            attribution[name] += result[name]
+        attribution["pnl_cumulative"] = sum(attribution.values())
+
+        # Balance-based P&L excludes derivatives; perps count at unrealized P&L here
+        perp_unrealized = result["perp_unrealized_pnl"]
+        balance_pnl = (self.latest_pnl_result or {}).get("BALANCE_BASED", {}).get(
+            "PNL_CUMULATIVE", result["balance_pnl_cumulative"] - perp_unrealized
+        )
+        balance_pnl += perp_unrealized
+        attribution["perp_unrealized_pnl"] = perp_unrealized
+        attribution["balance_pnl_cumulative"] = balance_pnl
+        attribution["reconciliation_difference"] = balance_pnl - attribution["pnl_cumulative"]
+
+        if abs(attribution["reconciliation_difference"]) > (
+            self.reconciliation_tolerance * self.initial_capital
+        ):
+            self.logger.warning(
+                f"Run attribution does not reconcile: balance=${balance_pnl:,.2f}, "
+                f"attribution=${attribution['pnl_cumulative']:,.2f}"
+            )
+        self.logger.info(
+            f"Run attribution over {len(timestamps)} ticks and {len(keys)} instruments: "
+            f"{attribution}"
+        )
+        return attribution
+
+    def _history_series(self, data_key: str, timestamps: List[pd.Timestamp]) -> np.ndarray:
+        """
+        Values of a data key at the recorded timestamps (NaN where unavailable).
+
+        Uses the provider's columnar get_series() when it serves the key, otherwise
+        falls back to per-timestamp snapshots.
+        """
+        csv_mappings = getattr(self.data_provider, "csv_mappings", None) or {}
+        if hasattr(self.data_provider, "get_series") and csv_mappings.get(data_key):
+            try:
+                series = self.data_provider.get_series(data_key, timestamps).ffill()
+                return series.to_numpy(dtype=float)
+            except Exception as e:
+                logger.warning(f"Series load failed for {data_key}, using snapshots: {e}")
+
+        section, field, name = data_key.split(".", 2)
+        values = np.full(len(timestamps), np.nan)
+        if self.data_provider is None:
+            return values
+        for row, timestamp in enumerate(timestamps):
+            try:
+                value = self.data_provider.get_data(timestamp)[section][field].get(name)
+            except Exception:
+                continue
+            if value is not None:
+                values[row] = float(value)
+        return values
+
     # Read-only methods for cached access
 
     def get_latest_pnl(self) -> Optional[Dict]:
         """Get the most recent P&L result without calculation."""
         return self.latest_pnl_result
 
+    def get_balance_pnl_at(self, positions: Dict[str, float], timestamp: pd.Timestamp) -> float:
+        """
+        Balance-based cumulative P&L of positions valued at timestamp.
+
+        Same valuation as update_state's BALANCE_BASED PNL_CUMULATIVE, without recording
+        a P&L result (for equity points of ticks skipped by sparse stepping).
+        """
+        return self._get_equity(positions, timestamp)["total_equity"] - self.initial_total_value
+
     def get_pnl_history(self, limit: int = 100) -> List[Dict]:
         """Get P&L history without calculation."""
         return self.pnl_history[-limit:] if self.pnl_history else []
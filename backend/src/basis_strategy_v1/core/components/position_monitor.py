@@ -5,7 +5,7 @@ Responsibilities:
 - Track positions in format: venue:position_type:symbol -> amount
 - Apply execution deltas from trades/operations
 - Simulate position updates in backtest mode
-- Query real positions in live mode
+- Query real positions in live mode (all venues concurrently, see venue_position_query)
 - Automatic settlements (m2m pnl, staking rewards)
 
 NOT responsible for:
@@ -29,6 +29,7 @@ from ...infrastructure.logging.structured_logger import StructuredLogger
 from ...infrastructure.logging.domain_event_logger import DomainEventLogger
 from ...core.models.domain_events import PositionSnapshot
 from ...core.errors.error_codes import ERROR_REGISTRY
+from .venue_position_query import VenuePositionQuery, VenueQueryResult
 
 logger = logging.getLogger(__name__)
 
@@ -128,6 +129,10 @@ class PositionMonitor:
         if self.venue_interface_factory:
             self._initialize_position_interfaces()
 
+        # Concurrent venue queries with per-venue timeouts; last refresh status per venue
+        self.venue_query = VenuePositionQuery.from_config(config)
+        self.venue_query_status: Dict[str, Dict[str, Any]] = {}
+
         self.logger.info(
             f"PositionMonitor initialized: {execution_mode} mode, "
             f"{share_class} share class, ${initial_capital:,.0f} capital, "
@@ -145,7 +150,7 @@ class PositionMonitor:
         # Calculate total value (use share class for simplicity)
         total_value = sum(abs(v) for v in self.simulated_positions.values())
 
-        snapshot = PositionSnapshot(
+        snapshot = PositionSnapshot.model_construct(
             timestamp=timestamp,
             real_utc_time=real_utc,
             correlation_id=self.correlation_id,
@@ -492,27 +497,22 @@ class PositionMonitor:
         """
         Query actual positions from venue interfaces (live mode only).
 
+        All venues are queried concurrently with per-venue timeouts. A venue that is slow
+        or failing contributes its last good positions, flagged stale in
+        venue_query_status; with none recent enough its positions read as 0.
+
         Returns:
             Dict mapping instrument_key -> actual amount
         """
         queried_positions = {}
 
-        # Query each venue interface
-        for venue, interface in self.position_interfaces.items():
-            if interface is None:
-                continue
-
-            try:
-                venue_positions = interface.get_positions(timestamp)
-                queried_positions.update(venue_positions)
-            except Exception as e:
-                self.logger.error(
-                    f"Failed to query positions from {venue}: {e}",
-                    error_code="POS-003",
-                    exc_info=e,
-                    operation="query_venue_positions",
-                    venue=venue,
-                )
+        # Merge in interface order (later venues win on shared keys)
+        results = self.venue_query.query(self.position_interfaces, timestamp)
+        for venue, result in results.items():
+            self._log_venue_query_result(result)
+            if result.positions is not None:
+                queried_positions.update(result.positions)
+        self.venue_query_status = {venue: result.to_dict() for venue, result in results.items()}
 
         # Start with all declared positions at 0
         result = {k: 0.0 for k in self.simulated_positions.keys()}
@@ -530,6 +530,28 @@ class PositionMonitor:
 
         return result
 
+    def _log_venue_query_result(self, result: VenueQueryResult) -> None:
+        if result.status == "error":
+            self.logger.error(
+                f"Failed to query positions from {result.venue}: {result.error}",
+                error_code="POS-003",
+                operation="query_venue_positions",
+                venue=result.venue,
+                stale=result.stale,
+            )
+        elif result.status in ("timeout", "busy"):
+            outcome = "timed out" if result.status == "timeout" else "skipped"
+            self.logger.warning(
+                f"Position query to {result.venue} {outcome} ({result.error}); "
+                + (
+                    f"reusing positions from {result.age_seconds:.1f}s ago"
+                    if result.stale
+                    else "no recent positions to reuse"
+                ),
+                operation="query_venue_positions",
+                venue=result.venue,
+            )
+
     # ========================================================================
     # PRIVATE METHODS - Delta Generators (Backtest Only)
     # ========================================================================
@@ -779,5 +801,25 @@ class PositionMonitor:
             "error_count": self.error_count,
             "position_count": len(self.simulated_positions),
             "position_interfaces_count": len(self.position_interfaces),
+            "venue_queries": self.venue_query.get_metrics(),
+            "stale_venues": sorted(
+                venue for venue, status in self.venue_query_status.items() if status["stale"]
+            ),
             "component": self.__class__.__name__,
         }
+
+    def get_checkpoint_state(self) -> Dict[str, Any]:
+        """Position state for backtest checkpoints."""
+        return {
+            "simulated_positions": dict(self.simulated_positions),
+            "real_positions": dict(self.real_positions),
+            "last_timestamp": self.last_timestamp,
+            "applied_this_timestamp": set(self.applied_this_timestamp),
+        }
+
+    def restore_checkpoint_state(self, state: Dict[str, Any]) -> None:
+        """Restore position state from a backtest checkpoint."""
+        self.simulated_positions = dict(state["simulated_positions"])
+        self.real_positions = dict(state["real_positions"])
+        self.last_timestamp = state["last_timestamp"]
+        self.applied_this_timestamp = set(state["applied_this_timestamp"])
@@ -15,6 +15,13 @@ Mode-Specific Behavior:
 - Live Mode: Query real positions from venues, compare with simulated
 - Reconciliation: Only in live mode (backtest always succeeds)
 
+Deferred Component Chain:
+- ExecutionManager opens a deferred chain around each atomic group
+- Deltas are applied (and reconciled) per order, the component chain runs once on flush
+- An order still runs the full chain when its projected LTV / CEX margin crosses
+  the configured guard band (risk_guard_band_ltv / risk_guard_band_margin)
+- The flushed chain sees the same final positions as the last eager pass
+
 Reference: WORKFLOW_GUIDE.md - Tight Loop Architecture
 """
 
@@ -101,12 +108,21 @@ class PositionUpdateHandler:
         position_config = config.get('component_config', {}).get('position_monitor', {})
         self.position_subscriptions = position_config.get('position_subscriptions', [])
         
+        # Deferred component chain settings
+        handler_config = config.get('component_config', {}).get('position_update_handler', {})
+        self.defer_component_chain = handler_config.get('defer_component_chain', True)
+        self.risk_guard_band_ltv = float(handler_config.get('risk_guard_band_ltv', 0.05))
+        self.risk_guard_band_margin = float(handler_config.get('risk_guard_band_margin', 0.05))
+        
         self.logger.info(f"PositionUpdateHandler subscribed to {len(self.position_subscriptions)} positions")
         
         # Initialize component-specific state
         self.tight_loop_active = False
         self.current_loop_timestamp = None
         self.loop_execution_count = 0
+        self._deferred_chain: Optional[Dict[str, Any]] = None
+        self.chain_run_count = 0
+        self.deferred_chain_skip_count = 0
         
         # Health integration
         self.health_status = {
@@ -201,6 +217,8 @@ class PositionUpdateHandler:
             'success_count': self.health_status['success_count'],
             'tight_loop_active': self.tight_loop_active,
             'loop_execution_count': self.loop_execution_count,
+            'chain_run_count': self.chain_run_count,
+            'deferred_chain_skip_count': self.deferred_chain_skip_count,
             'component': self.__class__.__name__
         }
     
@@ -287,9 +305,142 @@ class PositionUpdateHandler:
             self.position_monitor.update_state(timestamp, 'position_refresh', None)
             reconciliation_result = self._reconcile_positions()
         
+        if self._deferred_chain is not None and self._defer_chain_for_order(timestamp):
+            return {
+                'success': reconciliation_result['success'],
+                'reconciliation_result': reconciliation_result,
+                'deferred': True,
+                'execution_mode': self.execution_mode
+            }
+        
         # Continue with component chain
         return self._orchestrate_component_chain(timestamp, reconciliation_result)
     
+    def begin_deferred_chain(self, timestamp: pd.Timestamp) -> bool:
+        """
+        Start deferring the component chain for a group of execution_manager triggers.
+        
+        Args:
+            timestamp: Current timestamp
+            
+        Returns:
+            bool: True if deferral is active and flush_deferred_chain() must be called
+        """
+        if not self.defer_component_chain:
+            return False
+        
+        self._deferred_chain = {
+            'timestamp': timestamp,
+            'pending': False,
+            'risk_metrics': self._project_risk_metrics(timestamp)
+        }
+        return True
+    
+    def flush_deferred_chain(self) -> Optional[Dict]:
+        """
+        End deferral and run the component chain once on the final positions.
+        
+        Returns:
+            Component chain result, or None if no deltas were left pending
+        """
+        deferred_chain, self._deferred_chain = self._deferred_chain, None
+        if not deferred_chain or not deferred_chain['pending']:
+            return None
+        
+        self.logger.info(
+            'Running deferred component chain',
+            skipped_chain_runs=self.deferred_chain_skip_count
+        )
+        return self._orchestrate_component_chain(
+            deferred_chain['timestamp'], {'success': True, 'type': 'deferred_chain'}
+        )
+    
+    def _defer_chain_for_order(self, timestamp: pd.Timestamp) -> bool:
+        """Decide whether this order's chain run can be deferred to the flush."""
+        previous = self._deferred_chain['risk_metrics']
+        projected = self._project_risk_metrics(timestamp)
+        self._deferred_chain['risk_metrics'] = projected
+        
+        if self._crosses_risk_guard_band(previous, projected):
+            self.logger.info(
+                'Projected risk within guard band - running component chain for order',
+                projected_risk=projected
+            )
+            self._deferred_chain['pending'] = False
+            return False
+        
+        self._deferred_chain['pending'] = True
+        self.deferred_chain_skip_count += 1
+        return True
+    
+    def _project_risk_metrics(self, timestamp: pd.Timestamp) -> Optional[Dict[str, Any]]:
+        """
+        Project AAVE LTV and CEX margin ratios for the current positions.
+        
+        Reuses the exposure values of the last exposure pass at this timestamp and
+        only revalues instruments whose amount changed, without logging or events.
+        """
+        try:
+            positions = self.position_monitor.get_current_positions()
+            last_exposure = self.exposure_monitor.last_exposures or {}
+            last_exposures = (
+                last_exposure.get('exposures', {})
+                if last_exposure.get('timestamp') == timestamp else {}
+            )
+            
+            exposures = {}
+            for instrument_key, amount in positions.items():
+                previous = last_exposures.get(instrument_key)
+                if previous is not None and previous.get('amount') == amount:
+                    exposures[instrument_key] = previous
+                    continue
+                value_usd = self.exposure_monitor.utility_manager.convert_position_to_usd(
+                    instrument_key=instrument_key, amount=amount, timestamp=timestamp
+                )
+                exposures[instrument_key] = {'amount': amount, 'value_usd': value_usd}
+            
+            exposure_data = {'exposures': exposures}
+            return {
+                'ltv': float(self.risk_monitor._calculate_current_ltv(exposure_data)),
+                'margin_ratios': {
+                    venue: float(ratio)
+                    for venue, ratio in self.risk_monitor._calculate_cex_margin_ratios(exposure_data).items()
+                }
+            }
+        except Exception as e:
+            self.logger.warning(f'Risk projection failed, running component chain: {e}')
+            return None
+    
+    def _crosses_risk_guard_band(self, previous: Optional[Dict], projected: Optional[Dict]) -> bool:
+        """Check if an order moves LTV or a CEX margin ratio into (or deeper into) the guard band."""
+        if previous is None or projected is None:
+            return True
+        
+        try:
+            max_ltv = float(self.risk_monitor.aave_max_ltv_emode or 0)
+            if (
+                max_ltv > 0
+                and projected['ltv'] >= max_ltv - self.risk_guard_band_ltv
+                and projected['ltv'] > previous['ltv']
+            ):
+                return True
+            
+            margin_requirements = self.risk_monitor.cex_margin_requirements or {}
+            for venue, margin_ratio in projected['margin_ratios'].items():
+                maintenance_margin = float(
+                    margin_requirements.get(venue, {}).get('MAINTENANCE_MARGIN', 0)
+                )
+                if (
+                    margin_ratio <= maintenance_margin + self.risk_guard_band_margin
+                    and margin_ratio < previous['margin_ratios'].get(venue, 1.0)
+                ):
+                    return True
+        except Exception as e:
+            self.logger.warning(f'Risk guard band check failed, running component chain: {e}')
+            return True
+        
+        return False
+    
     def _handle_position_refresh_trigger(self, timestamp: pd.Timestamp) -> Dict:
         """Handle position_refresh trigger - periodic position refresh with automatic settlements."""
         if self.execution_mode == 'backtest':
@@ -330,6 +481,7 @@ class PositionUpdateHandler:
             # Step 3: Calculate P&L
             self.pnl_monitor.update_state(timestamp, "position_update")
             pnl = self.pnl_monitor.get_latest_pnl()
+            self.chain_run_count += 1
             
             return {
                 'success': reconciliation_result['success'],
@@ -4,12 +4,21 @@ Mode-Agnostic Risk Monitor
 Provides mode-agnostic risk monitoring that works for both backtest and live modes.
 Calculates risks across all venues and provides generic risk logic.
 
+Per-tick ratios are evaluated in float64 over the exposure vector. With exact_audit
+(component_config.risk_monitor, on by default) any ratio within exact_audit_epsilon of
+a threshold is recomputed with the Decimal calculators before it is reported.
+
+For leveraged or perp-hedged books the result also carries a STRESS grid: LTV, CEX margin
+ratio and distance to liquidation under simultaneous price / LST depeg / funding shocks
+(core.math.stress_grid), evaluated in one batched computation per tick.
+
 Reference: docs/REFERENCE_ARCHITECTURE_CANONICAL.md - Section 7 (Generic vs Mode-Specific)
 Reference: docs/specs/06_RISK_MONITOR.md - Mode-agnostic risk calculation
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import logging
+import numpy as np
 import pandas as pd
 import os
 import uuid
@@ -22,9 +31,23 @@ from ...infrastructure.logging.domain_event_logger import DomainEventLogger
 from ...core.models.domain_events import RiskAssessment
 from ...core.errors.error_codes import ERROR_REGISTRY
 from ...core.utilities.risk_data_loader import RiskDataLoader
+from ...core.math.scenario_engine import get_scenario_asset
+from ...core.math.stress_grid import (
+    StressGrid,
+    build_exposure_layout,
+    position_value_usd,
+    stress_exposures,
+)
 
 logger = logging.getLogger(__name__)
 
+CEX_VENUES = ("binance", "bybit", "okx")
+DEFAULT_EXACT_AUDIT_EPSILON = 1e-6
+
+# Exposure buckets for the float path; CEX venue i uses long/short buckets 3 + 2i / 4 + 2i
+AAVE_COLLATERAL, AAVE_DEBT, UNTRACKED = 0, 1, 2
+N_BUCKETS = 3 + 2 * len(CEX_VENUES)
+
 
 class RiskMonitor:
     """Mode-agnostic risk monitor that works for both backtest and live modes"""
@@ -97,6 +120,28 @@ class RiskMonitor:
         self._load_risk_parameters()
         self._initialize_risk_parameters()
 
+        # Float fast path with Decimal audit near thresholds
+        risk_config = config.get("component_config", {}).get("risk_monitor", {}) or {}
+        exact_audit = risk_config.get("exact_audit")
+        self.exact_audit = True if exact_audit is None else bool(exact_audit)
+        self.exact_audit_epsilon = float(
+            risk_config.get("exact_audit_epsilon") or DEFAULT_EXACT_AUDIT_EPSILON
+        )
+        self.exact_audit_count = 0
+        self._exposure_layouts: Dict[Tuple[str, ...], Tuple[np.ndarray, np.ndarray, List]] = {}
+        self._cache_float_parameters()
+
+        # Shock grid; on by default for books with AAVE debt or perp hedges
+        stress_config = risk_config.get("stress_grid") or {}
+        stress_enabled = stress_config.get("enabled")
+        if stress_enabled is None:
+            stress_enabled = self.leverage_enabled or any(
+                ":debtToken:" in key or ":Perp:" in key for key in self.position_subscriptions
+            )
+        self.stress_grid = StressGrid.from_config(stress_config) if stress_enabled else None
+        self.stress_asset = get_scenario_asset(config)
+        self._stress_layouts: Dict[Tuple[str, ...], Tuple[np.ndarray, np.ndarray]] = {}
+
     def check_component_health(self) -> Dict[str, Any]:
         """Check component health status."""
         return {
@@ -115,7 +160,7 @@ class RiskMonitor:
         timestamp = datetime.now().isoformat()
         real_utc = datetime.now(timezone.utc).isoformat()
 
-        assessment = RiskAssessment(
+        assessment = RiskAssessment.model_construct(
             timestamp=timestamp,
             real_utc_time=real_utc,
             correlation_id=self.correlation_id,
@@ -271,29 +316,38 @@ class RiskMonitor:
             - maintenance_margin_ratio: Strategy risk config maintenance margin ratio
         """
         try:
-            # Calculate current LTV for AAVE positions
-            current_ltv = self._calculate_current_ltv(exposure_data)
-
-            # Calculate current margin ratios for CEX positions
-            cex_margin_ratios = self._calculate_cex_margin_ratios(exposure_data)
-
-            # Calculate health ratios
-            health_ratios = self._calculate_health_ratios(current_ltv, cex_margin_ratios)
+            # Float pass over the exposure vector
+            current_ltv, cex_margin_ratios = self._calculate_risk_ratios_fast(exposure_data)
+            health_ratios = self._calculate_health_ratios_fast(current_ltv, cex_margin_ratios)
 
-            # Calculate maintenance margin ratios
-            maintenance_margin_ratios = self._calculate_maintenance_margin_ratios(cex_margin_ratios)
+            # Exact Decimal pass only when a ratio is too close to a threshold to trust float
+            exact_audit = self.exact_audit and self._near_threshold(
+                current_ltv, cex_margin_ratios, health_ratios
+            )
+            if exact_audit:
+                current_ltv, cex_margin_ratios, health_ratios = self._calculate_risk_ratios_exact(
+                    exposure_data
+                )
+                self.exact_audit_count += 1
 
             risk_result = {
                 "timestamp": timestamp,
-                "CURRENT_LTV": float(current_ltv),
-                "target_ltv": float(self.target_ltv),
-                "cex_margin_ratios": {k: float(v) for k, v in cex_margin_ratios.items()},
-                "cex_target_margins": {k: float(v) for k, v in self.cex_target_margins.items()},
+                "CURRENT_LTV": current_ltv,
+                "target_ltv": self._target_ltv_f,
+                "cex_margin_ratios": cex_margin_ratios,
+                "cex_target_margins": dict(self._cex_target_margins_f),
                 "HEALTH_RATIOS": health_ratios,
-                "maintenance_margin_ratios": maintenance_margin_ratios,
-                "aave_liquidation_threshold": float(self.aave_liquidation_threshold_emode),
-                "aave_max_ltv": float(self.aave_max_ltv_emode),
+                "maintenance_margin_ratios": {
+                    venue: self._cex_target_margins_f[venue]
+                    for venue in cex_margin_ratios
+                    if venue in self._cex_target_margins_f
+                },
+                "aave_liquidation_threshold": self._aave_liquidation_threshold_f,
+                "aave_max_ltv": self._aave_max_ltv_f,
+                "exact_audit": exact_audit,
             }
+            if self.stress_grid is not None:
+                risk_result["STRESS"] = self._calculate_stress_grid(exposure_data)
 
             self._update_last_risks(risk_result, timestamp)
 
@@ -319,6 +373,168 @@ class RiskMonitor:
                 "maintenance_margin_ratios": {},
             }
 
+    def _cache_float_parameters(self) -> None:
+        """Cache float copies of the Decimal risk parameters used on every tick."""
+        self._target_ltv_f = float(self.target_ltv)
+        self._aave_max_ltv_f = float(self.aave_max_ltv_emode)
+        self._aave_liquidation_threshold_f = float(self.aave_liquidation_threshold_emode)
+        self._cex_target_margins_f = {k: float(v) for k, v in self.cex_target_margins.items()}
+        self._cex_liquidation_thresholds_f = {
+            venue: float(requirements["liquidation_threshold"])
+            for venue, requirements in self.cex_margin_requirements.items()
+        }
+        self._ltv_thresholds = (
+            self._target_ltv_f,
+            self._aave_max_ltv_f,
+            self._aave_liquidation_threshold_f,
+        )
+        self._margin_thresholds = {
+            venue: tuple(float(value) for value in requirements.values())
+            + ((self._cex_target_margins_f[venue],) if venue in self._cex_target_margins_f else ())
+            for venue, requirements in self.cex_margin_requirements.items()
+        }
+
+    def _exposure_layout(self, keys: Tuple[str, ...]) -> Tuple[np.ndarray, np.ndarray, List]:
+        """
+        Bucket ids for a set of instrument keys, cached per key set.
+
+        Returns:
+            (base bucket per key, 1 where a non-positive amount moves the key to the short
+            bucket, CEX venues present)
+        """
+        layout = self._exposure_layouts.get(keys)
+        if layout is not None:
+            return layout
+
+        buckets = np.full(len(keys), UNTRACKED, dtype=np.intp)
+        short_if_flat = np.zeros(len(keys), dtype=np.intp)
+        venues = []
+        for i, instrument_key in enumerate(keys):
+            lowered = instrument_key.lower()
+            venue = instrument_key.split(":")[0] if ":" in instrument_key else "unknown"
+            if "aave" in lowered:
+                if "aToken" in instrument_key:
+                    buckets[i] = AAVE_COLLATERAL
+                elif "debt" in lowered or "borrow" in lowered:
+                    buckets[i] = AAVE_DEBT
+            elif venue in CEX_VENUES:
+                buckets[i] = 3 + 2 * CEX_VENUES.index(venue)
+                short_if_flat[i] = 0 if "spot" in lowered else 1
+                if venue not in venues:
+                    venues.append(venue)
+
+        layout = (buckets, short_if_flat, venues)
+        self._exposure_layouts[keys] = layout
+        return layout
+
+    def _calculate_risk_ratios_fast(self, exposure_data: Dict) -> Tuple[float, Dict[str, float]]:
+        """AAVE LTV and CEX margin ratios in float64 over the exposure vector."""
+        exposures = exposure_data.get("exposures", {})
+        buckets, short_if_flat, venues = self._exposure_layout(tuple(exposures))
+
+        count = len(exposures)
+        values = np.fromiter(
+            (position_value_usd(position) for position in exposures.values()), float, count
+        )
+        amounts = np.fromiter(
+            (position.get("amount", 0) or 0 for position in exposures.values()), float, count
+        )
+        totals = np.bincount(
+            buckets + short_if_flat * (amounts <= 0), weights=values, minlength=N_BUCKETS
+        )
+        return self._risk_ratios_from_totals(totals, venues)
+
+    def _risk_ratios_from_totals(
+        self, totals: np.ndarray, venues: List[str]
+    ) -> Tuple[float, Dict[str, float]]:
+        """AAVE LTV and CEX margin ratios from bucket totals (see _exposure_layout)."""
+        collateral = totals[AAVE_COLLATERAL]
+        current_ltv = float(totals[AAVE_DEBT] / collateral) if collateral > 0 else 0.0
+
+        cex_margin_ratios = {}
+        for venue in venues:
+            if venue in self.cex_margin_requirements:
+                long_value = totals[3 + 2 * CEX_VENUES.index(venue)]
+                total_value = long_value + totals[4 + 2 * CEX_VENUES.index(venue)]
+                cex_margin_ratios[venue] = (
+                    float(long_value / total_value) if total_value > 0 else 1.0
+                )
+
+        return current_ltv, cex_margin_ratios
+
+    def _calculate_health_ratios_fast(
+        self, current_ltv: float, cex_margin_ratios: Dict[str, float]
+    ) -> Dict[str, float]:
+        """Float counterpart of _calculate_health_ratios."""
+        health_ratios = {
+            "aave": self._aave_liquidation_threshold_f / current_ltv if current_ltv > 0 else 999.0
+        }
+        for venue, margin_ratio in cex_margin_ratios.items():
+            if venue in self._cex_liquidation_thresholds_f:
+                health_ratios[f"cex_{venue}"] = (
+                    self._cex_liquidation_thresholds_f[venue] / margin_ratio
+                    if margin_ratio > 0
+                    else 999.0
+                )
+        return health_ratios
+
+    def _near_threshold(
+        self,
+        current_ltv: float,
+        cex_margin_ratios: Dict[str, float],
+        health_ratios: Dict[str, float],
+    ) -> bool:
+        """Whether any float ratio is within exact_audit_epsilon of a threshold it is compared to."""
+        epsilon = self.exact_audit_epsilon
+        if current_ltv > 0 and any(abs(current_ltv - t) <= epsilon for t in self._ltv_thresholds):
+            return True
+        for venue, margin_ratio in cex_margin_ratios.items():
+            thresholds = self._margin_thresholds.get(venue, ())
+            if any(abs(margin_ratio - t) <= epsilon for t in thresholds):
+                return True
+        return any(abs(ratio - 1.0) <= epsilon for ratio in health_ratios.values())
+
+    def _calculate_risk_ratios_exact(
+        self, exposure_data: Dict
+    ) -> Tuple[float, Dict[str, float], Dict[str, float]]:
+        """Decimal LTV, CEX margin and health ratios, reported as floats."""
+        current_ltv = self._calculate_current_ltv(exposure_data)
+        cex_margin_ratios = self._calculate_cex_margin_ratios(exposure_data)
+        health_ratios = self._calculate_health_ratios(current_ltv, cex_margin_ratios)
+        return (
+            float(current_ltv),
+            {k: float(v) for k, v in cex_margin_ratios.items()},
+            {k: float(v) for k, v in health_ratios.items()},
+        )
+
+    def _calculate_stress_grid(self, exposure_data: Dict) -> Optional[Dict[str, Any]]:
+        """LTV, margin ratio and liquidation distance surfaces over the stress grid."""
+        try:
+            exposures = exposure_data.get("exposures", {})
+            keys = tuple(exposures)
+            layout = self._stress_layouts.get(keys)
+            if layout is None:
+                layout = build_exposure_layout(keys, self.stress_asset)
+                self._stress_layouts[keys] = layout
+
+            return stress_exposures(
+                exposures,
+                self.stress_asset,
+                self.stress_grid,
+                self._aave_liquidation_threshold_f,
+                self._cex_liquidation_thresholds_f,
+                layout=layout,
+            )
+
+        except Exception as e:
+            self.logger.error(
+                f"Error evaluating stress grid: {e}",
+                error_code="RISK-007",
+                exc_info=e,
+                operation="STRESS_GRID",
+            )
+            return None
+
     def _calculate_current_ltv(self, exposure_data: Dict) -> Decimal:
         """Calculate current LTV for AAVE positions."""
         try:
@@ -331,7 +547,7 @@ class RiskMonitor:
             for instrument_key, position_data in exposures.items():
                 if "aave" in instrument_key.lower():
                     amount = Decimal(str(position_data.get("amount", 0)))
-                    value_usd = Decimal(str(position_data.get("VALUE_USD", 0)))
+                    value_usd = Decimal(str(position_value_usd(position_data)))
 
                     # Determine if it's collateral or debt based on position type
                     if "aToken" in instrument_key:  # Collateral
@@ -370,7 +586,7 @@ class RiskMonitor:
                         venue_positions[venue] = {"long": Decimal("0"), "short": Decimal("0")}
 
                     amount = Decimal(str(position_data.get("amount", 0)))
-                    value_usd = Decimal(str(position_data.get("VALUE_USD", 0)))
+                    value_usd = Decimal(str(position_value_usd(position_data)))
 
                     # Determine if long or short position (simplified logic)
                     if "spot" in instrument_key.lower() or amount > 0:
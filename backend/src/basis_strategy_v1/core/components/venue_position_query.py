@@ -0,0 +1,291 @@
+"""
+Venue Position Query
+
+Concurrent live position queries across venue position interfaces for PositionMonitor.
+
+Key Principles:
+- All venues are queried at once, so a refresh takes as long as the slowest venue
+  (bounded by its timeout), not the sum of round-trips; the tick blocks only until every
+  venue answered or timed out
+- Async get_positions coroutines run on the loop that owns the interfaces (bind_loop)
+  when queried from another thread, e.g. the live loop's worker thread; otherwise on a
+  private event loop thread
+- Sync implementations run in a dedicated thread pool with at most one call in flight
+  per venue: a call still running from an earlier tick (threads cannot be cancelled)
+  makes the venue report 'busy' instead of starting another
+- Per-venue timeout (timeout_seconds, overridable per venue); a timed-out coroutine is
+  cancelled rather than left running into the next tick
+- A venue that times out, fails or is busy reuses its last good result, flagged stale
+  with its age, until max_staleness_seconds (None: reuse indefinitely)
+- Results are returned in interface order whatever order venues answer in
+- Metrics per venue: query latency percentiles, timeouts, errors, busy skips, stale reuses
+
+Configure with `component_config.position_monitor.venue_query: {timeout_seconds,
+venue_timeouts, max_staleness_seconds}`.
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT_SECONDS = 5.0
+DEFAULT_MAX_STALENESS_SECONDS = 300.0
+
+# Recent query latencies kept per venue for percentiles
+LATENCY_WINDOW = 500
+
+
+@dataclass
+class VenueQueryResult:
+    """Outcome of one venue's position query in a refresh."""
+
+    venue: str
+    status: str  # 'ok', 'timeout', 'error' or 'busy'
+    positions: Optional[Dict[str, Any]] = None
+    latency_seconds: float = 0.0
+    error: Optional[str] = None
+    stale: bool = False
+    age_seconds: float = 0.0
+    fetched_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "stale": self.stale,
+            "age_seconds": self.age_seconds,
+            "latency_ms": self.latency_seconds * 1000.0,
+            "error": self.error,
+        }
+
+
+@dataclass
+class _VenueStats:
+    queries: int = 0
+    timeouts: int = 0
+    errors: int = 0
+    busy_skips: int = 0
+    stale_reuses: int = 0
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+
+class VenuePositionQuery:
+    """Runs venue position queries concurrently with per-venue timeouts and stale reuse."""
+
+    def __init__(
+        self,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        venue_timeouts: Optional[Dict[str, float]] = None,
+        max_staleness_seconds: Optional[float] = DEFAULT_MAX_STALENESS_SECONDS,
+    ):
+        """
+        Initialize venue position query.
+
+        Args:
+            timeout_seconds: Default per-venue query timeout
+            venue_timeouts: Per-venue overrides of timeout_seconds
+            max_staleness_seconds: Oldest last-good result reused for a slow or failing
+                venue (None: no limit)
+        """
+        if timeout_seconds <= 0:
+            raise ValueError(f"timeout_seconds must be positive, got {timeout_seconds}")
+
+        self.timeout_seconds = float(timeout_seconds)
+        self.venue_timeouts = {k: float(v) for k, v in (venue_timeouts or {}).items()}
+        self.max_staleness_seconds = max_staleness_seconds
+
+        self._last_good: Dict[str, VenueQueryResult] = {}
+        self._stats: Dict[str, _VenueStats] = {}
+        self._in_flight: Dict[str, Future] = {}
+        self._owner_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "VenuePositionQuery":
+        """Query settings from component_config.position_monitor.venue_query."""
+        query_config = (
+            config.get("component_config", {}).get("position_monitor", {}).get("venue_query")
+            or {}
+        )
+        return cls(
+            timeout_seconds=float(query_config.get("timeout_seconds", DEFAULT_TIMEOUT_SECONDS)),
+            venue_timeouts=query_config.get("venue_timeouts"),
+            max_staleness_seconds=query_config.get(
+                "max_staleness_seconds", DEFAULT_MAX_STALENESS_SECONDS
+            ),
+        )
+
+    def timeout_for(self, venue: str) -> float:
+        return self.venue_timeouts.get(venue, self.timeout_seconds)
+
+    def bind_loop(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """Set the event loop that owns the venue interfaces (their sessions and clients)."""
+        self._owner_loop = loop
+
+    def query(
+        self, interfaces: Dict[str, Any], timestamp: pd.Timestamp
+    ) -> Dict[str, VenueQueryResult]:
+        """
+        Query every interface's get_positions(timestamp) concurrently.
+
+        Safe to call from inside a running event loop (the queries then run on the
+        private loop); called from another thread, async interfaces run on the bound
+        owning loop.
+
+        Returns:
+            venue -> result, in interface order; failed or timed-out venues carry their
+            last good positions flagged stale, or positions None once that is too old
+        """
+        venues = {venue: interface for venue, interface in interfaces.items() if interface}
+        if not venues:
+            return {}
+
+        loop = self._query_loop()
+        future = asyncio.run_coroutine_threadsafe(self._query_all(venues, timestamp), loop)
+        # Every venue is bounded by its own timeout; the margin covers scheduling
+        limit = max(self.timeout_for(venue) for venue in venues) + 1.0
+        results = future.result(timeout=limit)
+        return {venue: self._resolve(results[venue]) for venue in venues}
+
+    async def _query_all(
+        self, venues: Dict[str, Any], timestamp: pd.Timestamp
+    ) -> Dict[str, VenueQueryResult]:
+        results = await asyncio.gather(
+            *(self._query_one(venue, interface, timestamp) for venue, interface in venues.items())
+        )
+        return {result.venue: result for result in results}
+
+    async def _query_one(
+        self, venue: str, interface: Any, timestamp: pd.Timestamp
+    ) -> VenueQueryResult:
+        started = time.perf_counter()
+        pending = self._in_flight.get(venue)
+        if pending is not None and not pending.done():
+            return VenueQueryResult(venue, "busy", error="previous query still running")
+        try:
+            if inspect.iscoroutinefunction(interface.get_positions):
+                call = interface.get_positions(timestamp)
+            else:
+                submitted = self._get_executor().submit(interface.get_positions, timestamp)
+                self._in_flight[venue] = submitted
+                call = asyncio.wrap_future(submitted)
+            positions = await asyncio.wait_for(call, self.timeout_for(venue))
+            if inspect.isawaitable(positions):
+                positions = await asyncio.wait_for(positions, self.timeout_for(venue))
+            status, error = "ok", None
+        except asyncio.TimeoutError:
+            positions, status = None, "timeout"
+            error = f"no response within {self.timeout_for(venue)}s"
+        except Exception as e:
+            positions, status, error = None, "error", str(e)
+        return VenueQueryResult(
+            venue,
+            status,
+            positions=positions,
+            latency_seconds=time.perf_counter() - started,
+            error=error,
+            fetched_at=time.time() if status == "ok" else None,
+        )
+
+    def _resolve(self, result: VenueQueryResult) -> VenueQueryResult:
+        """Record stats; substitute the last good positions for a failed venue."""
+        stats = self._stats.setdefault(result.venue, _VenueStats())
+        stats.queries += 1
+        if result.status != "busy":
+            stats.latencies.append(result.latency_seconds)
+        if result.status == "ok":
+            self._last_good[result.venue] = result
+            return result
+
+        if result.status == "timeout":
+            stats.timeouts += 1
+        elif result.status == "busy":
+            stats.busy_skips += 1
+        else:
+            stats.errors += 1
+        last_good = self._last_good.get(result.venue)
+        if last_good is not None:
+            result.age_seconds = time.time() - last_good.fetched_at
+            limit = self.max_staleness_seconds
+            if limit is None or result.age_seconds <= limit:
+                result.positions = last_good.positions
+                result.fetched_at = last_good.fetched_at
+                result.stale = True
+                stats.stale_reuses += 1
+        return result
+
+    def _query_loop(self) -> asyncio.AbstractEventLoop:
+        """The owning loop when called from another thread, else the private loop."""
+        owner = self._owner_loop
+        if owner is not None and owner.is_running():
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is not owner:
+                return owner
+        return self._ensure_loop()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(thread_name_prefix="venue-position-query")
+            return self._executor
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or not self._thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="venue-position-query", daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def close(self) -> None:
+        """Stop the query loop thread and thread pool (restarted on the next query)."""
+        with self._lock:
+            if self._executor is not None:
+                # Calls still running are abandoned, not waited for
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join(timeout=1.0)
+                self._loop.close()
+                self._loop = None
+                self._thread = None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Per-venue query counts, timeouts, errors, busy skips, stale reuses and latency (ms)."""
+        metrics = {}
+        for venue, stats in self._stats.items():
+            ordered = sorted(stats.latencies)
+            metrics[venue] = {
+                "queries": stats.queries,
+                "timeouts": stats.timeouts,
+                "errors": stats.errors,
+                "busy_skips": stats.busy_skips,
+                "stale_reuses": stats.stale_reuses,
+                "timeout_seconds": self.timeout_for(venue),
+                "latency_ms": {
+                    "p50": ordered[len(ordered) // 2] * 1000.0 if ordered else None,
+                    "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000.0
+                    if ordered
+                    else None,
+                    "max": ordered[-1] * 1000.0 if ordered else None,
+                },
+            }
+        return metrics
@@ -36,6 +36,7 @@ ERROR_REGISTRY = {
     "RISK-004": "Risk limit breach detected",
     "RISK-005": "Liquidation threshold exceeded",
     "RISK-006": "Risk assessment failed",
+    "RISK-007": "Stress grid evaluation failed",
     # PnL Monitor (PNL-XXX)
     "PNL-001": "PnL calculation failed",
     "PNL-002": "Missing price data",
@@ -33,8 +33,13 @@ from ..strategies.base_strategy_manager import BaseStrategyManager
 from ..components.position_update_handler import PositionUpdateHandler
 from ..execution.execution_manager import ExecutionManager
 from ..execution.venue_interface_manager import VenueInterfaceManager
+from .sparse_stepping import SparseStepper, get_stepping_mode
+from .live_scheduler import LiveScheduler
+from .risk_watchdog import RiskWatchdog
 from ..interfaces.venue_interface_factory import VenueInterfaceFactory
 from ...infrastructure.persistence.async_results_store import AsyncResultsStore
+from ...infrastructure.data.market_tape import RecordingDataProvider, get_tape_recorder
+from ...infrastructure.persistence.backtest_checkpoint import get_checkpoint_interval, save_checkpoint
 from ...core.utilities.utility_manager import UtilityManager
 from ..health import (
     system_health_aggregator,
@@ -43,7 +48,10 @@ from ..health import (
     RiskMonitorHealthChecker,
     EventLoggerHealthChecker,
 )
-from ...infrastructure.logging.log_directory_manager import LogDirectoryManager
+from ...infrastructure.logging.log_directory_manager import (
+    LogDirectoryManager,
+    attach_component_log_file,
+)
 from ...infrastructure.logging.structured_logger import StructuredLogger
 
 logger = logging.getLogger(__name__)
@@ -51,21 +59,7 @@ logger = logging.getLogger(__name__)
 # Create dedicated event engine logger
 event_engine_logger = logging.getLogger("event_engine")
 event_engine_logger.setLevel(logging.INFO)
-
-# Create logs directory if it doesn't exist
-logs_dir = Path(__file__).parent.parent.parent.parent / "logs"
-logs_dir.mkdir(exist_ok=True)
-
-# Create file handler for event engine logs
-event_engine_handler = logging.FileHandler(logs_dir / "event_engine.log")
-event_engine_handler.setLevel(logging.INFO)
-
-# Create formatter
-event_engine_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-event_engine_handler.setFormatter(event_engine_formatter)
-
-# Add handler to logger
-event_engine_logger.addHandler(event_engine_handler)
+# Its log file is attached on first construction, not at import
 
 
 class EventDrivenStrategyEngine:
@@ -121,6 +115,8 @@ class EventDrivenStrategyEngine:
         # Initialize equity curve data collection for backtest results
         self.equity_curve_data = []
 
+        attach_component_log_file(event_engine_logger, "event_engine.log")
+
         # Create log directory structure
         self.log_dir = LogDirectoryManager.create_run_logs(
             correlation_id=self.correlation_id,
@@ -294,6 +290,23 @@ class EventDrivenStrategyEngine:
         # Event loop state
         self.current_timestamp = None
         self.is_running = False
+        self.last_timestep_order_count = 0
+        self.stepping_stats = {"mode": "dense"}
+        # Live loop cadence and triggers (created by run_live)
+        self.live_scheduler: Optional[LiveScheduler] = None
+        self.risk_watchdog: Optional[RiskWatchdog] = None
+        # Set by LiveTradingService: async callable(reason) running its emergency stop
+        self.emergency_stop_handler = None
+        self.last_exposure: Optional[Dict] = None
+        self.last_risk_assessment: Optional[Dict] = None
+
+        # Checkpoint identity (set by BacktestService; defaults to the results request_id)
+        self.checkpoint_id: Optional[str] = None
+        self.checkpoint_metadata: Dict[str, Any] = {}
+        self.last_checkpoint_path: Optional[Path] = None
+
+        # Active backtest run (set by start_backtest_run)
+        self._backtest_run: Optional[Dict[str, Any]] = None
 
         # Register components with health system
         self._register_components_with_health_system()
@@ -324,36 +337,39 @@ class EventDrivenStrategyEngine:
                 ExecutionManagerHealthChecker,
             )
 
-            # Register all core components
-            system_health_aggregator.register_component(
-                "position_monitor", PositionMonitorHealthChecker(self.position_monitor)
-            )
-            system_health_aggregator.register_component(
-                "data_provider", DataProviderHealthChecker(self.data_provider)
-            )
-            system_health_aggregator.register_component(
-                "exposure_monitor", ExposureMonitorHealthChecker(self.exposure_monitor)
-            )
-            system_health_aggregator.register_component(
-                "risk_monitor", RiskMonitorHealthChecker(self.risk_monitor)
-            )
-            system_health_aggregator.register_component(
-                "pnl_monitor", PnLMonitorHealthChecker(self.pnl_monitor)
-            )
-            system_health_aggregator.register_component(
-                "strategy_manager", StrategyManagerHealthChecker(self.strategy_manager)
-            )
-            system_health_aggregator.register_component(
-                "execution_manager", ExecutionManagerHealthChecker(self.execution_manager)
-            )
-            system_health_aggregator.register_component(
-                "event_logger", EventLoggerHealthChecker(self.event_logger)
-            )
+            # Register all core components (kept so release_resources can unregister them)
+            self._health_checkers = {
+                "position_monitor": PositionMonitorHealthChecker(self.position_monitor),
+                "data_provider": DataProviderHealthChecker(self.data_provider),
+                "exposure_monitor": ExposureMonitorHealthChecker(self.exposure_monitor),
+                "risk_monitor": RiskMonitorHealthChecker(self.risk_monitor),
+                "pnl_monitor": PnLMonitorHealthChecker(self.pnl_monitor),
+                "strategy_manager": StrategyManagerHealthChecker(self.strategy_manager),
+                "execution_manager": ExecutionManagerHealthChecker(self.execution_manager),
+                "event_logger": EventLoggerHealthChecker(self.event_logger),
+            }
+            for component_name, health_checker in self._health_checkers.items():
+                system_health_aggregator.register_component(component_name, health_checker)
 
             logger.info("All 8 main components registered with health system")
         except Exception as e:
             logger.error(f"Failed to register components with health system: {e}")
 
+    def release_resources(self) -> None:
+        """
+        Release references held after a run completes.
+
+        Unregisters this engine's health checkers (the global aggregator would
+        otherwise keep every component and the data provider alive) and drops
+        the collected equity curve, which has already been returned in results.
+        """
+        from ..health import system_health_aggregator
+
+        for component_name, health_checker in getattr(self, "_health_checkers", {}).items():
+            system_health_aggregator.unregister_component(component_name, health_checker)
+        self._health_checkers = {}
+        self.equity_curve_data = []
+
     def _handle_error(self, error: Exception, context: str = "") -> None:
         """Handle errors with structured error handling."""
         self.error_count += 1
@@ -375,13 +391,17 @@ class EventDrivenStrategyEngine:
         elif self.error_count > 5:
             self.health_status = "degraded"
 
-    async def run_backtest(self, start_date: str, end_date: str) -> Dict[str, Any]:
+    async def run_backtest(
+        self, start_date: str, end_date: str, resume_state: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Run a complete backtest using all components.
 
         Args:
             start_date: Start date for backtest (YYYY-MM-DD) - REQUIRED
             end_date: End date for backtest (YYYY-MM-DD) - REQUIRED
+            resume_state: Checkpoint state to continue from; only ticks after the
+                checkpointed timestamp are processed
 
         Returns:
             Dictionary containing backtest results
@@ -400,6 +420,43 @@ class EventDrivenStrategyEngine:
         # Reference: docs/WORKFLOW_GUIDE.md - Time-Triggered Workflow (Primary) section
         # Status: PENDING
         """
+        try:
+            timestamps = await self.start_backtest_run(start_date, end_date, resume_state)
+
+            # Run backtest loop with component orchestration
+            # Note: Initial capital is handled automatically by Position Monitor on first position_refresh
+            # See: docs/POSITION_MONITOR_REFACTOR_DESIGN.md - Phase 3: 2-Trigger System
+            for timestamp in timestamps:
+                await self.step_backtest_run(timestamp)
+
+            return await self.finish_backtest_run()
+
+        except Exception as e:
+            logger.error(f"Backtest failed: {e}")
+            # Ensure results store is stopped even on error
+            await self.abort_backtest_run()
+            raise
+
+    def get_tick_frequency(self) -> str:
+        """Backtest tick frequency: ML strategies use 5-minute intervals, others hourly."""
+        if self.mode in ["ml_btc_directional_usdt_margin", "ml_usdt_directional_usdt_margin"]:
+            return "5min"
+        return "h"
+
+    async def start_backtest_run(
+        self, start_date: str, end_date: str, resume_state: Optional[Dict[str, Any]] = None
+    ) -> pd.DatetimeIndex:
+        """
+        Prepare a backtest run: validate dates, start the results store, restore a
+        checkpoint and plan the ticks. Followed by step_backtest_run() per tick and
+        finish_backtest_run(); run_backtest() and PortfolioBacktestRunner drive these.
+
+        Returns:
+            pd.DatetimeIndex: Ticks this engine runs on
+
+        Raises:
+            ValueError: If start_date or end_date is not provided or invalid
+        """
         # Validate required parameters
         if not start_date:
             raise ValueError("start_date is required for backtest")
@@ -431,78 +488,203 @@ class EventDrivenStrategyEngine:
 
         logger.info(f"Starting backtest for {self.mode} mode from {start_date} to {end_date}")
 
+        # Phase 3: Data provider is already loaded with all data at startup
+        # No need to reload data - just verify it's available for the date range
         try:
-            # Phase 3: Data provider is already loaded with all data at startup
-            # No need to reload data - just verify it's available for the date range
-            try:
-                # Get data using canonical pattern
-                data = self.data_provider.get_data(start_dt)
-                test_snapshot = data["market_data"]
-                if not test_snapshot or len(test_snapshot) <= 1:  # Only timestamp
-                    raise ValueError(f"No market data available for start date {start_date}")
-            except Exception as e:
-                raise ValueError(
-                    f"No data available for backtest date range {start_date} to {end_date}: {e}"
-                )
+            # Get data using canonical pattern
+            data = self.data_provider.get_data(start_dt)
+            test_snapshot = data["market_data"]
+            if not test_snapshot or len(test_snapshot) <= 1:  # Only timestamp
+                raise ValueError(f"No market data available for start date {start_date}")
+        except Exception as e:
+            raise ValueError(
+                f"No data available for backtest date range {start_date} to {end_date}: {e}"
+            )
 
-            logger.info(f"Data loaded successfully for backtest")
+        logger.info(f"Data loaded successfully for backtest")
 
-            # Generate unique request ID for this backtest
-            request_id = str(uuid.uuid4())
+        # Generate unique request ID for this backtest
+        request_id = str(uuid.uuid4())
 
-            # Start async results store
-            await self.results_store.start()
+        # Start async results store
+        await self.results_store.start()
 
-            # Initialize results tracking (minimal for async storage)
-            results = {"config": self.config, "start_date": start_date, "end_date": end_date}
+        resume_after = None
+        if resume_state:
+            resume_after = self.restore_checkpoint_state(resume_state)
+            if resume_state["results"]["request_id"]:
+                # Resumed runs keep writing timesteps under the original request
+                request_id = resume_state["results"]["request_id"]
+                self.results_store.restore_offsets(request_id, resume_state["results"]["offsets"])
+            logger.info(f"Resuming backtest after checkpointed timestamp {resume_after}")
 
-            # Generate timestamps for backtest based on strategy mode
-            # ML strategies use 5-minute intervals, others use hourly
-            if self.mode in ["ml_btc_directional_usdt_margin", "ml_usdt_directional_usdt_margin"]:
-                freq = "5min"  # 5-minute intervals for ML strategies
-                logger.info("Using 5-minute intervals for ML strategy")
-            else:
-                freq = "H"  # Hourly intervals for traditional strategies
-                logger.info("Using hourly intervals for traditional strategy")
+        # Generate timestamps for backtest based on strategy mode
+        freq = self.get_tick_frequency()
+        logger.info(f"Using {freq} intervals for {self.mode}")
+
+        timestamps = pd.date_range(start=start_dt, end=end_dt, freq=freq, tz="UTC")
+        if resume_after is not None:
+            timestamps = timestamps[timestamps > resume_after]
 
-            timestamps = pd.date_range(start=start_dt, end=end_dt, freq=freq, tz="UTC")
+        logger.info(
+            f"Running backtest for {len(timestamps)} timestamps from {start_date} to {end_date}"
+        )
 
+        # Sparse stepping runs the component chain only on ticks that can change state
+        stepper = (
+            SparseStepper(self.config, self.position_monitor, self.data_provider, timestamps)
+            if get_stepping_mode(self.config) == "sparse"
+            else None
+        )
+        if stepper and resume_state and resume_state.get("stepper"):
+            stepper.restore_checkpoint_state(resume_state["stepper"])
+
+        self._backtest_run = {
+            "request_id": request_id,
+            "start_date": start_date,
+            "end_date": end_date,
+            "stepper": stepper,
+            "tick_count": len(timestamps),
+            "last_timestamp": timestamps[-1] if len(timestamps) else None,
+            "checkpoint_every": get_checkpoint_interval(),
+            "processed_ticks": 0,
+        }
+        return timestamps
+
+    async def step_backtest_run(
+        self, timestamp: pd.Timestamp, market_data: Optional[Dict] = None
+    ) -> bool:
+        """
+        Advance the run by one tick.
+
+        Args:
+            timestamp: Tick timestamp
+            market_data: Shared market data snapshot (fetched from the data provider if None)
+
+        Returns:
+            bool: True if the tick ran the component chain, False if skipped (skipped
+                ticks still get an accrued equity curve point)
+        """
+        run = self._backtest_run
+        stepper = run["stepper"]
+        if stepper and not stepper.should_process(
+            timestamp, is_last=timestamp == run["last_timestamp"]
+        ):
+            self._accrue_equity_point(timestamp)
+            return False
+
+        if market_data is None:
+            try:
+                # Get market data snapshot for this timestamp using canonical pattern
+                data = self.data_provider.get_data(timestamp)
+                market_data = data["market_data"]
+            except Exception as e:
+                logger.warning(f"Skipping timestamp {timestamp} due to missing data: {e}")
+                return False
+
+        self._process_timestep(timestamp, market_data, run["request_id"])
+        if stepper:
+            stepper.record_processed(timestamp, self.last_timestep_order_count)
+        run["processed_ticks"] += 1
+        if run["checkpoint_every"] and run["processed_ticks"] % run["checkpoint_every"] == 0:
+            await self._write_checkpoint()
+        return True
+
+    async def finish_backtest_run(self) -> Dict[str, Any]:
+        """Write the final checkpoint and results, and stop the results store."""
+        run = self._backtest_run
+        stepper = run["stepper"]
+
+        # Final checkpoint (before the final P&L pass) lets completed runs be extended
+        await self._write_checkpoint(completed=True)
+
+        if stepper:
+            self.stepping_stats = stepper.get_stats()
             logger.info(
-                f"Running backtest for {len(timestamps)} timestamps from {start_date} to {end_date}"
+                f"Sparse stepping processed {stepper.processed} of {run['tick_count']} ticks: {stepper.reasons}"
             )
 
-            # Run backtest loop with component orchestration
-            # Note: Initial capital is handled automatically by Position Monitor on first position_refresh
-            # See: docs/POSITION_MONITOR_REFACTOR_DESIGN.md - Phase 3: 2-Trigger System
-            for timestamp in timestamps:
-                try:
-                    # Get market data snapshot for this timestamp using canonical pattern
-                    data = self.data_provider.get_data(timestamp)
-                    market_data = data["market_data"]
-                except Exception as e:
-                    logger.warning(f"Skipping timestamp {timestamp} due to missing data: {e}")
-                    continue
-                self._process_timestep(timestamp, market_data, request_id)
-            # Save final results and event log
-            final_results = self._calculate_final_results(results)
-            await self.results_store.save_final_result(request_id, final_results)
-            # Event logs are already saved to JSONL files by DomainEventLogger
-            # await self.results_store.save_event_log(request_id, self.event_logger._get_all_events())
+        # Save final results and event log
+        results = {"config": self.config, "start_date": run["start_date"], "end_date": run["end_date"]}
+        final_results = self._calculate_final_results(results)
+        await self.results_store.save_final_result(run["request_id"], final_results)
+        # Event logs are already saved to JSONL files by DomainEventLogger
+        # await self.results_store.save_event_log(request_id, self.event_logger._get_all_events())
 
-            # Stop async results store
+        # Stop async results store
+        await self.results_store.stop()
+        self._backtest_run = None
+
+        logger.info("Backtest completed successfully")
+        return final_results
+
+    async def abort_backtest_run(self) -> None:
+        """Stop the results store of a failed run."""
+        self._backtest_run = None
+        try:
             await self.results_store.stop()
+        except Exception as stop_error:
+            logger.error(f"Error stopping results store: {stop_error}")
 
-            logger.info("Backtest completed successfully")
-            return final_results
+    def get_checkpoint_state(self) -> Dict[str, Any]:
+        """Engine and component state needed to continue a backtest."""
+        return {
+            "engine": {
+                "current_timestamp": self.current_timestamp,
+                "equity_curve_data": self.equity_curve_data,
+                "last_timestep_order_count": self.last_timestep_order_count,
+            },
+            "position_monitor": self.position_monitor.get_checkpoint_state(),
+            "pnl_monitor": self.pnl_monitor.get_checkpoint_state(),
+            "strategy_manager": self.strategy_manager.get_checkpoint_state(),
+        }
 
+    def restore_checkpoint_state(self, state: Dict[str, Any]) -> pd.Timestamp:
+        """
+        Restore engine and component state from a checkpoint.
+
+        Returns:
+            pd.Timestamp: Last timestamp processed before the checkpoint
+        """
+        engine_state = state["engine"]
+        self.current_timestamp = engine_state["current_timestamp"]
+        self.equity_curve_data = list(engine_state["equity_curve_data"])
+        self.last_timestep_order_count = engine_state["last_timestep_order_count"]
+        self.position_monitor.restore_checkpoint_state(state["position_monitor"])
+        self.pnl_monitor.restore_checkpoint_state(state["pnl_monitor"])
+        self.strategy_manager.restore_checkpoint_state(state["strategy_manager"])
+        return self.current_timestamp
+
+    async def _write_checkpoint(self, completed: bool = False) -> None:
+        """Flush queued results and snapshot run state to the log directory."""
+        run = self._backtest_run
+        if self.current_timestamp is None:
+            return
+        try:
+            await self.results_store.flush()
+            stepper = run["stepper"]
+            state = self.get_checkpoint_state()
+            state.update(
+                {
+                    "metadata": self.checkpoint_metadata,
+                    "correlation_id": self.correlation_id,
+                    "mode": self.mode,
+                    "start_date": run["start_date"],
+                    "end_date": run["end_date"],
+                    "completed": completed,
+                    "stepper": stepper.get_checkpoint_state() if stepper else None,
+                    "results": {
+                        "request_id": run["request_id"],
+                        "offsets": self.results_store.get_offsets(run["request_id"]),
+                    },
+                }
+            )
+            self.last_checkpoint_path = save_checkpoint(
+                self.log_dir, self.checkpoint_id or run["request_id"], state
+            )
         except Exception as e:
-            logger.error(f"Backtest failed: {e}")
-            # Ensure results store is stopped even on error
-            try:
-                await self.results_store.stop()
-            except Exception as stop_error:
-                logger.error(f"Error stopping results store: {stop_error}")
-            raise
+            # A missed checkpoint only costs recomputation on resume
+            logger.warning(f"Failed to write backtest checkpoint at {self.current_timestamp}: {e}")
 
     def _process_timestep(self, timestamp: pd.Timestamp, market_data: Dict, request_id: str):
         """
@@ -512,6 +694,7 @@ class EventDrivenStrategyEngine:
         for each timestamp in the backtest.
         """
         self.current_timestamp = timestamp
+        self.last_timestep_order_count = 0
 
         try:
             # 1. Refresh positions (MODE-AGNOSTIC - called in BOTH backtest and live)
@@ -546,6 +729,7 @@ class EventDrivenStrategyEngine:
                 exposure_data=exposure, market_data=market_data, timestamp=timestamp
             )
             logger.info(f"Event Engine: Risk Monitor assess_risk completed")
+            self.last_risk_assessment = risk_assessment
 
             # RiskMonitor handles its own domain event logging
             # No need to log here - component will log RiskAssessment
@@ -567,6 +751,7 @@ class EventDrivenStrategyEngine:
 
             # 5. Execute orders if any (via ExecutionManager orchestration)
             if strategy_orders:
+                self.last_timestep_order_count = len(strategy_orders)
                 logger.info(
                     f"Event Engine: Strategy generated {len(strategy_orders)} orders to execute"
                 )
@@ -607,23 +792,12 @@ class EventDrivenStrategyEngine:
             current_exposure = self.exposure_monitor.calculate_exposure(
                 timestamp=timestamp, position_snapshot=current_position, market_data=market_data
             )
+            self.last_exposure = current_exposure
             
             # Get current P&L to calculate net value
             current_pnl = self.pnl_monitor.get_latest_pnl()
             pnl_cumulative = current_pnl.get("BALANCE_BASED", {}).get("PNL_CUMULATIVE", 0.0)
-            net_value = self.initial_capital + pnl_cumulative
-            gross_value = current_exposure.get("total_exposure", net_value)
-            
-            # Collect equity curve data point
-            equity_point = {
-                "timestamp": timestamp.isoformat(),
-                "net_value": net_value,
-                "gross_value": gross_value,
-                "positions": current_position.copy()  # Copy to avoid reference issues
-            }
-            self.equity_curve_data.append(equity_point)
-            
-            logger.debug(f"Event Engine: Collected equity curve point - timestamp: {timestamp}, net_value: {net_value}")
+            self._record_equity_point(timestamp, current_position, pnl_cumulative, current_exposure)
 
             # 8. Log events (async I/O - handled separately)
             # P0 FIX: Use strategy_orders instead of undefined strategy_decision
@@ -657,6 +831,41 @@ class EventDrivenStrategyEngine:
             )
             self._log_error_event(timestamp, str(e))
 
+    def _record_equity_point(
+        self,
+        timestamp: pd.Timestamp,
+        positions: Dict[str, float],
+        pnl_cumulative: float,
+        exposure: Dict[str, Any],
+    ) -> None:
+        """Append a point (net value from balance-based P&L) to the equity curve."""
+        net_value = self.initial_capital + pnl_cumulative
+        gross_value = exposure.get("total_exposure", net_value)
+
+        # Collect equity curve data point
+        equity_point = {
+            "timestamp": timestamp.isoformat(),
+            "net_value": net_value,
+            "gross_value": gross_value,
+            "positions": positions.copy(),  # Copy to avoid reference issues
+        }
+        self.equity_curve_data.append(equity_point)
+
+        logger.debug(f"Event Engine: Collected equity curve point - timestamp: {timestamp}, net_value: {net_value}")
+
+    def _accrue_equity_point(self, timestamp: pd.Timestamp) -> None:
+        """
+        Equity curve point for a tick skipped by sparse stepping.
+
+        Positions are unchanged across a skipped span (no orders, settlements or rewards
+        fall in it), so the point values the current positions at the tick's prices and
+        indexes exactly as a processed tick would, without running the component chain.
+        """
+        positions = self.position_monitor.get_current_positions()
+        pnl_cumulative = self.pnl_monitor.get_balance_pnl_at(positions, timestamp)
+        exposure = self.exposure_monitor.value_positions(timestamp, positions)
+        self._record_equity_point(timestamp, positions, pnl_cumulative, exposure)
+
     def _calculate_final_results(self, results: Dict) -> Dict[str, Any]:
         """Calculate final backtest results."""
 
@@ -695,6 +904,7 @@ class EventDrivenStrategyEngine:
                 "equity_curve": self.equity_curve_data,  # Include equity curve data
             },
             "final_pnl": final_pnl,
+            "pnl_attribution": self.pnl_monitor.calculate_run_attribution(),
             "final_position": current_position,
             "events": all_events,
             "config": self.config,
@@ -702,6 +912,7 @@ class EventDrivenStrategyEngine:
             "end_date": results["end_date"],
             "mode": self.mode,
             "share_class": self.share_class,
+            "stepping": self.stepping_stats,
         }
 
         logger.info(
@@ -709,43 +920,134 @@ class EventDrivenStrategyEngine:
         )
         return final_results
 
-    async def run_live(self):
-        """Run the strategy in live mode with 60-second position refresh cycle."""
+    async def run_live(self, clock=None):
+        """
+        Run the strategy in live mode.
+
+        LiveScheduler runs the full loop every interval (60s default, drift-corrected)
+        and out of band on price moves (notify_prices), funding settlements, LTV
+        threshold crossings and order fills. Each loop runs in a worker thread so the
+        event loop (price streaming, the watchdog, async venues) keeps running; its
+        ExecutionManager fills and RiskMonitor LTV are handed back to the scheduler.
+        For leveraged and hedged books RiskWatchdog re-prices the last loop's exposure
+        between loops (prices fed via notify_prices), streams the re-priced LTV to the
+        scheduler and escalates guard band breaches to an out-of-band loop or the
+        emergency stop. With BASIS_LIVE__TAPE_DIR set every market data snapshot is
+        recorded to a market tape (replay it with core.event_engine.tape_replay.TapeReplay).
+
+        Args:
+            clock: Scheduler time source (default: wall clock; SimulatedClock in tests)
+        """
         logger.info("Starting live strategy execution")
         self.is_running = True
         request_id = str(uuid.uuid4())
+        tape_recorder = get_tape_recorder()
+        data_provider = (
+            RecordingDataProvider(self.data_provider, tape_recorder)
+            if tape_recorder is not None
+            else self.data_provider
+        )
 
-        try:
-            # Start async results store
-            await self.results_store.start()
+        loop = asyncio.get_running_loop()
 
-            while self.is_running:
-                # Get current market data using canonical pattern
-                current_timestamp = pd.Timestamp.now(tz="UTC")
-                data = self.data_provider.get_data(current_timestamp)
-                current_data = data["market_data"]
+        def run_full_loop(timestamp: pd.Timestamp, reasons: List[str]) -> Dict:
+            # Get current market data using canonical pattern
+            data = data_provider.get_data(timestamp)
+            current_data = data["market_data"]
 
-                # Process timestep (includes position_refresh at start)
-                # See: docs/POSITION_MONITOR_REFACTOR_DESIGN.md - Phase 3: 2-Trigger System
-                self._process_timestep(current_timestamp, current_data, request_id)
+            # Process timestep (includes position_refresh at start)
+            # See: docs/POSITION_MONITOR_REFACTOR_DESIGN.md - Phase 3: 2-Trigger System
+            logger.debug(f"Live loop at {timestamp} ({', '.join(reasons)})")
+            self._process_timestep(timestamp, current_data, request_id)
+            return current_data
+
+        async def run_loop(timestamp: pd.Timestamp, reasons: List[str]) -> None:
+            to_thread = getattr(self.live_scheduler.clock, "to_thread", asyncio.to_thread)
+            current_data = await to_thread(run_full_loop, timestamp, reasons)
+
+            # Back on the event loop: hand the loop's results to the scheduler and watchdog
+            ltv = (self.last_risk_assessment or {}).get("CURRENT_LTV")
+            if ltv is not None:
+                self.live_scheduler.notify_ltv(ltv)
+            if self.risk_watchdog is not None and self.last_exposure is not None:
+                self.risk_watchdog.update_exposure(
+                    self.last_exposure, current_data.get("prices", {})
+                )
+            if not self.is_running:
+                self.live_scheduler.stop()
 
-                # Wait for next update cycle (60-second refresh)
-                await asyncio.sleep(60)  # Update every minute
+        def on_fill(handshake) -> None:
+            # Fills arrive on the loop's worker thread
+            loop.call_soon_threadsafe(self.live_scheduler.notify_fill, handshake)
+
+        self.live_scheduler = LiveScheduler.from_config(self.config, run_loop, clock=clock)
+        self.risk_watchdog = RiskWatchdog.from_config(
+            self.config,
+            self.risk_monitor,
+            on_strategy_breach=lambda report: self.live_scheduler.trigger("risk_watchdog"),
+            on_emergency=self._risk_emergency_stop,
+            clock=clock,
+            on_evaluation=lambda report: self.live_scheduler.notify_ltv(report["current_ltv"]),
+        )
+        self.execution_manager.on_fill = on_fill
+        watchdog_task = None
+        # Venue interfaces belong to this loop; position queries made off-loop run here
+        venue_query = getattr(self.position_monitor, "venue_query", None)
+        if venue_query is not None:
+            venue_query.bind_loop(loop)
+
+        try:
+            # Start async results store
+            await self.results_store.start()
+            if self.risk_watchdog is not None:
+                watchdog_task = asyncio.ensure_future(self.risk_watchdog.run())
+            await self.live_scheduler.run()
 
         except Exception as e:
             logger.error(f"Live execution failed: {e}")
             raise
         finally:
             self.is_running = False
+            self.execution_manager.on_fill = None
+            if venue_query is not None:
+                venue_query.bind_loop(None)
+            if watchdog_task is not None:
+                self.risk_watchdog.stop()
+                watchdog_task.cancel()
+            if tape_recorder is not None:
+                tape_recorder.flush()
             # Stop async results store
             try:
                 await self.results_store.stop()
             except Exception as stop_error:
                 logger.error(f"Error stopping results store: {stop_error}")
 
+    def notify_prices(self, prices: Dict[str, float]) -> None:
+        """Feed streamed prices to the live scheduler and the risk watchdog."""
+        if self.live_scheduler is not None:
+            self.live_scheduler.notify_prices(prices)
+        if self.risk_watchdog is not None:
+            self.risk_watchdog.notify_prices(prices)
+
+    def _risk_emergency_stop(self, report: Dict[str, Any]):
+        """Emergency band breached: the service's emergency stop, or a plain stop without one."""
+        reason = f"Risk watchdog: {'; '.join(report['reasons'])}"
+        if self.emergency_stop_handler is not None:
+            return self.emergency_stop_handler(reason)
+        logger.error(f"{reason}; stopping live execution")
+        self._stop()
+
+    def stop(self):
+        """Stop the live strategy execution (LiveTradingService entry point)."""
+        self._stop()
+
     def _stop(self):
         """Stop the live strategy execution."""
         self.is_running = False
+        if self.live_scheduler is not None:
+            self.live_scheduler.stop()
+        if self.risk_watchdog is not None:
+            self.risk_watchdog.stop()
         logger.info("Strategy execution stopped")
 
     def _get_current_timestamp(self) -> pd.Timestamp:
@@ -778,6 +1080,12 @@ class EventDrivenStrategyEngine:
             "initial_capital": self.config.get("initial_capital", 100000),
             "is_running": self.is_running,
             "current_timestamp": self.current_timestamp,
+            "live_scheduler": (
+                self.live_scheduler.get_metrics() if self.live_scheduler is not None else None
+            ),
+            "risk_watchdog": (
+                self.risk_watchdog.get_metrics() if self.risk_watchdog is not None else None
+            ),
             "health": {
                 "overall_status": health_report["status"],
                 "timestamp": health_report["timestamp"],
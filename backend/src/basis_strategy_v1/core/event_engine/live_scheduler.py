@@ -0,0 +1,413 @@
+"""
+Live Scheduler
+
+Decides when the live engine runs the full component chain.
+
+Key Principles:
+- Periodic full loop on a drift-corrected grid (multiples of interval_seconds since the
+  epoch): a slow loop shortens the next wait instead of shifting every later loop, and
+  grid slots missed entirely are counted and skipped, never replayed
+- Out-of-band loops between grid slots on triggers: a streamed price moving more than
+  price_move_threshold since the last loop (default: SparseStepper.derive_move_threshold),
+  LTV crossing ltv_threshold, an approaching funding settlement (0/8/16 UTC, enabled by
+  the position monitor's settlement config) and order fill events
+- Triggers arriving while a loop is pending or running coalesce into one loop
+- Time comes from an injectable clock; SimulatedClock drives it in tests
+- Metrics: loops by reason, triggers received/coalesced, missed grid slots, loop latency
+
+Configure with `live_scheduler: {interval_seconds, price_move_threshold, ltv_threshold,
+funding_lead_seconds}` in the mode config; BASIS_LIVE__INTERVAL_SECONDS overrides the interval.
+"""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+import math
+import os
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from .sparse_stepping import SparseStepper
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_SECONDS = 60.0
+DEFAULT_FUNDING_LEAD_SECONDS = 30.0
+# How often SimulatedClock.advance() checks on work running in a thread
+THREAD_POLL_SECONDS = 0.001
+FUNDING_HOURS = (0, 8, 16)
+
+# Recent loop latencies kept for percentiles
+LATENCY_WINDOW = 1000
+
+
+class SystemClock:
+    """Wall clock (epoch seconds) and asyncio sleep."""
+
+    def now(self) -> float:
+        return time.time()
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(max(seconds, 0.0))
+
+    async def to_thread(self, func: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.to_thread(func, *args)
+
+
+class SimulatedClock:
+    """
+    Clock that only moves when advanced, for deterministic scheduler tests.
+
+    Sleepers wake in deadline order as advance() passes their deadlines; code under
+    test can also move the clock directly (clock.current += 5.0) to simulate work.
+    Work started with to_thread() holds the clock: advance() waits for it to finish.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self.current = float(start)
+        self._sleepers: List[Tuple[float, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._threads = 0
+
+    def now(self) -> float:
+        return self.current
+
+    async def sleep(self, seconds: float) -> None:
+        if seconds <= 0:
+            await asyncio.sleep(0)
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._sleepers, (self.current + seconds, next(self._sequence), future))
+        await future
+
+    async def advance(self, seconds: float) -> None:
+        """Move the clock forward, waking each sleeper at its deadline."""
+        target = self.current + seconds
+        while True:
+            await self._settle()
+            if not self._sleepers or self._sleepers[0][0] > target:
+                break
+            deadline, _, future = heapq.heappop(self._sleepers)
+            self.current = max(self.current, deadline)
+            if not future.done():
+                future.set_result(None)
+        self.current = max(self.current, target)
+        await self._settle()
+
+    async def to_thread(self, func: Callable[..., Any], *args: Any) -> Any:
+        """asyncio.to_thread that advance() waits for, so time stands still while it runs."""
+        self._threads += 1
+        try:
+            return await asyncio.to_thread(func, *args)
+        finally:
+            self._threads -= 1
+
+    async def _settle(self) -> None:
+        """Let woken tasks run until they block again (on the clock, not on a thread)."""
+        while True:
+            for _ in range(20):
+                await asyncio.sleep(0)
+            if not self._threads:
+                return
+            await asyncio.sleep(THREAD_POLL_SECONDS)
+
+
+class LiveScheduler:
+    """Runs the live loop on a drift-corrected period and on market/execution triggers."""
+
+    def __init__(
+        self,
+        run_loop: Callable[[pd.Timestamp, List[str]], Any],
+        interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+        clock: Optional[Any] = None,
+        price_move_threshold: Optional[float] = None,
+        ltv_threshold: Optional[float] = None,
+        funding_hours: Tuple[int, ...] = (),
+        funding_lead_seconds: float = DEFAULT_FUNDING_LEAD_SECONDS,
+    ):
+        """
+        Initialize live scheduler.
+
+        Args:
+            run_loop: Called with (timestamp, reasons) for every loop; may be a coroutine
+                function. Exceptions propagate out of run()
+            interval_seconds: Period of the full loop
+            clock: Time source with now(), async sleep() and async to_thread()
+                (default: SystemClock)
+            price_move_threshold: Relative price move since the last loop that triggers
+                a loop (None: price streaming never triggers)
+            ltv_threshold: LTV level whose crossing since the last loop triggers a loop
+            funding_hours: UTC hours of funding settlements to run ahead of
+            funding_lead_seconds: How long before a settlement its loop runs
+        """
+        if interval_seconds <= 0:
+            raise ValueError(f"interval_seconds must be positive, got {interval_seconds}")
+
+        self.run_loop = run_loop
+        self.interval_seconds = float(interval_seconds)
+        self.clock = clock or SystemClock()
+        self.price_move_threshold = price_move_threshold
+        self.ltv_threshold = ltv_threshold
+        self.funding_hours = tuple(sorted(funding_hours))
+        self.funding_lead_seconds = funding_lead_seconds
+        self.is_running = False
+
+        self._pending: Set[str] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._in_loop = False
+
+        self._latest_prices: Dict[str, float] = {}
+        self._reference_prices: Dict[str, float] = {}
+        self._latest_ltv: Optional[float] = None
+        self._reference_ltv: Optional[float] = None
+
+        self.loops: Dict[str, int] = {}
+        self.periodic_loops = 0
+        self.out_of_band_loops = 0
+        self.missed_ticks = 0
+        self.triggers: Dict[str, int] = {}
+        self.coalesced_triggers = 0
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.last_loop_at: Optional[float] = None
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Dict[str, Any],
+        run_loop: Callable[[pd.Timestamp, List[str]], Any],
+        clock: Optional[Any] = None,
+    ) -> "LiveScheduler":
+        """Build a scheduler from a mode config (live_scheduler section and strategy thresholds)."""
+        scheduler_config = config.get("live_scheduler") or {}
+        interval = os.getenv("BASIS_LIVE__INTERVAL_SECONDS") or scheduler_config.get(
+            "interval_seconds", DEFAULT_INTERVAL_SECONDS
+        )
+        price_move_threshold = scheduler_config.get("price_move_threshold")
+        if price_move_threshold is None:
+            price_move_threshold = SparseStepper.derive_move_threshold(config)
+
+        ltv_threshold = scheduler_config.get("ltv_threshold")
+        if ltv_threshold is None:
+            target_ltv = config.get("target_ltv")
+            max_ltv = config.get("max_ltv")
+            if target_ltv and max_ltv and max_ltv > target_ltv:
+                # Halfway from target to max: time to act before the risk monitor must
+                ltv_threshold = target_ltv + 0.5 * (max_ltv - target_ltv)
+
+        settlement = (
+            config.get("component_config", {}).get("position_monitor", {}).get("settlement", {})
+        )
+        return cls(
+            run_loop,
+            interval_seconds=float(interval),
+            clock=clock,
+            price_move_threshold=price_move_threshold,
+            ltv_threshold=ltv_threshold,
+            funding_hours=FUNDING_HOURS if settlement.get("funding_enabled") else (),
+            funding_lead_seconds=float(
+                scheduler_config.get("funding_lead_seconds", DEFAULT_FUNDING_LEAD_SECONDS)
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    # Triggers (call from the event loop, e.g. streaming or fill handlers)
+    # ------------------------------------------------------------------
+
+    def notify_prices(self, prices: Dict[str, float]) -> bool:
+        """
+        Record streamed prices; trigger a loop if one moved beyond the threshold.
+
+        Returns:
+            bool: True if this update triggered a loop
+        """
+        self._latest_prices.update(prices)
+        if self.price_move_threshold is None:
+            return False
+        for key, value in prices.items():
+            reference = self._reference_prices.get(key)
+            if reference is None:
+                # First sighting becomes the reference until the next loop
+                self._reference_prices[key] = value
+            elif reference == 0:
+                if value != 0:
+                    return self.trigger("price_move")
+            elif abs(value - reference) / abs(reference) > self.price_move_threshold:
+                return self.trigger("price_move")
+        return False
+
+    def notify_ltv(self, ltv: float) -> bool:
+        """
+        Record an LTV; trigger a loop if it crossed ltv_threshold since the last loop.
+
+        An LTV reported while a loop runs (the loop's own risk assessment) becomes the
+        reference for later LTVs instead of triggering.
+
+        Returns:
+            bool: True if this update triggered a loop
+        """
+        self._latest_ltv = ltv
+        if self._in_loop:
+            self._reference_ltv = ltv
+            return False
+        if self.ltv_threshold is None:
+            return False
+        if self._reference_ltv is None:
+            self._reference_ltv = ltv
+            return False
+        if (self._reference_ltv < self.ltv_threshold) != (ltv < self.ltv_threshold):
+            return self.trigger("ltv_threshold")
+        return False
+
+    def notify_fill(self, fill: Any = None) -> bool:
+        """Trigger a loop for an order fill so positions and follow-up orders update."""
+        return self.trigger("order_fill")
+
+    def trigger(self, reason: str) -> bool:
+        """
+        Request an out-of-band loop.
+
+        Returns:
+            bool: False if a loop was already pending (the trigger joined it)
+        """
+        self.triggers[reason] = self.triggers.get(reason, 0) + 1
+        if self._pending:
+            self.coalesced_triggers += 1
+            self._pending.add(reason)
+            return False
+        self._pending.add(reason)
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    async def run(self) -> None:
+        """Run loops until stop(); the first loop runs immediately."""
+        self.is_running = True
+        self._wakeup = asyncio.Event()
+        self._pending.add("startup")
+        next_due = self._next_slot(self.clock.now())
+        next_funding = self._next_funding_trigger(self.clock.now())
+
+        try:
+            while self.is_running:
+                now = self.clock.now()
+                if next_funding is not None and now >= next_funding:
+                    self.trigger("funding_settlement")
+                    next_funding = self._next_funding_trigger(now + self.funding_lead_seconds)
+
+                periodic = now >= next_due
+                if periodic or self._pending:
+                    await self._run_loop(periodic)
+                    if periodic:
+                        after = self._next_slot(self.clock.now())
+                        self.missed_ticks += max(
+                            0, int(round((after - next_due) / self.interval_seconds)) - 1
+                        )
+                        next_due = after
+                    continue
+
+                wake_at = next_due if next_funding is None else min(next_due, next_funding)
+                await self._wait(wake_at - now)
+        finally:
+            self.is_running = False
+            self._wakeup = None
+
+    def stop(self) -> None:
+        """Stop after the current loop."""
+        self.is_running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _next_slot(self, now: float) -> float:
+        """First grid time strictly after now."""
+        return (math.floor(now / self.interval_seconds) + 1) * self.interval_seconds
+
+    def _next_funding_trigger(self, now: float) -> Optional[float]:
+        """Time of the next pre-settlement loop at or after now."""
+        if not self.funding_hours:
+            return None
+        day = math.floor(now / 86400.0) * 86400.0
+        for offset in (0.0, 86400.0):
+            for hour in self.funding_hours:
+                trigger_at = day + offset + hour * 3600.0 - self.funding_lead_seconds
+                if trigger_at >= now:
+                    return trigger_at
+        return None
+
+    async def _wait(self, delay: float) -> None:
+        """Sleep until delay passes or a trigger/stop arrives."""
+        self._wakeup.clear()
+        sleep = asyncio.ensure_future(self.clock.sleep(delay))
+        wakeup = asyncio.ensure_future(self._wakeup.wait())
+        try:
+            await asyncio.wait({sleep, wakeup}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (sleep, wakeup):
+                task.cancel()
+
+    async def _run_loop(self, periodic: bool) -> None:
+        reasons = sorted(self._pending | ({"periodic"} if periodic else set()))
+        self._pending.clear()
+        if periodic:
+            self.periodic_loops += 1
+        else:
+            self.out_of_band_loops += 1
+        for reason in reasons:
+            self.loops[reason] = self.loops.get(reason, 0) + 1
+
+        # Moves are measured from the market as of this loop
+        self._reference_prices = dict(self._latest_prices)
+        self._reference_ltv = self._latest_ltv
+
+        started = self.clock.now()
+        self.last_loop_at = started
+        self._in_loop = True
+        try:
+            result = self.run_loop(pd.Timestamp(started, unit="s", tz="UTC"), reasons)
+            if inspect.isawaitable(result):
+                await result
+        finally:
+            self._in_loop = False
+            self.latencies.append(self.clock.now() - started)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Loop counts, trigger counts and loop latency (ms) for status endpoints and logs."""
+        latency = {"p50": None, "p95": None, "max": None, "last": None}
+        if self.latencies:
+            ordered = sorted(self.latencies)
+            latency = {
+                "p50": ordered[len(ordered) // 2] * 1000.0,
+                "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000.0,
+                "max": ordered[-1] * 1000.0,
+                "last": self.latencies[-1] * 1000.0,
+            }
+        return {
+            "interval_seconds": self.interval_seconds,
+            "is_running": self.is_running,
+            "in_loop": self._in_loop,
+            "periodic_loops": self.periodic_loops,
+            "out_of_band_loops": self.out_of_band_loops,
+            "missed_ticks": self.missed_ticks,
+            "loops_by_reason": dict(self.loops),
+            "triggers": dict(self.triggers),
+            "coalesced_triggers": self.coalesced_triggers,
+            "pending_triggers": sorted(self._pending),
+            "tick_latency_ms": latency,
+            "last_loop_at": (
+                pd.Timestamp(self.last_loop_at, unit="s", tz="UTC").isoformat()
+                if self.last_loop_at is not None
+                else None
+            ),
+        }
@@ -0,0 +1,211 @@
+"""
+Portfolio Backtest Runner
+
+Advances several EventDrivenStrategyEngine component graphs in lockstep over one
+shared timestamp iterator and aggregates them into a combined book.
+
+Key Principles:
+- One timeline: the union of every engine's ticks (hourly strategies run on the hour,
+  5-minute ML strategies on every 5-minute tick of the same iterator)
+- One data pass: engines built on the same data provider share its per-timestamp
+  snapshot cache, so each tick's snapshot is loaded once for all strategies
+- Independent state: components are process singletons, so each engine must be built
+  after isolate_component_singletons() to get its own component graph
+- Combined book: strategies are funded with capital weights and valued in the
+  reporting currency (USDT) at each tick using the shared snapshot prices
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from .event_driven_strategy_engine import EventDrivenStrategyEngine
+from ..components.exposure_monitor import ExposureMonitor
+from ..components.pnl_monitor import PnLMonitor
+from ..components.position_monitor import PositionMonitor
+from ..components.position_update_handler import PositionUpdateHandler
+from ..components.risk_monitor import RiskMonitor
+from ..execution.execution_manager import ExecutionManager
+from ..utilities.utility_manager import UtilityManager
+from ...infrastructure.logging.domain_event_logger import DomainEventLogger
+
+logger = logging.getLogger(__name__)
+
+# Per-engine components implemented as process singletons
+COMPONENT_SINGLETONS = (
+    UtilityManager,
+    PositionMonitor,
+    ExposureMonitor,
+    RiskMonitor,
+    PnLMonitor,
+    PositionUpdateHandler,
+    ExecutionManager,
+    DomainEventLogger,
+)
+
+
+def isolate_component_singletons() -> None:
+    """Drop cached component singletons so the next engine builds its own component graph."""
+    for component_class in COMPONENT_SINGLETONS:
+        component_class._instance = None
+
+
+def normalize_weights(strategies: List[str], weights: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    """
+    Normalize capital weights to sum to 1 (equal weights by default).
+
+    Raises:
+        ValueError: If a weight is negative, missing, or all weights are zero
+    """
+    if not strategies:
+        raise ValueError("At least one strategy is required for a portfolio backtest")
+    if weights is None:
+        return {name: 1.0 / len(strategies) for name in strategies}
+
+    missing = [name for name in strategies if name not in weights]
+    if missing:
+        raise ValueError(f"Missing capital weights for strategies: {missing}")
+    if any(weights[name] < 0 for name in strategies):
+        raise ValueError(f"Capital weights must be non-negative: {weights}")
+
+    total = sum(weights[name] for name in strategies)
+    if total <= 0:
+        raise ValueError(f"Capital weights must sum to a positive value: {weights}")
+    return {name: weights[name] / total for name in strategies}
+
+
+class PortfolioBacktestRunner:
+    """Runs strategy engines in lockstep and combines their books."""
+
+    REPORTING_CURRENCY = "USDT"
+
+    def __init__(
+        self,
+        engines: Dict[str, EventDrivenStrategyEngine],
+        weights: Dict[str, float],
+        total_capital: float,
+    ):
+        """
+        Initialize portfolio runner.
+
+        Args:
+            engines: Strategy name -> engine (each with its own component graph)
+            weights: Normalized capital weights per strategy
+            total_capital: Combined book capital in the reporting currency
+        """
+        self.engines = engines
+        self.weights = weights
+        self.total_capital = total_capital
+        self.ticks_processed = 0
+
+    async def run(self, start_date: str, end_date: str) -> Dict[str, Any]:
+        """
+        Run all engines over one shared timestamp iterator.
+
+        Args:
+            start_date: Start date for backtest (YYYY-MM-DD)
+            end_date: End date for backtest (YYYY-MM-DD)
+
+        Returns:
+            Dictionary with per-strategy results and the combined book
+        """
+        started: List[str] = []
+        try:
+            schedules = {}
+            for name, engine in self.engines.items():
+                schedules[name] = set(await engine.start_backtest_run(start_date, end_date))
+                started.append(name)
+
+            timeline = sorted(set().union(*schedules.values()))
+            logger.info(
+                f"Portfolio backtest: {len(self.engines)} strategies in lockstep over {len(timeline)} ticks"
+            )
+
+            for timestamp in timeline:
+                for name, engine in self.engines.items():
+                    if timestamp in schedules[name]:
+                        await engine.step_backtest_run(timestamp)
+                self.ticks_processed += 1
+
+            strategy_results = {}
+            for name, engine in self.engines.items():
+                strategy_results[name] = await engine.finish_backtest_run()
+                started.remove(name)
+
+        except Exception as e:
+            logger.error(f"Portfolio backtest failed: {e}")
+            for name in started:
+                await self.engines[name].abort_backtest_run()
+            raise
+
+        return {
+            "start_date": start_date,
+            "end_date": end_date,
+            "reporting_currency": self.REPORTING_CURRENCY,
+            "weights": dict(self.weights),
+            "strategies": strategy_results,
+            "combined": self._combine(strategy_results),
+            "data_access": self._data_access_stats(),
+        }
+
+    def _combine(self, strategy_results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Combined book: strategy values converted to the reporting currency and summed per tick."""
+        curves = {
+            name: {
+                pd.Timestamp(point["timestamp"]): point["net_value"]
+                for point in results["performance"]["equity_curve"]
+            }
+            for name, results in strategy_results.items()
+        }
+        timeline = sorted(set().union(*(curve.keys() for curve in curves.values())))
+
+        # Strategies without a point at a tick (sparse stepping, other frequency) carry their last value
+        last_values = {name: engine.initial_capital for name, engine in self.engines.items()}
+        equity_curve = []
+        for timestamp in timeline:
+            by_strategy = {}
+            for name, engine in self.engines.items():
+                if timestamp in curves[name]:
+                    last_values[name] = curves[name][timestamp]
+                by_strategy[name] = last_values[name] * self._share_class_price(engine, timestamp)
+            equity_curve.append(
+                {
+                    "timestamp": timestamp.isoformat(),
+                    "net_value": sum(by_strategy.values()),
+                    "by_strategy": by_strategy,
+                }
+            )
+
+        final_value = equity_curve[-1]["net_value"] if equity_curve else self.total_capital
+        total_return = final_value - self.total_capital
+        return {
+            "initial_capital": self.total_capital,
+            "final_value": final_value,
+            "total_return": total_return,
+            "total_return_pct": (total_return / self.total_capital) * 100
+            if self.total_capital > 0
+            else 0,
+            "equity_curve": equity_curve,
+        }
+
+    def _share_class_price(self, engine: EventDrivenStrategyEngine, timestamp: pd.Timestamp) -> float:
+        """Reporting-currency price of an engine's share class at a tick."""
+        if engine.share_class == self.REPORTING_CURRENCY:
+            return 1.0
+        prices = engine.data_provider.get_data(timestamp)["market_data"]["prices"]
+        if engine.share_class not in prices:
+            raise ValueError(
+                f"No {engine.share_class} price at {timestamp} to value {engine.mode} in {self.REPORTING_CURRENCY}"
+            )
+        return prices[engine.share_class]
+
+    def _data_access_stats(self) -> Dict[str, Any]:
+        """Shared data providers and snapshots loaded for the run."""
+        providers = {id(engine.data_provider): engine.data_provider for engine in self.engines.values()}
+        snapshots = sum(len(getattr(provider, "_data_cache", {})) for provider in providers.values())
+        return {
+            "ticks": self.ticks_processed,
+            "shared_data_providers": len(providers),
+            "snapshots_loaded": snapshots,
+        }
@@ -0,0 +1,430 @@
+"""
+Risk Watchdog
+
+Sub-second LTV and CEX margin guard for live mode, between full loops.
+
+Key Principles:
+- Cached exposure vector: values, RiskMonitor bucket ids and a price slot per instrument
+  key, rebuilt by update_exposure() after every full loop (so after every fill)
+- Streamed prices only update a price array; each evaluation re-prices the cached values
+  by latest / reference price and runs RiskMonitor's own bucket -> LTV / margin math
+  (stables and unpriced keys keep their value; LSTs move with ETH until the next loop)
+- Guard bands: the strategy band (LTV at or above halfway from target to AAVE max LTV, or
+  a CEX margin ratio at or below the venue target margin) triggers an out-of-band full
+  loop; the emergency band (LTV at or above AAVE max LTV, or a margin ratio at or below
+  the maintenance margin) goes to the emergency-stop path
+- Escalation is edge-triggered: a band escalates once on entry, after `confirmations`
+  consecutive evaluations in it, and re-arms when the book leaves it
+- Every report goes to on_evaluation (run_live streams its LTV to the live scheduler)
+- Evaluates only when prices changed since the last evaluation; time comes from an
+  injectable clock (live_scheduler.SimulatedClock in tests)
+
+Configure with `component_config.risk_monitor.watchdog: {enabled, interval_seconds,
+ltv_strategy_band, ltv_emergency_band, confirmations}`; BASIS_LIVE__WATCHDOG_INTERVAL_SECONDS
+overrides the interval.
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
+
+import numpy as np
+
+from ..components.risk_monitor import N_BUCKETS
+from ..math.stress_grid import LST_TOKENS, position_value_usd
+from .live_scheduler import SystemClock
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_SECONDS = 0.25
+DEFAULT_CONFIRMATIONS = 2
+PERP_QUOTES = ("USDT", "USDC", "USD")
+LST_UNDERLYING = "ETH"
+
+OK, STRATEGY, EMERGENCY = 0, 1, 2
+BANDS = ("ok", "strategy", "emergency")
+
+# Recent evaluation latencies kept for percentiles
+LATENCY_WINDOW = 1000
+
+
+def price_key(instrument_key: str, prices: Dict[str, float]) -> Optional[str]:
+    """
+    Key of the streamed price an exposure moves with (None: value held constant).
+
+    aTokens and debtTokens follow their underlying, perps their base asset, wrapped
+    tokens the unwrapped asset and LSTs without their own price ETH.
+    """
+    parts = instrument_key.split(":")
+    if len(parts) < 3:
+        return None
+    position_type, token = parts[1], parts[2]
+    if position_type == "aToken":
+        token = token[1:]
+    elif position_type == "debtToken":
+        token = token[len("debt"):]
+    elif position_type == "Perp":
+        for quote in PERP_QUOTES:
+            if token.endswith(quote) and len(token) > len(quote):
+                token = token[: -len(quote)]
+                break
+
+    if token in prices:
+        return token
+    if token.startswith("W") and token[1:] in prices:
+        return token[1:]
+    if token in LST_TOKENS and LST_UNDERLYING in prices:
+        return LST_UNDERLYING
+    return None
+
+
+class RiskWatchdog:
+    """Re-prices the last exposure on streamed prices and escalates guard band breaches."""
+
+    def __init__(
+        self,
+        risk_monitor,
+        on_strategy_breach: Callable[[Dict[str, Any]], Any],
+        on_emergency: Callable[[Dict[str, Any]], Any],
+        interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+        clock: Optional[Any] = None,
+        ltv_strategy_band: Optional[float] = None,
+        ltv_emergency_band: Optional[float] = None,
+        confirmations: int = DEFAULT_CONFIRMATIONS,
+        on_evaluation: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ):
+        """
+        Initialize risk watchdog.
+
+        Args:
+            risk_monitor: RiskMonitor whose layout, ratio math and thresholds are used
+            on_strategy_breach: Called with the evaluation report on entering the strategy
+                band; may return an awaitable (scheduled, not awaited)
+            on_emergency: Called with the evaluation report on entering the emergency band
+            interval_seconds: Time between evaluations
+            clock: Time source with now() and async sleep() (default: SystemClock)
+            ltv_strategy_band: LTV that escalates to the strategy (default: halfway from
+                target LTV to AAVE max LTV)
+            ltv_emergency_band: LTV that escalates to emergency stop (default: AAVE max LTV)
+            confirmations: Consecutive evaluations in a band before it escalates
+            on_evaluation: Called with every evaluation report (e.g. to stream the
+                re-priced LTV to the live scheduler)
+        """
+        if interval_seconds <= 0:
+            raise ValueError(f"interval_seconds must be positive, got {interval_seconds}")
+        if confirmations < 1:
+            raise ValueError(f"confirmations must be at least 1, got {confirmations}")
+
+        self.risk_monitor = risk_monitor
+        self.on_strategy_breach = on_strategy_breach
+        self.on_emergency = on_emergency
+        self.on_evaluation = on_evaluation
+        self.interval_seconds = float(interval_seconds)
+        self.clock = clock or SystemClock()
+        self.confirmations = int(confirmations)
+
+        target_ltv = risk_monitor._target_ltv_f
+        max_ltv = risk_monitor._aave_max_ltv_f
+        if ltv_emergency_band is None:
+            ltv_emergency_band = max_ltv
+        if ltv_strategy_band is None:
+            ltv_strategy_band = (
+                target_ltv + 0.5 * (max_ltv - target_ltv) if max_ltv > target_ltv else max_ltv
+            )
+        self.ltv_strategy_band = float(min(ltv_strategy_band, ltv_emergency_band))
+        self.ltv_emergency_band = float(ltv_emergency_band)
+
+        # Venue -> (strategy floor, emergency floor) for the CEX margin ratio
+        self.margin_bands: Dict[str, tuple] = {}
+        for venue, requirements in risk_monitor.cex_margin_requirements.items():
+            emergency_floor = float(requirements["MAINTENANCE_MARGIN"])
+            strategy_floor = risk_monitor._cex_target_margins_f.get(venue, emergency_floor)
+            self.margin_bands[venue] = (max(strategy_floor, emergency_floor), emergency_floor)
+
+        self.is_running = False
+
+        # Cached exposure vector (set by update_exposure)
+        self._values: Optional[np.ndarray] = None
+        self._bucket_ids: Optional[np.ndarray] = None
+        self._price_slots: Optional[np.ndarray] = None
+        self._venues: List[str] = []
+        self._slot_of: Dict[str, int] = {}
+        self._reference = np.zeros(0)
+        self._latest = np.zeros(0)
+        self._scale = np.ones(1)
+        self._dirty = False
+
+        self._escalated = OK
+        self._candidate = OK
+        self._streak = 0
+        self._escalations: Set[asyncio.Future] = set()
+
+        self.evaluations = 0
+        self.skipped_evaluations = 0
+        self.exposure_updates = 0
+        self.errors = 0
+        self.breaches: Dict[str, int] = {"strategy": 0, "emergency": 0}
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.last_report: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Dict[str, Any],
+        risk_monitor,
+        on_strategy_breach: Callable[[Dict[str, Any]], Any],
+        on_emergency: Callable[[Dict[str, Any]], Any],
+        clock: Optional[Any] = None,
+        on_evaluation: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> Optional["RiskWatchdog"]:
+        """
+        Watchdog from component_config.risk_monitor.watchdog, or None when disabled.
+
+        On by default for books with leverage, AAVE debt or perp hedges.
+        """
+        component_config = config.get("component_config", {})
+        watchdog_config = (component_config.get("risk_monitor", {}) or {}).get("watchdog") or {}
+        enabled = watchdog_config.get("enabled")
+        if enabled is None:
+            subscriptions = component_config.get("position_monitor", {}).get(
+                "position_subscriptions", []
+            )
+            enabled = bool(config.get("leverage_enabled")) or any(
+                ":debtToken:" in key or ":Perp:" in key for key in subscriptions
+            )
+        if not enabled:
+            return None
+
+        interval = os.getenv("BASIS_LIVE__WATCHDOG_INTERVAL_SECONDS") or watchdog_config.get(
+            "interval_seconds", DEFAULT_INTERVAL_SECONDS
+        )
+        return cls(
+            risk_monitor,
+            on_strategy_breach,
+            on_emergency,
+            interval_seconds=float(interval),
+            clock=clock,
+            ltv_strategy_band=watchdog_config.get("ltv_strategy_band"),
+            ltv_emergency_band=watchdog_config.get("ltv_emergency_band"),
+            confirmations=int(watchdog_config.get("confirmations", DEFAULT_CONFIRMATIONS)),
+            on_evaluation=on_evaluation,
+        )
+
+    # ------------------------------------------------------------------
+    # Inputs
+    # ------------------------------------------------------------------
+
+    def update_exposure(self, exposure_data: Dict, prices: Dict[str, float]) -> None:
+        """
+        Cache the exposure vector priced at prices (the full loop's market data).
+
+        Call after every full loop, i.e. after fills have been applied to positions.
+        The band the book is in now becomes the baseline (the loop's strategy has seen
+        it), except that an emergency level still escalates.
+        """
+        exposures = exposure_data.get("exposures", {}) if exposure_data else {}
+        keys = tuple(exposures)
+        buckets, short_if_flat, venues = self.risk_monitor._exposure_layout(keys)
+
+        count = len(keys)
+        self._values = np.fromiter(
+            (position_value_usd(position) for position in exposures.values()), float, count
+        )
+        amounts = np.fromiter(
+            (position.get("amount", 0) or 0 for position in exposures.values()), float, count
+        )
+        self._bucket_ids = buckets + short_if_flat * (amounts <= 0)
+        self._venues = list(venues)
+
+        self._slot_of = {}
+        reference: List[float] = []
+        slots = np.empty(count, dtype=np.intp)
+        for i, instrument_key in enumerate(keys):
+            key = price_key(instrument_key, prices)
+            if key is not None and prices[key]:
+                if key not in self._slot_of:
+                    self._slot_of[key] = len(reference)
+                    reference.append(float(prices[key]))
+                slots[i] = self._slot_of[key]
+            else:
+                slots[i] = -1  # Last scale entry, always 1.0
+        self._reference = np.asarray(reference, dtype=float)
+        self._latest = self._reference.copy()
+        self._scale = np.ones(len(reference) + 1)
+        self._price_slots = slots
+        self._dirty = False
+
+        self.exposure_updates += 1
+        level, _ = self._classify(*self._ratios())
+        self._escalated = min(level, STRATEGY)
+        self._candidate = OK
+        self._streak = 0
+
+    def notify_prices(self, prices: Dict[str, float]) -> None:
+        """Record streamed prices; only keys in the cached exposure vector are kept."""
+        for key, value in prices.items():
+            slot = self._slot_of.get(key)
+            if slot is not None and value:
+                self._latest[slot] = value
+                self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+
+    def evaluate(self) -> Optional[Dict[str, Any]]:
+        """
+        Re-price the cached exposure, classify it and escalate a newly entered band.
+
+        Returns:
+            The evaluation report, or None before the first update_exposure()
+        """
+        if self._values is None:
+            return None
+        started = time.perf_counter()
+        self._dirty = False
+        current_ltv, margin_ratios = self._ratios()
+        level, reasons = self._classify(current_ltv, margin_ratios)
+        self.evaluations += 1
+        self.latencies.append(time.perf_counter() - started)
+
+        report = {
+            "timestamp": self.clock.now(),
+            "band": BANDS[level],
+            "reasons": reasons,
+            "current_ltv": current_ltv,
+            "cex_margin_ratios": margin_ratios,
+        }
+        self.last_report = report
+        if self.on_evaluation is not None:
+            try:
+                self.on_evaluation(report)
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Risk watchdog evaluation callback failed: {e}")
+
+        if level <= self._escalated:
+            self._escalated = level
+            self._candidate, self._streak = OK, 0
+            return report
+
+        if level == self._candidate:
+            self._streak += 1
+        else:
+            self._candidate, self._streak = level, 1
+        if self._streak >= self.confirmations:
+            self._escalated = level
+            self._candidate, self._streak = OK, 0
+            self._escalate(level, report)
+        return report
+
+    def _ratios(self):
+        """LTV and CEX margin ratios of the cached exposure at the latest prices."""
+        if len(self._reference):
+            np.divide(self._latest, self._reference, out=self._scale[:-1])
+        values = self._values * self._scale[self._price_slots]
+        totals = np.bincount(self._bucket_ids, weights=values, minlength=N_BUCKETS)
+        return self.risk_monitor._risk_ratios_from_totals(totals, self._venues)
+
+    def _classify(self, current_ltv: float, margin_ratios: Dict[str, float]):
+        """Worst band of the LTV and margin ratios, with the reasons for it."""
+        level, reasons = OK, []
+        if current_ltv >= self.ltv_emergency_band:
+            level = EMERGENCY
+            reasons.append(f"ltv {current_ltv:.4f} >= {self.ltv_emergency_band:.4f}")
+        elif current_ltv >= self.ltv_strategy_band:
+            level = STRATEGY
+            reasons.append(f"ltv {current_ltv:.4f} >= {self.ltv_strategy_band:.4f}")
+        for venue, margin_ratio in margin_ratios.items():
+            bands = self.margin_bands.get(venue)
+            if bands is None:
+                continue
+            strategy_floor, emergency_floor = bands
+            if margin_ratio <= emergency_floor:
+                level = EMERGENCY
+                reasons.append(f"{venue} margin {margin_ratio:.4f} <= {emergency_floor:.4f}")
+            elif margin_ratio <= strategy_floor:
+                level = max(level, STRATEGY)
+                reasons.append(f"{venue} margin {margin_ratio:.4f} <= {strategy_floor:.4f}")
+        return level, reasons
+
+    def _escalate(self, level: int, report: Dict[str, Any]) -> None:
+        band = BANDS[level]
+        self.breaches[band] += 1
+        logger.warning(f"Risk watchdog: {band} band breached ({'; '.join(report['reasons'])})")
+        handler = self.on_emergency if level == EMERGENCY else self.on_strategy_breach
+        try:
+            result = handler(report)
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(result)
+                self._escalations.add(task)
+                task.add_done_callback(self._escalation_done)
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Risk watchdog {band} escalation failed: {e}")
+        if level == EMERGENCY:
+            self.stop()
+
+    def _escalation_done(self, task: asyncio.Future) -> None:
+        self._escalations.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.errors += 1
+            logger.error(f"Risk watchdog escalation failed: {task.exception()}")
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    async def run(self) -> None:
+        """Evaluate every interval while prices change, until stop() or an emergency."""
+        self.is_running = True
+        try:
+            while self.is_running:
+                await self.clock.sleep(self.interval_seconds)
+                if not self._dirty:
+                    self.skipped_evaluations += 1
+                    continue
+                try:
+                    self.evaluate()
+                except Exception as e:
+                    # The guard must outlive a bad tick; the next price update retries
+                    self.errors += 1
+                    logger.error(f"Risk watchdog evaluation failed: {e}")
+        finally:
+            self.is_running = False
+
+    def stop(self) -> None:
+        """Stop after the current evaluation."""
+        self.is_running = False
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Evaluation counts, breaches, latency (microseconds) and the last report."""
+        latency = {"p50": None, "p95": None, "max": None}
+        if self.latencies:
+            ordered = sorted(self.latencies)
+            latency = {
+                "p50": ordered[len(ordered) // 2] * 1e6,
+                "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1e6,
+                "max": ordered[-1] * 1e6,
+            }
+        return {
+            "interval_seconds": self.interval_seconds,
+            "is_running": self.is_running,
+            "ltv_strategy_band": self.ltv_strategy_band,
+            "ltv_emergency_band": self.ltv_emergency_band,
+            "exposure_updates": self.exposure_updates,
+            "evaluations": self.evaluations,
+            "skipped_evaluations": self.skipped_evaluations,
+            "breaches": dict(self.breaches),
+            "errors": self.errors,
+            "evaluation_latency_us": latency,
+            "last_report": self.last_report,
+        }
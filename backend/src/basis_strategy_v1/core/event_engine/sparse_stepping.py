@@ -0,0 +1,284 @@
+"""
+Sparse Stepping
+
+Selects the backtest timestamps that need the full component chain.
+
+Key Principles:
+- Dense stepping (default) runs the chain on every tick; sparse stepping skips quiescent ticks
+- Always processed: first and last tick, funding settlements (0/8/16 UTC) and seasonal
+  reward dates as scheduled by PositionMonitor, the tick after any tick that generated orders
+  and the first tick at or after each deposit/withdrawal (`capital_flows` in the mode config,
+  or schedule_capital_flow() at run time)
+- Market-driven: a tick is processed when a watched price or index moved more than
+  move_threshold since the last processed tick (derived from the strategy's
+  position_deviation_threshold and target/max LTV headroom); the watched series are
+  precomputed in one pass so skipped ticks never build a data snapshot
+- aToken balances grow via the AAVE index and LSTs via their rate, both applied at valuation
+  time, so balances across a skipped span are accrued exactly at the next processed tick
+- Skipped ticks run no component chain and produce no timestep result or domain events; the
+  engine still records an equity curve point valuing the unchanged positions at the tick, so
+  dense and sparse runs give the same equity curve
+
+Enable with `backtest_stepping: sparse` in the mode config or BASIS_BACKTEST__STEPPING=sparse.
+"""
+
+import logging
+import math
+import os
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Snapshot sections whose moves can change a strategy decision
+WATCHED_SECTIONS = (
+    ("market_data", "prices"),
+    ("protocol_data", "perp_prices"),
+    ("protocol_data", "aave_indexes"),
+    ("protocol_data", "oracle_prices"),
+    ("protocol_data", "market_prices"),
+)
+
+# Capital flow types that force a tick (reason names in get_stats)
+CAPITAL_FLOW_TYPES = ("deposit", "withdrawal")
+
+# Prediction-driven strategies can trade on any tick
+DENSE_ONLY_MODES = ("ml_btc_directional_usdt_margin", "ml_btc_directional_btc_margin", "ml_usdt_directional_usdt_margin")
+
+
+def get_stepping_mode(config: Dict[str, Any]) -> str:
+    """Resolve stepping mode ('dense' or 'sparse') from env or mode config."""
+    stepping = os.getenv("BASIS_BACKTEST__STEPPING") or config.get("backtest_stepping", "dense")
+    if stepping not in ("dense", "sparse"):
+        raise ValueError(f"Invalid backtest_stepping: {stepping}. Must be 'dense' or 'sparse'.")
+    if stepping == "sparse" and config.get("mode") in DENSE_ONLY_MODES:
+        logger.warning(f"Sparse stepping not supported for {config.get('mode')}, using dense stepping")
+        return "dense"
+    return stepping
+
+
+class SparseStepper:
+    """Decides which backtest ticks run the full component chain."""
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        position_monitor: Any,
+        data_provider: Any,
+        timestamps: List[pd.Timestamp],
+        move_threshold: Optional[float] = None,
+    ):
+        """
+        Initialize sparse stepper and precompute the watched market series.
+
+        Args:
+            config: Strategy configuration
+            position_monitor: Position monitor (source of truth for settlement schedule)
+            data_provider: Data provider (get_series() for precomputation, else get_data())
+            timestamps: All backtest ticks
+            move_threshold: Relative move of a watched series that forces a tick
+                (default: derived from strategy thresholds, see derive_move_threshold)
+
+        Config `capital_flows` lists scheduled deposits/withdrawals as
+        {"timestamp": ..., "type": "deposit" | "withdrawal"}.
+        """
+        self.config = config
+        self.position_monitor = position_monitor
+        self.data_provider = data_provider
+        self.move_threshold = (
+            move_threshold
+            if move_threshold is not None
+            else config.get("sparse_stepping_move_threshold") or self.derive_move_threshold(config)
+        )
+
+        self._watched_rows = self._precompute_watched_values(timestamps)
+        self._reference: Optional[Dict[str, float]] = None
+        self._force_next = True
+        self._capital_flows: Dict[pd.Timestamp, str] = {}
+        for flow in config.get("capital_flows") or []:
+            self.schedule_capital_flow(flow["timestamp"], flow.get("type", "deposit"))
+
+        self.processed = 0
+        self.skipped = 0
+        self.reasons: Dict[str, int] = {}
+
+    @staticmethod
+    def derive_move_threshold(config: Dict[str, Any]) -> float:
+        """Half of the tightest strategy threshold a market move can breach."""
+        strategy_config = config.get("component_config", {}).get("strategy_manager", {})
+        thresholds = [
+            float(
+                strategy_config.get("position_deviation_threshold")
+                or config.get("position_deviation_threshold")
+                or 0.02
+            )
+        ]
+
+        target_ltv = config.get("target_ltv") or strategy_config.get("target_ltv")
+        max_ltv = config.get("max_ltv")
+        if target_ltv and max_ltv and max_ltv > target_ltv:
+            # Relative collateral move that takes LTV from target to max
+            thresholds.append(1 - target_ltv / max_ltv)
+
+        return 0.5 * min(thresholds)
+
+    def should_process(self, timestamp: pd.Timestamp, is_last: bool = False) -> bool:
+        """
+        Check if the full component chain must run at this tick.
+
+        Args:
+            timestamp: Tick timestamp
+            is_last: True for the final backtest tick
+
+        Returns:
+            bool: True to process the tick, False to skip it
+        """
+        reason = self._process_reason(timestamp, is_last)
+        if reason is None:
+            self.skipped += 1
+            return False
+
+        self.reasons[reason] = self.reasons.get(reason, 0) + 1
+        return True
+
+    def schedule_capital_flow(self, timestamp: Any, flow_type: str = "deposit") -> None:
+        """
+        Force the first tick at or after a deposit or withdrawal.
+
+        Args:
+            timestamp: Time the capital flow arrives (naive timestamps are UTC)
+            flow_type: 'deposit' or 'withdrawal'
+        """
+        if flow_type not in CAPITAL_FLOW_TYPES:
+            raise ValueError(f"Invalid capital flow type: {flow_type}. Must be one of {CAPITAL_FLOW_TYPES}.")
+        timestamp = pd.Timestamp(timestamp)
+        timestamp = timestamp.tz_localize("UTC") if timestamp.tz is None else timestamp.tz_convert("UTC")
+        self._capital_flows[timestamp] = flow_type
+
+    def record_processed(self, timestamp: pd.Timestamp, order_count: int = 0) -> None:
+        """Record a processed tick as the new market reference."""
+        self.processed += 1
+        self._reference = self._watched_values(timestamp)
+        # Follow-up tick lets the strategy see the settled result of its orders
+        self._force_next = order_count > 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Stepping statistics for results and logs."""
+        total = self.processed + self.skipped
+        return {
+            "mode": "sparse",
+            "processed_ticks": self.processed,
+            "skipped_ticks": self.skipped,
+            "processed_fraction": self.processed / total if total else 0.0,
+            "move_threshold": self.move_threshold,
+            "reasons": dict(self.reasons),
+        }
+
+    def get_checkpoint_state(self) -> Dict[str, Any]:
+        """Stepping state for backtest checkpoints."""
+        return {
+            "reference": self._reference,
+            "force_next": self._force_next,
+            "processed": self.processed,
+            "skipped": self.skipped,
+            "reasons": dict(self.reasons),
+            "capital_flows": [
+                (timestamp.isoformat(), flow_type)
+                for timestamp, flow_type in self._capital_flows.items()
+            ],
+        }
+
+    def restore_checkpoint_state(self, state: Dict[str, Any]) -> None:
+        """Continue stepping from a backtest checkpoint."""
+        self._reference = state["reference"]
+        self._force_next = state["force_next"]
+        self.processed = state["processed"]
+        self.skipped = state["skipped"]
+        self.reasons = dict(state["reasons"])
+        self._capital_flows = {}
+        for timestamp, flow_type in state.get("capital_flows", []):
+            self.schedule_capital_flow(timestamp, flow_type)
+
+    def _process_reason(self, timestamp: pd.Timestamp, is_last: bool) -> Optional[str]:
+        """Name the first rule that requires processing this tick, or None."""
+        capital_flow = self._pop_capital_flow(timestamp)
+        if self._reference is None:
+            return "first_tick"
+        if is_last:
+            return "last_tick"
+        if self._force_next:
+            return "after_orders"
+        if capital_flow:
+            return capital_flow
+        if self.position_monitor._should_apply_funding_settlement(timestamp):
+            return "funding_settlement"
+        if self.position_monitor._should_apply_seasonal_rewards(timestamp):
+            return "seasonal_rewards"
+        if self._moved_beyond_threshold(self._watched_values(timestamp)):
+            return "market_move"
+        return None
+
+    def _pop_capital_flow(self, timestamp: pd.Timestamp) -> Optional[str]:
+        """Consume capital flows due by this tick; returns the latest one's type."""
+        flow_type = None
+        for flow in sorted(self._capital_flows):
+            if flow > timestamp:
+                break
+            flow_type = self._capital_flows.pop(flow)
+        return flow_type
+
+    def _moved_beyond_threshold(self, values: Dict[str, float]) -> bool:
+        """Check if any watched series moved more than move_threshold since the reference."""
+        for key, value in values.items():
+            reference = self._reference.get(key)
+            if reference is None or math.isnan(reference) or math.isnan(value):
+                if not (reference is not None and math.isnan(reference) and math.isnan(value)):
+                    return True
+            elif reference == 0:
+                if value != 0:
+                    return True
+            elif abs(value - reference) / abs(reference) > self.move_threshold:
+                return True
+        return False
+
+    def _watched_values(self, timestamp: pd.Timestamp) -> Dict[str, float]:
+        """Watched values at a tick (precomputed, or from the data provider snapshot)."""
+        if self._watched_rows is not None:
+            return self._watched_rows[timestamp]
+
+        data = self.data_provider.get_data(timestamp)
+        values = {}
+        for section, field in WATCHED_SECTIONS:
+            series = data.get(section, {}).get(field, {})
+            if not isinstance(series, dict):
+                continue
+            for name, value in series.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    values[f"{section}.{field}.{name}"] = float(value)
+        return values
+
+    def _precompute_watched_values(
+        self, timestamps: List[pd.Timestamp]
+    ) -> Optional[Dict[pd.Timestamp, Dict[str, float]]]:
+        """Load every watched series once; None falls back to per-tick snapshots."""
+        if not hasattr(self.data_provider, "get_series"):
+            return None
+
+        prefixes = tuple(f"{section}.{field}." for section, field in WATCHED_SECTIONS)
+        csv_mappings = getattr(self.data_provider, "csv_mappings", {}) or {}
+        data_keys = sorted(
+            key for key, path in csv_mappings.items()
+            if key.startswith(prefixes) and path and not path.endswith(".json")
+        )
+
+        try:
+            frame = pd.DataFrame(
+                {key: self.data_provider.get_series(key, timestamps) for key in data_keys},
+                index=pd.DatetimeIndex(timestamps),
+            )
+        except Exception as e:
+            logger.warning(f"Watched series precomputation failed, using snapshots: {e}")
+            return None
+
+        return dict(zip(timestamps, frame.to_dict("records")))
@@ -0,0 +1,148 @@
+"""
+Tape Replay
+
+Runs EventDrivenStrategyEngine.run_live against a recorded market tape instead of live
+sources, for incident reproduction, load tests and latency regression checks offline.
+
+Key Principles:
+- The engine's data provider is swapped for ReplayDataProvider for the run (restored
+  afterwards): every loop sees the snapshot live had received by the loop's timestamp
+- Virtual time starts at the tape's first receive time; the live scheduler, risk
+  watchdog and feed all run on one clock:
+  - speed N (1.0 = real time): ScaledClock, tape time advances N seconds per wall second
+  - speed None (max): SimulatedClock advanced straight from event to event, so loops
+    run back to back with no waiting and the run is deterministic (the clock holds
+    while a loop runs in its worker thread)
+- Recorded snapshot prices are streamed to engine.notify_prices at their receive times,
+  so price triggers and the watchdog fire as they did live
+- The engine is stopped after the last event (plus tail_seconds of virtual time)
+- Metrics: events, virtual vs wall seconds, achieved speed-up and the live scheduler's
+  loop latency percentiles
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .live_scheduler import SimulatedClock
+from ...infrastructure.data.market_tape import MarketTape, ReplayDataProvider
+
+logger = logging.getLogger(__name__)
+
+# Iterations waited for the engine's scheduler to start before feeding events
+STARTUP_ATTEMPTS = 1000
+
+
+class ScaledClock:
+    """Clock running `speed` times faster than the wall clock from `start` (epoch seconds)."""
+
+    def __init__(self, start: float, speed: float = 1.0):
+        if speed <= 0:
+            raise ValueError(f"speed must be positive, got {speed}")
+        self.start = float(start)
+        self.speed = float(speed)
+        self._wall_start = time.monotonic()
+
+    def now(self) -> float:
+        return self.start + (time.monotonic() - self._wall_start) * self.speed
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(max(seconds, 0.0) / self.speed)
+
+    async def to_thread(self, func: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.to_thread(func, *args)
+
+
+class TapeReplay:
+    """Replays a market tape through an engine's live loop."""
+
+    def __init__(
+        self,
+        engine: Any,
+        tape: MarketTape,
+        speed: Optional[float] = 1.0,
+        tail_seconds: float = 0.0,
+    ):
+        """
+        Initialize tape replay.
+
+        Args:
+            engine: EventDrivenStrategyEngine (anything with data_provider, run_live(clock),
+                notify_prices, stop and live_scheduler)
+            tape: Recorded tape with at least one snapshot
+            speed: Replay speed multiple (1.0 real time), None for as fast as possible
+            tail_seconds: Virtual time to keep running after the last event
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError(f"speed must be positive or None, got {speed}")
+
+        self.engine = engine
+        self.tape = tape
+        self.speed = speed
+        self.tail_seconds = tail_seconds
+        self.data_provider = ReplayDataProvider(tape)
+        self.clock = SimulatedClock(tape.start) if speed is None else ScaledClock(tape.start, speed)
+
+        self.events_fed = 0
+        self.wall_seconds: Optional[float] = None
+
+    async def run(self) -> Dict[str, Any]:
+        """Run the engine over the whole tape; returns get_metrics()."""
+        original_provider = self.engine.data_provider
+        self.engine.data_provider = self.data_provider
+        started = time.perf_counter()
+        engine_task = asyncio.ensure_future(self.engine.run_live(clock=self.clock))
+        try:
+            await self._wait_for_scheduler(engine_task)
+            for event in self.tape.events("snapshot"):
+                if engine_task.done():
+                    break
+                await self._advance_to(event.received_at)
+                prices = event.data.get("market_data", {}).get("prices")
+                if prices:
+                    self.engine.notify_prices(prices)
+                self.events_fed += 1
+            if not engine_task.done():
+                await self._advance_to(self.tape.end + self.tail_seconds)
+        finally:
+            self.engine.stop()
+            if isinstance(self.clock, SimulatedClock):
+                await self.clock.advance(0)
+            await engine_task
+            self.engine.data_provider = original_provider
+            self.wall_seconds = time.perf_counter() - started
+        return self.get_metrics()
+
+    async def _wait_for_scheduler(self, engine_task: asyncio.Future) -> None:
+        """Let run_live reach its scheduler loop so the first loop sees the tape start."""
+        for _ in range(STARTUP_ATTEMPTS):
+            scheduler = getattr(self.engine, "live_scheduler", None)
+            if engine_task.done() or (scheduler is not None and scheduler.is_running):
+                break
+            await asyncio.sleep(0)
+        if isinstance(self.clock, SimulatedClock):
+            await self.clock.advance(0)
+
+    async def _advance_to(self, target: float) -> None:
+        delay = target - self.clock.now()
+        if isinstance(self.clock, SimulatedClock):
+            await self.clock.advance(max(delay, 0.0))
+        elif delay > 0:
+            await self.clock.sleep(delay)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        virtual_seconds = self.tape.end - self.tape.start + self.tail_seconds
+        scheduler = getattr(self.engine, "live_scheduler", None)
+        return {
+            "speed": self.speed if self.speed is not None else "max",
+            "snapshots": self.tape.snapshot_count,
+            "events_fed": self.events_fed,
+            "data_requests": self.data_provider.requests,
+            "virtual_seconds": virtual_seconds,
+            "wall_seconds": self.wall_seconds,
+            "speedup": (
+                virtual_seconds / self.wall_seconds if self.wall_seconds else None
+            ),
+            "live_scheduler": scheduler.get_metrics() if scheduler is not None else None,
+        }
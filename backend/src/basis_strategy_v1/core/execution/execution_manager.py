@@ -8,7 +8,7 @@ Reference: docs/REFERENCE_ARCHITECTURE_CANONICAL.md - Section 4
 Reference: docs/specs/06_EXECUTION_MANAGER.md
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, List, Optional
 import logging
 import pandas as pd
 from datetime import datetime
@@ -49,6 +49,7 @@ class ExecutionManager:
         correlation_id: str = None,
         pid: int = None,
         log_dir: Path = None,
+        on_fill: Optional[Callable[[ExecutionHandshake], Any]] = None,
     ):
         """
         Initialize execution manager.
@@ -62,12 +63,15 @@ class ExecutionManager:
             correlation_id: Unique correlation ID for this run
             pid: Process ID
             log_dir: Log directory path (logs/{correlation_id}/{pid}/)
+            on_fill: Called with the handshake of every confirmed order (live mode
+                feeds it to the live scheduler's fill trigger)
         """
         self.execution_mode = execution_mode
         self.config = config
         self.venue_interface_manager = venue_interface_manager
         self.position_update_handler = position_update_handler
         self.data_provider = data_provider
+        self.on_fill = on_fill
 
         # Get position subscriptions from config
         position_config = config.get("component_config", {}).get("position_monitor", {})
@@ -196,6 +200,9 @@ class ExecutionManager:
                 # Log tight loop execution event
                 self._log_tight_loop_execution(order, handshake, reconciliation_success, timestamp)
 
+                if handshake.was_successful():
+                    self._notify_fill(handshake)
+
             return handshake
 
         except Exception as e:
@@ -207,6 +214,15 @@ class ExecutionManager:
             )
             return None
 
+    def _notify_fill(self, handshake: ExecutionHandshake) -> None:
+        """Hand a confirmed order to on_fill; a failing listener never fails the order."""
+        if self.on_fill is None:
+            return
+        try:
+            self.on_fill(handshake)
+        except Exception as e:
+            self.logger.warning(f"Fill listener failed: {e}", order_id=handshake.operation_id)
+
     def _process_atomic_group(
         self, timestamp: pd.Timestamp, orders: List[Order], atomic_group_id: str
     ) -> List[ExecutionHandshake]:
@@ -222,17 +238,27 @@ class ExecutionManager:
             handshakes = []
             group_success = True
 
-            # Process each order in sequence
-            for order in sorted_orders:
-                handshake = self._process_single_order(timestamp, order)
-                if handshake:
-                    handshakes.append(handshake)
-                    if handshake.was_failed():
+            # Defer the exposure → risk → pnl chain until every delta in the group is applied
+            deferred = bool(
+                self.position_update_handler
+                and self.position_update_handler.begin_deferred_chain(timestamp)
+            )
+
+            try:
+                # Process each order in sequence
+                for order in sorted_orders:
+                    handshake = self._process_single_order(timestamp, order)
+                    if handshake:
+                        handshakes.append(handshake)
+                        if handshake.was_failed():
+                            group_success = False
+                            break
+                    else:
                         group_success = False
                         break
-                else:
+            finally:
+                if deferred and not self._flush_deferred_chain(atomic_group_id):
                     group_success = False
-                    break
 
             # Log atomic group event
             self._log_atomic_group_execution(
@@ -251,6 +277,20 @@ class ExecutionManager:
             )
             return []
 
+    def _flush_deferred_chain(self, atomic_group_id: str) -> bool:
+        """Run the deferred component chain once for an atomic group."""
+        try:
+            result = self.position_update_handler.flush_deferred_chain()
+            return result is None or result.get("success", False)
+        except Exception as e:
+            self.logger.error(
+                "Deferred component chain failed",
+                error_code="EXEC-003",
+                exc_info=e,
+                atomic_group_id=atomic_group_id,
+            )
+            return False
+
     def _reconcile_with_retry(self, timestamp: pd.Timestamp, handshake: ExecutionHandshake, order: Order) -> bool:
         """Reconcile execution with position update handler."""
         try:
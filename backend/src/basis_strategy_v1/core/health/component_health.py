@@ -593,6 +593,21 @@ class SystemHealthAggregator:
         """Register a component health checker."""
         self.component_checkers[component_name] = health_checker
         logger.info(f"Registered health checker for {component_name}")
+
+    def unregister_component(
+        self, component_name: str, health_checker: Optional[ComponentHealthChecker] = None
+    ):
+        """
+        Unregister a component health checker.
+
+        If health_checker is given, only remove it when it is still the
+        registered checker (a newer run may have replaced it).
+        """
+        current = self.component_checkers.get(component_name)
+        if current is None or (health_checker is not None and current is not health_checker):
+            return
+        del self.component_checkers[component_name]
+        logger.info(f"Unregistered health checker for {component_name}")
     
     async def check_basic_health(self) -> Dict[str, Any]:
         """
@@ -43,12 +43,11 @@ from typing import Dict, List, Optional, Any, Union
 import pandas as pd
 from datetime import datetime, timezone
 import json
-from pathlib import Path
-import ccxt
 
 from .base_execution_interface import BaseExecutionInterface
 from ...core.models.order import Order
 from ...core.models.execution import ExecutionHandshake, ExecutionStatus
+from ...infrastructure.logging.log_directory_manager import attach_component_log_file
 
 
 logger = logging.getLogger(__name__)
@@ -56,21 +55,7 @@ logger = logging.getLogger(__name__)
 # Create dedicated CEX execution interface logger
 cex_interface_logger = logging.getLogger("cex_execution_interface")
 cex_interface_logger.setLevel(logging.INFO)
-
-# Create logs directory if it doesn't exist
-logs_dir = Path(__file__).parent.parent.parent.parent / "logs"
-logs_dir.mkdir(exist_ok=True)
-
-# Create file handler for CEX execution interface logs
-cex_interface_handler = logging.FileHandler(logs_dir / "cex_execution_interface.log")
-cex_interface_handler.setLevel(logging.INFO)
-
-# Create formatter
-cex_interface_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-cex_interface_handler.setFormatter(cex_interface_formatter)
-
-# Add handler to logger
-cex_interface_logger.addHandler(cex_interface_handler)
+# Its log file is attached on first construction, not at import
 
 # Error codes for CEX Execution Interface
 ERROR_CODES = {
@@ -94,6 +79,7 @@ class CEXExecutionInterface(BaseExecutionInterface):
 
     def __init__(self, execution_mode: str, config: Dict[str, Any]):
         super().__init__(execution_mode, config)
+        attach_component_log_file(cex_interface_logger, "cex_execution_interface.log")
 
         # Initialize exchange clients for live mode
         if execution_mode == "live":
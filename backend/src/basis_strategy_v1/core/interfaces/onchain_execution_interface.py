@@ -42,9 +42,9 @@ from typing import Dict, List, Optional, Any, Union
 import pandas as pd
 from datetime import datetime, timezone
 import json
-from pathlib import Path
 
 from .base_execution_interface import BaseExecutionInterface
+from ...infrastructure.logging.log_directory_manager import attach_component_log_file
 
 
 logger = logging.getLogger(__name__)
@@ -52,21 +52,7 @@ logger = logging.getLogger(__name__)
 # Create dedicated OnChain execution interface logger
 onchain_interface_logger = logging.getLogger("onchain_execution_interface")
 onchain_interface_logger.setLevel(logging.INFO)
-
-# Create logs directory if it doesn't exist
-logs_dir = Path(__file__).parent.parent.parent.parent / "logs"
-logs_dir.mkdir(exist_ok=True)
-
-# Create file handler for OnChain execution interface logs
-onchain_interface_handler = logging.FileHandler(logs_dir / "onchain_execution_interface.log")
-onchain_interface_handler.setLevel(logging.INFO)
-
-# Create formatter
-onchain_interface_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-onchain_interface_handler.setFormatter(onchain_interface_formatter)
-
-# Add handler to logger
-onchain_interface_logger.addHandler(onchain_interface_handler)
+# Its log file is attached on first construction, not at import
 
 # Error codes for OnChain Execution Interface
 ERROR_CODES = {
@@ -90,6 +76,7 @@ class OnChainExecutionInterface(BaseExecutionInterface):
 
     def __init__(self, execution_mode: str, config: Dict[str, Any], data_provider=None):
         super().__init__(execution_mode, config)
+        attach_component_log_file(onchain_interface_logger, "onchain_execution_interface.log")
 
         # Store data provider for liquidity index queries
         self.data_provider = data_provider
@@ -105,7 +92,11 @@ class OnChainExecutionInterface(BaseExecutionInterface):
         """Initialize Web3 clients and contracts for live mode."""
         try:
             from web3 import Web3
-            from web3.middleware import geth_poa_middleware
+
+            try:
+                from web3.middleware import geth_poa_middleware
+            except ImportError:  # web3 >= 7
+                from web3.middleware import ExtraDataToPOAMiddleware as geth_poa_middleware
 
             self.web3_clients = {}
             self.contracts = {}
@@ -350,12 +341,35 @@ class OnChainExecutionInterface(BaseExecutionInterface):
         if "ethereum" not in self.web3_clients:
             return 0.0
 
-        w3 = self.web3_clients["ethereum"]
+        environment = os.getenv("BASIS_ENVIRONMENT", "dev").upper()
+        wallet_address = os.getenv(f"BASIS_{environment}__ALCHEMY__WALLET_ADDRESS")
+        if not wallet_address:
+            return 0.0
 
         try:
-            # This would get the actual balance from the blockchain
-            # For now, return 0
-            return 0.0
+            from ...infrastructure.chain.chain_reader import ChainRead, get_chain_reader
+
+            # Shares the position interfaces' block cache for the same RPC endpoint
+            reader = get_chain_reader(self.web3_clients["ethereum"].provider.endpoint_uri)
+            if asset == "ETH":
+                reads = [ChainRead.native_balance(asset, wallet_address)]
+            else:
+                from ...infrastructure.config.config_manager import get_config_manager
+
+                venue_config = get_config_manager().get_venue_config(venue or "aave_v3")
+                token = (venue_config.get("contracts") or {}).get(asset)
+                if token is None:
+                    logger.warning(f"No contract address for {asset} on {venue or 'aave_v3'}")
+                    return 0.0
+                reads = [
+                    ChainRead.erc20_balance(asset, token, wallet_address),
+                    ChainRead.erc20_decimals("decimals", token),
+                ]
+            result = await reader.read(reads)
+            if result.errors:
+                raise RuntimeError(result.errors)
+            decimals = result.values.get("decimals", 18)
+            return result.values[asset] / 10**decimals
         except Exception as e:
             logger.error(f"Failed to get balance: {e}")
             return 0.0
@@ -4,18 +4,26 @@ OnChain Position Interface
 Position monitoring interface for OnChain venues (AAVE, Morpho, Lido, EtherFi).
 Handles DeFi protocol position queries for on-chain protocols.
 
+Live reads (token, aToken and debtToken balances, AAVE oracle prices) for a refresh go
+through one block-pinned ChainReader batch (infrastructure.chain); contract addresses
+come from the venue config's `contracts` map (symbol -> address, plus `oracle`).
+
 Reference: docs/REFERENCE_ARCHITECTURE_CANONICAL.md - Section 9 (Execution Interface Factory Extended)
 Reference: docs/specs/07B_EXECUTION_INTERFACES.md - Position Monitoring Interface Methods
 """
 
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
 import pandas as pd
 import os
 
 from .base_position_interface import BasePositionInterface
 
+if TYPE_CHECKING:
+    # eth_abi / eth_utils are only imported on the live path
+    from ...infrastructure.chain.chain_reader import ChainRead, ChainReadResult
+
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +54,13 @@ class OnChainPositionInterface(BasePositionInterface):
         self.credentials = self._get_credentials(venue)
 
         # Initialize venue-specific client (for live mode)
+        self.contracts: Dict[str, str] = {}
+        self.token_decimals: Dict[str, int] = {}
+        self.oracle_prices: Dict[str, float] = {}
+        self.last_chain_read: Optional["ChainReadResult"] = None
+        self.wallet_address: Optional[str] = None
         if execution_mode == "live":
+            self.contracts = self._get_contracts(venue)
             self.client = self._initialize_client(venue)
         else:
             self.client = None
@@ -133,7 +147,7 @@ class OnChainPositionInterface(BasePositionInterface):
         """
         credential_prefix = os.getenv("BASIS_ENVIRONMENT", "dev").upper() + "_"
 
-        if venue == "aave":
+        if venue in ("aave", "aave_v3"):
             return {
                 "rpc_url": os.getenv(f"{credential_prefix}ONCHAIN__AAVE_RPC_URL"),
                 "private_key": os.getenv(f"{credential_prefix}ONCHAIN__AAVE_PRIVATE_KEY"),
@@ -166,11 +180,76 @@ class OnChainPositionInterface(BasePositionInterface):
         Returns:
             Initialized client instance
         """
-        # TODO: Implement actual client initialization
-        # This would use the appropriate Web3 client for each protocol
-        # For now, return None as placeholder
-        self.logger.warning(f"Client initialization not implemented for {venue}")
-        return None
+        environment = os.getenv("BASIS_ENVIRONMENT", "dev").upper()
+        rpc_url = self.credentials.get("rpc_url") or os.getenv(
+            f"BASIS_{environment}__ALCHEMY__RPC_URL"
+        )
+        self.wallet_address = self.credentials.get("wallet_address") or os.getenv(
+            f"BASIS_{environment}__ALCHEMY__WALLET_ADDRESS"
+        )
+        if not rpc_url:
+            self.logger.warning(f"No RPC URL configured for {venue}")
+            return None
+        try:
+            from ...infrastructure.chain.chain_reader import get_chain_reader
+
+            return get_chain_reader(rpc_url)
+        except ImportError:
+            self.logger.error("Web3.py not installed. Install with: pip install web3")
+            return None
+
+    def _get_contracts(self, venue: str) -> Dict[str, str]:
+        """Contract addresses from the venue config (symbol -> address, 'oracle')."""
+        try:
+            from ...infrastructure.config.config_manager import get_config_manager
+
+            return dict(get_config_manager().get_venue_config(venue).get("contracts") or {})
+        except KeyError:
+            return {}
+        except Exception as e:
+            self.logger.warning(f"No contract addresses for {venue}: {e}")
+            return {}
+
+    def _position_reads(self) -> List["ChainRead"]:
+        """
+        Reads for one refresh: balance of every subscribed position with a known contract,
+        decimals not yet known and the AAVE oracle price of each position's underlying.
+        """
+        from ...infrastructure.chain.chain_reader import ChainRead
+
+        subscriptions = (
+            self.config.get("component_config", {})
+            .get("position_monitor", {})
+            .get("position_subscriptions", [])
+        )
+        oracle = self.contracts.get("oracle")
+        reads: List["ChainRead"] = []
+        for instrument_key in subscriptions:
+            parts = instrument_key.split(":")
+            if len(parts) < 3 or parts[0] != self.venue:
+                continue
+            position_type, symbol = parts[1], parts[2]
+            if symbol == "ETH":
+                reads.append(ChainRead.native_balance(instrument_key, self.wallet_address))
+                continue
+            token = self.contracts.get(symbol)
+            if token is None:
+                self.logger.debug(f"No contract address for {instrument_key}")
+                continue
+            reads.append(ChainRead.erc20_balance(instrument_key, token, self.wallet_address))
+            if symbol not in self.token_decimals:
+                reads.append(ChainRead.erc20_decimals(f"decimals:{symbol}", token))
+
+            underlying = {"aToken": symbol[1:], "debtToken": symbol[len("debt"):]}.get(
+                position_type, symbol
+            )
+            if oracle and underlying in self.contracts:
+                reads.append(
+                    ChainRead.oracle_price(
+                        f"price:{underlying}", oracle, self.contracts[underlying]
+                    )
+                )
+        return reads
 
     def _get_simulated_positions(self, timestamp: pd.Timestamp) -> Dict[str, Any]:
         """
@@ -278,17 +357,28 @@ class OnChainPositionInterface(BasePositionInterface):
         Returns:
             Live position data
         """
-        # TODO: Implement actual on-chain queries
-        # This would use Web3 clients to query protocol contracts
-        self.logger.warning(f"Live position query not implemented for {self.venue}")
-
-        # Return empty positions for now
-        return {
-            "venue": self.venue,
-            "timestamp": timestamp,
-            "positions": {},
-            "execution_mode": "live",
-        }
+        if self.client is None or not self.wallet_address:
+            self.logger.warning(f"Live position query not available for {self.venue}")
+            return {}
+
+        read = await self.client.read(self._position_reads())
+        self.last_chain_read = read
+        for key, error in read.errors.items():
+            self.logger.warning(f"Chain read {key} failed at block {read.block_number}: {error}")
+
+        positions = {}
+        for key, value in read.values.items():
+            if key.startswith("decimals:"):
+                self.token_decimals[key[len("decimals:"):]] = int(value)
+        for key, value in read.values.items():
+            if key.startswith("price:"):
+                self.oracle_prices[key[len("price:"):]] = value / 1e8
+            elif not key.startswith("decimals:"):
+                symbol = key.split(":")[2]
+                decimals = 18 if symbol == "ETH" else self.token_decimals.get(symbol)
+                if decimals is not None:
+                    positions[key] = value / 10**decimals
+        return positions
 
     async def _get_live_balance(self, asset: str, timestamp: pd.Timestamp) -> float:
         """
@@ -301,9 +391,10 @@ class OnChainPositionInterface(BasePositionInterface):
         Returns:
             Live balance
         """
-        # TODO: Implement actual on-chain queries
-        # This would use Web3 clients to query token balances
-        self.logger.warning(f"Live balance query not implemented for {self.venue}")
+        positions = await self._get_live_positions(timestamp)
+        for instrument_key, amount in positions.items():
+            if instrument_key.split(":")[2] == asset:
+                return amount
         return 0.0
 
     async def _get_live_position_history(
@@ -5,6 +5,9 @@ from .margin_calculator import MarginCalculator
 from .health_calculator import HealthCalculator
 from .metrics_calculator import MetricsCalculator
 from .math_utilities_wrapper import MathUtilities
+from .pnl_attribution import PositionHistory, attribute_pnl
+from .scenario_engine import ScenarioEconomics, run_scenarios
+from .stress_grid import StressGrid, stress_exposures
 
 __all__ = [
     "LTVCalculator",
@@ -12,4 +15,10 @@ __all__ = [
     "HealthCalculator",
     "MetricsCalculator",
     "MathUtilities",
+    "PositionHistory",
+    "attribute_pnl",
+    "ScenarioEconomics",
+    "run_scenarios",
+    "StressGrid",
+    "stress_exposures",
 ]
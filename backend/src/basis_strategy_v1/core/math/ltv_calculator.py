@@ -24,6 +24,7 @@ ERROR_CODES = {
     "LTV-006": "LTV safety validation failed",
     "LTV-007": "E-mode eligibility check failed",
     "LTV-008": "Leverage headroom calculation failed",
+    "LTV-009": "Leverage loop solve failed",
 }
 
 
@@ -237,6 +238,68 @@ class LTVCalculator:
 
         return max(Decimal("0"), leverage_capacity)
 
+    @staticmethod
+    def solve_leverage_loop(
+        equity: Decimal,
+        target_ltv: Decimal,
+        lst_eth_ratio: Decimal = Decimal("1"),
+        stake_fee: Decimal = Decimal("0"),
+        flash_loan_fee: Decimal = Decimal("0"),
+    ) -> Dict[str, Decimal]:
+        """Solve the converged stake -> supply -> borrow -> stake loop in closed form.
+
+        Looping loop by loop (calculate_next_loop_capacity) stakes equity, supplies the
+        LST, borrows up to target_ltv and restakes the borrowed ETH. The collateral
+        converges to the geometric series sum
+            equity * (1 - stake_fee) / (1 - target_ltv * (1 - stake_fee))
+        which a single flash-loan bundle reaches directly: flash borrow F, stake
+        equity + F, supply the LST, borrow F * (1 + flash_loan_fee) and repay, with
+            F = target_ltv * (1 - stake_fee) * equity
+                / (1 + flash_loan_fee - target_ltv * (1 - stake_fee))
+
+        Args:
+            equity: Equity to deploy in ETH
+            target_ltv: Target LTV after the loop
+            lst_eth_ratio: LST/ETH oracle price (ETH value of one LST)
+            stake_fee: Fraction of staked ETH lost to staking fees/slippage
+            flash_loan_fee: Flash loan fee as a fraction of the flash amount
+
+        Returns:
+            Dict with flash_loan_amount, stake_amount (ETH), lst_amount, collateral_value
+            (ETH), debt_amount (ETH), leverage (collateral / equity) and ltv
+        """
+        equity = Decimal(str(equity))
+        target_ltv = Decimal(str(target_ltv))
+        lst_eth_ratio = Decimal(str(lst_eth_ratio))
+        stake_efficiency = Decimal("1") - Decimal(str(stake_fee))
+        flash_cost = Decimal("1") + Decimal(str(flash_loan_fee))
+
+        if not Decimal("0") <= target_ltv < Decimal("1"):
+            raise ValueError(f"LTV-009: target_ltv must be in [0, 1), got {target_ltv}")
+        if lst_eth_ratio <= 0 or stake_efficiency <= 0:
+            raise ValueError("LTV-009: lst_eth_ratio must be positive and stake_fee below 1")
+        if flash_cost <= target_ltv * stake_efficiency:
+            raise ValueError("LTV-009: flash loan fee too low for the loop to converge")
+
+        flash_loan_amount = (
+            target_ltv * stake_efficiency * equity / (flash_cost - target_ltv * stake_efficiency)
+            if equity > 0
+            else Decimal("0")
+        )
+        stake_amount = equity + flash_loan_amount
+        collateral_value = stake_amount * stake_efficiency
+        debt_amount = flash_loan_amount * flash_cost
+
+        return {
+            "flash_loan_amount": flash_loan_amount,
+            "stake_amount": stake_amount,
+            "lst_amount": collateral_value / lst_eth_ratio,
+            "collateral_value": collateral_value,
+            "debt_amount": debt_amount,
+            "leverage": collateral_value / equity if equity > 0 else Decimal("1"),
+            "ltv": debt_amount / collateral_value if collateral_value > 0 else Decimal("0"),
+        }
+
     @staticmethod
     def calculate_health_factor(
         collateral_value: Decimal, debt_value: Decimal, liquidation_threshold: Decimal
@@ -0,0 +1,242 @@
+"""PnL Attribution - Post-run vectorized attribution over the columnar run history.
+
+Splits every instrument's value change between consecutive ticks into components with
+array differences over the whole run, instead of per-tick Python calculations:
+
+- Unit value per instrument U = value / amount is factored as U = index x oracle x price,
+  where index is the AAVE liquidity / borrow index (aTokens, debtTokens), oracle the
+  LST/ETH oracle rate (LSTs and aTokens on LSTs) and price the remaining residual
+- Revaluation of the held amount telescopes exactly into
+  index growth x balance (supply_pnl for aTokens, borrow_cost for debtTokens),
+  oracle drift x LST amount (staking_yield_oracle) and price moves (delta_pnl)
+- Perps are valued at unrealized P&L, amount x (mark - average entry); mark moves on the
+  held amount are delta_pnl and funding (-amount x rate x mark at settlement ticks) is
+  funding_pnl
+- settlement_pnl is the opening book against the baseline plus amount changes at the new
+  unit value (trades, fees, transfers), less the funding (and, with margin settlement,
+  the realized perp P&L) credited to balances
+
+Each component comes from its own inputs, and their sum is reconciled against the equity
+change with perps at unrealized P&L: reconciliation_difference is non-zero when the
+book's equity moved in a way the components do not explain, e.g. perp P&L realized by a
+reduction that no balance received.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+ATTRIBUTION_COMPONENTS = (
+    "supply_pnl",
+    "borrow_cost",
+    "staking_yield_oracle",
+    "delta_pnl",
+    "funding_pnl",
+    "settlement_pnl",
+)
+
+
+class PositionHistory:
+    """Columnar per-tick record of position amounts and signed share-class values."""
+
+    def __init__(self):
+        self.timestamps: List[pd.Timestamp] = []
+        self.keys: List[str] = []
+        self._columns: Dict[str, int] = {}
+        self._amounts: List[List[float]] = []
+        self._values: List[List[float]] = []
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def record(
+        self, timestamp: pd.Timestamp, amounts: Dict[str, float], values: Dict[str, float]
+    ) -> None:
+        """Append a tick (a repeated timestamp replaces the previous row)."""
+        for instrument_key in list(amounts) + list(values):
+            if instrument_key not in self._columns:
+                self._columns[instrument_key] = len(self.keys)
+                self.keys.append(instrument_key)
+
+        amount_row = [float(amounts.get(key, 0.0) or 0.0) for key in self.keys]
+        value_row = [float(values.get(key, 0.0) or 0.0) for key in self.keys]
+        if self.timestamps and self.timestamps[-1] == timestamp:
+            self._amounts[-1], self._values[-1] = amount_row, value_row
+            return
+        self.timestamps.append(timestamp)
+        self._amounts.append(amount_row)
+        self._values.append(value_row)
+
+    def to_arrays(self) -> Tuple[List[pd.Timestamp], List[str], np.ndarray, np.ndarray]:
+        """(timestamps, keys, amounts[tick, key], values[tick, key]); later keys pad with 0."""
+        width = len(self.keys)
+        amounts = np.zeros((len(self.timestamps), width))
+        values = np.zeros((len(self.timestamps), width))
+        for row, (amount_row, value_row) in enumerate(zip(self._amounts, self._values)):
+            amounts[row, : len(amount_row)] = amount_row
+            values[row, : len(value_row)] = value_row
+        return list(self.timestamps), list(self.keys), amounts, values
+
+
+def _factor(series: Optional[np.ndarray], shape: Tuple[int, int]) -> np.ndarray:
+    """Multiplicative factor array; missing, NaN or non-positive entries are 1 (not modelled)."""
+    if series is None:
+        return np.ones(shape)
+    series = np.asarray(series, dtype=float)
+    return np.where(np.isfinite(series) & (series > 0), series, 1.0)
+
+
+def _perp_pnl(amounts: np.ndarray, marks: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Unrealized P&L (USD) per tick, amount x (mark - average entry), and the P&L realized
+    by reductions, closes and flips between ticks.
+
+    Entries average in while a position grows, reset when it opens or flips side and are
+    kept while it shrinks; positions held at the first tick open at its mark.
+    """
+    ticks, width = amounts.shape
+    unrealized = np.zeros((ticks, width))
+    realized = np.zeros((max(ticks - 1, 0), width))
+    for column in range(width):
+        entry = marks[0, column]
+        for tick in range(1, ticks):
+            previous, amount = amounts[tick - 1, column], amounts[tick, column]
+            mark = marks[tick, column]
+            if previous == 0 or amount * previous < 0:
+                realized[tick - 1, column] = previous * (mark - entry)
+                entry = mark
+            elif abs(amount) > abs(previous):
+                entry = (previous * entry + (amount - previous) * mark) / amount
+            else:
+                realized[tick - 1, column] = (previous - amount) * (mark - entry)
+            unrealized[tick, column] = amount * (mark - entry)
+    return unrealized, realized
+
+
+def attribute_pnl(
+    keys: Sequence[str],
+    amounts: np.ndarray,
+    values: np.ndarray,
+    opening_value: float,
+    index: Optional[np.ndarray] = None,
+    oracle: Optional[np.ndarray] = None,
+    funding_rates: Optional[np.ndarray] = None,
+    mark_prices: Optional[np.ndarray] = None,
+    usd_to_share_class: Optional[np.ndarray] = None,
+    perp_pnl_settled: bool = False,
+) -> Dict[str, Any]:
+    """
+    Attribute the equity change of a run to P&L components.
+
+    Args:
+        keys: Instrument keys (venue:position_type:token), one per column
+        amounts: Position amounts, shape (tick, key)
+        values: Share-class values with debts negative and derivatives 0, shape (tick, key)
+        opening_value: Equity the first tick is booked against (initial capital)
+        index: AAVE index per tick and key (1 where not applicable)
+        oracle: LST/ETH oracle rate per tick and key (1 where not applicable)
+        funding_rates: Funding rate per tick and perp key, 0 outside settlement ticks
+        mark_prices: Perp mark price (USD) per tick and key (perps are unvalued without it)
+        usd_to_share_class: Share-class units per USD per tick
+        perp_pnl_settled: Realized perp P&L is credited to balances (margin settlement),
+            so like funding it is taken out of settlement_pnl
+
+    Returns:
+        Cumulative components and their sum (pnl_cumulative), the equity change with
+        perps at unrealized P&L (balance_pnl_cumulative), the closing perp unrealized
+        P&L (perp_unrealized_pnl) and balance minus components (reconciliation_difference)
+    """
+    amounts = np.asarray(amounts, dtype=float)
+    values = np.asarray(values, dtype=float)
+    if amounts.shape != values.shape or amounts.ndim != 2 or len(keys) != amounts.shape[1]:
+        raise ValueError(
+            f"Attribution needs (tick, key) amounts and values for {len(keys)} keys, "
+            f"got {amounts.shape} and {values.shape}"
+        )
+    components = {name: 0.0 for name in ATTRIBUTION_COMPONENTS}
+    if amounts.shape[0] == 0:
+        components.update(
+            pnl_cumulative=0.0,
+            balance_pnl_cumulative=0.0,
+            perp_unrealized_pnl=0.0,
+            reconciliation_difference=0.0,
+        )
+        return components
+
+    position_types = np.array([key.split(":")[1] if key.count(":") >= 2 else "" for key in keys])
+    perps = position_types == "Perp"
+    fx = (
+        np.ones(amounts.shape[0])
+        if usd_to_share_class is None
+        else np.nan_to_num(np.asarray(usd_to_share_class, dtype=float))
+    )
+
+    index = _factor(index, amounts.shape)
+    oracle = _factor(oracle, amounts.shape)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        unit = np.where((amounts != 0) & ~perps, values / amounts, 0.0)
+    price = unit / (index * oracle)
+
+    previous_amounts = amounts[:-1]
+    held = (previous_amounts != 0) & (amounts[1:] != 0)
+    i0, i1 = index[:-1], index[1:]
+    o0, o1 = oracle[:-1], oracle[1:]
+    p0, p1 = price[:-1], price[1:]
+    index_part = np.where(held, previous_amounts * (i1 - i0) * o1 * p1, 0.0)
+    oracle_part = np.where(held, previous_amounts * i0 * (o1 - o0) * p1, 0.0)
+    price_part = np.where(held, previous_amounts * i0 * o0 * (p1 - p0), 0.0)
+
+    # Amount changes at the new unit value (the old one for a closed position)
+    flows = (amounts[1:] - previous_amounts) * np.where(amounts[1:] != 0, unit[1:], unit[:-1])
+
+    index_by_key = index_part.sum(axis=0)
+    components["supply_pnl"] = float(index_by_key[position_types == "aToken"].sum())
+    components["borrow_cost"] = float(index_by_key[position_types == "debtToken"].sum())
+    components["staking_yield_oracle"] = float(oracle_part.sum())
+    components["delta_pnl"] = float(price_part.sum())
+
+    perp_unrealized = np.zeros(amounts.shape[0])
+    settled_perp_pnl = 0.0
+    if mark_prices is not None and perps.any():
+        marks = np.nan_to_num(np.asarray(mark_prices, dtype=float)[:, perps])
+        unrealized, realized = _perp_pnl(amounts[:, perps], marks)
+        unrealized = unrealized.sum(axis=1)
+        perp_unrealized = unrealized * fx
+        if amounts.shape[0] > 1:
+            # Mark moves on the held amount, and the open P&L revalued into the share class
+            mark_moves = (amounts[:-1, perps] * np.diff(marks, axis=0)).sum(axis=1)
+            components["delta_pnl"] += float(
+                (mark_moves * fx[1:]).sum() + (unrealized[:-1] * np.diff(fx)).sum()
+            )
+            if perp_pnl_settled:
+                settled_perp_pnl = float((realized.sum(axis=1) * fx[1:]).sum())
+
+    if funding_rates is not None and mark_prices is not None and amounts.shape[0] > 1:
+        received = -previous_amounts * np.nan_to_num(funding_rates[1:]) * np.nan_to_num(
+            mark_prices[1:]
+        )
+        components["funding_pnl"] = float((received.sum(axis=1) * fx[1:]).sum())
+
+    # Opening book against the baseline, then balance changes other than funding and
+    # settled perp P&L (both already counted above)
+    components["settlement_pnl"] = (
+        float(values[0].sum())
+        - opening_value
+        + float(flows.sum())
+        - components["funding_pnl"]
+        - settled_perp_pnl
+    )
+    components["pnl_cumulative"] = float(sum(components[name] for name in ATTRIBUTION_COMPONENTS))
+    components["perp_unrealized_pnl"] = float(perp_unrealized[-1])
+    components["balance_pnl_cumulative"] = (
+        float(values[-1].sum()) + components["perp_unrealized_pnl"] - opening_value
+    )
+    components["reconciliation_difference"] = (
+        components["balance_pnl_cumulative"] - components["pnl_cumulative"]
+    )
+    return components
@@ -0,0 +1,370 @@
+"""Scenario Engine - Vectorized Monte-Carlo / bootstrap simulation of basis strategy economics.
+
+Generates thousands of alternative paths for price, funding and AAVE index growth from
+historical factor series and simulates the core strategy economics across all paths at
+once with NumPy arrays of shape (paths, time):
+
+- Lending: AAVE supply (liquidityIndex) and variable debt (variableBorrowIndex) growth
+- Basis: spot holding plus perp short with margin, funding received at settlements
+- Risk: LTV and health factor per step (LTVCalculator / HealthCalculator formulas),
+  perp margin ratio vs maintenance margin since the last margin rebalance; a path is
+  liquidated on the first breach and its equity frozen after the liquidation penalty
+
+Paths are simulated in fixed-size chunks with one spawned seed per chunk, so results
+are reproducible for a seed whatever the number of worker processes.
+"""
+
+import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+# Error codes for Scenario Engine
+ERROR_CODES = {
+    "SCENARIO-001": "Scenario history validation failed",
+    "SCENARIO-002": "Path generation failed",
+    "SCENARIO-003": "Path simulation failed",
+}
+
+# Factor columns of a scenario history array (time, factors)
+FACTORS = ("price_log_return", "funding_rate", "supply_log_growth", "borrow_log_growth")
+PRICE, FUNDING, SUPPLY, BORROW = range(len(FACTORS))
+
+PATH_METHODS = ("bootstrap", "parametric")
+DEFAULT_CHUNK_PATHS = 256
+DISTRIBUTION_PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+
+# Health factor reported when there is no debt (HealthCalculator convention)
+NO_DEBT_HEALTH_FACTOR = 999.0
+
+
+def get_scenario_asset(config: Dict[str, Any]) -> str:
+    """Volatile asset whose price, funding and AAVE rates drive a mode's scenarios."""
+    return config.get("asset") or ("BTC" if "btc" in config.get("mode", "") else "ETH")
+
+
+@dataclass
+class ScenarioEconomics:
+    """Strategy position sizes (multiples of initial equity) and risk parameters."""
+
+    collateral: float = 0.0
+    debt: float = 0.0
+    spot: float = 0.0
+    perp_short: float = 0.0
+    perp_margin: float = 0.0
+    collateral_price_exposure: bool = False
+    debt_price_exposure: bool = False
+    spot_price_exposure: bool = True
+    liquidation_threshold: float = 0.85
+    liquidation_bonus: float = 0.05
+    maintenance_margin: float = 0.05
+    rebalance_steps: int = 24  # Perp margin reset from spot every N steps (0: never)
+
+    @property
+    def initial_equity(self) -> float:
+        return self.collateral - self.debt + self.spot + self.perp_margin
+
+    @classmethod
+    def from_mode_config(cls, config: Dict[str, Any]) -> "ScenarioEconomics":
+        """
+        Derive position sizes from a mode config's strategy flags.
+
+        Values are in the share class: assets only carry price exposure when they
+        differ from the share class (e.g. ETH collateral in a USDT share class).
+        Leveraged collateral is the converged loop size base / (1 - target_ltv).
+        """
+        mode = config.get("mode", "")
+        share_class = config.get("share_class", "USDT")
+        asset = get_scenario_asset(config)
+        exposed = share_class != asset
+
+        risk_limits = (
+            config.get("component_config", {}).get("risk_monitor", {}).get("risk_limits", {})
+        )
+        liquidation_threshold = (
+            config.get("liquidation_threshold") or risk_limits.get("liquidation_threshold") or 0.85
+        )
+        params = {
+            "liquidation_threshold": float(liquidation_threshold),
+            "collateral_price_exposure": exposed,
+            "debt_price_exposure": exposed,
+            "spot_price_exposure": exposed,
+        }
+
+        if config.get("basis_trade_enabled"):
+            return cls(spot=0.5, perp_short=0.5, perp_margin=0.5, **params)
+
+        if config.get("staking_enabled"):
+            # USDT share classes hedge the staked ETH with a perp short
+            stake = float(config.get("stake_allocation_percentage") or (0.5 if exposed else 1.0))
+            hedge = {"perp_short": stake, "perp_margin": 1.0 - stake} if exposed else {}
+            if config.get("leverage_enabled") and config.get("target_ltv"):
+                ltv = float(config["target_ltv"])
+                return cls(
+                    collateral=stake / (1 - ltv), debt=stake * ltv / (1 - ltv), **hedge, **params
+                )
+            return cls(spot=stake, **hedge, **params)
+
+        if config.get("lending_enabled"):
+            lending_asset = config.get("asset") or share_class
+            params["collateral_price_exposure"] = share_class != lending_asset
+            return cls(collateral=1.0, **params)
+
+        raise ValueError(
+            f"No scenario economics for mode {mode}: no lending, staking or basis trade"
+        )
+
+
+def validate_history(history: np.ndarray) -> None:
+    """Raise ValueError unless history is a finite (time, factors) array."""
+    if history.ndim != 2 or history.shape[1] != len(FACTORS):
+        raise ValueError(
+            f"SCENARIO-001: history must have shape (time, {len(FACTORS)}), got {history.shape}"
+        )
+    if history.shape[0] < 2:
+        raise ValueError("SCENARIO-001: history needs at least 2 steps")
+    if not np.isfinite(history).all():
+        raise ValueError("SCENARIO-001: history contains NaN or infinite values")
+
+
+def bootstrap_paths(
+    history: np.ndarray, n_paths: int, horizon: int, block_size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Block-bootstrap factor paths (paths, horizon, factors).
+
+    Whole rows are resampled in contiguous blocks, preserving cross-factor correlation
+    and autocorrelation within a block (e.g. funding regimes, daily index updates).
+    """
+    block_size = max(1, min(block_size, history.shape[0]))
+    n_blocks = math.ceil(horizon / block_size)
+    starts = rng.integers(0, history.shape[0] - block_size + 1, size=(n_paths, n_blocks))
+    rows = (starts[..., None] + np.arange(block_size)).reshape(n_paths, -1)[:, :horizon]
+    return history[rows]
+
+
+def parametric_paths(
+    history: np.ndarray, n_paths: int, horizon: int, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Parametric factor paths (paths, horizon, factors).
+
+    Multivariate normal with the historical per-step mean and covariance. Index growth is
+    not floored: per-step noise averages out while the mean keeps the historical rate.
+    """
+    return rng.multivariate_normal(
+        history.mean(axis=0), np.cov(history, rowvar=False), size=(n_paths, horizon)
+    )
+
+
+def simulate_paths(
+    paths: np.ndarray, economics: ScenarioEconomics, periods_per_year: float
+) -> Dict[str, np.ndarray]:
+    """
+    Simulate strategy economics on factor paths.
+
+    Args:
+        paths: Factor paths (paths, time, factors)
+        economics: Position sizes and risk parameters
+        periods_per_year: Steps per year (8760 for hourly paths)
+
+    Returns:
+        Per-path arrays: apy, total_return, max_drawdown, liquidated, liquidation_step,
+        min_health_factor, max_ltv
+    """
+    e = economics
+    n_paths, horizon, _ = paths.shape
+    price = np.exp(np.cumsum(paths[..., PRICE], axis=1))
+    supply_index = np.exp(np.cumsum(paths[..., SUPPLY], axis=1))
+    borrow_index = np.exp(np.cumsum(paths[..., BORROW], axis=1))
+
+    collateral = e.collateral * supply_index * (price if e.collateral_price_exposure else 1.0)
+    debt = e.debt * borrow_index * (price if e.debt_price_exposure else 1.0)
+    spot = e.spot * (price if e.spot_price_exposure else 1.0)
+
+    # Perp short: mark-to-market PnL plus funding on the current notional
+    perp_notional = e.perp_short * price
+    funding_pnl = np.cumsum(perp_notional * paths[..., FUNDING], axis=1)
+    margin_equity = e.perp_margin - e.perp_short * (price - 1.0) + funding_pnl
+    posted_margin = _rebalanced_margin(e, price, funding_pnl)
+
+    equity = collateral - debt + spot + margin_equity
+
+    # LTVCalculator.calculate_current_ltv / HealthCalculator.calculate_health_factor
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ltv = np.where(collateral > 0, debt / collateral, np.where(debt > 0, 1.0, 0.0))
+        health_factor = np.where(
+            debt > 0, collateral * e.liquidation_threshold / debt, NO_DEBT_HEALTH_FACTOR
+        )
+        margin_ratio = np.where(perp_notional > 0, posted_margin / perp_notional, np.inf)
+
+    aave_breach = health_factor < 1.0
+    margin_breach = margin_ratio < e.maintenance_margin
+    breach = aave_breach | margin_breach
+    liquidated = breach.any(axis=1)
+    liquidation_step = np.where(liquidated, breach.argmax(axis=1), -1)
+
+    # Freeze liquidated paths: AAVE liquidators take the bonus on repaid debt,
+    # a liquidated perp loses its posted margin
+    rows = np.arange(n_paths)
+    step = np.maximum(liquidation_step, 0)
+    penalty = np.where(aave_breach[rows, step], e.liquidation_bonus * debt[rows, step], 0.0)
+    penalty += np.where(margin_breach[rows, step], np.maximum(posted_margin[rows, step], 0.0), 0.0)
+    frozen = equity[rows, step] - penalty
+    after = liquidated[:, None] & (np.arange(horizon) >= step[:, None])
+    equity = np.where(after, frozen[:, None], equity)
+
+    initial_equity = e.initial_equity
+    growth = np.maximum(equity[:, -1] / initial_equity, 0.0)
+    total_return = growth - 1.0
+    apy = np.power(growth, periods_per_year / horizon) - 1.0
+
+    peak = np.maximum.accumulate(np.maximum(equity, initial_equity), axis=1)
+    max_drawdown = np.clip(1.0 - equity / peak, 0.0, 1.0).max(axis=1)
+
+    return {
+        "apy": apy,
+        "total_return": total_return,
+        "max_drawdown": max_drawdown,
+        "liquidated": liquidated,
+        "liquidation_step": liquidation_step,
+        "min_health_factor": health_factor.min(axis=1),
+        "max_ltv": ltv.max(axis=1),
+    }
+
+
+def _rebalanced_margin(
+    economics: ScenarioEconomics, price: np.ndarray, funding_pnl: np.ndarray
+) -> np.ndarray:
+    """
+    Perp margin equity when margin is reset to its initial ratio every rebalance_steps.
+
+    Rebalancing moves value between spot and margin, so it changes the margin ratio
+    but not the strategy equity.
+    """
+    e = economics
+    if e.rebalance_steps <= 0:
+        return e.perp_margin - e.perp_short * (price - 1.0) + funding_pnl
+
+    last = (np.arange(price.shape[1]) // e.rebalance_steps) * e.rebalance_steps
+    rebalance_price = price[:, last]
+    initial_ratio = e.perp_margin / e.perp_short if e.perp_short else 0.0
+    return (
+        e.perp_short * (initial_ratio * rebalance_price - (price - rebalance_price))
+        + funding_pnl
+        - funding_pnl[:, last]
+    )
+
+
+def _simulate_chunk(
+    history: np.ndarray,
+    economics: ScenarioEconomics,
+    n_paths: int,
+    horizon: int,
+    method: str,
+    block_size: int,
+    periods_per_year: float,
+    seed: np.random.SeedSequence,
+) -> Dict[str, np.ndarray]:
+    """Generate and simulate one chunk of paths (runs in a worker process)."""
+    rng = np.random.default_rng(seed)
+    if method == "bootstrap":
+        paths = bootstrap_paths(history, n_paths, horizon, block_size, rng)
+    else:
+        paths = parametric_paths(history, n_paths, horizon, rng)
+    return simulate_paths(paths, economics, periods_per_year)
+
+
+def summarize_distribution(values: np.ndarray) -> Dict[str, float]:
+    """Mean, standard deviation and percentiles of a per-path metric."""
+    summary = {"mean": float(values.mean()), "std": float(values.std())}
+    percentiles = np.percentile(values, DISTRIBUTION_PERCENTILES)
+    for pct, value in zip(DISTRIBUTION_PERCENTILES, percentiles):
+        summary[f"p{pct}"] = float(value)
+    return summary
+
+
+def run_scenarios(
+    history: np.ndarray,
+    economics: ScenarioEconomics,
+    n_paths: int = 10000,
+    horizon: int = 8760,
+    method: str = "bootstrap",
+    block_size: int = 168,
+    periods_per_year: float = 8760.0,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+    chunk_paths: int = DEFAULT_CHUNK_PATHS,
+) -> Dict[str, Any]:
+    """
+    Simulate strategy economics over generated paths, split across cores.
+
+    Args:
+        history: Historical factor steps (time, factors), see FACTORS
+        economics: Position sizes and risk parameters
+        n_paths: Number of simulated paths
+        horizon: Steps per path
+        method: 'bootstrap' (block bootstrap) or 'parametric' (multivariate normal)
+        block_size: Bootstrap block length in steps
+        periods_per_year: Steps per year used to annualize returns
+        seed: Random seed (None for fresh entropy)
+        workers: Worker processes (defaults to CPU count, 1 runs in-process)
+        chunk_paths: Paths simulated per task
+
+    Returns:
+        Distributions of APY, max drawdown, total return and min health factor,
+        liquidation probability and run parameters
+    """
+    if method not in PATH_METHODS:
+        raise ValueError(f"Invalid scenario method: {method}. Must be one of {PATH_METHODS}")
+    if n_paths <= 0 or horizon <= 0:
+        raise ValueError("n_paths and horizon must be positive")
+    if economics.initial_equity <= 0:
+        raise ValueError("Scenario economics must start with positive equity")
+    history = np.asarray(history, dtype=float)
+    validate_history(history)
+
+    chunk_sizes = [min(chunk_paths, n_paths - start) for start in range(0, n_paths, chunk_paths)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    tasks = [
+        (history, economics, size, horizon, method, block_size, periods_per_year, chunk_seed)
+        for size, chunk_seed in zip(chunk_sizes, seeds)
+    ]
+
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    logger.info(
+        f"Running {n_paths} {method} scenario paths x {horizon} steps "
+        f"in {len(tasks)} chunks on {workers} workers"
+    )
+    if workers == 1:
+        chunks = [_simulate_chunk(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(executor.map(_simulate_chunk, *zip(*tasks)))
+
+    metrics = {key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}
+    liquidation_steps = metrics["liquidation_step"][metrics["liquidated"]]
+
+    return {
+        "method": method,
+        "n_paths": n_paths,
+        "horizon": horizon,
+        "block_size": block_size if method == "bootstrap" else None,
+        "seed": seed,
+        "economics": asdict(economics),
+        "apy": summarize_distribution(metrics["apy"]),
+        "max_drawdown": summarize_distribution(metrics["max_drawdown"]),
+        "total_return": summarize_distribution(metrics["total_return"]),
+        "min_health_factor": summarize_distribution(metrics["min_health_factor"]),
+        "liquidation_probability": float(metrics["liquidated"].mean()),
+        "median_steps_to_liquidation": float(np.median(liquidation_steps))
+        if liquidation_steps.size
+        else None,
+    }
@@ -0,0 +1,281 @@
+"""Stress Grid - Vectorized liquidation distance under simultaneous shocks.
+
+Evaluates the current exposure vector under every combination of an asset price shock,
+an LST depeg and an adverse funding spike in one batched NumPy computation with arrays
+of shape (price, depeg, funding):
+
+- AAVE: LTV = stressed debt / stressed collateral; liquidation at the liquidation threshold
+- CEX: margin ratio = (venue collateral + perp PnL - funding paid) / perp notional;
+  liquidation at the venue's liquidation threshold
+- Distance to liquidation: fraction of AAVE collateral or CEX equity that can still be
+  lost before liquidation (1 - LTV / threshold, 1 - threshold / margin ratio); <= 0 means
+  liquidated, floored at -1
+
+Exposures are split into factor loadings per venue (stable, asset, LST; collateral,
+debt, perp) once per instrument key set, so a tick only sums values into that layout.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+LST_TOKENS = ("stETH", "eETH", "wstETH", "weETH")
+CEX_VENUES = ("binance", "bybit", "okx")
+
+# Factor loading columns per venue row (row 0 is AAVE, rows 1.. are CEX_VENUES)
+LOADINGS = (
+    "collateral_stable",
+    "collateral_asset",
+    "collateral_lst",
+    "debt_stable",
+    "debt_asset",
+    "perp",
+)
+(
+    COLLATERAL_STABLE,
+    COLLATERAL_ASSET,
+    COLLATERAL_LST,
+    DEBT_STABLE,
+    DEBT_ASSET,
+    PERP,
+) = range(len(LOADINGS))
+AAVE_ROW = 0
+N_ROWS = 1 + len(CEX_VENUES)
+
+DISTANCE_FLOOR = -1.0
+
+
+@dataclass
+class StressGrid:
+    """Shock axes: relative asset price moves, LST depegs and adverse funding per settlement."""
+
+    price_shocks: Sequence[float] = field(
+        default_factory=lambda: [round(x, 2) for x in np.linspace(-0.30, 0.30, 13)]
+    )
+    lst_depegs: Sequence[float] = (0.0, 0.01, 0.02, 0.03, 0.04, 0.05)
+    funding_shocks: Sequence[float] = (0.0, 0.001, 0.005, 0.01)
+
+    def __post_init__(self):
+        self.price_shocks = [float(x) for x in self.price_shocks]
+        self.lst_depegs = [float(x) for x in self.lst_depegs]
+        self.funding_shocks = [float(x) for x in self.funding_shocks]
+        if not (self.price_shocks and self.lst_depegs and self.funding_shocks):
+            raise ValueError("Stress grid axes must not be empty")
+        if min(self.price_shocks) <= -1.0:
+            raise ValueError(f"Price shocks must be above -100%, got {min(self.price_shocks)}")
+        if min(self.lst_depegs) < 0.0 or max(self.lst_depegs) >= 1.0:
+            raise ValueError(f"LST depegs must be in [0, 1), got {self.lst_depegs}")
+
+        self._price = 1.0 + np.asarray(self.price_shocks)[:, None, None]
+        self._lst = self._price * (1.0 - np.asarray(self.lst_depegs)[None, :, None])
+        self._funding = np.asarray(self.funding_shocks)[None, None, :]
+
+    @classmethod
+    def from_config(cls, stress_config: Optional[Dict[str, Any]]) -> "StressGrid":
+        """Grid from component_config.risk_monitor.stress_grid; missing axes use defaults."""
+        stress_config = stress_config or {}
+        axes = {
+            name: stress_config[name]
+            for name in ("price_shocks", "lst_depegs", "funding_shocks")
+            if stress_config.get(name) is not None
+        }
+        return cls(**axes)
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        return len(self.price_shocks), len(self.lst_depegs), len(self.funding_shocks)
+
+
+def _token_factor(token: str, asset: str) -> Optional[str]:
+    """'lst', 'asset' or 'stable' price factor of an underlying token (None: not modelled)."""
+    if token in LST_TOKENS:
+        return "lst"
+    if token in (asset, f"W{asset}"):
+        return "asset"
+    if token.startswith("USD") or token in ("DAI", "FDUSD"):
+        return "stable"
+    return None
+
+
+def position_value_usd(position: Dict[str, Any]) -> float:
+    """USD value of an exposure entry (ExposureMonitor writes value_usd)."""
+    value = position.get("value_usd")
+    if value is None:
+        value = position.get("VALUE_USD", 0)
+    return float(value or 0)
+
+
+def build_exposure_layout(keys: Sequence[str], asset: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Venue row and loading column per instrument key (-1 where the key is not stressed).
+
+    AAVE aTokens are collateral and debtTokens debt; CEX BaseTokens are margin collateral
+    and Perps the hedge. Wallet and staking-venue balances carry no liquidation risk.
+    """
+    rows = np.full(len(keys), -1, dtype=np.intp)
+    columns = np.full(len(keys), -1, dtype=np.intp)
+    for i, instrument_key in enumerate(keys):
+        parts = instrument_key.split(":")
+        if len(parts) < 3:
+            continue
+        venue, position_type, token = parts[0], parts[1], parts[2]
+
+        if venue.startswith("aave") and position_type in ("aToken", "debtToken"):
+            row = AAVE_ROW
+            underlying = token[len("debt"):] if position_type == "debtToken" else token[1:]
+            factor = _token_factor(underlying, asset)
+            if position_type == "aToken":
+                column = {"stable": COLLATERAL_STABLE, "asset": COLLATERAL_ASSET,
+                          "lst": COLLATERAL_LST}.get(factor)
+            else:
+                column = {"stable": DEBT_STABLE, "asset": DEBT_ASSET, "lst": DEBT_ASSET}.get(factor)
+        elif venue in CEX_VENUES:
+            row = 1 + CEX_VENUES.index(venue)
+            if position_type == "Perp":
+                column = PERP if token.startswith(asset) else None
+            else:
+                factor = _token_factor(token, asset)
+                column = {"stable": COLLATERAL_STABLE, "asset": COLLATERAL_ASSET,
+                          "lst": COLLATERAL_LST}.get(factor)
+        else:
+            continue
+
+        if column is not None:
+            rows[i], columns[i] = row, column
+    return rows, columns
+
+
+def exposure_loadings(
+    values_usd: np.ndarray, rows: np.ndarray, columns: np.ndarray
+) -> np.ndarray:
+    """Sum USD values into a (venue row, loading) matrix; perp values keep their sign."""
+    loadings = np.zeros((N_ROWS, len(LOADINGS)))
+    stressed = rows >= 0
+    np.add.at(loadings, (rows[stressed], columns[stressed]), values_usd[stressed])
+    return loadings
+
+
+def _distance(remaining: np.ndarray, held: np.ndarray) -> np.ndarray:
+    """remaining / held floored at DISTANCE_FLOOR, DISTANCE_FLOOR where nothing is held."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        distance = np.where(held > 0, remaining / held, DISTANCE_FLOOR)
+    return np.maximum(distance, DISTANCE_FLOOR)
+
+
+def evaluate_stress_grid(
+    loadings: np.ndarray,
+    grid: StressGrid,
+    aave_liquidation_threshold: float,
+    cex_liquidation_thresholds: Dict[str, float],
+) -> Dict[str, Any]:
+    """
+    Evaluate AAVE LTV and CEX margin ratios over the whole shock grid.
+
+    Args:
+        loadings: (venue row, loading) USD matrix from exposure_loadings
+        grid: Shock axes
+        aave_liquidation_threshold: AAVE liquidation LTV
+        cex_liquidation_thresholds: Margin ratio at which each CEX venue liquidates
+
+    Returns:
+        Grid axes, surfaces indexed [price][depeg][funding] per venue, and the minimum
+        distance to liquidation with the shock that produces it
+    """
+    shape = grid.shape
+    surfaces: Dict[str, Dict[str, np.ndarray]] = {}
+
+    def stressed(row: np.ndarray, stable: int, asset: int, lst: Optional[int]) -> np.ndarray:
+        value = row[stable] + row[asset] * grid._price
+        if lst is not None:
+            value = value + row[lst] * grid._lst
+        return np.broadcast_to(value, shape)
+
+    aave = loadings[AAVE_ROW]
+    if aave[DEBT_STABLE] + aave[DEBT_ASSET] > 0:
+        collateral = stressed(aave, COLLATERAL_STABLE, COLLATERAL_ASSET, COLLATERAL_LST)
+        debt = stressed(aave, DEBT_STABLE, DEBT_ASSET, None)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ltv = np.where(collateral > 0, debt / collateral, 999.0)  # No collateral left
+        surfaces["aave"] = {
+            "ltv": ltv,
+            "liquidation_distance": _distance(
+                collateral * aave_liquidation_threshold - debt,
+                collateral * aave_liquidation_threshold,
+            ),
+        }
+
+    for index, venue in enumerate(CEX_VENUES):
+        row = loadings[1 + index]
+        if row[PERP] == 0 or venue not in cex_liquidation_thresholds:
+            continue
+        notional = abs(row[PERP]) * grid._price
+        equity = (
+            stressed(row, COLLATERAL_STABLE, COLLATERAL_ASSET, COLLATERAL_LST)
+            + row[PERP] * (grid._price - 1.0)
+            - grid._funding * notional
+        )
+        surfaces[venue] = {
+            "margin_ratio": np.broadcast_to(equity / notional, shape),
+            "liquidation_distance": _distance(
+                equity - cex_liquidation_thresholds[venue] * notional, equity
+            ),
+        }
+
+    result = {
+        "price_shocks": list(grid.price_shocks),
+        "lst_depegs": list(grid.lst_depegs),
+        "funding_shocks": list(grid.funding_shocks),
+        "surfaces": {
+            venue: {name: surface.tolist() for name, surface in venue_surfaces.items()}
+            for venue, venue_surfaces in surfaces.items()
+        },
+        "min_liquidation_distance": None,
+        "worst_shock": None,
+    }
+
+    if surfaces:
+        venues = list(surfaces)
+        distances = np.stack([surfaces[venue]["liquidation_distance"] for venue in venues])
+        worst = np.unravel_index(int(np.argmin(distances)), distances.shape)
+        result["min_liquidation_distance"] = float(distances[worst])
+        result["worst_shock"] = {
+            "venue": venues[worst[0]],
+            "price_shock": grid.price_shocks[worst[1]],
+            "lst_depeg": grid.lst_depegs[worst[2]],
+            "funding_shock": grid.funding_shocks[worst[3]],
+        }
+
+    return result
+
+
+def stress_exposures(
+    exposures: Dict[str, Dict[str, Any]],
+    asset: str,
+    grid: StressGrid,
+    aave_liquidation_threshold: float,
+    cex_liquidation_thresholds: Dict[str, float],
+    layout: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+) -> Dict[str, Any]:
+    """Stress grid for an ExposureMonitor exposures dict (see evaluate_stress_grid)."""
+    if layout is None:
+        layout = build_exposure_layout(list(exposures), asset)
+    values_usd = np.fromiter(
+        (position_value_usd(position) for position in exposures.values()), float, len(exposures)
+    )
+    amounts = np.fromiter(
+        (position.get("amount", 0) or 0 for position in exposures.values()), float, len(exposures)
+    )
+    # Short perps carry a negative value whether or not the exposure entry is signed
+    values_usd = np.where(amounts < 0, -np.abs(values_usd), values_usd)
+    return evaluate_stress_grid(
+        exposure_loadings(values_usd, *layout),
+        grid,
+        aave_liquidation_threshold,
+        cex_liquidation_thresholds,
+    )
+
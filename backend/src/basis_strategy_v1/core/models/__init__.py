@@ -9,6 +9,7 @@ Reference: docs/REFERENCE_ARCHITECTURE_CANONICAL.md - Updated execution flow
 """
 
 from .order import Order, OrderOperation, VenueType
+from .order_template import OrderTemplate, Scaled, AMOUNT, NOTIONAL, PRICE
 from .execution import ExecutionHandshake, OperationType, ExecutionStatus
 from .domain_events import (
     PositionSnapshot,
@@ -30,6 +31,12 @@ __all__ = [
     "Order",
     "OrderOperation",
     "VenueType",
+    # Order templates
+    "OrderTemplate",
+    "Scaled",
+    "AMOUNT",
+    "NOTIONAL",
+    "PRICE",
     # Execution models
     "ExecutionHandshake",
     "OperationType",
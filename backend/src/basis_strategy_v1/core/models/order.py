@@ -49,6 +49,26 @@ class OrderOperation(str, Enum):
     TRANSFER = "transfer"
 
 
+def validate_risk_levels(
+    side: Optional[str],
+    price: Optional[float],
+    take_profit: Optional[float],
+    stop_loss: Optional[float],
+) -> None:
+    """Check take profit and stop loss lie on the correct side of the entry price."""
+    if take_profit is not None:
+        if side == "LONG" and price and take_profit <= price:
+            raise ValueError("take_profit must be higher than entry price for LONG positions")
+        elif side == "SHORT" and price and take_profit >= price:
+            raise ValueError("take_profit must be lower than entry price for SHORT positions")
+
+    if stop_loss is not None:
+        if side == "LONG" and price and stop_loss >= price:
+            raise ValueError("stop_loss must be lower than entry price for LONG positions")
+        elif side == "SHORT" and price and stop_loss <= price:
+            raise ValueError("stop_loss must be higher than entry price for SHORT positions")
+
+
 class Order(BaseModel):
     """
     Unified order specification for all venue types.
@@ -183,17 +203,7 @@ class Order(BaseModel):
             raise ValueError("sequence_in_group required when atomic_group_id is provided")
 
         # Risk management validation
-        if self.take_profit is not None:
-            if self.side == "LONG" and self.price and self.take_profit <= self.price:
-                raise ValueError("take_profit must be higher than entry price for LONG positions")
-            elif self.side == "SHORT" and self.price and self.take_profit >= self.price:
-                raise ValueError("take_profit must be lower than entry price for SHORT positions")
-
-        if self.stop_loss is not None:
-            if self.side == "LONG" and self.price and self.stop_loss >= self.price:
-                raise ValueError("stop_loss must be lower than entry price for LONG positions")
-            elif self.side == "SHORT" and self.price and self.stop_loss <= self.price:
-                raise ValueError("stop_loss must be higher than entry price for SHORT positions")
+        validate_risk_levels(self.side, self.price, self.take_profit, self.stop_loss)
 
         return self
 
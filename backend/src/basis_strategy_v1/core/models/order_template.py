@@ -0,0 +1,200 @@
+"""
+Order Templates - Pre-validated Order Shapes for Strategies
+
+A strategy declares each order shape it emits (venue, operation, pair, side, token flow,
+execution mode, intent) once as an OrderTemplate. The template validates a prototype
+Order at declaration; each order is then produced from the amount and a price with
+Order.model_copy, so the field and model validators do not re-check the fixed shape on
+every decision.
+
+Expected deltas and derived operation details / metadata are declared as Scaled terms:
+per_amount x amount + per_notional x amount x price + per_price x price.
+
+Reference: core/models/order.py - Order validation rules
+"""
+
+import time
+from typing import Any, Dict, NamedTuple, Optional
+
+from .order import Order, validate_risk_levels
+
+
+class Scaled(NamedTuple):
+    """Linear term in the order amount and price."""
+
+    per_amount: float = 0.0
+    per_notional: float = 0.0
+    per_price: float = 0.0
+
+    def __neg__(self) -> "Scaled":
+        return Scaled(-self.per_amount, -self.per_notional, -self.per_price)
+
+    @property
+    def uses_price(self) -> bool:
+        return bool(self.per_notional or self.per_price)
+
+    def resolve(self, amount: float, price: Optional[float]) -> float:
+        value = self.per_amount * amount
+        if self.per_notional:
+            value += self.per_notional * (amount * price)
+        if self.per_price:
+            value += self.per_price * price
+        return value
+
+
+AMOUNT = Scaled(per_amount=1.0)
+NOTIONAL = Scaled(per_notional=1.0)
+PRICE = Scaled(per_price=1.0)
+
+# Fields set per order rather than by the template
+_PER_ORDER_FIELDS = {
+    "operation_id",
+    "amount",
+    "price",
+    "expected_deltas",
+    "take_profit",
+    "stop_loss",
+}
+
+_last_operation_us = 0
+
+
+def next_operation_id(prefix: str) -> str:
+    """'{prefix}_{unix microseconds}', strictly increasing so consecutive orders never collide."""
+    global _last_operation_us
+    now_us = time.time_ns() // 1000
+    _last_operation_us = now_us if now_us > _last_operation_us else _last_operation_us + 1
+    return f"{prefix}_{_last_operation_us}"
+
+
+def _resolve_values(
+    values: Dict[str, Any], amount: float, price: Optional[float], overrides: Optional[Dict]
+) -> Dict[str, Any]:
+    resolved = {
+        key: value.resolve(amount, price) if isinstance(value, Scaled) else value
+        for key, value in values.items()
+    }
+    if overrides:
+        resolved.update(overrides)
+    return resolved
+
+
+class OrderTemplate:
+    """
+    Order shape validated once and built per order from amount and price.
+
+    Args:
+        operation_id_prefix: Orders get operation_id '{prefix}_{unix microseconds}'
+        expected_deltas: instrument_key -> Scaled delta
+        operation_details: Static values or Scaled terms
+        metadata: Static values or Scaled terms
+        price_on_order: Set Order.price to the price (False: the price only values
+            deltas and details, e.g. market orders or conversion rates)
+        **order_fields: Order fields fixed by the shape (venue, operation, pair, side,
+            token flow, execution_mode, strategy_intent, strategy_id, ...)
+
+    Raises:
+        ValueError: If order_fields contain a per-order field or the shape is invalid
+    """
+
+    def __init__(
+        self,
+        operation_id_prefix: str,
+        expected_deltas: Dict[str, Scaled],
+        operation_details: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        price_on_order: bool = True,
+        **order_fields: Any,
+    ):
+        per_order = _PER_ORDER_FIELDS.intersection(order_fields)
+        if per_order:
+            raise ValueError(f"Per-order fields cannot be fixed by a template: {sorted(per_order)}")
+
+        self.operation_id_prefix = operation_id_prefix
+        self.expected_deltas = dict(expected_deltas)
+        self.operation_details = dict(operation_details or {})
+        self.metadata = dict(metadata or {})
+        self.price_on_order = price_on_order
+        self.uses_price = price_on_order or any(
+            isinstance(term, Scaled) and term.uses_price
+            for values in (self.expected_deltas, self.operation_details, self.metadata)
+            for term in values.values()
+        )
+        # Atomic shapes without a fixed group take atomic_group_id per order
+        self.group_per_order = order_fields.get("execution_mode") == "atomic" and not (
+            order_fields.get("atomic_group_id")
+        )
+        if self.group_per_order:
+            order_fields["atomic_group_id"] = f"{operation_id_prefix}_template"
+
+        # Full validation of the fixed shape, once
+        self.prototype = Order(
+            operation_id=f"{operation_id_prefix}_template",
+            amount=1.0,
+            price=1.0 if price_on_order else None,
+            expected_deltas={},
+            **order_fields,
+        )
+
+    def build(
+        self,
+        amount: float,
+        price: Optional[float] = None,
+        atomic_group_id: Optional[str] = None,
+        take_profit: Optional[float] = None,
+        stop_loss: Optional[float] = None,
+        operation_details: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Order:
+        """
+        Build an order of this shape.
+
+        Only the checks that depend on per-order values run (amount and price sign,
+        atomic group, risk levels); the shape was validated at declaration.
+
+        Args:
+            amount: Order amount (in base asset units)
+            price: Price valuing the amount (required if the template uses it)
+            atomic_group_id: Group of atomic shapes declared without one
+            take_profit: Take profit price
+            stop_loss: Stop loss price
+            operation_details: Per-order details merged over the template's
+            metadata: Per-order metadata merged over the template's
+
+        Returns:
+            Order
+
+        Raises:
+            ValueError: If a per-order value is invalid
+        """
+        amount = float(amount)
+        if amount <= 0:
+            raise ValueError("amount must be positive")
+        if price is not None:
+            price = float(price)
+            if price <= 0:
+                raise ValueError("price must be positive")
+        elif self.uses_price:
+            raise ValueError(f"{self.operation_id_prefix} orders require a price")
+        if self.group_per_order and not atomic_group_id:
+            raise ValueError("atomic_group_id required when execution_mode is atomic")
+
+        update = {
+            "operation_id": next_operation_id(self.operation_id_prefix),
+            "amount": amount,
+            "price": price if self.price_on_order else None,
+            "expected_deltas": {
+                key: term.resolve(amount, price) for key, term in self.expected_deltas.items()
+            },
+            "operation_details": _resolve_values(
+                self.operation_details, amount, price, operation_details
+            ),
+            "metadata": _resolve_values(self.metadata, amount, price, metadata),
+        }
+        if atomic_group_id:
+            update["atomic_group_id"] = atomic_group_id
+        if take_profit is not None or stop_loss is not None:
+            validate_risk_levels(self.prototype.side, update["price"], take_profit, stop_loss)
+            update["take_profit"] = take_profit
+            update["stop_loss"] = stop_loss
+        return self.prototype.model_copy(update=update)
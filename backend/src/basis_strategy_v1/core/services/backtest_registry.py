@@ -0,0 +1,254 @@
+"""Bounded registry of completed backtests.
+
+Keeps lightweight summaries of finished runs in memory and spills full
+results to the ResultStore. Engine, data provider and config references are
+dropped when a run is registered, entries are evicted by LRU order and age,
+and full results are reloaded lazily (with a tiny LRU cache) on request.
+"""
+
+import logging
+import os
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Keys that hold heavy object graphs and are never kept in the registry
+HEAVY_KEYS = ("strategy_engine", "config", "data_provider", "results")
+
+# Scalar performance fields kept in memory for list/status/result endpoints
+SUMMARY_PERFORMANCE_KEYS = (
+    "total_return",
+    "total_return_pct",
+    "initial_capital",
+    "final_value",
+    "annualized_return",
+    "sharpe_ratio",
+    "max_drawdown",
+    "total_trades",
+    "total_fees",
+)
+
+
+def estimate_size(obj: Any, _seen: Optional[set] = None) -> int:
+    """Approximate deep size of plain containers in bytes (objects counted shallowly)."""
+    seen = _seen if _seen is not None else set()
+    obj_id = id(obj)
+    if obj_id in seen:
+        return 0
+    seen.add(obj_id)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += estimate_size(key, seen) + estimate_size(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += estimate_size(item, seen)
+    return size
+
+
+class BacktestRegistry:
+    """
+    Dict-like registry of completed backtests with bounded memory.
+
+    Supports the mapping operations BacktestService already uses
+    (``in``, ``[]``, ``get``, ``items``, ``len``); assigning a full
+    ``backtest_info`` stores only its summary.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_age_seconds: Optional[float] = None,
+        max_cached_results: int = 2,
+        result_store=None,
+    ):
+        """
+        Initialize registry.
+
+        Args:
+            max_entries: Max summaries kept in memory (env BASIS_BACKTEST_REGISTRY__MAX_ENTRIES)
+            max_age_seconds: Evict summaries older than this (env
+                BASIS_BACKTEST_REGISTRY__MAX_AGE_SECONDS, 0 disables)
+            max_cached_results: Full result payloads kept after a lazy reload
+            result_store: ResultStore used to spill/reload full results
+        """
+        self.max_entries = int(
+            max_entries
+            if max_entries is not None
+            else os.getenv("BASIS_BACKTEST_REGISTRY__MAX_ENTRIES", 100)
+        )
+        self.max_age_seconds = float(
+            max_age_seconds
+            if max_age_seconds is not None
+            else os.getenv("BASIS_BACKTEST_REGISTRY__MAX_AGE_SECONDS", 24 * 60 * 60)
+        )
+        if self.max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {self.max_entries}")
+        self.max_cached_results = max_cached_results
+        self._result_store = result_store
+
+        # request_id -> (summary, registered_monotonic, approx_bytes)
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], float, int]]" = OrderedDict()
+        self._full_results: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._full_results_bytes: Dict[str, int] = {}
+
+        self.evictions = 0
+        self.reloads = 0
+        self.reload_misses = 0
+
+    @property
+    def result_store(self):
+        if self._result_store is None:
+            from ...infrastructure.persistence.result_store import ResultStore
+
+            self._result_store = ResultStore()
+        return self._result_store
+
+    # Mapping interface -------------------------------------------------
+
+    def __setitem__(self, request_id: str, backtest_info: Dict[str, Any]) -> None:
+        summary = self.summarize(backtest_info)
+        self._entries[request_id] = (summary, time.monotonic(), estimate_size(summary))
+        self._entries.move_to_end(request_id)
+        self._full_results.pop(request_id, None)
+        self._full_results_bytes.pop(request_id, None)
+        self._evict()
+
+    def __getitem__(self, request_id: str) -> Dict[str, Any]:
+        summary = self.get(request_id)
+        if summary is None:
+            raise KeyError(request_id)
+        return summary
+
+    def __delitem__(self, request_id: str) -> None:
+        del self._entries[request_id]
+        self._full_results.pop(request_id, None)
+        self._full_results_bytes.pop(request_id, None)
+
+    def __contains__(self, request_id: object) -> bool:
+        self._evict_expired()
+        return request_id in self._entries
+
+    def __len__(self) -> int:
+        self._evict_expired()
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        self._evict_expired()
+        return iter(list(self._entries))
+
+    def get(self, request_id: str, default: Any = None) -> Any:
+        self._evict_expired()
+        entry = self._entries.get(request_id)
+        if entry is None:
+            return default
+        self._entries.move_to_end(request_id)
+        return entry[0]
+
+    def items(self) -> List[Tuple[str, Dict[str, Any]]]:
+        self._evict_expired()
+        return [(request_id, entry[0]) for request_id, entry in self._entries.items()]
+
+    def keys(self) -> List[str]:
+        return list(self)
+
+    def values(self) -> List[Dict[str, Any]]:
+        return [summary for _, summary in self.items()]
+
+    # Summaries and full results ----------------------------------------
+
+    @staticmethod
+    def summarize(backtest_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Strip engine/provider/config references and heavy series from a backtest_info."""
+        summary = {k: v for k, v in backtest_info.items() if k not in HEAVY_KEYS}
+        if "log_dir" in summary and summary["log_dir"] is not None:
+            summary["log_dir"] = str(summary["log_dir"])
+
+        results = backtest_info.get("results") or {}
+        performance = results.get("performance", {}) if isinstance(results, dict) else {}
+        summary["performance"] = {
+            key: performance[key] for key in SUMMARY_PERFORMANCE_KEYS if key in performance
+        }
+        summary["equity_points"] = len(performance.get("equity_curve") or [])
+        if isinstance(results, dict) and results.get("pnl_attribution"):
+            summary["pnl_attribution"] = dict(results["pnl_attribution"])
+        summary["has_full_results"] = bool(results)
+        return summary
+
+    async def get_full_results(self, request_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the full results payload of a completed backtest.
+
+        Served from the small in-memory cache when possible, otherwise
+        reloaded from the ResultStore spill file.
+        """
+        cached = self._full_results.get(request_id)
+        if cached is not None:
+            self._full_results.move_to_end(request_id)
+            return cached
+
+        full_results = await self.result_store.load_full_results(request_id)
+        if full_results is None:
+            self.reload_misses += 1
+            return None
+
+        self.reloads += 1
+        self._full_results[request_id] = full_results
+        self._full_results_bytes[request_id] = estimate_size(full_results)
+        while len(self._full_results) > self.max_cached_results:
+            evicted_id, _ = self._full_results.popitem(last=False)
+            self._full_results_bytes.pop(evicted_id, None)
+        return full_results
+
+    def cache_full_results(self, request_id: str, full_results: Dict[str, Any]) -> None:
+        """Prime the reload cache with results that are already in memory."""
+        if request_id not in self._entries or not full_results:
+            return
+        self._full_results[request_id] = full_results
+        self._full_results.move_to_end(request_id)
+        self._full_results_bytes[request_id] = estimate_size(full_results)
+        while len(self._full_results) > self.max_cached_results:
+            evicted_id, _ = self._full_results.popitem(last=False)
+            self._full_results_bytes.pop(evicted_id, None)
+
+    # Eviction and accounting -------------------------------------------
+
+    def _evict_expired(self) -> None:
+        if self.max_age_seconds <= 0:
+            return
+        cutoff = time.monotonic() - self.max_age_seconds
+        expired = [rid for rid, (_, registered, _) in self._entries.items() if registered < cutoff]
+        for request_id in expired:
+            del self[request_id]
+            self.evictions += 1
+            logger.info(f"Evicted expired backtest summary: {request_id}")
+
+    def _evict(self) -> None:
+        self._evict_expired()
+        while len(self._entries) > self.max_entries:
+            request_id, _ = self._entries.popitem(last=False)
+            self._full_results.pop(request_id, None)
+            self._full_results_bytes.pop(request_id, None)
+            self.evictions += 1
+            logger.info(f"Evicted least recently used backtest summary: {request_id}")
+
+    def memory_stats(self) -> Dict[str, Any]:
+        """Memory accounting for the health endpoint."""
+        self._evict_expired()
+        summary_bytes = sum(entry[2] for entry in self._entries.values())
+        cached_bytes = sum(self._full_results_bytes.values())
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "max_age_seconds": self.max_age_seconds,
+            "summary_bytes": summary_bytes,
+            "cached_full_results": len(self._full_results),
+            "cached_full_results_bytes": cached_bytes,
+            "total_bytes": summary_bytes + cached_bytes,
+            "evictions": self.evictions,
+            "reloads": self.reloads,
+            "reload_misses": self.reload_misses,
+        }
@@ -15,7 +15,14 @@ import pytz
 import pandas as pd
 
 from ..event_engine.event_driven_strategy_engine import EventDrivenStrategyEngine
+from ..event_engine.portfolio_backtest_runner import (
+    PortfolioBacktestRunner,
+    isolate_component_singletons,
+    normalize_weights,
+)
+from ...infrastructure.persistence.backtest_checkpoint import find_checkpoint, load_checkpoint
 from ..strategies.strategy_factory import StrategyFactory
+from .backtest_registry import BacktestRegistry
 
 
 logger = logging.getLogger(__name__)
@@ -42,6 +49,7 @@ class BacktestRequest:
     config_overrides: Dict[str, Any] = field(default_factory=dict)
     debug_mode: bool = False
     request_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    extends: Optional[str] = None  # Completed backtest this run extends
     health_status: str = "healthy"
     error_count: int = 0
 
@@ -123,9 +131,10 @@ class BacktestRequest:
 class BacktestService:
     """Service for running backtests using the new component architecture."""
 
-    def __init__(self):
+    def __init__(self, completed_registry: Optional[BacktestRegistry] = None):
         self.running_backtests: Dict[str, Dict[str, Any]] = {}
-        self.completed_backtests: Dict[str, Dict[str, Any]] = {}
+        # Completed runs keep only summaries in memory; full results spill to ResultStore
+        self.completed_backtests: BacktestRegistry = completed_registry or BacktestRegistry()
 
     def create_request(
         self,
@@ -160,10 +169,312 @@ class BacktestService:
             logger.error(f"[BT-001] Backtest request validation failed: {', '.join(errors)}")
             raise ValueError(f"Invalid request: {', '.join(errors)}")
 
+        return await self._launch_backtest(request, correlation_id)
+
+    async def resume_backtest(self, request_id: str) -> str:
+        """
+        Continue an interrupted backtest from its last checkpoint.
+
+        The run keeps its request_id, correlation_id and timestep results; only
+        ticks after the checkpointed timestamp are processed.
+        """
+        if request_id in self.running_backtests:
+            raise ValueError(f"Backtest {request_id} is still running")
+
+        state = self._load_checkpoint_state(request_id)
+        if state["completed"]:
+            raise ValueError(
+                f"Backtest {request_id} already completed; use extend_backtest to add days"
+            )
+
+        request = BacktestRequest(**state["metadata"])
+        logger.info(f"Resuming backtest {request_id} after {state['engine']['current_timestamp']}")
+        return await self._launch_backtest(request, state["correlation_id"], resume_state=state)
+
+    async def extend_backtest(self, request_id: str, days: int, correlation_id: str = None) -> str:
+        """
+        Extend a completed backtest by N days without recomputing its history.
+
+        Runs as a new request (recording `extends`) that starts from the completed
+        run's final checkpoint; results cover the original start to the new end date.
+        """
+        if days <= 0:
+            raise ValueError(f"days must be positive, got {days}")
+
+        state = self._load_checkpoint_state(request_id)
+        if not state["completed"]:
+            raise ValueError(f"Backtest {request_id} has not completed; use resume_backtest first")
+
+        original = BacktestRequest(**state["metadata"])
+        request = self.create_request(
+            strategy_name=original.strategy_name,
+            start_date=original.start_date,
+            end_date=original.end_date + timedelta(days=days),
+            initial_capital=original.initial_capital,
+            share_class=original.share_class,
+            config_overrides=original.config_overrides,
+            debug_mode=original.debug_mode,
+        )
+        request.extends = request_id
+
+        # New request: timestep results and offsets start fresh
+        extend_state = {**state, "results": {"request_id": None, "offsets": {}}}
+        logger.info(f"Extending backtest {request_id} by {days} days as {request.request_id}")
+        return await self._launch_backtest(request, correlation_id, resume_state=extend_state)
+
+    async def run_portfolio_backtest(
+        self,
+        strategy_names: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        total_capital: Decimal,
+        weights: Optional[Dict[str, float]] = None,
+        config_overrides: Optional[Dict[str, Dict[str, Any]]] = None,
+        correlation_id: str = None,
+    ) -> Dict[str, Any]:
+        """
+        Run several strategies in lockstep over one shared data pass.
+
+        Each strategy is funded with its capital weight of total_capital (USDT,
+        converted at the start price for ETH share classes). Strategies of the same
+        data type share one data provider covering all their position subscriptions,
+        so each tick's snapshot is loaded once.
+
+        Args:
+            strategy_names: Strategies (modes) to run
+            start_date: Backtest start date
+            end_date: Backtest end date
+            total_capital: Combined book capital in USDT
+            weights: Capital weights per strategy (equal weights if None)
+            config_overrides: Per-strategy config overrides
+            correlation_id: Correlation ID prefix for the strategy runs
+
+        Returns:
+            Per-strategy results and the combined book (see PortfolioBacktestRunner)
+        """
+        import os
+        from ...infrastructure.config.config_manager import get_config_manager
+        from ...infrastructure.data.data_provider_cache import get_data_provider_cache
+
+        weights = normalize_weights(strategy_names, weights)
+        if total_capital <= 0:
+            raise ValueError("total_capital must be positive")
+        if end_date <= start_date:
+            raise ValueError("end_date must be after start_date")
+        # Sleeves are mode names; never fall back to a default mode
+        config_manager = get_config_manager()
+        for name in strategy_names:
+            config_manager.validate_strategy_name(name)
+
+        portfolio_id = correlation_id or uuid.uuid4().hex
+        execution_mode = os.getenv("BASIS_EXECUTION_MODE")
+        config_overrides = config_overrides or {}
+
+        # Per-strategy configs (capital is set once share-class prices are known)
+        configs = {}
+        for name in strategy_names:
+            mode_config = self._slice_config(name)
+            request = self.create_request(
+                strategy_name=name,
+                start_date=start_date,
+                end_date=end_date,
+                initial_capital=Decimal(str(total_capital)) * Decimal(str(weights[name])),
+                share_class=mode_config.get("share_class", "USDT"),
+                config_overrides=config_overrides.get(name),
+            )
+            configs[name] = self._create_config(request)
+
+        # One provider per data type covering every strategy's subscriptions
+        data_providers = {}
+        for data_type, names in self._group_by_data_type(strategy_names).items():
+            data_providers[data_type] = get_data_provider_cache().acquire(
+                execution_mode=execution_mode,
+                data_type=data_type,
+                config=self._union_subscriptions_config([configs[name] for name in names]),
+                start_date=start_date,
+                end_date=end_date,
+            )
+
+        engines = {}
+        try:
+            for data_type, names in self._group_by_data_type(strategy_names).items():
+                data_provider = data_providers[data_type]
+                for name in names:
+                    share_class = configs[name]["share_class"]
+                    capital = float(total_capital) * weights[name]
+                    if share_class != PortfolioBacktestRunner.REPORTING_CURRENCY:
+                        prices = data_provider.get_data(pd.Timestamp(start_date, tz="UTC"))[
+                            "market_data"
+                        ]["prices"]
+                        capital /= prices[share_class]
+                    configs[name].update({"initial_capital": capital})
+                    configs[name]["backtest"]["initial_capital"] = capital
+
+                    # Components are process singletons; each strategy needs its own graph
+                    isolate_component_singletons()
+                    engines[name] = EventDrivenStrategyEngine(
+                        config=configs[name],
+                        execution_mode=execution_mode,
+                        data_provider=data_provider,
+                        initial_capital=capital,
+                        share_class=share_class,
+                        correlation_id=f"{portfolio_id}_{name}",
+                    )
+
+            runner = PortfolioBacktestRunner(engines, weights, float(total_capital))
+            results = await runner.run(
+                start_date=start_date.strftime("%Y-%m-%d"), end_date=end_date.strftime("%Y-%m-%d")
+            )
+            results["portfolio_id"] = portfolio_id
+            logger.info(
+                f"✅ Portfolio backtest completed: {len(engines)} strategies, "
+                f"combined return {results['combined']['total_return_pct']:.2f}%"
+            )
+            return results
+
+        except Exception as e:
+            logger.error(f"[BT-004] Portfolio backtest failed: {e}")
+            raise
+
+        finally:
+            for engine in engines.values():
+                engine.release_resources()
+            for data_provider in data_providers.values():
+                get_data_provider_cache().release(data_provider)
+
+    def _group_by_data_type(self, strategy_names: List[str]) -> Dict[str, List[str]]:
+        """Group strategies by data type (ML strategies use CeFi data)."""
+        groups: Dict[str, List[str]] = {}
+        for name in strategy_names:
+            groups.setdefault("cefi" if name.startswith("ml_") else "defi", []).append(name)
+        return groups
+
+    def _union_subscriptions_config(self, configs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Data provider config whose position subscriptions cover every given config."""
+        subscriptions = []
+        for config in configs:
+            for instrument in config["component_config"]["position_monitor"][
+                "position_subscriptions"
+            ]:
+                if instrument not in subscriptions:
+                    subscriptions.append(instrument)
+
+        union_config = self._deep_merge(
+            configs[0],
+            {"component_config": {"position_monitor": {"position_subscriptions": subscriptions}}},
+        )
+        return union_config
+
+    async def run_scenario_analysis(
+        self,
+        strategy_name: str,
+        history_start: datetime,
+        history_end: datetime,
+        n_paths: int = 10000,
+        horizon_days: int = 365,
+        method: str = "bootstrap",
+        block_hours: int = 168,
+        seed: Optional[int] = None,
+        workers: Optional[int] = None,
+        config_overrides: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Simulate a strategy's economics over bootstrapped or parametric paths.
+
+        Paths are generated from the hourly price, funding and AAVE index history of
+        the strategy's subscriptions between history_start and history_end, and
+        simulated vectorized across worker processes (see core.math.scenario_engine).
+
+        Args:
+            strategy_name: Strategy (mode) to simulate
+            history_start: Start of the historical window paths are drawn from
+            history_end: End of the historical window
+            n_paths: Number of simulated paths
+            horizon_days: Length of each path in days
+            method: 'bootstrap' or 'parametric'
+            block_hours: Bootstrap block length in hours
+            seed: Random seed for reproducible distributions
+            workers: Worker processes (defaults to CPU count)
+            config_overrides: Mode config overrides (e.g. target_ltv)
+
+        Returns:
+            APY, drawdown, total return and health factor distributions and the
+            liquidation probability
+        """
+        from ..math.scenario_engine import ScenarioEconomics, run_scenarios
+        from ...infrastructure.data.scenario_history import load_scenario_history
+
+        if history_end <= history_start:
+            raise ValueError("history_end must be after history_start")
+
+        config = self._slice_config(self._map_strategy_to_mode(strategy_name))
+        if config_overrides:
+            config = self._deep_merge(config, config_overrides)
+
+        history = load_scenario_history(config, history_start, history_end)
+        economics = ScenarioEconomics.from_mode_config(config)
+
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(
+            None,
+            lambda: run_scenarios(
+                history,
+                economics,
+                n_paths=n_paths,
+                horizon=horizon_days * 24,
+                method=method,
+                block_size=block_hours,
+                periods_per_year=8760.0,
+                seed=seed,
+                workers=workers,
+            ),
+        )
+        results.update(
+            {
+                "strategy_name": strategy_name,
+                "history_start": str(history_start),
+                "history_end": str(history_end),
+            }
+        )
+        return results
+
+    def _load_checkpoint_state(self, request_id: str) -> Dict[str, Any]:
+        """Load the newest checkpoint of a backtest started by this service."""
+        known_log_dir = self.get_log_dir(request_id)
+        path = find_checkpoint(request_id, log_dirs=[known_log_dir] if known_log_dir else [])
+        if path is None:
+            raise ValueError(f"No checkpoint found for backtest {request_id}")
+
+        state = load_checkpoint(path)
+        if not state.get("metadata"):
+            raise ValueError(f"Checkpoint {path} has no backtest request metadata")
+        return state
+
+    def _checkpoint_metadata(self, request: BacktestRequest) -> Dict[str, Any]:
+        """Request fields needed to rebuild the backtest from a checkpoint."""
+        return {
+            "strategy_name": request.strategy_name,
+            "start_date": request.start_date,
+            "end_date": request.end_date,
+            "initial_capital": request.initial_capital,
+            "share_class": request.share_class,
+            "config_overrides": request.config_overrides,
+            "debug_mode": request.debug_mode,
+            "request_id": request.request_id,
+            "extends": request.extends,
+        }
+
+    async def _launch_backtest(
+        self,
+        request: BacktestRequest,
+        correlation_id: str = None,
+        resume_state: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Build config, data provider and engine for a request and execute it."""
         try:
             # Phase 4: Use new architecture with proper dependency injection
             from ...infrastructure.config.config_manager import get_config_manager
-            from ...infrastructure.data.data_provider_factory import create_data_provider
+            from ...infrastructure.data.data_provider_cache import get_data_provider_cache
 
             # Create config with API request parameters applied
             config = self._create_config(request)
@@ -180,26 +491,42 @@ class BacktestService:
             else:
                 data_type = "defi"
 
-            data_provider = create_data_provider(
-                execution_mode=os.getenv("BASIS_EXECUTION_MODE"), data_type=data_type, config=config
+            # Shared, reference-counted provider: repeated runs over the same
+            # mappings, data files and date range skip loading entirely
+            data_provider = get_data_provider_cache().acquire(
+                execution_mode=os.getenv("BASIS_EXECUTION_MODE"),
+                data_type=data_type,
+                config=config,
+                start_date=request.start_date,
+                end_date=request.end_date,
             )
 
             # Phase 3: Initialize strategy engine with proper dependency injection
-            strategy_engine = EventDrivenStrategyEngine(
-                config=config,
-                execution_mode=os.getenv("BASIS_EXECUTION_MODE"),
-                data_provider=data_provider,
-                initial_capital=float(request.initial_capital),  # From API request
-                share_class=request.share_class,  # From API request
-                debug_mode=request.debug_mode,
-                correlation_id=correlation_id,
-            )
+            try:
+                strategy_engine = EventDrivenStrategyEngine(
+                    config=config,
+                    execution_mode=os.getenv("BASIS_EXECUTION_MODE"),
+                    data_provider=data_provider,
+                    initial_capital=float(request.initial_capital),  # From API request
+                    share_class=request.share_class,  # From API request
+                    debug_mode=request.debug_mode,
+                    correlation_id=correlation_id,
+                )
+            except Exception:
+                get_data_provider_cache().release(data_provider)
+                raise
+
+            # Checkpoints are keyed by the service request_id and carry the request
+            strategy_engine.checkpoint_id = request.request_id
+            strategy_engine.checkpoint_metadata = self._checkpoint_metadata(request)
 
             # Store request info
             self.running_backtests[request.request_id] = {
                 "request": request,
                 "config": config,
                 "strategy_engine": strategy_engine,
+                "data_provider": data_provider,
+                "log_dir": strategy_engine.log_dir,
                 "status": "running",
                 "started_at": datetime.utcnow(),
                 "progress": 0,
@@ -214,7 +541,7 @@ class BacktestService:
                 strategy_engine.debug_print_position_monitor()
 
             # Execute backtest synchronously (Phase 4: no background tasks)
-            results = await self._execute_backtest_sync(request.request_id)
+            results = await self._execute_backtest_sync(request.request_id, resume_state)
 
             return request.request_id
 
@@ -222,11 +549,14 @@ class BacktestService:
             logger.error(f"[BT-003] Strategy engine initialization failed: {e}")
             raise
 
-    async def _execute_backtest_sync(self, request_id: str) -> Dict[str, Any]:
+    async def _execute_backtest_sync(
+        self, request_id: str, resume_state: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Execute backtest synchronously using Phase 3 component architecture.
 
         Phase 4: Synchronous execution with real component orchestration.
+        resume_state continues the run from a checkpoint (resume/extend).
         """
         if request_id not in self.running_backtests:
             raise ValueError(f"Backtest request not found: {request_id}")
@@ -244,6 +574,7 @@ class BacktestService:
             results = await strategy_engine.run_backtest(
                 start_date=request.start_date.strftime("%Y-%m-%d"),
                 end_date=request.end_date.strftime("%Y-%m-%d"),
+                resume_state=resume_state,
             )
 
             # Debug: Print final position monitor state
@@ -256,18 +587,9 @@ class BacktestService:
             backtest_info["completed_at"] = datetime.utcnow()
             backtest_info["results"] = results
 
-            # Move to completed backtests
-            self.completed_backtests[request_id] = backtest_info
-
-            # Clean up running backtests to free memory and prevent state persistence
-            if request_id in self.running_backtests:
-                del self.running_backtests[request_id]
-
-            # Save results to filesystem for quality gates
+            # Save results to filesystem for quality gates (also spills full results)
             try:
-                from ...infrastructure.persistence.result_store import ResultStore
-
-                result_store = ResultStore()
+                result_store = self.completed_backtests.result_store
 
                 # Create result data in the format expected by ResultStore
                 performance = results.get("performance", {})
@@ -293,6 +615,9 @@ class BacktestService:
                     "total_fees": str(performance.get("total_fees", 0)),
                     "equity_curve": performance.get("equity_curve"),
                     "metrics_summary": performance.get("metrics_summary", {}),
+                    "pnl_attribution": results.get("pnl_attribution"),
+                    "log_dir": str(backtest_info["log_dir"]) if backtest_info.get("log_dir") else None,
+                    "extends": request.extends,
                 }
 
                 await result_store.save_result(request_id, result_data, full_results=results)
@@ -301,6 +626,18 @@ class BacktestService:
                 logger.warning(f"⚠️ Failed to save results to filesystem: {e}")
                 # Continue without failing the backtest
 
+            # Move to completed backtests (summary only) and keep the fresh
+            # results in the small reload cache for immediate follow-up queries
+            self.completed_backtests[request_id] = backtest_info
+            self.completed_backtests.cache_full_results(request_id, results)
+
+            # Release engine, data provider and config references
+            self._release_backtest_resources(backtest_info)
+
+            # Clean up running backtests to free memory and prevent state persistence
+            if request_id in self.running_backtests:
+                del self.running_backtests[request_id]
+
             logger.info(f"✅ Backtest completed successfully: {request_id}")
             return results
 
@@ -311,12 +648,53 @@ class BacktestService:
             backtest_info["completed_at"] = datetime.utcnow()
 
             # Clean up running backtests even on failure to free memory
+            self._release_backtest_resources(backtest_info)
             if request_id in self.running_backtests:
                 del self.running_backtests[request_id]
 
             logger.error(f"❌ Backtest failed: {request_id} - {e}")
             raise ValueError(f"Backtest execution failed: {e}")
 
+    def _release_backtest_resources(self, backtest_info: Dict[str, Any]) -> None:
+        """Drop engine, data provider and config references held for a finished run."""
+        strategy_engine = backtest_info.pop("strategy_engine", None)
+        if strategy_engine is not None and hasattr(strategy_engine, "release_resources"):
+            try:
+                strategy_engine.release_resources()
+            except Exception as e:
+                logger.warning(f"Failed to release strategy engine resources: {e}")
+        data_provider = backtest_info.pop("data_provider", None)
+        if data_provider is not None:
+            from ...infrastructure.data.data_provider_cache import get_data_provider_cache
+
+            get_data_provider_cache().release(data_provider)
+        backtest_info.pop("config", None)
+        backtest_info.pop("results", None)
+
+    def get_engine(self, request_id: str) -> Optional[EventDrivenStrategyEngine]:
+        """Get the live strategy engine of a running backtest (released once completed)."""
+        backtest_info = self.running_backtests.get(request_id)
+        if not backtest_info:
+            return None
+        return backtest_info.get("strategy_engine")
+
+    def get_pnl_attribution(self, request_id: str) -> Optional[Dict[str, float]]:
+        """Run-end P&L attribution of a completed backtest (kept in its registry summary)."""
+        backtest_info = self.completed_backtests.get(request_id)
+        if not backtest_info:
+            return None
+        return backtest_info.get("pnl_attribution")
+
+    def get_memory_stats(self) -> Dict[str, Any]:
+        """Memory accounting for running and completed backtests (health endpoint)."""
+        from ...infrastructure.data.data_provider_cache import get_data_provider_cache
+
+        return {
+            "running_backtests": len(self.running_backtests),
+            "completed_registry": self.completed_backtests.memory_stats(),
+            "data_provider_cache": get_data_provider_cache().get_stats(),
+        }
+
     def _create_config(self, request: BacktestRequest) -> Dict[str, Any]:
         """Create configuration using existing config infrastructure."""
         try:
@@ -362,7 +740,11 @@ class BacktestService:
             raise
 
     def _map_strategy_to_mode(self, strategy_name: str) -> str:
-        """Map strategy name to mode."""
+        """Map strategy name to mode (modes in the config registry map to themselves)."""
+        from ...infrastructure.config.config_manager import get_config_manager
+
+        if get_config_manager().strategy_exists(strategy_name):
+            return strategy_name
         mode_map = {
             "pure_lending_usdt": "pure_lending_usdt",
             "pure_lending_eth": "pure_lending_eth",
@@ -480,6 +862,7 @@ class BacktestService:
             backtest_info["status"] = "completed"
             backtest_info["progress"] = 1.0
             backtest_info["completed_at"] = datetime.utcnow()
+            self._release_backtest_resources(backtest_info)
 
             logger.info(f"Backtest {request_id} completed successfully")
 
@@ -516,9 +899,9 @@ class BacktestService:
         if request_id in self.completed_backtests:
             backtest_info = self.completed_backtests[request_id]
 
-            # Extract the actual results from the event engine
-            raw_results = backtest_info.get("results", {})
-            performance = raw_results.get("performance", {})
+            # Full results are reloaded lazily from the ResultStore spill
+            raw_results = await self.completed_backtests.get_full_results(request_id) or {}
+            performance = raw_results.get("performance") or backtest_info.get("performance", {})
 
             logger.info(
                 f"Backtest Service get_result: raw_results keys = {list(raw_results.keys()) if raw_results else 'None'}"
@@ -557,6 +940,23 @@ class BacktestService:
                 )  # Recursive call to handle completed backtests
         return None
 
+    def get_log_dir(self, request_id: str) -> Optional[Path]:
+        """Get the log directory (logs/{correlation_id}/{pid}/) of a known backtest."""
+        backtest_info = self.running_backtests.get(request_id) or self.completed_backtests.get(
+            request_id
+        )
+        if not backtest_info or not backtest_info.get("log_dir"):
+            return None
+        return Path(backtest_info["log_dir"])
+
+    def get_strategy_name(self, request_id: str) -> str:
+        """Get the strategy name of a known backtest."""
+        backtest_info = self.running_backtests.get(request_id) or self.completed_backtests.get(
+            request_id
+        )
+        request = backtest_info.get("request") if backtest_info else None
+        return getattr(request, "strategy_name", "unknown")
+
     async def cancel_backtest(self, request_id: str) -> bool:
         """Cancel a running backtest."""
         if request_id in self.running_backtests:
@@ -285,6 +285,12 @@ class LiveTradingService:
 
             logger.info(f"Starting live trading for strategy {request_id}")
 
+            # Risk watchdog emergency breaches take the same path as /live/emergency-stop
+            async def emergency_stop_handler(reason: str) -> bool:
+                return await self.emergency_stop(request_id, reason)
+
+            strategy_engine.emergency_stop_handler = emergency_stop_handler
+
             # Start the strategy engine in live mode
             await strategy_engine.run_live()
 
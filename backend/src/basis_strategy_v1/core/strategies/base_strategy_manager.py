@@ -11,18 +11,38 @@ Reference: docs/WORKFLOW_GUIDE.md - Order generation workflow
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 import logging
 import os
 import pandas as pd
 from pathlib import Path
 
-from ...core.models.order import Order
+from ...core.models.order import Order, OrderOperation
+from ...core.models.order_template import OrderTemplate, next_operation_id
+from ...core.models.venues import Venue
 from ...infrastructure.logging.structured_logger import StructuredLogger
 from ...infrastructure.logging.domain_event_logger import DomainEventLogger
 
 logger = logging.getLogger(__name__)
 
+# Plain-data attribute types captured in backtest checkpoints
+_CHECKPOINT_SCALAR_TYPES = (type(None), bool, int, float, str, pd.Timestamp)
+# Attributes rebuilt from config/wiring when the strategy is constructed
+_CHECKPOINT_EXCLUDED_ATTRIBUTES = {"config", "strategy_config", "correlation_id", "pid"}
+
+
+def _is_checkpoint_value(value: Any) -> bool:
+    """Check if a value is plain data that can be checkpointed."""
+    if isinstance(value, _CHECKPOINT_SCALAR_TYPES):
+        return True
+    if isinstance(value, (list, tuple, set)):
+        return all(_is_checkpoint_value(item) for item in value)
+    if isinstance(value, dict):
+        return all(
+            _is_checkpoint_value(key) and _is_checkpoint_value(item) for key, item in value.items()
+        )
+    return False
+
 
 class BaseStrategyManager(ABC):
     """Abstract base class for all strategy managers - ORDER GENERATION FOCUSED"""
@@ -87,6 +107,9 @@ class BaseStrategyManager(ABC):
         self.available_actions = self.strategy_config.get("actions", [])
         self.rebalancing_triggers = self.strategy_config.get("rebalancing_triggers", [])
 
+        # Order shapes, declared by subclasses once their instruments are set
+        self.order_templates: Dict[str, OrderTemplate] = {}
+
         # Log component initialization
         self.logger.info(
             f"BaseStrategyManager initialized for {self.strategy_type}",
@@ -278,6 +301,305 @@ class BaseStrategyManager(ABC):
                 method="trigger_tight_loop",
             )
 
+    def get_lst_eth_ratio(self, timestamp: pd.Timestamp, lst_symbol: str) -> float:
+        """LST/ETH oracle price at a timestamp (1.0 if the oracle has no price)."""
+        try:
+            ratio = self.utility_manager.get_oracle_price(lst_symbol, "ETH", timestamp)
+        except Exception as e:
+            self.logger.warning(f"No {lst_symbol}/ETH oracle price at {timestamp}: {e}")
+            return 1.0
+        return float(ratio) if isinstance(ratio, (int, float)) and ratio > 0 else 1.0
+
+    def _create_leveraged_staking_orders(
+        self,
+        loop: Dict[str, float],
+        lst_type: str,
+        staking_instrument: str,
+        borrow_instrument: str,
+        staking_protocol: str,
+        atomic_group_id: str,
+        strategy_intent: str,
+        target_ltv: float,
+        first_sequence: int = 1,
+    ) -> List[Order]:
+        """
+        Single atomic flash-loan bundle reaching a converged leverage loop.
+
+        Replaces loop-by-loop stake -> supply -> borrow sequences with five orders:
+        FLASH_BORROW, STAKE, SUPPLY, BORROW, FLASH_REPAY, sized by
+        LTVCalculator.solve_leverage_loop.
+
+        Args:
+            loop: solve_leverage_loop result (floats)
+            lst_type: LST token symbol
+            staking_instrument: LST position key credited by the stake
+            borrow_instrument: AAVE debt position key
+            staking_protocol: Staking protocol venue
+            atomic_group_id: Atomic group of the bundle
+            strategy_intent: Order intent (entry_full, entry_partial)
+            target_ltv: Target LTV the loop was solved for
+            first_sequence: sequence_in_group of the first order
+
+        Returns:
+            List of Order objects for the bundle
+        """
+        flash_amount = loop["flash_loan_amount"]
+        stake_amount = loop["stake_amount"]
+        lst_amount = loop["lst_amount"]
+        debt_amount = loop["debt_amount"]
+        leverage = loop["leverage"]
+        strategy_id = self.config.get("mode", self.__class__.__name__)
+        bundle = {
+            "execution_mode": "atomic",
+            "atomic_group_id": atomic_group_id,
+            "strategy_intent": strategy_intent,
+            "strategy_id": strategy_id,
+        }
+
+        return [
+            Order(
+                operation_id=next_operation_id("flash_borrow"),
+                venue=Venue.INSTADAPP,
+                operation=OrderOperation.FLASH_BORROW,
+                token_out="WETH",
+                amount=flash_amount,
+                source_venue=Venue.INSTADAPP,
+                target_venue=Venue.WALLET,
+                source_token="WETH",
+                target_token="WETH",
+                expected_deltas={
+                    f"{Venue.INSTADAPP.value}:BaseToken:WETH": flash_amount,
+                    f"{Venue.WALLET.value}:BaseToken:WETH": flash_amount,
+                },
+                operation_details={"target_ltv": target_ltv, "leverage": leverage},
+                sequence_in_group=first_sequence,
+                metadata={"target_ltv": target_ltv, "leverage": leverage},
+                **bundle,
+            ),
+            Order(
+                operation_id=next_operation_id("stake"),
+                venue=staking_protocol,
+                operation=OrderOperation.STAKE,
+                token_in="WETH",
+                token_out=lst_type,
+                amount=stake_amount,
+                source_venue=Venue.WALLET,
+                target_venue=staking_protocol,
+                source_token="WETH",
+                target_token=lst_type,
+                expected_deltas={
+                    f"{Venue.WALLET.value}:BaseToken:WETH": -stake_amount,
+                    staking_instrument: lst_amount,
+                },
+                operation_details={"lst_type": lst_type, "staking_protocol": staking_protocol},
+                sequence_in_group=first_sequence + 1,
+                **bundle,
+            ),
+            Order(
+                operation_id=next_operation_id("supply"),
+                venue=Venue.AAVE_V3,
+                operation=OrderOperation.SUPPLY,
+                token_in=lst_type,
+                token_out=f"a{lst_type}",
+                amount=lst_amount,
+                source_venue=Venue.WALLET,
+                target_venue=Venue.AAVE_V3,
+                source_token=lst_type,
+                target_token=f"a{lst_type}",
+                expected_deltas={
+                    staking_instrument: -lst_amount,
+                    f"{Venue.AAVE_V3.value}:aToken:a{lst_type}": lst_amount,
+                },
+                operation_details={"lending_protocol": "aave_v3", "COLLATERAL_TYPE": lst_type},
+                sequence_in_group=first_sequence + 2,
+                **bundle,
+            ),
+            Order(
+                operation_id=next_operation_id("borrow"),
+                venue=Venue.AAVE_V3,
+                operation=OrderOperation.BORROW,
+                token_out="WETH",
+                amount=debt_amount,
+                source_venue=Venue.AAVE_V3,
+                target_venue=Venue.WALLET,
+                source_token="WETH",
+                target_token="WETH",
+                expected_deltas={
+                    borrow_instrument: debt_amount,
+                    f"{Venue.WALLET.value}:BaseToken:WETH": debt_amount,
+                },
+                operation_details={"lending_protocol": "aave_v3", "borrow_asset": "WETH"},
+                sequence_in_group=first_sequence + 3,
+                **bundle,
+            ),
+            Order(
+                operation_id=next_operation_id("flash_repay"),
+                venue=Venue.INSTADAPP,
+                operation=OrderOperation.FLASH_REPAY,
+                token_in="WETH",
+                amount=debt_amount,
+                source_venue=Venue.WALLET,
+                target_venue=Venue.INSTADAPP,
+                source_token="WETH",
+                target_token="WETH",
+                expected_deltas={
+                    f"{Venue.WALLET.value}:BaseToken:WETH": -debt_amount,
+                    f"{Venue.INSTADAPP.value}:BaseToken:WETH": -flash_amount,
+                },
+                operation_details={"flash_loan_protocol": "instadapp", "REPAY_ASSET": "WETH"},
+                sequence_in_group=first_sequence + 4,
+                **bundle,
+            ),
+        ]
+
+    def _create_leveraged_unwind_orders(
+        self,
+        unwind: Dict[str, float],
+        lst_type: str,
+        staking_instrument: str,
+        borrow_instrument: str,
+        staking_protocol: str,
+        atomic_group_id: str,
+        strategy_intent: str,
+        first_sequence: int = 1,
+    ) -> List[Order]:
+        """
+        Single atomic flash-loan bundle unwinding (part of) a leverage loop.
+
+        Mirrors _create_leveraged_staking_orders with five orders: FLASH_BORROW the
+        debt, REPAY it, WITHDRAW the LST collateral, UNSTAKE it to WETH and
+        FLASH_REPAY; the wallet keeps the unstaked WETH net of the debt.
+
+        Args:
+            unwind: debt_amount (WETH repaid), lst_amount (collateral withdrawn) and
+                weth_amount (WETH received for lst_amount)
+            lst_type: LST token symbol
+            staking_instrument: LST position key the collateral is withdrawn to
+            borrow_instrument: AAVE debt position key
+            staking_protocol: Staking protocol venue
+            atomic_group_id: Atomic group of the bundle
+            strategy_intent: Order intent (exit_full, exit_partial)
+            first_sequence: sequence_in_group of the first order
+
+        Returns:
+            List of Order objects for the bundle
+        """
+        debt_amount = unwind["debt_amount"]
+        lst_amount = unwind["lst_amount"]
+        weth_amount = unwind["weth_amount"]
+        strategy_id = self.config.get("mode", self.__class__.__name__)
+        bundle = {
+            "execution_mode": "atomic",
+            "atomic_group_id": atomic_group_id,
+            "strategy_intent": strategy_intent,
+            "strategy_id": strategy_id,
+        }
+
+        return [
+            Order(
+                operation_id=next_operation_id("flash_borrow"),
+                venue=Venue.INSTADAPP,
+                operation=OrderOperation.FLASH_BORROW,
+                token_out="WETH",
+                amount=debt_amount,
+                source_venue=Venue.INSTADAPP,
+                target_venue=Venue.WALLET,
+                source_token="WETH",
+                target_token="WETH",
+                expected_deltas={
+                    f"{Venue.INSTADAPP.value}:BaseToken:WETH": debt_amount,
+                    f"{Venue.WALLET.value}:BaseToken:WETH": debt_amount,
+                },
+                sequence_in_group=first_sequence,
+                **bundle,
+            ),
+            Order(
+                operation_id=next_operation_id("repay"),
+                venue=Venue.AAVE_V3,
+                operation=OrderOperation.REPAY,
+                token_in="WETH",
+                amount=debt_amount,
+                source_venue=Venue.WALLET,
+                target_venue=Venue.AAVE_V3,
+                source_token="WETH",
+                target_token="WETH",
+                expected_deltas={
+                    f"{Venue.WALLET.value}:BaseToken:WETH": -debt_amount,
+                    borrow_instrument: -debt_amount,
+                },
+                operation_details={"lending_protocol": "aave_v3", "REPAY_ASSET": "WETH"},
+                sequence_in_group=first_sequence + 1,
+                **bundle,
+            ),
+            Order(
+                operation_id=next_operation_id("withdraw"),
+                venue=Venue.AAVE_V3,
+                operation=OrderOperation.WITHDRAW,
+                token_in=f"a{lst_type}",
+                token_out=lst_type,
+                amount=lst_amount,
+                source_venue=Venue.AAVE_V3,
+                target_venue=Venue.WALLET,
+                source_token=f"a{lst_type}",
+                target_token=lst_type,
+                expected_deltas={
+                    f"{Venue.AAVE_V3.value}:aToken:a{lst_type}": -lst_amount,
+                    staking_instrument: lst_amount,
+                },
+                operation_details={"lending_protocol": "aave_v3", "COLLATERAL_TYPE": lst_type},
+                sequence_in_group=first_sequence + 2,
+                **bundle,
+            ),
+            Order(
+                operation_id=next_operation_id("unstake"),
+                venue=staking_protocol,
+                operation=OrderOperation.UNSTAKE,
+                token_in=lst_type,
+                token_out="WETH",
+                amount=lst_amount,
+                source_venue=staking_protocol,
+                target_venue=Venue.WALLET,
+                source_token=lst_type,
+                target_token="WETH",
+                expected_deltas={
+                    staking_instrument: -lst_amount,
+                    f"{Venue.WALLET.value}:BaseToken:WETH": weth_amount,
+                },
+                operation_details={"lst_type": lst_type, "staking_protocol": staking_protocol},
+                sequence_in_group=first_sequence + 3,
+                **bundle,
+            ),
+            Order(
+                operation_id=next_operation_id("flash_repay"),
+                venue=Venue.INSTADAPP,
+                operation=OrderOperation.FLASH_REPAY,
+                token_in="WETH",
+                amount=debt_amount,
+                source_venue=Venue.WALLET,
+                target_venue=Venue.INSTADAPP,
+                source_token="WETH",
+                target_token="WETH",
+                expected_deltas={
+                    f"{Venue.WALLET.value}:BaseToken:WETH": -debt_amount,
+                    f"{Venue.INSTADAPP.value}:BaseToken:WETH": -debt_amount,
+                },
+                operation_details={"flash_loan_protocol": "instadapp", "REPAY_ASSET": "WETH"},
+                sequence_in_group=first_sequence + 4,
+                **bundle,
+            ),
+        ]
+
+    def _declare_order_templates(self) -> Dict[str, OrderTemplate]:
+        """Order shapes this strategy emits, validated once at construction."""
+        return {}
+
+    def _order_template(self, name: str, declare: Callable[[], OrderTemplate]) -> OrderTemplate:
+        """Template for shapes keyed by runtime values (e.g. dust tokens), declared on first use."""
+        template = self.order_templates.get(name)
+        if template is None:
+            template = self.order_templates[name] = declare()
+        return template
+
     def get_current_equity(self, exposure_data: Dict) -> float:
         """Get current equity from exposure data."""
         return exposure_data.get("total_exposure", 0.0)
@@ -343,3 +665,21 @@ class BaseStrategyManager(ABC):
         except Exception as e:
             self.logger.error("Error getting strategy info", error_code="STRAT-001", exc_info=e)
             return {"strategy_type": self.__class__.__name__, "equity": 0.0, "error": str(e)}
+
+    def get_checkpoint_state(self) -> Dict[str, Any]:
+        """
+        Strategy internal state for backtest checkpoints.
+
+        Captures plain-data attributes (counters, flags, last signals); component
+        references, loggers and models are rebuilt when the strategy is constructed.
+        """
+        return {
+            name: value
+            for name, value in vars(self).items()
+            if name not in _CHECKPOINT_EXCLUDED_ATTRIBUTES and _is_checkpoint_value(value)
+        }
+
+    def restore_checkpoint_state(self, state: Dict[str, Any]) -> None:
+        """Restore strategy internal state from a backtest checkpoint."""
+        for name, value in state.items():
+            setattr(self, name, value)
@@ -16,6 +16,7 @@ from pathlib import Path
 
 from .base_strategy_manager import BaseStrategyManager
 from ...core.models.order import Order, OrderOperation
+from ...core.models.order_template import AMOUNT, NOTIONAL, PRICE, OrderTemplate, Scaled
 from ...core.models.venues import Venue
 from ...core.models.instruments import validate_instrument_key, get_display_name, get_instrument
 
@@ -122,6 +123,8 @@ class BTCBasisStrategy(BaseStrategyManager):
             except ValueError as e:
                 raise ValueError(f"Invalid instrument key format: {instrument}") from e
 
+        self.order_templates = self._declare_order_templates()
+
         self.logger.info(
             f"BTCBasisStrategy initialized with {self.btc_allocation*100}% BTC allocation"
         )
@@ -250,6 +253,208 @@ class BTCBasisStrategy(BaseStrategyManager):
                 "total_equity": current_equity,
             }
 
+    def _declare_order_templates(self) -> Dict[str, OrderTemplate]:
+        """Order shapes of the BTC basis strategy, parameterized by BTC amount and price."""
+        spot_buy = dict(
+            venue="binance",
+            operation=OrderOperation.SPOT_TRADE,
+            pair="BTC/USDT",
+            side="BUY",
+            order_type="market",
+            source_venue="wallet",
+            target_venue="binance",
+            source_token="USDT",
+            target_token="BTC",
+            execution_mode="sequential",
+            strategy_id="btc_basis",
+        )
+        perp_short = dict(
+            venue="bybit",
+            operation=OrderOperation.PERP_TRADE,
+            pair="BTCUSDT",
+            side="SHORT",
+            order_type="market",
+            source_venue="wallet",
+            target_venue="bybit",
+            source_token="USDT",
+            target_token="BTC",
+            execution_mode="sequential",
+            strategy_id="btc_basis",
+        )
+        spot_buy_deltas = {
+            "binance:BaseToken:BTC": AMOUNT,  # Gain BTC
+            "binance:BaseToken:USDT": -NOTIONAL,  # Lose USDT
+        }
+        margin = Scaled(per_notional=0.1)  # 10% margin
+        perp_short_deltas = {
+            "bybit:PerpPosition:BTC": -AMOUNT,  # Negative BTC exposure (short)
+            "bybit:BaseToken:USDT": -margin,  # Lose USDT as margin
+        }
+        rebalance = {"REBALANCE_TYPE": "increase"}
+
+        templates = {
+            "entry_spot_buy": OrderTemplate(
+                "spot_buy",
+                expected_deltas=spot_buy_deltas,
+                operation_details={
+                    "btc_allocation": self.btc_allocation,
+                    "btc_price": PRICE,
+                    "usdt_amount": NOTIONAL,
+                },
+                metadata={"btc_allocation": self.btc_allocation},
+                strategy_intent="btc_basis_entry",
+                **spot_buy,
+            ),
+            "entry_perp_short": OrderTemplate(
+                "perp_short",
+                expected_deltas=perp_short_deltas,
+                operation_details={
+                    "btc_allocation": self.btc_allocation,
+                    "btc_price": PRICE,
+                    "MARGIN_AMOUNT": margin,
+                    "MARGIN_RATIO": 0.1,
+                },
+                metadata={"btc_allocation": self.btc_allocation},
+                strategy_intent="btc_basis_entry",
+                **perp_short,
+            ),
+            "exit_perp_close": OrderTemplate(
+                "perp_close",
+                expected_deltas={
+                    "bybit:PerpPosition:BTC": AMOUNT,  # Close short (positive delta)
+                    "bybit:BaseToken:USDT": margin,  # Return margin
+                },
+                operation_details={
+                    "position_type": "close_short",
+                    "btc_price": PRICE,
+                    "MARGIN_RETURN": margin,
+                },
+                metadata={"position_type": "close_short"},
+                venue="bybit",
+                operation=OrderOperation.PERP_TRADE,
+                pair="BTCUSDT",
+                side="LONG",  # Close short position
+                order_type="market",
+                source_venue="bybit",
+                target_venue="wallet",
+                source_token="BTC",
+                target_token="USDT",
+                execution_mode="sequential",
+                strategy_intent="btc_basis_exit",
+                strategy_id="btc_basis",
+            ),
+            "exit_spot_sell": OrderTemplate(
+                "spot_sell",
+                expected_deltas={
+                    "binance:BaseToken:BTC": -AMOUNT,  # Lose BTC
+                    "binance:BaseToken:USDT": NOTIONAL,  # Gain USDT
+                },
+                operation_details={"btc_balance": AMOUNT, "btc_price": PRICE, "usdt_amount": NOTIONAL},
+                metadata={"btc_balance": AMOUNT},
+                venue="binance",
+                operation=OrderOperation.SPOT_TRADE,
+                pair="BTC/USDT",
+                side="SELL",
+                order_type="market",
+                source_venue="binance",
+                target_venue="wallet",
+                source_token="BTC",
+                target_token="USDT",
+                execution_mode="sequential",
+                strategy_intent="btc_basis_exit",
+                strategy_id="btc_basis",
+            ),
+            "rebalance_spot_buy": OrderTemplate(
+                "rebalance_buy",
+                expected_deltas=spot_buy_deltas,
+                operation_details={**rebalance, "btc_price": PRICE, "usdt_amount": NOTIONAL},
+                metadata=rebalance,
+                strategy_intent="btc_basis_rebalance",
+                **spot_buy,
+            ),
+            "rebalance_perp_short": OrderTemplate(
+                "rebalance_short",
+                expected_deltas=perp_short_deltas,
+                operation_details={**rebalance, "btc_price": PRICE, "MARGIN_AMOUNT": margin},
+                metadata=rebalance,
+                strategy_intent="btc_basis_rebalance",
+                **perp_short,
+            ),
+        }
+
+        # Market orders sized from equity: the price only values the share-class leg
+        for intent, suffix in (("entry_full", ""), ("entry_partial", "_partial")):
+            templates[f"{intent}_spot_buy"] = OrderTemplate(
+                f"spot_buy{suffix}",
+                expected_deltas={self.spot_instrument: AMOUNT, self.entry_instrument: -NOTIONAL},
+                price_on_order=False,
+                venue=Venue.BINANCE,
+                operation=OrderOperation.SPOT_TRADE,
+                pair="BTCUSDT",
+                side="BUY",
+                order_type="market",
+                source_venue=Venue.WALLET,
+                target_venue=Venue.BINANCE,
+                source_token="USDT",
+                target_token="BTC",
+                execution_mode="sequential",
+                strategy_intent=intent,
+                strategy_id="btc_basis",
+            )
+            templates[f"{intent}_perp_short"] = OrderTemplate(
+                f"perp_short{suffix}",
+                expected_deltas={self.perp_instrument: -AMOUNT},  # Short position
+                price_on_order=False,
+                venue=Venue.BINANCE,
+                operation=OrderOperation.PERP_TRADE,
+                pair="BTCUSDT",
+                side="SELL",
+                order_type="market",
+                source_venue=Venue.BINANCE,
+                target_venue=Venue.BINANCE,
+                source_token="USDT",
+                target_token="BTC",
+                execution_mode="sequential",
+                strategy_intent=intent,
+                strategy_id="btc_basis",
+            )
+        for intent, suffix in (("exit_full", ""), ("exit_partial", "_partial")):
+            templates[f"{intent}_spot_sell"] = OrderTemplate(
+                f"spot_sell{suffix}",
+                expected_deltas={self.spot_instrument: -AMOUNT, self.entry_instrument: NOTIONAL},
+                price_on_order=False,
+                venue=Venue.BINANCE,
+                operation=OrderOperation.SPOT_TRADE,
+                pair="BTCUSDT",
+                side="SELL",
+                order_type="market",
+                source_venue=Venue.BINANCE,
+                target_venue=Venue.WALLET,
+                source_token="BTC",
+                target_token="USDT",
+                execution_mode="sequential",
+                strategy_intent=intent,
+                strategy_id="btc_basis",
+            )
+            templates[f"{intent}_perp_buy"] = OrderTemplate(
+                f"perp_buy{suffix}",
+                expected_deltas={self.perp_instrument: AMOUNT},  # Close short position
+                price_on_order=False,
+                venue=Venue.BINANCE,
+                operation=OrderOperation.PERP_TRADE,
+                pair="BTCUSDT",
+                side="BUY",
+                order_type="market",
+                source_venue=Venue.BINANCE,
+                target_venue=Venue.BINANCE,
+                source_token="USDT",
+                target_token="BTC",
+                execution_mode="sequential",
+                strategy_intent=intent,
+                strategy_id="btc_basis",
+            )
+        return templates
+
     def _create_entry_orders(self, equity: float) -> List[Order]:
         """
         Create orders for full BTC basis position entry.
@@ -271,94 +476,15 @@ class BTCBasisStrategy(BaseStrategyManager):
             # 1. Buy BTC spot
             btc_amount = target_position.get("btc_balance", 0.0)
             if btc_amount > 0:
-                # Generate unique operation ID
-                operation_id = f"spot_buy_{uuid.uuid4().hex[:8]}"
-
-                # Get BTC price for expected deltas calculation
                 btc_price = self._get_asset_price()
-                usdt_amount = btc_amount * btc_price
-
-                # Calculate expected deltas for spot trade
-                expected_deltas = {
-                    f"binance:BaseToken:BTC": btc_amount,  # Gain BTC
-                    f"binance:BaseToken:USDT": -usdt_amount,  # Lose USDT
-                }
-
-                # Operation details
-                operation_details = {
-                    "btc_allocation": self.btc_allocation,
-                    "btc_price": btc_price,
-                    "usdt_amount": usdt_amount,
-                }
-
-                orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue="binance",
-                        operation=OrderOperation.SPOT_TRADE,
-                        pair="BTC/USDT",
-                        side="BUY",
-                        amount=btc_amount,
-                        price=btc_price,
-                        order_type="market",
-                        source_venue="wallet",
-                        target_venue="binance",
-                        source_token="USDT",
-                        target_token="BTC",
-                        expected_deltas=expected_deltas,
-                        operation_details=operation_details,
-                        execution_mode="sequential",
-                        strategy_intent="btc_basis_entry",
-                        strategy_id="btc_basis",
-                        metadata={"btc_allocation": self.btc_allocation},
-                    )
-                )
+                orders.append(self.order_templates["entry_spot_buy"].build(btc_amount, btc_price))
 
             # 2. Open short perpetual position
             short_amount = abs(target_position.get("btc_perpetual_short", 0.0))
             if short_amount > 0:
-                # Generate unique operation ID
-                operation_id = f"perp_short_{uuid.uuid4().hex[:8]}"
-
-                # Get BTC price for margin calculation
                 btc_price = self._get_asset_price()
-                margin_amount = short_amount * btc_price * 0.1  # 10% margin
-
-                # Calculate expected deltas for perp short
-                expected_deltas = {
-                    f"bybit:PerpPosition:BTC": -short_amount,  # Negative BTC exposure (short)
-                    f"bybit:BaseToken:USDT": -margin_amount,  # Lose USDT as margin
-                }
-
-                # Operation details
-                operation_details = {
-                    "btc_allocation": self.btc_allocation,
-                    "btc_price": btc_price,
-                    "MARGIN_AMOUNT": margin_amount,
-                    "MARGIN_RATIO": 0.1,
-                }
-
                 orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue="bybit",
-                        operation=OrderOperation.PERP_TRADE,
-                        pair="BTCUSDT",
-                        side="SHORT",
-                        amount=short_amount,
-                        price=btc_price,
-                        order_type="market",
-                        source_venue="wallet",
-                        target_venue="bybit",
-                        source_token="USDT",
-                        target_token="BTC",
-                        expected_deltas=expected_deltas,
-                        operation_details=operation_details,
-                        execution_mode="sequential",
-                        strategy_intent="btc_basis_entry",
-                        strategy_id="btc_basis",
-                        metadata={"btc_allocation": self.btc_allocation},
-                    )
+                    self.order_templates["entry_perp_short"].build(short_amount, btc_price)
                 )
 
             return orders
@@ -396,95 +522,20 @@ class BTCBasisStrategy(BaseStrategyManager):
 
             # 1. Close short perpetual position
             if btc_short < 0:
-                # Generate unique operation ID
-                operation_id = f"perp_close_{uuid.uuid4().hex[:8]}"
-
-                # Get BTC price for margin calculation
                 btc_price = self._get_asset_price()
-                close_amount = abs(btc_short)
-                margin_return = close_amount * btc_price * 0.1  # Return 10% margin
-
-                # Calculate expected deltas for closing perp short
-                expected_deltas = {
-                    f"bybit:PerpPosition:BTC": close_amount,  # Close short (positive delta)
-                    f"bybit:BaseToken:USDT": margin_return,  # Return margin
-                }
-
-                # Operation details
-                operation_details = {
-                    "position_type": "close_short",
-                    "original_short": btc_short,
-                    "btc_price": btc_price,
-                    "MARGIN_RETURN": margin_return,
-                }
-
                 orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue="bybit",
-                        operation=OrderOperation.PERP_TRADE,
-                        pair="BTCUSDT",
-                        side="LONG",  # Close short position
-                        amount=close_amount,
-                        price=btc_price,
-                        order_type="market",
-                        source_venue="bybit",
-                        target_venue="wallet",
-                        source_token="BTC",
-                        target_token="USDT",
-                        expected_deltas=expected_deltas,
-                        operation_details=operation_details,
-                        execution_mode="sequential",
-                        strategy_intent="btc_basis_exit",
-                        strategy_id="btc_basis",
-                        metadata={"position_type": "close_short", "original_short": btc_short},
+                    self.order_templates["exit_perp_close"].build(
+                        abs(btc_short),
+                        btc_price,
+                        operation_details={"original_short": btc_short},
+                        metadata={"original_short": btc_short},
                     )
                 )
 
             # 2. Sell BTC spot
             if btc_balance > 0:
-                # Generate unique operation ID
-                operation_id = f"spot_sell_{uuid.uuid4().hex[:8]}"
-
-                # Get BTC price for expected deltas calculation
                 btc_price = self._get_asset_price()
-                usdt_amount = btc_balance * btc_price
-
-                # Calculate expected deltas for spot sell
-                expected_deltas = {
-                    f"binance:BaseToken:BTC": -btc_balance,  # Lose BTC
-                    f"binance:BaseToken:USDT": usdt_amount,  # Gain USDT
-                }
-
-                # Operation details
-                operation_details = {
-                    "btc_balance": btc_balance,
-                    "btc_price": btc_price,
-                    "usdt_amount": usdt_amount,
-                }
-
-                orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue="binance",
-                        operation=OrderOperation.SPOT_TRADE,
-                        pair="BTC/USDT",
-                        side="SELL",
-                        amount=btc_balance,
-                        price=btc_price,
-                        order_type="market",
-                        source_venue="binance",
-                        target_venue="wallet",
-                        source_token="BTC",
-                        target_token="USDT",
-                        expected_deltas=expected_deltas,
-                        operation_details=operation_details,
-                        execution_mode="sequential",
-                        strategy_intent="btc_basis_exit",
-                        strategy_id="btc_basis",
-                        metadata={"btc_balance": btc_balance},
-                    )
-                )
+                orders.append(self.order_templates["exit_spot_sell"].build(btc_balance, btc_price))
 
             return orders
 
@@ -519,93 +570,17 @@ class BTCBasisStrategy(BaseStrategyManager):
 
             orders = []
 
-            # 1. Buy additional BTC spot
-            if btc_amount > 0:
-                # Generate unique operation ID
-                operation_id = f"rebalance_buy_{uuid.uuid4().hex[:8]}"
-
-                usdt_amount = btc_amount * btc_price
-
-                # Calculate expected deltas for rebalance spot buy
-                expected_deltas = {
-                    f"binance:BaseToken:BTC": btc_amount,  # Gain BTC
-                    f"binance:BaseToken:USDT": -usdt_amount,  # Lose USDT
-                }
-
-                # Operation details
-                operation_details = {
-                    "btc_delta": btc_delta,
-                    "REBALANCE_TYPE": "increase",
-                    "btc_price": btc_price,
-                    "usdt_amount": usdt_amount,
-                }
-
-                orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue="binance",
-                        operation=OrderOperation.SPOT_TRADE,
-                        pair="BTC/USDT",
-                        side="BUY",
-                        amount=btc_amount,
-                        price=btc_price,
-                        order_type="market",
-                        source_venue="wallet",
-                        target_venue="binance",
-                        source_token="USDT",
-                        target_token="BTC",
-                        expected_deltas=expected_deltas,
-                        operation_details=operation_details,
-                        execution_mode="sequential",
-                        strategy_intent="btc_basis_rebalance",
-                        strategy_id="btc_basis",
-                        metadata={"btc_delta": btc_delta, "REBALANCE_TYPE": "increase"},
-                    )
-                )
-
-            # 2. Increase short perpetual position
+            # Buy additional BTC spot and increase the short perpetual position
             if btc_amount > 0:
-                # Generate unique operation ID
-                operation_id = f"rebalance_short_{uuid.uuid4().hex[:8]}"
-
-                margin_amount = btc_amount * btc_price * 0.1  # 10% margin
-
-                # Calculate expected deltas for rebalance perp short
-                expected_deltas = {
-                    f"bybit:PerpPosition:BTC": -btc_amount,  # Increase short (negative delta)
-                    f"bybit:BaseToken:USDT": -margin_amount,  # Lose USDT as margin
-                }
-
-                # Operation details
-                operation_details = {
-                    "btc_delta": btc_delta,
-                    "REBALANCE_TYPE": "increase",
-                    "btc_price": btc_price,
-                    "MARGIN_AMOUNT": margin_amount,
-                }
-
-                orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue="bybit",
-                        operation=OrderOperation.PERP_TRADE,
-                        pair="BTCUSDT",
-                        side="SHORT",
-                        amount=btc_amount,
-                        price=btc_price,
-                        order_type="market",
-                        source_venue="wallet",
-                        target_venue="bybit",
-                        source_token="USDT",
-                        target_token="BTC",
-                        expected_deltas=expected_deltas,
-                        operation_details=operation_details,
-                        execution_mode="sequential",
-                        strategy_intent="btc_basis_rebalance",
-                        strategy_id="btc_basis",
-                        metadata={"btc_delta": btc_delta, "REBALANCE_TYPE": "increase"},
+                for name in ("rebalance_spot_buy", "rebalance_perp_short"):
+                    orders.append(
+                        self.order_templates[name].build(
+                            btc_amount,
+                            btc_price,
+                            operation_details={"btc_delta": btc_delta},
+                            metadata={"btc_delta": btc_delta},
+                        )
                     )
-                )
 
             return orders
 
@@ -763,60 +738,14 @@ class BTCBasisStrategy(BaseStrategyManager):
     def _create_entry_full_orders(self, equity: float) -> List[Order]:
         """Create entry full orders for BTC basis strategy."""
         try:
-            orders = []
-
             # Calculate BTC amount
             btc_price = self._get_asset_price()
             btc_amount = equity / btc_price if btc_price > 0 else 0
 
-            # Create spot buy order
-            operation_id = f"spot_buy_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-            orders.append(
-                Order(
-                    operation_id=operation_id,
-                    venue=Venue.BINANCE,
-                    operation=OrderOperation.SPOT_TRADE,
-                    pair="BTCUSDT",
-                    side="BUY",
-                    amount=btc_amount,
-                    order_type="market",
-                    source_venue=Venue.WALLET,
-                    target_venue=Venue.BINANCE,
-                    source_token="USDT",
-                    target_token="BTC",
-                    expected_deltas={
-                        self.spot_instrument: btc_amount,
-                        self.entry_instrument: -equity,
-                    },
-                    execution_mode="sequential",
-                    strategy_intent="entry_full",
-                    strategy_id="btc_basis",
-                )
-            )
-
-            # Create perp short order
-            operation_id = f"perp_short_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-            orders.append(
-                Order(
-                    operation_id=operation_id,
-                    venue=Venue.BINANCE,
-                    operation=OrderOperation.PERP_TRADE,
-                    pair="BTCUSDT",
-                    side="SELL",
-                    amount=btc_amount,
-                    order_type="market",
-                    source_venue=Venue.BINANCE,
-                    target_venue=Venue.BINANCE,
-                    source_token="USDT",
-                    target_token="BTC",
-                    expected_deltas={self.perp_instrument: -btc_amount},  # Short position
-                    execution_mode="sequential",
-                    strategy_intent="entry_full",
-                    strategy_id="btc_basis",
-                )
-            )
-
-            return orders
+            return [
+                self.order_templates["entry_full_spot_buy"].build(btc_amount, btc_price),
+                self.order_templates["entry_full_perp_short"].build(btc_amount),
+            ]
 
         except Exception as e:
             logger.error(f"Error creating entry full orders: {e}")
@@ -825,60 +754,14 @@ class BTCBasisStrategy(BaseStrategyManager):
     def _create_entry_partial_orders(self, equity_delta: float) -> List[Order]:
         """Create entry partial orders for BTC basis strategy."""
         try:
-            orders = []
-
             # Calculate BTC amount for partial entry
             btc_price = self._get_asset_price()
             btc_amount = equity_delta / btc_price if btc_price > 0 else 0
 
-            # Create spot buy order
-            operation_id = f"spot_buy_partial_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-            orders.append(
-                Order(
-                    operation_id=operation_id,
-                    venue=Venue.BINANCE,
-                    operation=OrderOperation.SPOT_TRADE,
-                    pair="BTCUSDT",
-                    side="BUY",
-                    amount=btc_amount,
-                    order_type="market",
-                    source_venue=Venue.WALLET,
-                    target_venue=Venue.BINANCE,
-                    source_token="USDT",
-                    target_token="BTC",
-                    expected_deltas={
-                        self.spot_instrument: btc_amount,
-                        self.entry_instrument: -equity_delta,
-                    },
-                    execution_mode="sequential",
-                    strategy_intent="entry_partial",
-                    strategy_id="btc_basis",
-                )
-            )
-
-            # Create perp short order
-            operation_id = f"perp_short_partial_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-            orders.append(
-                Order(
-                    operation_id=operation_id,
-                    venue=Venue.BINANCE,
-                    operation=OrderOperation.PERP_TRADE,
-                    pair="BTCUSDT",
-                    side="SELL",
-                    amount=btc_amount,
-                    order_type="market",
-                    source_venue=Venue.BINANCE,
-                    target_venue=Venue.BINANCE,
-                    source_token="USDT",
-                    target_token="BTC",
-                    expected_deltas={self.perp_instrument: -btc_amount},  # Short position
-                    execution_mode="sequential",
-                    strategy_intent="entry_partial",
-                    strategy_id="btc_basis",
-                )
-            )
-
-            return orders
+            return [
+                self.order_templates["entry_partial_spot_buy"].build(btc_amount, btc_price),
+                self.order_templates["entry_partial_perp_short"].build(btc_amount),
+            ]
 
         except Exception as e:
             logger.error(f"Error creating entry partial orders: {e}")
@@ -896,54 +779,15 @@ class BTCBasisStrategy(BaseStrategyManager):
 
             if spot_position > 0:
                 # Close spot position
-                operation_id = f"spot_sell_{int(pd.Timestamp.now().timestamp() * 1000000)}"
                 orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue=Venue.BINANCE,
-                        operation=OrderOperation.SPOT_TRADE,
-                        pair="BTCUSDT",
-                        side="SELL",
-                        amount=spot_position,
-                        order_type="market",
-                        source_venue=Venue.BINANCE,
-                        target_venue=Venue.WALLET,
-                        source_token="BTC",
-                        target_token="USDT",
-                        expected_deltas={
-                            self.spot_instrument: -spot_position,
-                            self.entry_instrument: spot_position * self._get_asset_price(),
-                        },
-                        execution_mode="sequential",
-                        strategy_intent="exit_full",
-                        strategy_id="btc_basis",
+                    self.order_templates["exit_full_spot_sell"].build(
+                        spot_position, self._get_asset_price()
                     )
                 )
 
             if perp_position < 0:  # Short position
                 # Close perp position
-                operation_id = f"perp_buy_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-                orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue=Venue.BINANCE,
-                        operation=OrderOperation.PERP_TRADE,
-                        pair="BTCUSDT",
-                        side="BUY",
-                        amount=abs(perp_position),
-                        order_type="market",
-                        source_venue=Venue.BINANCE,
-                        target_venue=Venue.BINANCE,
-                        source_token="USDT",
-                        target_token="BTC",
-                        expected_deltas={
-                            self.perp_instrument: abs(perp_position)  # Close short position
-                        },
-                        execution_mode="sequential",
-                        strategy_intent="exit_full",
-                        strategy_id="btc_basis",
-                    )
-                )
+                orders.append(self.order_templates["exit_full_perp_buy"].build(abs(perp_position)))
 
             return orders
 
@@ -968,54 +812,13 @@ class BTCBasisStrategy(BaseStrategyManager):
             # Calculate partial amounts (proportional to current positions)
             if spot_position > 0:
                 partial_spot = min(btc_amount, spot_position)
-                operation_id = f"spot_sell_partial_{int(pd.Timestamp.now().timestamp() * 1000000)}"
                 orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue=Venue.BINANCE,
-                        operation=OrderOperation.SPOT_TRADE,
-                        pair="BTCUSDT",
-                        side="SELL",
-                        amount=partial_spot,
-                        order_type="market",
-                        source_venue=Venue.BINANCE,
-                        target_venue=Venue.WALLET,
-                        source_token="BTC",
-                        target_token="USDT",
-                        expected_deltas={
-                            self.spot_instrument: -partial_spot,
-                            self.entry_instrument: partial_spot * btc_price,
-                        },
-                        execution_mode="sequential",
-                        strategy_intent="exit_partial",
-                        strategy_id="btc_basis",
-                    )
+                    self.order_templates["exit_partial_spot_sell"].build(partial_spot, btc_price)
                 )
 
             if perp_position < 0:  # Short position
                 partial_perp = min(btc_amount, abs(perp_position))
-                operation_id = f"perp_buy_partial_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-                orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue=Venue.BINANCE,
-                        operation=OrderOperation.PERP_TRADE,
-                        pair="BTCUSDT",
-                        side="BUY",
-                        amount=partial_perp,
-                        order_type="market",
-                        source_venue=Venue.BINANCE,
-                        target_venue=Venue.BINANCE,
-                        source_token="USDT",
-                        target_token="BTC",
-                        expected_deltas={
-                            self.perp_instrument: partial_perp  # Close partial short position
-                        },
-                        execution_mode="sequential",
-                        strategy_intent="exit_partial",
-                        strategy_id="btc_basis",
-                    )
-                )
+                orders.append(self.order_templates["exit_partial_perp_buy"].build(partial_perp))
 
             return orders
 
@@ -1040,31 +843,30 @@ class BTCBasisStrategy(BaseStrategyManager):
                     continue
                 else:
                     # Sell other dust tokens for USDT
-                    operation_id = (
-                        f"dust_sell_{token}_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-                    )
-                    orders.append(
-                        Order(
-                            operation_id=operation_id,
+                    template = self._order_template(
+                        f"dust_sell_{token}",
+                        lambda: OrderTemplate(
+                            f"dust_sell_{token}",
+                            expected_deltas={
+                                f"{Venue.WALLET.value}:BaseToken:{token}": -AMOUNT,
+                                self.entry_instrument: AMOUNT,  # Simplified 1:1
+                            },
+                            price_on_order=False,
                             venue=Venue.BINANCE,
                             operation=OrderOperation.SPOT_TRADE,
                             pair=f"{token.upper()}/USDT",
                             side="SELL",
-                            amount=amount,
                             order_type="market",
                             source_venue=Venue.WALLET,
                             target_venue=Venue.WALLET,
                             source_token=token,
                             target_token="USDT",
-                            expected_deltas={
-                                f"{Venue.WALLET.value}:BaseToken:{token}": -amount,
-                                self.entry_instrument: amount,  # Simplified 1:1
-                            },
                             execution_mode="sequential",
                             strategy_intent="dust_sell",
                             strategy_id="btc_basis",
-                        )
+                        ),
                     )
+                    orders.append(template.build(amount))
 
             return orders
 
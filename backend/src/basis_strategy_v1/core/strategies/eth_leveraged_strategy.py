@@ -8,13 +8,16 @@ Reference: docs/STRATEGY_MODES.md - ETH Leveraged Strategy Mode
 Reference: docs/specs/05_STRATEGY_MANAGER.md - Component specification
 """
 
+from decimal import Decimal
 from typing import Dict, List, Any
 import logging
 import pandas as pd
 from pathlib import Path
 
 from .base_strategy_manager import BaseStrategyManager
+from ...core.math.ltv_calculator import LTVCalculator
 from ...core.models.order import Order, OrderOperation
+from ...core.models.order_template import AMOUNT, NOTIONAL, OrderTemplate
 from ...core.models.venues import Venue
 from ...core.models.instruments import validate_instrument_key, get_display_name
 
@@ -83,6 +86,8 @@ class ETHLeveragedStrategy(BaseStrategyManager):
 
         # For leveraged staking, allocate 100% to ETH staking
         self.eth_allocation = 1.0
+        # LST/ETH oracle ratio used to size the loop (refreshed each decision)
+        self.lst_eth_ratio = 1.0
 
         # Define and validate instrument keys
         self.entry_instrument = f"{Venue.WALLET.value}:BaseToken:ETH"
@@ -122,6 +127,8 @@ class ETHLeveragedStrategy(BaseStrategyManager):
                     f"Add to configs/modes/{config.get('mode', 'eth_leveraged')}.yaml"
                 )
 
+        self.order_templates = self._declare_order_templates()
+
         logger.info(
             f"ETHLeveragedStrategy initialized with {self.eth_allocation*100}% ETH allocation, {self.lst_type}"
         )
@@ -159,6 +166,10 @@ class ETHLeveragedStrategy(BaseStrategyManager):
             # Log strategy decision start
             self.logger.info(f"Making ETH leveraged strategy decision with target_ltv={target_ltv}")
 
+            self.lst_eth_ratio = self.get_lst_eth_ratio(
+                timestamp, self.staking_instrument.split(":")[-1]
+            )
+
             # Get current equity and positions
             current_equity = exposure.get("total_exposure", 0.0)
             current_positions = exposure.get("positions", {})
@@ -206,6 +217,9 @@ class ETHLeveragedStrategy(BaseStrategyManager):
         """
         Calculate target position for ETH leveraged strategy using target_ltv from risk_monitor.
 
+        Position sizes are the converged leverage loop solved in closed form
+        (LTVCalculator.solve_leverage_loop) at the current LST/ETH oracle ratio.
+
         Args:
             current_equity: Current equity in share class currency
             target_ltv: Target loan-to-value ratio from risk_monitor
@@ -214,34 +228,36 @@ class ETHLeveragedStrategy(BaseStrategyManager):
             Dictionary of target positions by token/venue
         """
         try:
-            # Calculate leverage from target_ltv: leverage = target_ltv / (1 - target_ltv)
-            if target_ltv > 0 and target_ltv < 1:
-                leverage = target_ltv / (1 - target_ltv)
-            else:
-                leverage = 1.0  # No leverage if target_ltv is 0 or invalid
-
-            # Calculate target allocations
-            leveraged_equity = current_equity * leverage
-            eth_target = leveraged_equity * self.eth_allocation
-
-            # Get current ETH price
+            # Equity in ETH (share class is ETH unless configured otherwise)
             eth_price = self._get_asset_price()
-            eth_amount = eth_target / eth_price if eth_price > 0 else 0
-
-            # Calculate AAVE positions
-            supply_amount = eth_amount  # LST supplied as collateral
-            debt_amount = eth_amount * (leverage - 1)  # WETH borrowed
+            if self.share_class == "ETH":
+                equity_eth = current_equity
+            else:
+                equity_eth = current_equity / eth_price if eth_price > 0 else 0.0
+
+            loop_ltv = target_ltv if 0 < target_ltv < 1 else 0.0
+            loop = {
+                key: float(value)
+                for key, value in LTVCalculator.solve_leverage_loop(
+                    Decimal(str(max(equity_eth, 0.0))),
+                    Decimal(str(loop_ltv)),
+                    lst_eth_ratio=Decimal(str(self.lst_eth_ratio)),
+                ).items()
+            }
 
             return {
                 "eth_balance": 0.0,  # No raw ETH, all staked
-                f"{self.lst_type.lower()}_balance": eth_amount,  # LST staked
-                "aave_v3:aToken:aWETH": supply_amount,  # LST supplied as collateral
-                "aave_v3:debtToken:debtWETH": debt_amount,  # WETH borrowed
+                f"{self.lst_type.lower()}_balance": loop["lst_amount"],  # LST staked
+                "aave_v3:aToken:aWETH": loop["lst_amount"],  # LST supplied as collateral
+                "aave_v3:debtToken:debtWETH": loop["debt_amount"],  # WETH borrowed
                 f"{self.share_class.lower()}_balance": current_equity,
                 "total_equity": current_equity,
-                "leveraged_equity": leveraged_equity,
-                "target_ltv": target_ltv,
-                "leverage": leverage,
+                "leveraged_equity": loop["collateral_value"],
+                "leveraged_equity_usd": loop["collateral_value"] * eth_price,
+                "stake_amount": loop["stake_amount"],
+                "flash_loan_amount": loop["flash_loan_amount"],
+                "target_ltv": loop_ltv,
+                "leverage": loop["leverage"],
             }
 
         except Exception as e:
@@ -254,10 +270,214 @@ class ETHLeveragedStrategy(BaseStrategyManager):
                 f"{self.share_class.lower()}_balance": 0.0,
                 "total_equity": current_equity,
                 "leveraged_equity": current_equity,
+                "leveraged_equity_usd": 0.0,
+                "stake_amount": 0.0,
+                "flash_loan_amount": 0.0,
                 "target_ltv": 0.0,
                 "leverage": 1.0,
             }
 
+    def _declare_order_templates(self) -> Dict[str, OrderTemplate]:
+        """Order shapes of the ETH leveraged strategy (atomic shapes take their group per order)."""
+        lst = self.lst_type
+        wallet_weth = f"{Venue.WALLET}:BaseToken:WETH"
+        to_share_class = {
+            wallet_weth: -AMOUNT,  # Lose WETH
+            f"{Venue.WALLET}:BaseToken:{self.share_class}": AMOUNT,  # Gain share class (simplified 1:1)
+        }
+        staking_details = {"lst_type": lst, "staking_protocol": self.staking_protocol}
+        atomic = dict(execution_mode="atomic", strategy_id="eth_leveraged")
+        transfer = dict(
+            venue="wallet",
+            operation=OrderOperation.TRANSFER,
+            source_venue="wallet",
+            target_venue="wallet",
+            source_token="WETH",
+            target_token=self.share_class,
+            strategy_id="eth_leveraged",
+        )
+        unstake = dict(
+            venue=Venue.ETHERFI,
+            operation=OrderOperation.UNSTAKE,
+            token_in=lst,
+            token_out="WETH",
+            target_venue="wallet",
+            source_token=lst,
+            target_token="WETH",
+        )
+        return {
+            **{
+                # Priced by the LST received per WETH staked
+                f"{intent}_stake": OrderTemplate(
+                    "stake",
+                    expected_deltas={
+                        wallet_weth: -AMOUNT,  # Lose WETH
+                        self.staking_instrument: NOTIONAL,  # Gain LST
+                    },
+                    operation_details=staking_details,
+                    price_on_order=False,
+                    venue=Venue.ETHERFI,
+                    operation=OrderOperation.STAKE,
+                    token_in="WETH",
+                    token_out=lst,
+                    source_venue="wallet",
+                    target_venue=self.staking_protocol,
+                    source_token="WETH",
+                    target_token=lst,
+                    execution_mode="sequential",
+                    strategy_intent=intent,
+                    strategy_id="eth_leveraged",
+                )
+                for intent in ("entry_full", "entry_partial")
+            },
+            "exit_full_repay": OrderTemplate(
+                "repay",
+                expected_deltas={
+                    wallet_weth: -AMOUNT,  # Lose WETH
+                    "aave_v3:debtToken:debtWETH": -AMOUNT,  # Reduce debt
+                },
+                operation_details={"lending_protocol": "aave_v3", "repay_asset": "WETH"},
+                price_on_order=False,
+                venue=Venue.AAVE_V3,
+                operation=OrderOperation.REPAY,
+                token_in="WETH",
+                source_venue=Venue.WALLET,
+                target_venue=Venue.AAVE_V3,
+                source_token="WETH",
+                target_token="WETH",
+                sequence_in_group=1,
+                strategy_intent="exit_full",
+                **atomic,
+            ),
+            "exit_full_withdraw": OrderTemplate(
+                "withdraw",
+                expected_deltas={
+                    f"aave_v3:aToken:a{lst}": -AMOUNT,  # Lose aToken
+                    f"{Venue.WALLET}:BaseToken:{lst}": AMOUNT,  # Gain LST
+                },
+                operation_details={"lending_protocol": "aave_v3", "WITHDRAW_ASSET": lst},
+                price_on_order=False,
+                venue=Venue.AAVE_V3,
+                operation=OrderOperation.WITHDRAW,
+                token_out=lst,
+                source_venue=Venue.AAVE_V3,
+                target_venue=Venue.WALLET,
+                source_token=f"a{lst}",
+                target_token=lst,
+                sequence_in_group=2,
+                strategy_intent="exit_full",
+                **atomic,
+            ),
+            "exit_full_unstake": OrderTemplate(
+                "unstake",
+                expected_deltas={
+                    f"{self.staking_protocol}:aToken:{lst}": -AMOUNT,  # Lose LST
+                    wallet_weth: AMOUNT,  # Gain WETH
+                },
+                operation_details=staking_details,
+                price_on_order=False,
+                source_venue=self.staking_protocol,
+                sequence_in_group=3,
+                strategy_intent="exit_full",
+                **unstake,
+                **atomic,
+            ),
+            "exit_full_transfer": OrderTemplate(
+                "transfer",
+                expected_deltas=to_share_class,
+                operation_details={
+                    "conversion_type": "exit_conversion",
+                    "FROM_ASSET": "WETH",
+                    "to_asset": self.share_class,
+                },
+                price_on_order=False,
+                token=self.share_class,
+                execution_mode="sequential",
+                strategy_intent="exit_full",
+                **transfer,
+            ),
+            "exit_partial_repay": OrderTemplate(
+                "repay",
+                expected_deltas={"aave_v3:debtToken:debtWETH": -AMOUNT},
+                price_on_order=False,
+                venue=Venue.AAVE_V3,
+                operation=OrderOperation.REPAY,
+                token_in="WETH",
+                source_venue="wallet",
+                target_venue=Venue.AAVE_V3,
+                source_token="WETH",
+                target_token="debtWETH",
+                sequence_in_group=1,
+                strategy_intent="exit_partial",
+                **atomic,
+            ),
+            "exit_partial_withdraw": OrderTemplate(
+                "withdraw",
+                expected_deltas={f"aave_v3:aToken:a{lst}": -AMOUNT},
+                price_on_order=False,
+                venue=Venue.AAVE_V3,
+                operation=OrderOperation.WITHDRAW,
+                token_out=lst,
+                source_venue=Venue.AAVE_V3,
+                target_venue="wallet",
+                source_token=f"a{lst}",
+                target_token=lst,
+                sequence_in_group=2,
+                strategy_intent="exit_partial",
+                **atomic,
+            ),
+            "exit_partial_unstake": OrderTemplate(
+                "unstake",
+                expected_deltas={f"{lst.lower()}_balance": -AMOUNT, "weth_balance": AMOUNT},
+                price_on_order=False,
+                source_venue=Venue.ETHERFI,
+                sequence_in_group=3,
+                strategy_intent="exit_partial",
+                **unstake,
+                **atomic,
+            ),
+            "exit_partial_transfer": OrderTemplate(
+                "transfer",
+                expected_deltas={
+                    "weth_balance": -AMOUNT,
+                    f"{self.share_class.lower()}_balance": AMOUNT,
+                },
+                price_on_order=False,
+                token=self.share_class,
+                execution_mode="sequential",
+                strategy_intent="exit_partial",
+                **transfer,
+            ),
+            "dust_unstake": OrderTemplate(
+                "dust_unstake",
+                expected_deltas={
+                    f"{self.staking_protocol}:aToken:{lst}": -AMOUNT,  # Lose LST
+                    wallet_weth: AMOUNT,  # Gain WETH
+                },
+                operation_details=staking_details,
+                price_on_order=False,
+                source_venue=self.staking_protocol,
+                sequence_in_group=1,
+                strategy_intent="sell_dust",
+                **unstake,
+                **atomic,
+            ),
+            "dust_unstake_transfer": OrderTemplate(
+                "dust_transfer",
+                expected_deltas=to_share_class,
+                operation_details={
+                    "conversion_type": "dust_cleanup",
+                    "FROM_ASSET": "WETH",
+                    "to_asset": self.share_class,
+                },
+                price_on_order=False,
+                token="WETH",
+                sequence_in_group=2,
+                strategy_intent="sell_dust",
+                **{**transfer, **atomic},
+            ),
+        }
+
     def _create_entry_full_orders(self, equity: float, target_ltv: float) -> List[Order]:
         """
         Create entry full orders for ETH leveraged strategy using atomic flash loan.
@@ -269,190 +489,9 @@ class ETHLeveragedStrategy(BaseStrategyManager):
         Returns:
             List of Order objects for full entry
         """
-        try:
-            # Calculate target position with target_ltv
-            target_position = self.calculate_target_position(equity, target_ltv)
-
-            orders = []
-            atomic_group_id = f"eth_leveraged_entry_{int(equity)}"
-
-            # Calculate leverage and amounts
-            leverage = target_position.get("leverage", 1.0)
-            eth_amount = target_position[f"{self.lst_type.lower()}_balance"]
-            supply_amount = target_position.get("aave_v3:aToken:aWETH", 0.0)
-            debt_amount = target_position.get("aave_v3:debtToken:debtWETH", 0.0)
-
-            if eth_amount > 0 and leverage > 1.0:
-                # Atomic flash loan sequence:
-                # 1. FLASH_BORROW WETH from Morpho (via Instadapp)
-                orders.append(
-                    Order(
-                        operation_id=f"flash_borrow_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                        venue=Venue.INSTADAPP,
-                        operation=OrderOperation.FLASH_BORROW,
-                        token_out="WETH",
-                        amount=debt_amount,
-                        source_venue=Venue.INSTADAPP,
-                        target_venue=Venue.WALLET,
-                        source_token="WETH",
-                        target_token="WETH",
-                        expected_deltas={
-                            f"{Venue.INSTADAPP}:BaseToken:WETH": debt_amount,  # Gain WETH from flash loan
-                            f"{Venue.WALLET}:BaseToken:WETH": debt_amount,
-                        },
-                        operation_details={"target_ltv": target_ltv, "leverage": leverage},
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=1,
-                        strategy_intent="entry_full",
-                        strategy_id="eth_leveraged",
-                        metadata={"target_ltv": target_ltv, "leverage": leverage},
-                    )
-                )
-
-                # 2. STAKE WETH to get LST (weETH/wstETH)
-                orders.append(
-                    Order(
-                        operation_id=f"stake_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                        venue=Venue.ETHERFI,
-                        operation=OrderOperation.STAKE,
-                        token_in="WETH",
-                        token_out=self.lst_type,
-                        amount=eth_amount,
-                        source_venue="wallet",
-                        target_venue=self.staking_protocol,
-                        source_token="WETH",
-                        target_token=self.lst_type,
-                        expected_deltas={
-                            f"{Venue.WALLET}:BaseToken:WETH": -eth_amount,  # Lose WETH
-                            self.staking_instrument: eth_amount,  # Gain LST
-                        },
-                        operation_details={
-                            "lst_type": self.lst_type,
-                            "staking_protocol": self.staking_protocol,
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=2,
-                        strategy_intent="entry_full",
-                        strategy_id="eth_leveraged",
-                    )
-                )
-
-                # 3. SUPPLY LST to AAVE as collateral
-                orders.append(
-                    Order(
-                        operation_id=f"supply_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                        venue=Venue.AAVE_V3,
-                        operation=OrderOperation.SUPPLY,
-                        token_in=self.lst_type,
-                        token_out=f"a{self.lst_type}",
-                        amount=supply_amount,
-                        source_venue=Venue.WALLET,
-                        target_venue=Venue.AAVE_V3,
-                        source_token=self.lst_type,
-                        target_token=f"a{self.lst_type}",
-                        expected_deltas={
-                            f"{Venue.WALLET}:BaseToken:{self.lst_type}": -supply_amount,  # Lose LST
-                            f"{Venue.AAVE_V3}:aToken:a{self.lst_type}": supply_amount,  # Gain aToken
-                        },
-                        operation_details={
-                            "lending_protocol": "aave_v3",
-                            "COLLATERAL_TYPE": self.lst_type,
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=3,
-                        strategy_intent="entry_full",
-                        strategy_id="eth_leveraged",
-                    )
-                )
-
-                # 4. BORROW WETH from AAVE (up to target_ltv)
-                orders.append(
-                    Order(
-                        operation_id=f"borrow_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                        venue=Venue.AAVE_V3,
-                        operation=OrderOperation.BORROW,
-                        token_out="WETH",
-                        amount=debt_amount,
-                        source_venue=Venue.AAVE_V3,
-                        target_venue=Venue.WALLET,
-                        source_token="WETH",
-                        target_token="WETH",
-                        expected_deltas={
-                            self.borrow_instrument: debt_amount,  # Gain debt
-                            f"{Venue.WALLET}:BaseToken:WETH": debt_amount,  # Gain WETH
-                        },
-                        operation_details={"lending_protocol": "aave_v3", "borrow_asset": "WETH"},
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=4,
-                        strategy_intent="entry_full",
-                        strategy_id="eth_leveraged",
-                    )
-                )
-
-                # 5. FLASH_REPAY WETH to Morpho
-                orders.append(
-                    Order(
-                        operation_id=f"flash_repay_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                        venue=Venue.INSTADAPP,
-                        operation=OrderOperation.FLASH_REPAY,
-                        token_in="WETH",
-                        amount=debt_amount,
-                        source_venue=Venue.WALLET,
-                        target_venue=Venue.INSTADAPP,
-                        source_token="WETH",
-                        target_token="WETH",
-                        expected_deltas={
-                            f"{Venue.WALLET}:BaseToken:WETH": -debt_amount,  # Lose WETH
-                            f"{Venue.INSTADAPP}:BaseToken:WETH": -debt_amount,  # Repay flash loan
-                        },
-                        operation_details={
-                            "flash_loan_protocol": "instadapp",
-                            "REPAY_ASSET": "WETH",
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=5,
-                        strategy_intent="entry_full",
-                        strategy_id="eth_leveraged",
-                    )
-                )
-            else:
-                # No leverage needed - simple staking only
-                orders.append(
-                    Order(
-                        operation_id=f"stake_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                        venue=Venue.ETHERFI,
-                        operation=OrderOperation.STAKE,
-                        token_in="WETH",
-                        token_out=self.lst_type,
-                        amount=eth_amount,
-                        source_venue="wallet",
-                        target_venue=self.staking_protocol,
-                        source_token="WETH",
-                        target_token=self.lst_type,
-                        expected_deltas={
-                            f"{Venue.WALLET}:BaseToken:WETH": -eth_amount,  # Lose WETH
-                            self.staking_instrument: eth_amount,  # Gain LST
-                        },
-                        operation_details={
-                            "lst_type": self.lst_type,
-                            "staking_protocol": self.staking_protocol,
-                        },
-                        execution_mode="sequential",
-                        strategy_intent="entry_full",
-                        strategy_id="eth_leveraged",
-                    )
-                )
-
-            return orders
-
-        except Exception as e:
-            logger.error(f"Error creating entry full orders: {e}")
-            return []
+        return self._create_entry_orders(
+            equity, target_ltv, "entry_full", f"eth_leveraged_entry_{int(equity)}"
+        )
 
     def _create_entry_partial_orders(self, equity_delta: float, target_ltv: float) -> List[Order]:
         """
@@ -465,189 +504,60 @@ class ETHLeveragedStrategy(BaseStrategyManager):
         Returns:
             List of Order objects for partial entry
         """
-        try:
-            # Calculate target position for additional equity
-            target_position = self.calculate_target_position(equity_delta, target_ltv)
-
-            orders = []
-            atomic_group_id = f"eth_leveraged_partial_{int(equity_delta)}"
+        return self._create_entry_orders(
+            equity_delta, target_ltv, "entry_partial", f"eth_leveraged_partial_{int(equity_delta)}"
+        )
 
-            # Calculate amounts
-            leverage = target_position.get("leverage", 1.0)
-            eth_amount = target_position[f"{self.lst_type.lower()}_balance"]
-            supply_amount = target_position.get("aave_v3:aToken:aWETH", 0.0)
-            debt_amount = target_position.get("aave_v3:debtToken:debtWETH", 0.0)
+    def _create_entry_orders(
+        self, equity: float, target_ltv: float, strategy_intent: str, atomic_group_id: str
+    ) -> List[Order]:
+        """
+        Create entry orders: one flash-loan bundle for the converged loop, or a plain stake.
 
-            if eth_amount > 0 and leverage > 1.0:
-                # Use same atomic flash loan sequence as full entry
-                # 1. FLASH_BORROW WETH
-                orders.append(
-                    Order(
-                        operation_id=f"flash_borrow_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                        venue=Venue.INSTADAPP,
-                        operation=OrderOperation.FLASH_BORROW,
-                        token_out="WETH",
-                        amount=debt_amount,
-                        source_venue="instadapp",
-                        target_venue="wallet",
-                        source_token="WETH",
-                        target_token="WETH",
-                        expected_deltas={
-                            f"{Venue.INSTADAPP}:BaseToken:WETH": debt_amount,  # Gain WETH from flash loan
-                            f"{Venue.WALLET}:BaseToken:WETH": debt_amount,
-                        },
-                        operation_details={"target_ltv": target_ltv, "leverage": leverage},
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=1,
-                        strategy_intent="entry_partial",
-                        strategy_id="eth_leveraged",
-                        metadata={"target_ltv": target_ltv, "leverage": leverage},
-                    )
-                )
+        Args:
+            equity: Equity to deploy in share class currency
+            target_ltv: Target loan-to-value ratio from risk_monitor
+            strategy_intent: entry_full or entry_partial
+            atomic_group_id: Atomic group of the flash-loan bundle
 
-                # 2. STAKE WETH to get LST
-                orders.append(
-                    Order(
-                        operation_id=f"stake_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                        venue=Venue.ETHERFI,
-                        operation=OrderOperation.STAKE,
-                        token_in="WETH",
-                        token_out=self.lst_type,
-                        amount=eth_amount,
-                        source_venue="wallet",
-                        target_venue=self.staking_protocol,
-                        source_token="WETH",
-                        target_token=self.lst_type,
-                        expected_deltas={
-                            f"{Venue.WALLET}:BaseToken:WETH": -eth_amount,  # Lose WETH
-                            self.staking_instrument: eth_amount,  # Gain LST
-                        },
-                        operation_details={
-                            "lst_type": self.lst_type,
-                            "staking_protocol": self.staking_protocol,
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=2,
-                        strategy_intent="entry_partial",
-                        strategy_id="eth_leveraged",
-                    )
-                )
+        Returns:
+            List of Order objects
+        """
+        try:
+            target_position = self.calculate_target_position(equity, target_ltv)
+            stake_amount = target_position["stake_amount"]
+            lst_amount = target_position[f"{self.lst_type.lower()}_balance"]
 
-                # 3. SUPPLY LST to AAVE
-                orders.append(
-                    Order(
-                        operation_id=f"supply_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                        venue=Venue.AAVE_V3,
-                        operation=OrderOperation.SUPPLY,
-                        token_in=self.lst_type,
-                        token_out=f"a{self.lst_type}",
-                        amount=supply_amount,
-                        source_venue=Venue.WALLET,
-                        target_venue=Venue.AAVE_V3,
-                        source_token=self.lst_type,
-                        target_token=f"a{self.lst_type}",
-                        expected_deltas={
-                            f"{Venue.WALLET}:BaseToken:{self.lst_type}": -supply_amount,  # Lose LST
-                            f"{Venue.AAVE_V3}:aToken:a{self.lst_type}": supply_amount,  # Gain aToken
-                        },
-                        operation_details={
-                            "lending_protocol": "aave_v3",
-                            "COLLATERAL_TYPE": self.lst_type,
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=3,
-                        strategy_intent="entry_partial",
-                        strategy_id="eth_leveraged",
-                    )
-                )
+            if stake_amount <= 0:
+                return []
 
-                # 4. BORROW WETH from AAVE
-                orders.append(
-                    Order(
-                        operation_id=f"borrow_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                        venue=Venue.AAVE_V3,
-                        operation=OrderOperation.BORROW,
-                        token_out="WETH",
-                        amount=debt_amount,
-                        source_venue=Venue.AAVE_V3,
-                        target_venue=Venue.WALLET,
-                        source_token="WETH",
-                        target_token="WETH",
-                        expected_deltas={
-                            self.borrow_instrument: debt_amount,  # Gain debt
-                            f"{Venue.WALLET}:BaseToken:WETH": debt_amount,  # Gain WETH
-                        },
-                        operation_details={"lending_protocol": "aave_v3", "borrow_asset": "WETH"},
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=4,
-                        strategy_intent="entry_partial",
-                        strategy_id="eth_leveraged",
-                    )
+            if target_position["flash_loan_amount"] > 0:
+                return self._create_leveraged_staking_orders(
+                    loop={
+                        "flash_loan_amount": target_position["flash_loan_amount"],
+                        "stake_amount": stake_amount,
+                        "lst_amount": lst_amount,
+                        "debt_amount": target_position["aave_v3:debtToken:debtWETH"],
+                        "leverage": target_position["leverage"],
+                    },
+                    lst_type=self.lst_type,
+                    staking_instrument=self.staking_instrument,
+                    borrow_instrument=self.borrow_instrument,
+                    staking_protocol=self.staking_protocol,
+                    atomic_group_id=atomic_group_id,
+                    strategy_intent=strategy_intent,
+                    target_ltv=target_position["target_ltv"],
                 )
 
-                # 5. FLASH_REPAY WETH
-                orders.append(
-                    Order(
-                        operation_id=f"flash_repay_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                        venue=Venue.INSTADAPP,
-                        operation=OrderOperation.FLASH_REPAY,
-                        token_in="WETH",
-                        amount=debt_amount,
-                        source_venue=Venue.WALLET,
-                        target_venue=Venue.INSTADAPP,
-                        source_token="WETH",
-                        target_token="WETH",
-                        expected_deltas={
-                            f"{Venue.WALLET}:BaseToken:WETH": -debt_amount,  # Lose WETH
-                            f"{Venue.INSTADAPP}:BaseToken:WETH": -debt_amount,  # Repay flash loan
-                        },
-                        operation_details={
-                            "flash_loan_protocol": "instadapp",
-                            "REPAY_ASSET": "WETH",
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=5,
-                        strategy_intent="entry_partial",
-                        strategy_id="eth_leveraged",
-                    )
+            # No leverage needed - simple staking only
+            return [
+                self.order_templates[f"{strategy_intent}_stake"].build(
+                    stake_amount, lst_amount / stake_amount
                 )
-            else:
-                # Simple staking for additional equity
-                orders.append(
-                    Order(
-                        operation_id=f"stake_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                        venue=Venue.ETHERFI,
-                        operation=OrderOperation.STAKE,
-                        token_in="WETH",
-                        token_out=self.lst_type,
-                        amount=eth_amount,
-                        source_venue="wallet",
-                        target_venue=self.staking_protocol,
-                        source_token="WETH",
-                        target_token=self.lst_type,
-                        expected_deltas={
-                            f"{Venue.WALLET}:BaseToken:WETH": -eth_amount,  # Lose WETH
-                            self.staking_instrument: eth_amount,  # Gain LST
-                        },
-                        operation_details={
-                            "lst_type": self.lst_type,
-                            "staking_protocol": self.staking_protocol,
-                        },
-                        execution_mode="sequential",
-                        strategy_intent="entry_partial",
-                        strategy_id="eth_leveraged",
-                    )
-                )
-
-            return orders
+            ]
 
         except Exception as e:
-            logger.error(f"Error creating entry partial orders: {e}")
+            logger.error(f"Error creating {strategy_intent} orders: {e}")
             return []
 
     def _create_exit_full_orders(self, equity: float) -> List[Order]:
@@ -673,55 +583,16 @@ class ETHLeveragedStrategy(BaseStrategyManager):
             # 1. Repay AAVE debt (atomic group)
             if aave_debt > 0:
                 orders.append(
-                    Order(
-                        operation_id=f"repay_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                        venue=Venue.AAVE_V3,
-                        operation=OrderOperation.REPAY,
-                        token_in="WETH",
-                        amount=aave_debt,
-                        source_venue=Venue.WALLET,
-                        target_venue=Venue.AAVE_V3,
-                        source_token="WETH",
-                        target_token="WETH",
-                        expected_deltas={
-                            f"{Venue.WALLET}:BaseToken:WETH": -aave_debt,  # Lose WETH
-                            "aave_v3:debtToken:debtWETH": -aave_debt,  # Reduce debt
-                        },
-                        operation_details={"lending_protocol": "aave_v3", "repay_asset": "WETH"},
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=1,
-                        strategy_intent="exit_full",
-                        strategy_id="eth_leveraged",
+                    self.order_templates["exit_full_repay"].build(
+                        aave_debt, atomic_group_id=atomic_group_id
                     )
                 )
 
             # 2. Withdraw LST from AAVE (atomic group)
             if aave_supply > 0:
                 orders.append(
-                    Order(
-                        operation_id=f"withdraw_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                        venue=Venue.AAVE_V3,
-                        operation=OrderOperation.WITHDRAW,
-                        token_out=self.lst_type,
-                        amount=aave_supply,
-                        source_venue=Venue.AAVE_V3,
-                        target_venue=Venue.WALLET,
-                        source_token=f"a{self.lst_type}",
-                        target_token=self.lst_type,
-                        expected_deltas={
-                            f"aave_v3:aToken:a{self.lst_type}": -aave_supply,  # Lose aToken
-                            f"{Venue.WALLET}:BaseToken:{self.lst_type}": aave_supply,  # Gain LST
-                        },
-                        operation_details={
-                            "lending_protocol": "aave_v3",
-                            "WITHDRAW_ASSET": self.lst_type,
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=2,
-                        strategy_intent="exit_full",
-                        strategy_id="eth_leveraged",
+                    self.order_templates["exit_full_withdraw"].build(
+                        aave_supply, atomic_group_id=atomic_group_id
                     )
                 )
 
@@ -729,59 +600,13 @@ class ETHLeveragedStrategy(BaseStrategyManager):
             total_lst = lst_balance + aave_supply
             if total_lst > 0:
                 orders.append(
-                    Order(
-                        operation_id=f"unstake_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                        venue=Venue.ETHERFI,
-                        operation=OrderOperation.UNSTAKE,
-                        token_in=self.lst_type,
-                        token_out="WETH",
-                        amount=total_lst,
-                        source_venue=self.staking_protocol,
-                        target_venue="wallet",
-                        source_token=self.lst_type,
-                        target_token="WETH",
-                        expected_deltas={
-                            f"{self.staking_protocol}:aToken:{self.lst_type}": -total_lst,  # Lose LST
-                            f"{Venue.WALLET}:BaseToken:WETH": total_lst,  # Gain WETH
-                        },
-                        operation_details={
-                            "lst_type": self.lst_type,
-                            "staking_protocol": self.staking_protocol,
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=3,
-                        strategy_intent="exit_full",
-                        strategy_id="eth_leveraged",
+                    self.order_templates["exit_full_unstake"].build(
+                        total_lst, atomic_group_id=atomic_group_id
                     )
                 )
 
             # 4. Convert WETH to share class currency (sequential)
-            orders.append(
-                Order(
-                    operation_id=f"transfer_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                    venue="wallet",
-                    operation=OrderOperation.TRANSFER,
-                    source_venue="wallet",
-                    target_venue="wallet",
-                    source_token="WETH",
-                    target_token=self.share_class,
-                    token=self.share_class,
-                    amount=equity,
-                    expected_deltas={
-                        f"{Venue.WALLET}:BaseToken:WETH": -equity,  # Lose WETH
-                        f"{Venue.WALLET}:BaseToken:{self.share_class}": equity,  # Gain share class (simplified 1:1)
-                    },
-                    operation_details={
-                        "conversion_type": "exit_conversion",
-                        "FROM_ASSET": "WETH",
-                        "to_asset": self.share_class,
-                    },
-                    execution_mode="sequential",
-                    strategy_intent="exit_full",
-                    strategy_id="eth_leveraged",
-                )
-            )
+            orders.append(self.order_templates["exit_full_transfer"].build(equity))
 
             return orders
 
@@ -823,46 +648,16 @@ class ETHLeveragedStrategy(BaseStrategyManager):
             # 1. Repay proportional AAVE debt (atomic group)
             if aave_debt_reduction > 0:
                 orders.append(
-                    Order(
-                        operation_id=f"repay_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                        venue=Venue.AAVE_V3,
-                        operation=OrderOperation.REPAY,
-                        token_in="WETH",
-                        amount=aave_debt_reduction,
-                        source_venue="wallet",
-                        target_venue=Venue.AAVE_V3,
-                        source_token="WETH",
-                        target_token="debtWETH",
-                        expected_deltas={"aave_v3:debtToken:debtWETH": -aave_debt_reduction},
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=1,
-                        strategy_intent="exit_partial",
-                        strategy_id="eth_leveraged",
+                    self.order_templates["exit_partial_repay"].build(
+                        aave_debt_reduction, atomic_group_id=atomic_group_id
                     )
                 )
 
             # 2. Withdraw proportional LST from AAVE (atomic group)
             if aave_supply_reduction > 0:
                 orders.append(
-                    Order(
-                        operation_id=f"withdraw_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                        venue=Venue.AAVE_V3,
-                        operation=OrderOperation.WITHDRAW,
-                        token_out=self.lst_type,
-                        amount=aave_supply_reduction,
-                        source_venue=Venue.AAVE_V3,
-                        target_venue="wallet",
-                        source_token=f"a{self.lst_type}",
-                        target_token=self.lst_type,
-                        expected_deltas={
-                            f"aave_v3:aToken:a{self.lst_type}": -aave_supply_reduction
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=2,
-                        strategy_intent="exit_partial",
-                        strategy_id="eth_leveraged",
+                    self.order_templates["exit_partial_withdraw"].build(
+                        aave_supply_reduction, atomic_group_id=atomic_group_id
                     )
                 )
 
@@ -870,50 +665,13 @@ class ETHLeveragedStrategy(BaseStrategyManager):
             total_lst_reduction = lst_reduction + aave_supply_reduction
             if total_lst_reduction > 0:
                 orders.append(
-                    Order(
-                        operation_id=f"unstake_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                        venue=Venue.ETHERFI,
-                        operation=OrderOperation.UNSTAKE,
-                        token_in=self.lst_type,
-                        token_out="WETH",
-                        amount=total_lst_reduction,
-                        source_venue=Venue.ETHERFI,
-                        target_venue="wallet",
-                        source_token=self.lst_type,
-                        target_token="WETH",
-                        expected_deltas={
-                            f"{self.lst_type.lower()}_balance": -total_lst_reduction,
-                            "weth_balance": total_lst_reduction,
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=3,
-                        strategy_intent="exit_partial",
-                        strategy_id="eth_leveraged",
+                    self.order_templates["exit_partial_unstake"].build(
+                        total_lst_reduction, atomic_group_id=atomic_group_id
                     )
                 )
 
             # 4. Convert to share class currency (sequential)
-            orders.append(
-                Order(
-                    operation_id=f"transfer_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                    venue="wallet",
-                    operation=OrderOperation.TRANSFER,
-                    source_venue="wallet",
-                    target_venue="wallet",
-                    token=self.share_class,
-                    source_token="WETH",
-                    target_token=self.share_class,
-                    amount=equity_delta,
-                    expected_deltas={
-                        "weth_balance": -equity_delta,
-                        f"{self.share_class.lower()}_balance": equity_delta,
-                    },
-                    execution_mode="sequential",
-                    strategy_intent="exit_partial",
-                    strategy_id="eth_leveraged",
-                )
-            )
+            orders.append(self.order_templates["exit_partial_transfer"].build(equity_delta))
 
             return orders
 
@@ -937,148 +695,80 @@ class ETHLeveragedStrategy(BaseStrategyManager):
             for token, amount in dust_tokens.items():
                 if amount > 0 and token != self.share_class:
                     # Convert to share class currency
-                    if token == "WETH":
-                        # Convert WETH to share class
-                        orders.append(
-                            Order(
-                                operation_id=f"dust_transfer_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                                venue="wallet",
-                                operation=OrderOperation.TRANSFER,
-                                source_venue="wallet",
-                                target_venue="wallet",
-                                source_token=token,
-                                target_token=self.share_class,
-                                token=token,
-                                amount=amount,
-                                expected_deltas={
-                                    f"{Venue.WALLET}:BaseToken:{token}": -amount,  # Lose dust token
-                                    f"{Venue.WALLET}:BaseToken:{self.share_class}": amount,  # Gain share class (simplified 1:1)
-                                },
-                                operation_details={
-                                    "conversion_type": "dust_cleanup",
-                                    "FROM_ASSET": token,
-                                    "to_asset": self.share_class,
-                                },
-                                execution_mode="sequential",
-                                strategy_intent="sell_dust",
-                                strategy_id="eth_leveraged",
-                            )
-                        )
-
-                    elif token == self.lst_type:
+                    if token == self.lst_type:
                         # Unstake LST first, then convert WETH (atomic group)
                         atomic_group_id = f"dust_unstake_{token}_{int(amount)}"
                         orders.append(
-                            Order(
-                                operation_id=f"dust_unstake_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                                venue=Venue.ETHERFI,
-                                operation=OrderOperation.UNSTAKE,
-                                token_in=token,
-                                token_out="WETH",
-                                amount=amount,
-                                source_venue=self.staking_protocol,
-                                target_venue="wallet",
-                                source_token=token,
-                                target_token="WETH",
-                                expected_deltas={
-                                    f"{self.staking_protocol}:aToken:{token}": -amount,  # Lose LST
-                                    f"{Venue.WALLET}:BaseToken:WETH": amount,  # Gain WETH
-                                },
-                                operation_details={
-                                    "lst_type": token,
-                                    "staking_protocol": self.staking_protocol,
-                                },
-                                execution_mode="atomic",
-                                atomic_group_id=atomic_group_id,
-                                sequence_in_group=1,
-                                strategy_intent="sell_dust",
-                                strategy_id="eth_leveraged",
+                            self.order_templates["dust_unstake"].build(
+                                amount, atomic_group_id=atomic_group_id
                             )
                         )
                         orders.append(
-                            Order(
-                                operation_id=f"dust_transfer_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                                venue="wallet",
-                                operation=OrderOperation.TRANSFER,
-                                source_venue="wallet",
-                                target_venue="wallet",
-                                source_token="WETH",
-                                target_token=self.share_class,
-                                token="WETH",
-                                amount=amount,
-                                expected_deltas={
-                                    f"{Venue.WALLET}:BaseToken:WETH": -amount,  # Lose WETH
-                                    f"{Venue.WALLET}:BaseToken:{self.share_class}": amount,  # Gain share class (simplified 1:1)
-                                },
-                                operation_details={
-                                    "conversion_type": "dust_cleanup",
-                                    "FROM_ASSET": "WETH",
-                                    "to_asset": self.share_class,
-                                },
-                                execution_mode="atomic",
-                                atomic_group_id=atomic_group_id,
-                                sequence_in_group=2,
-                                strategy_intent="sell_dust",
-                                strategy_id="eth_leveraged",
+                            self.order_templates["dust_unstake_transfer"].build(
+                                amount, atomic_group_id=atomic_group_id
                             )
                         )
 
                     elif token in ["EIGEN", "ETHFI", "KING"]:
                         # Dust tokens from staking rewards - swap via Uniswap
-                        orders.append(
-                            Order(
-                                operation_id=f"dust_swap_{int(pd.Timestamp.now().timestamp() * 1000000)}",
+                        template = self._order_template(
+                            f"dust_swap_{token}",
+                            lambda: OrderTemplate(
+                                "dust_swap",
+                                expected_deltas={
+                                    f"{Venue.WALLET}:BaseToken:{token}": -AMOUNT,  # Lose dust token
+                                    f"{Venue.WALLET}:BaseToken:ETH": AMOUNT,  # Gain ETH
+                                },
+                                operation_details={
+                                    "conversion_type": "dust_cleanup",
+                                    "FROM_ASSET": token,
+                                    "to_asset": "ETH",
+                                },
+                                price_on_order=False,
                                 venue=Venue.UNISWAP,
                                 operation=OrderOperation.SWAP,
                                 token_in=token,
                                 token_out="ETH",
-                                amount=amount,
                                 source_venue="wallet",
                                 target_venue="wallet",
                                 source_token=token,
                                 target_token="ETH",
-                                expected_deltas={
-                                    f"{Venue.WALLET}:BaseToken:{token}": -amount,  # Lose dust token
-                                    f"{Venue.WALLET}:BaseToken:ETH": amount,  # Gain ETH
-                                },
-                                operation_details={
-                                    "conversion_type": "dust_cleanup",
-                                    "FROM_ASSET": token,
-                                    "to_asset": "ETH",
-                                },
                                 execution_mode="sequential",
                                 strategy_intent="dust_sell",
                                 strategy_id="eth_leveraged",
-                            )
+                            ),
                         )
+                        orders.append(template.build(amount))
 
                     else:
-                        # Other tokens - convert to share class
-                        orders.append(
-                            Order(
-                                operation_id=f"dust_transfer_{int(pd.Timestamp.now().timestamp() * 1000000)}",
-                                venue="wallet",
-                                operation=OrderOperation.TRANSFER,
-                                source_venue="wallet",
-                                target_venue="wallet",
-                                source_token=token,
-                                target_token=self.share_class,
-                                token=token,
-                                amount=amount,
+                        # WETH and other tokens - convert to share class
+                        template = self._order_template(
+                            f"dust_transfer_{token}",
+                            lambda: OrderTemplate(
+                                "dust_transfer",
                                 expected_deltas={
-                                    f"{Venue.WALLET}:BaseToken:{token}": -amount,  # Lose dust token
-                                    f"{Venue.WALLET}:BaseToken:{self.share_class}": amount,  # Gain share class (simplified 1:1)
+                                    f"{Venue.WALLET}:BaseToken:{token}": -AMOUNT,  # Lose dust token
+                                    f"{Venue.WALLET}:BaseToken:{self.share_class}": AMOUNT,  # Gain share class (simplified 1:1)
                                 },
                                 operation_details={
                                     "conversion_type": "dust_cleanup",
                                     "FROM_ASSET": token,
                                     "to_asset": self.share_class,
                                 },
+                                price_on_order=False,
+                                venue="wallet",
+                                operation=OrderOperation.TRANSFER,
+                                source_venue="wallet",
+                                target_venue="wallet",
+                                source_token=token,
+                                target_token=self.share_class,
+                                token=token,
                                 execution_mode="sequential",
                                 strategy_intent="sell_dust",
                                 strategy_id="eth_leveraged",
-                            )
+                            ),
                         )
+                        orders.append(template.build(amount))
 
             return orders
 
@@ -17,6 +17,7 @@ import pandas as pd
 
 from .base_strategy_manager import BaseStrategyManager
 from ...core.models.order import Order, OrderOperation
+from ...core.models.order_template import AMOUNT, OrderTemplate, Scaled
 from ...core.models.venues import Venue
 from ...core.models.instruments import validate_instrument_key, get_display_name
 
@@ -133,6 +134,8 @@ class MLBTCDirectionalUSDTMarginStrategy(BaseStrategyManager):
         self.last_prediction = None
         self.last_signal = None
 
+        self.order_templates = self._declare_order_templates()
+
         logger.info(
             f"MLBTCDirectionalStrategy initialized with signal threshold: {self.signal_threshold}"
         )
@@ -407,6 +410,51 @@ class MLBTCDirectionalUSDTMarginStrategy(BaseStrategyManager):
             logger.error(f"Failed to calculate target position: {e}")
             return {"btc_perp_position": 0.0, "usdt_balance": current_equity}
 
+    def _declare_order_templates(self) -> Dict[str, OrderTemplate]:
+        """Perp order shapes of the ML BTC directional strategy, by intent and side."""
+        perp = dict(
+            venue=Venue.BINANCE,
+            operation=OrderOperation.PERP_TRADE,
+            pair="BTCUSDT",
+            order_type="market",
+            source_venue=Venue.BINANCE,
+            target_venue=Venue.BINANCE,
+            source_token="USDT",
+            target_token="BTC",
+            execution_mode="sequential",
+            strategy_id="ml_btc_directional",
+        )
+        templates = {}
+        for intent, prefix in (("entry_full", "perp_trade"), ("entry_partial", "perp_trade_partial")):
+            for signal, side, delta in (("long", "LONG", AMOUNT), ("short", "SHORT", -AMOUNT)):
+                templates[f"{intent}_{signal}"] = OrderTemplate(
+                    prefix,
+                    expected_deltas={self.perp_instrument: delta},
+                    metadata={
+                        "confidence": 0.8,  # Would come from ML predictions
+                        "signal_threshold": self.signal_threshold,
+                    },
+                    side=side,
+                    strategy_intent=intent,
+                    **perp,
+                )
+        for intent, prefix, exit_metadata in (
+            ("exit_full", "perp_close", {"close_position": True}),
+            ("exit_partial", "perp_close_partial", {"close_position": True, "partial_exit": True}),
+        ):
+            # Closing a long sells, closing a short buys back
+            for side, delta in (("SELL", -AMOUNT), ("BUY", AMOUNT)):
+                templates[f"{intent}_{side.lower()}"] = OrderTemplate(
+                    prefix,
+                    expected_deltas={self.perp_instrument: delta},
+                    metadata=exit_metadata,
+                    price_on_order=False,
+                    side=side,
+                    strategy_intent=intent,
+                    **perp,
+                )
+        return templates
+
     def _create_entry_full_orders(self, equity: float, signal: str) -> List[Order]:
         """
         Create entry full orders for ML BTC directional strategy.
@@ -432,37 +480,13 @@ class MLBTCDirectionalUSDTMarginStrategy(BaseStrategyManager):
             )
 
             # Create BTC perpetual order with risk management
-            operation_id = f"perp_trade_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-            order = Order(
-                operation_id=operation_id,
-                venue=Venue.BINANCE,
-                operation=OrderOperation.PERP_TRADE,
-                pair="BTCUSDT",
-                side="LONG" if signal == "long" else "SHORT",
-                amount=target_position["btc_perp_position"],
-                price=btc_price,
-                order_type="market",
+            template = self.order_templates[f"entry_full_{'long' if signal == 'long' else 'short'}"]
+            order = template.build(
+                target_position["btc_perp_position"],
+                btc_price,
                 take_profit=take_profit,
                 stop_loss=stop_loss,
-                source_venue=Venue.BINANCE,
-                target_venue=Venue.BINANCE,
-                source_token="USDT",
-                target_token="BTC",
-                expected_deltas={
-                    self.perp_instrument: (
-                        target_position["btc_perp_position"]
-                        if signal == "long"
-                        else -target_position["btc_perp_position"]
-                    )
-                },
-                execution_mode="sequential",
-                strategy_intent="entry_full",
-                strategy_id="ml_btc_directional",
-                metadata={
-                    "ml_signal": signal,
-                    "confidence": 0.8,  # Would come from ML predictions
-                    "signal_threshold": self.signal_threshold,
-                },
+                metadata={"ml_signal": signal},
             )
 
             return [order]
@@ -496,35 +520,15 @@ class MLBTCDirectionalUSDTMarginStrategy(BaseStrategyManager):
             )
 
             # Create BTC perpetual order with risk management
-            operation_id = f"perp_trade_partial_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-            order = Order(
-                operation_id=operation_id,
-                venue=Venue.BINANCE,
-                operation=OrderOperation.PERP_TRADE,
-                pair="BTCUSDT",
-                side="LONG" if signal == "long" else "SHORT",
-                amount=partial_position,
-                price=btc_price,
-                order_type="market",
+            template = self.order_templates[
+                f"entry_partial_{'long' if signal == 'long' else 'short'}"
+            ]
+            order = template.build(
+                partial_position,
+                btc_price,
                 take_profit=take_profit,
                 stop_loss=stop_loss,
-                source_venue=Venue.BINANCE,
-                target_venue=Venue.BINANCE,
-                source_token="USDT",
-                target_token="BTC",
-                expected_deltas={
-                    self.perp_instrument: (
-                        partial_position if signal == "long" else -partial_position
-                    )
-                },
-                execution_mode="sequential",
-                strategy_intent="entry_partial",
-                strategy_id="ml_btc_directional",
-                metadata={
-                    "ml_signal": signal,
-                    "confidence": 0.8,  # Would come from ML predictions
-                    "signal_threshold": self.signal_threshold,
-                },
+                metadata={"ml_signal": signal},
             )
 
             return [order]
@@ -552,27 +556,11 @@ class MLBTCDirectionalUSDTMarginStrategy(BaseStrategyManager):
                 return []  # No position to close
 
             # Determine close side based on current position
-            close_side = "SELL" if btc_position > 0 else "BUY"
+            close_side = "sell" if btc_position > 0 else "buy"
 
             # Create close position order
-            operation_id = f"perp_close_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-            order = Order(
-                operation_id=operation_id,
-                venue=Venue.BINANCE,
-                operation=OrderOperation.PERP_TRADE,
-                pair="BTCUSDT",
-                side=close_side,
-                amount=abs(btc_position),
-                order_type="market",
-                source_venue=Venue.BINANCE,
-                target_venue=Venue.BINANCE,
-                source_token="USDT",
-                target_token="BTC",
-                expected_deltas={self.perp_instrument: -btc_position},  # Close position
-                execution_mode="sequential",
-                strategy_intent="exit_full",
-                strategy_id="ml_btc_directional",
-                metadata={"close_position": True, "original_position": btc_position},
+            order = self.order_templates[f"exit_full_{close_side}"].build(
+                abs(btc_position), metadata={"original_position": btc_position}
             )
 
             return [order]
@@ -604,33 +592,11 @@ class MLBTCDirectionalUSDTMarginStrategy(BaseStrategyManager):
             partial_exit = min(partial_exit, abs(btc_position))  # Don't exceed current position
 
             # Determine close side based on current position
-            close_side = "SELL" if btc_position > 0 else "BUY"
+            close_side = "sell" if btc_position > 0 else "buy"
 
             # Create close position order
-            operation_id = f"perp_close_partial_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-            order = Order(
-                operation_id=operation_id,
-                venue=Venue.BINANCE,
-                operation=OrderOperation.PERP_TRADE,
-                pair="BTCUSDT",
-                side=close_side,
-                amount=partial_exit,
-                order_type="market",
-                source_venue=Venue.BINANCE,
-                target_venue=Venue.BINANCE,
-                source_token="USDT",
-                target_token="BTC",
-                expected_deltas={
-                    self.perp_instrument: -partial_exit if btc_position > 0 else partial_exit
-                },
-                execution_mode="sequential",
-                strategy_intent="exit_partial",
-                strategy_id="ml_btc_directional",
-                metadata={
-                    "close_position": True,
-                    "partial_exit": True,
-                    "original_position": btc_position,
-                },
+            order = self.order_templates[f"exit_partial_{close_side}"].build(
+                partial_exit, metadata={"original_position": btc_position}
             )
 
             return [order]
@@ -735,31 +701,31 @@ class MLBTCDirectionalUSDTMarginStrategy(BaseStrategyManager):
             for token, amount in dust_tokens.items():
                 if amount > 0 and token != "USDT":  # USDT is the target asset for USDT margin
                     # Sell dust tokens for USDT
-                    operation_id = (
-                        f"dust_sell_{token}_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-                    )
-                    orders.append(
-                        Order(
-                            operation_id=operation_id,
+                    template = self._order_template(
+                        f"dust_sell_{token}",
+                        lambda: OrderTemplate(
+                            f"dust_sell_{token}",
+                            expected_deltas={
+                                f"{Venue.BINANCE.value}:BaseToken:{token}": -AMOUNT,
+                                f"{Venue.BINANCE.value}:BaseToken:USDT": Scaled(
+                                    per_amount=0.99
+                                ),  # Assume 1% slippage
+                            },
+                            price_on_order=False,
                             venue=Venue.BINANCE,
                             operation=OrderOperation.SPOT_TRADE,
                             pair=f"{token}/USDT",
                             side="SELL",
-                            amount=amount,
                             source_venue=Venue.BINANCE,
                             target_venue=Venue.BINANCE,
                             source_token=token,
                             target_token="USDT",
-                            expected_deltas={
-                                f"{Venue.BINANCE.value}:BaseToken:{token}": -amount,
-                                f"{Venue.BINANCE.value}:BaseToken:USDT": amount
-                                * 0.99,  # Assume 1% slippage
-                            },
                             execution_mode="sequential",
                             strategy_intent="sell_dust",
                             strategy_id="ml_btc_directional",
-                        )
+                        ),
                     )
+                    orders.append(template.build(amount))
 
             return orders
 
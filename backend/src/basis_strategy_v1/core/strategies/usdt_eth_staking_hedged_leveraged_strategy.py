@@ -8,13 +8,16 @@ Reference: docs/STRATEGY_MODES.md - USDT ETH Staking Hedged Leveraged Strategy M
 Reference: docs/specs/05_STRATEGY_MANAGER.md - Component specification
 """
 
+from decimal import Decimal
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 import logging
 import pandas as pd
 
 from .base_strategy_manager import BaseStrategyManager
+from ...core.math.ltv_calculator import LTVCalculator
 from ...core.models.order import Order, OrderOperation
+from ...core.models.order_template import next_operation_id
 from ...core.models.venues import Venue
 from ...core.models.instruments import validate_instrument_key, get_display_name
 
@@ -26,9 +29,9 @@ class USDTETHStakingHedgedLeveragedStrategy(BaseStrategyManager):
     USDT ETH Staking Hedged Leveraged Strategy - Market neutral with leverage.
 
     Strategy Overview:
-    - Lend USDT on AAVE/Morpho with leverage
+    - Lend USDT on AAVE/Morpho (unlevered)
     - Stake ETH via liquid staking
-    - Use leverage to increase exposure
+    - Loop the LST on AAVE (flash-loan bundle) to lever the staking leg
     - Target APY: 15-30%
     """
 
@@ -75,7 +78,7 @@ class USDTETHStakingHedgedLeveragedStrategy(BaseStrategyManager):
             "stake_allocation_percentage",
             "leverage_multiplier",
             "lst_type",
-            "LENDING_PROTOCOL",
+            "lending_protocol",
             "staking_protocol",
         ]
         for key in required_keys:
@@ -129,6 +132,10 @@ class USDTETHStakingHedgedLeveragedStrategy(BaseStrategyManager):
         # Calculate derived allocations
         self.usdt_allocation = 1.0 - self.stake_allocation_percentage  # Remaining for USDT lending
         self.eth_allocation = self.stake_allocation_percentage  # For ETH staking
+        # Loop leverage 1 / (1 - ltv) on the staking leg
+        self.loop_ltv = max(0.0, 1.0 - 1.0 / self.leverage_multiplier)
+        # LST/ETH oracle ratio used to size the loop (refreshed each decision)
+        self.lst_eth_ratio = 1.0
 
         logger.info(
             f"USDTETHStakingHedgedLeveragedStrategy initialized with {self.stake_allocation_percentage*100}% ETH staking, {self.usdt_allocation*100}% USDT lending, {self.leverage_multiplier}x leverage"
@@ -164,6 +171,8 @@ class USDTETHStakingHedgedLeveragedStrategy(BaseStrategyManager):
             # Log strategy decision start
             self.logger.info("Making USDT market neutral strategy decision")
 
+            self.lst_eth_ratio = self.get_lst_eth_ratio(timestamp, "weETH")
+
             # Get current equity and positions
             current_equity = exposure.get("total_exposure", 0.0)
             current_positions = exposure.get("positions", {})
@@ -217,23 +226,26 @@ class USDTETHStakingHedgedLeveragedStrategy(BaseStrategyManager):
             Dictionary of target positions by token/venue
         """
         try:
-            # Calculate target allocations with leverage
-            leveraged_equity = current_equity * self.leverage_multiplier
-            usdt_target = leveraged_equity * self.usdt_allocation
-            eth_target = leveraged_equity * self.eth_allocation
+            # Leverage comes from the staking loop; USDT lending is unlevered
+            usdt_target = current_equity * self.usdt_allocation
+            eth_target = current_equity * self.eth_allocation
 
             # Get current ETH price
             eth_price = self._get_asset_price()
             eth_amount = eth_target / eth_price if eth_price > 0 else 0
+            loop = self._solve_staking_loop(eth_amount)
 
             return {
                 "usdt_balance": 0.0,  # No raw USDT, all lent
-                "aUSDT_balance": usdt_target,  # Leveraged lent USDT
+                "aUSDT_balance": usdt_target,  # Lent USDT
                 "eth_balance": 0.0,  # No raw ETH, all staked
-                f"{self.lst_type.lower()}_balance": eth_amount,  # Staked ETH
+                "eth_purchase": eth_amount,  # ETH bought with the staking allocation
+                f"{self.lst_type.lower()}_balance": loop["lst_amount"],  # Looped LST
+                "aave_v3:debtToken:debtWETH": loop["debt_amount"],  # WETH borrowed
                 f"{self.share_class.lower()}_balance": current_equity,
                 "total_equity": current_equity,
-                "leveraged_equity": leveraged_equity,
+                "leveraged_equity": usdt_target + loop["collateral_value"] * eth_price,
+                "staking_loop": loop,
             }
 
         except Exception as e:
@@ -242,12 +254,64 @@ class USDTETHStakingHedgedLeveragedStrategy(BaseStrategyManager):
                 "usdt_balance": 0.0,
                 "aUSDT_balance": 0.0,
                 "eth_balance": 0.0,
+                "eth_purchase": 0.0,
                 f"{self.lst_type.lower()}_balance": 0.0,
                 f"{self.share_class.lower()}_balance": current_equity,
                 "total_equity": current_equity,
                 "leveraged_equity": current_equity,
             }
 
+    def _solve_staking_loop(self, eth_amount: float) -> Dict[str, float]:
+        """Converged staking loop for eth_amount of ETH (LTVCalculator.solve_leverage_loop)."""
+        loop = LTVCalculator.solve_leverage_loop(
+            Decimal(str(max(eth_amount, 0.0))),
+            Decimal(str(self.loop_ltv)),
+            lst_eth_ratio=Decimal(str(self.lst_eth_ratio)),
+        )
+        return {key: float(value) for key, value in loop.items()}
+
+    def _create_staking_orders(
+        self, loop: Dict[str, float], atomic_group_id: str, strategy_intent: str, first_sequence: int
+    ) -> List[Order]:
+        """Flash-loan bundle for a leveraged loop, or a plain stake without leverage."""
+        if loop["flash_loan_amount"] > 0:
+            return self._create_leveraged_staking_orders(
+                loop=loop,
+                lst_type=self.lst_type,
+                staking_instrument=f"etherfi:LST:{self.lst_type}",
+                borrow_instrument=f"{Venue.AAVE_V3.value}:debtToken:debtWETH",
+                staking_protocol=self.staking_protocol,
+                atomic_group_id=atomic_group_id,
+                strategy_intent=strategy_intent,
+                target_ltv=self.loop_ltv,
+                first_sequence=first_sequence,
+            )
+
+        stake_amount = loop["stake_amount"]
+        return [
+            Order(
+                operation_id=next_operation_id("stake_eth"),
+                venue=Venue.ETHERFI,
+                operation=OrderOperation.STAKE,
+                token_in="WETH",
+                token_out=self.lst_type,
+                amount=stake_amount,
+                source_venue=Venue.WALLET,
+                target_venue=Venue.ETHERFI,
+                source_token="WETH",
+                target_token=self.lst_type,
+                expected_deltas={
+                    f"etherfi:LST:{self.lst_type}": loop["lst_amount"],
+                    "wallet:BaseToken:WETH": -stake_amount,
+                },
+                execution_mode="atomic",
+                atomic_group_id=atomic_group_id,
+                sequence_in_group=first_sequence,
+                strategy_intent=strategy_intent,
+                strategy_id="usdt_eth_staking_hedged_leveraged",
+            )
+        ]
+
     def _create_entry_full_orders(self, equity: float) -> List[Order]:
         """
         Create entry full orders for USDT market neutral strategy.
@@ -265,7 +329,7 @@ class USDTETHStakingHedgedLeveragedStrategy(BaseStrategyManager):
             orders = []
             atomic_group_id = f"usdt_eth_staking_hedged_leveraged_entry_{int(equity)}"
 
-            # 1. Lend USDT with leverage (atomic group)
+            # 1. Lend USDT, unlevered (atomic group)
             usdt_amount = target_position["aUSDT_balance"]
             if usdt_amount > 0:
                 operation_id = f"supply_usdt_{int(pd.Timestamp.now().timestamp() * 1000000)}"
@@ -290,62 +354,23 @@ class USDTETHStakingHedgedLeveragedStrategy(BaseStrategyManager):
                         sequence_in_group=1,
                         strategy_intent="entry_full",
                         strategy_id="usdt_eth_staking_hedged_leveraged",
-                        metadata={"leverage": self.leverage_multiplier},
                     )
                 )
 
-            # 2. Buy ETH for staking (atomic group)
-            eth_amount = target_position[f"{self.lst_type.lower()}_balance"]
+            # 2. Swap USDT to WETH for staking (atomic group)
+            eth_amount = target_position["eth_purchase"]
             if eth_amount > 0:
-                operation_id = f"buy_eth_{int(pd.Timestamp.now().timestamp() * 1000000)}"
                 orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue=Venue.BINANCE,
-                        operation=OrderOperation.SPOT_TRADE,
-                        pair="ETH/USDT",
-                        side="BUY",
-                        amount=eth_amount,
-                        source_venue=Venue.WALLET,
-                        target_venue=Venue.BINANCE,
-                        source_token="USDT",
-                        target_token="ETH",
-                        expected_deltas={
-                            "wallet:BaseToken:ETH": eth_amount,
-                            "wallet:BaseToken:USDT": -eth_amount * self._get_asset_price(),
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=2,
-                        strategy_intent="entry_full",
-                        strategy_id="usdt_eth_staking_hedged_leveraged",
+                    self._create_weth_swap_order(
+                        "USDT", eth_amount, atomic_group_id, "entry_full", 2
                     )
                 )
 
-            # 3. Stake ETH (atomic group)
+            # 3. Leveraged staking loop as one flash-loan bundle (atomic group)
             if eth_amount > 0:
-                operation_id = f"stake_eth_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-                orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue=Venue.ETHERFI,
-                        operation=OrderOperation.STAKE,
-                        token_in="ETH",
-                        token_out=self.lst_type,
-                        amount=eth_amount,
-                        source_venue=Venue.WALLET,
-                        target_venue=Venue.ETHERFI,
-                        source_token="ETH",
-                        target_token=self.lst_type,
-                        expected_deltas={
-                            f"etherfi:LST:{self.lst_type}": eth_amount,
-                            "wallet:BaseToken:ETH": -eth_amount,
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=3,
-                        strategy_intent="entry_full",
-                        strategy_id="usdt_eth_staking_hedged_leveraged",
+                orders.extend(
+                    self._create_staking_orders(
+                        target_position["staking_loop"], atomic_group_id, "entry_full", 3
                     )
                 )
 
@@ -390,10 +415,9 @@ class USDTETHStakingHedgedLeveragedStrategy(BaseStrategyManager):
             List of Order objects for partial entry
         """
         try:
-            # Calculate proportional allocation with leverage
-            leveraged_delta = equity_delta * self.leverage_multiplier
-            usdt_delta = leveraged_delta * self.usdt_allocation
-            eth_delta = leveraged_delta * self.eth_allocation
+            # Leverage comes from the staking loop; USDT lending is unlevered
+            usdt_delta = equity_delta * self.usdt_allocation
+            eth_delta = equity_delta * self.eth_allocation
 
             # Get current ETH price
             eth_price = self._get_asset_price()
@@ -402,7 +426,7 @@ class USDTETHStakingHedgedLeveragedStrategy(BaseStrategyManager):
             orders = []
             atomic_group_id = f"usdt_eth_staking_hedged_leveraged_partial_{int(equity_delta)}"
 
-            # 1. Lend additional USDT with leverage (atomic group)
+            # 1. Lend additional USDT, unlevered (atomic group)
             if usdt_delta > 0:
                 operation_id = f"supply_usdt_{int(pd.Timestamp.now().timestamp() * 1000000)}"
                 orders.append(
@@ -426,61 +450,22 @@ class USDTETHStakingHedgedLeveragedStrategy(BaseStrategyManager):
                         sequence_in_group=1,
                         strategy_intent="entry_partial",
                         strategy_id="usdt_eth_staking_hedged_leveraged",
-                        metadata={"leverage": self.leverage_multiplier},
                     )
                 )
 
-            # 2. Buy additional ETH (atomic group)
+            # 2. Swap additional USDT to WETH (atomic group)
             if eth_amount > 0:
-                operation_id = f"buy_eth_{int(pd.Timestamp.now().timestamp() * 1000000)}"
                 orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue="binance",
-                        operation=OrderOperation.SPOT_TRADE,
-                        pair="ETH/USDT",
-                        side="BUY",
-                        amount=eth_amount,
-                        source_venue=Venue.WALLET,
-                        target_venue=Venue.BINANCE,
-                        source_token="USDT",
-                        target_token="ETH",
-                        expected_deltas={
-                            "wallet:BaseToken:ETH": eth_amount,
-                            "wallet:BaseToken:USDT": -eth_amount * eth_price,
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=2,
-                        strategy_intent="entry_partial",
-                        strategy_id="usdt_eth_staking_hedged_leveraged",
+                    self._create_weth_swap_order(
+                        "USDT", eth_amount, atomic_group_id, "entry_partial", 2
                     )
                 )
 
-            # 3. Stake additional ETH (atomic group)
+            # 3. Leveraged staking loop as one flash-loan bundle (atomic group)
             if eth_amount > 0:
-                operation_id = f"stake_eth_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-                orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue=self.staking_protocol,
-                        operation=OrderOperation.STAKE,
-                        token_in="ETH",
-                        token_out=self.lst_type,
-                        amount=eth_amount,
-                        source_venue=Venue.WALLET,
-                        target_venue=Venue.ETHERFI,
-                        source_token="ETH",
-                        target_token=self.lst_type,
-                        expected_deltas={
-                            f"etherfi:LST:{self.lst_type}": eth_amount,
-                            "wallet:BaseToken:ETH": -eth_amount,
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=3,
-                        strategy_intent="entry_partial",
-                        strategy_id="usdt_eth_staking_hedged_leveraged",
+                orders.extend(
+                    self._create_staking_orders(
+                        self._solve_staking_loop(eth_amount), atomic_group_id, "entry_partial", 3
                     )
                 )
 
@@ -505,7 +490,7 @@ class USDTETHStakingHedgedLeveragedStrategy(BaseStrategyManager):
                         },
                         execution_mode="atomic",
                         atomic_group_id=atomic_group_id,
-                        sequence_in_group=4,
+                        sequence_in_group=len(orders) + 1,
                         strategy_intent="entry_partial",
                         strategy_id="usdt_eth_staking_hedged_leveraged",
                     )
@@ -517,6 +502,153 @@ class USDTETHStakingHedgedLeveragedStrategy(BaseStrategyManager):
             logger.error(f"Error creating entry partial orders: {e}")
             return []
 
+    def _create_weth_swap_order(
+        self,
+        token_in: str,
+        weth_amount: float,
+        atomic_group_id: str,
+        strategy_intent: str,
+        sequence_in_group: int,
+    ) -> Order:
+        """Uniswap swap between wallet USDT and weth_amount of wallet WETH (either direction)."""
+        token_out = "USDT" if token_in == "WETH" else "WETH"
+        usdt_amount = weth_amount * self._get_asset_price()
+        sign = 1 if token_out == "WETH" else -1
+        return Order(
+            operation_id=next_operation_id(f"swap_{token_in.lower()}"),
+            venue=Venue.UNISWAP,
+            operation=OrderOperation.SWAP,
+            token_in=token_in,
+            token_out=token_out,
+            amount=weth_amount if token_in == "WETH" else usdt_amount,
+            source_venue=Venue.WALLET,
+            target_venue=Venue.UNISWAP,
+            source_token=token_in,
+            target_token=token_out,
+            expected_deltas={
+                "wallet:BaseToken:WETH": sign * weth_amount,
+                "wallet:BaseToken:USDT": -sign * usdt_amount,
+            },
+            execution_mode="atomic",
+            atomic_group_id=atomic_group_id,
+            sequence_in_group=sequence_in_group,
+            strategy_intent=strategy_intent,
+            strategy_id="usdt_eth_staking_hedged_leveraged",
+        )
+
+    def _create_unstaking_orders(
+        self,
+        lst_amount: float,
+        debt_amount: float,
+        atomic_group_id: str,
+        strategy_intent: str,
+        first_sequence: int,
+    ) -> List[Order]:
+        """
+        Unwind lst_amount of the staking leg and swap the freed WETH to USDT.
+
+        With debt, a flash-loan bundle repays debt_amount of WETH debt and withdraws
+        lst_amount of a{lst} collateral (mirror of the entry loop); without leverage the
+        LST is unstaked directly.
+        """
+        weth_amount = lst_amount * self.lst_eth_ratio
+        staking_instrument = f"etherfi:LST:{self.lst_type}"
+
+        if debt_amount > 0:
+            orders = self._create_leveraged_unwind_orders(
+                unwind={
+                    "debt_amount": debt_amount,
+                    "lst_amount": lst_amount,
+                    "weth_amount": weth_amount,
+                },
+                lst_type=self.lst_type,
+                staking_instrument=staking_instrument,
+                borrow_instrument=f"{Venue.AAVE_V3.value}:debtToken:debtWETH",
+                staking_protocol=self.staking_protocol,
+                atomic_group_id=atomic_group_id,
+                strategy_intent=strategy_intent,
+                first_sequence=first_sequence,
+            )
+        else:
+            orders = [
+                Order(
+                    operation_id=next_operation_id("unstake"),
+                    venue=self.staking_protocol,
+                    operation=OrderOperation.UNSTAKE,
+                    token_in=self.lst_type,
+                    token_out="WETH",
+                    amount=lst_amount,
+                    source_venue=Venue.ETHERFI,
+                    target_venue=Venue.WALLET,
+                    source_token=self.lst_type,
+                    target_token="WETH",
+                    expected_deltas={
+                        staking_instrument: -lst_amount,
+                        "wallet:BaseToken:WETH": weth_amount,
+                    },
+                    execution_mode="atomic",
+                    atomic_group_id=atomic_group_id,
+                    sequence_in_group=first_sequence,
+                    strategy_intent=strategy_intent,
+                    strategy_id="usdt_eth_staking_hedged_leveraged",
+                )
+            ]
+
+        # WETH left after the flash loan is repaid
+        residual_weth = weth_amount - debt_amount
+        if residual_weth > 0:
+            orders.append(
+                self._create_weth_swap_order(
+                    "WETH",
+                    residual_weth,
+                    atomic_group_id,
+                    strategy_intent,
+                    first_sequence + len(orders),
+                )
+            )
+        return orders
+
+    def _create_withdraw_usdt_order(
+        self, amount: float, atomic_group_id: str, strategy_intent: str, sequence_in_group: int
+    ) -> Order:
+        """Withdraw lent USDT from the lending protocol."""
+        return Order(
+            operation_id=next_operation_id("withdraw_usdt"),
+            venue=self.lending_protocol,
+            operation=OrderOperation.WITHDRAW,
+            token_in="aUSDT",
+            token_out="USDT",
+            amount=amount,
+            source_venue=Venue.AAVE_V3,
+            target_venue=Venue.WALLET,
+            source_token="aUSDT",
+            target_token="USDT",
+            expected_deltas={
+                "aave_v3:aToken:aUSDT": -amount,
+                "wallet:BaseToken:USDT": amount,
+            },
+            execution_mode="atomic",
+            atomic_group_id=atomic_group_id,
+            sequence_in_group=sequence_in_group,
+            strategy_intent=strategy_intent,
+            strategy_id="usdt_eth_staking_hedged_leveraged",
+        )
+
+    def _get_unwind_balances(self) -> Dict[str, float]:
+        """Lent USDT, LST collateral (or unlevered LST) and WETH debt from the position monitor."""
+        current_position = self.position_monitor.get_current_position()
+        debt = current_position.get(f"{Venue.AAVE_V3.value}:debtToken:debtWETH", 0.0)
+        lst_key = (
+            f"{Venue.AAVE_V3.value}:aToken:a{self.lst_type}"
+            if debt > 0
+            else f"etherfi:LST:{self.lst_type}"
+        )
+        return {
+            "ausdt": current_position.get(f"{Venue.AAVE_V3.value}:aToken:aUSDT", 0.0),
+            "lst": current_position.get(lst_key, 0.0),
+            "debt": debt,
+        }
+
     def _create_exit_full_orders(self, equity: float) -> List[Order]:
         """
         Create exit full orders for USDT market neutral strategy.
@@ -528,116 +660,27 @@ class USDTETHStakingHedgedLeveragedStrategy(BaseStrategyManager):
             List of Order objects for full exit
         """
         try:
-            # Get current position
-            current_position = self.position_monitor.get_current_position()
-            ausdt_balance = current_position.get("aUSDT_balance", 0.0)
-            lst_balance = current_position.get(f"{self.lst_type.lower()}_balance", 0.0)
+            balances = self._get_unwind_balances()
 
             orders = []
             atomic_group_id = f"usdt_eth_staking_hedged_leveraged_exit_{int(equity)}"
 
-            # 1. Unstake LST to get ETH (atomic group)
-            if lst_balance > 0:
-                operation_id = f"unstake_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-                orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue=self.staking_protocol,
-                        operation=OrderOperation.UNSTAKE,
-                        token_in=self.lst_type,
-                        token_out="ETH",
-                        amount=lst_balance,
-                        source_venue=Venue.ETHERFI,
-                        target_venue=Venue.WALLET,
-                        source_token=self.lst_type,
-                        target_token="ETH",
-                        expected_deltas={
-                            f"etherfi:LST:{self.lst_type}": -lst_balance,
-                            "wallet:BaseToken:ETH": lst_balance,
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=1,
-                        strategy_intent="exit_full",
-                        strategy_id="usdt_eth_staking_hedged_leveraged",
-                    )
-                )
-
-            # 2. Sell ETH (atomic group)
-            if lst_balance > 0:
-                operation_id = f"sell_eth_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-                eth_price = self._get_asset_price()
-                orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue="binance",
-                        operation=OrderOperation.SPOT_TRADE,
-                        pair="ETH/USDT",
-                        side="SELL",
-                        amount=lst_balance,
-                        source_venue=Venue.WALLET,
-                        target_venue=Venue.BINANCE,
-                        source_token="ETH",
-                        target_token="USDT",
-                        expected_deltas={
-                            "wallet:BaseToken:ETH": -lst_balance,
-                            "wallet:BaseToken:USDT": lst_balance * eth_price,
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=2,
-                        strategy_intent="exit_full",
-                        strategy_id="usdt_eth_staking_hedged_leveraged",
+            # 1. Flash-unwind the staking loop and swap the freed WETH (atomic group)
+            if balances["lst"] > 0:
+                orders.extend(
+                    self._create_unstaking_orders(
+                        balances["lst"], balances["debt"], atomic_group_id, "exit_full", 1
                     )
                 )
 
-            # 3. Withdraw lent USDT (atomic group)
-            if ausdt_balance > 0:
-                operation_id = f"withdraw_usdt_{int(pd.Timestamp.now().timestamp() * 1000000)}"
+            # 2. Withdraw lent USDT (atomic group)
+            if balances["ausdt"] > 0:
                 orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue=self.lending_protocol,
-                        operation=OrderOperation.WITHDRAW,
-                        token_in="aUSDT",
-                        token_out="USDT",
-                        amount=ausdt_balance,
-                        source_venue=Venue.AAVE_V3,
-                        target_venue=Venue.WALLET,
-                        source_token="aUSDT",
-                        target_token="USDT",
-                        expected_deltas={
-                            "aave_v3:aToken:aUSDT": -ausdt_balance,
-                            "wallet:BaseToken:USDT": ausdt_balance,
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=3,
-                        strategy_intent="exit_full",
-                        strategy_id="usdt_eth_staking_hedged_leveraged",
+                    self._create_withdraw_usdt_order(
+                        balances["ausdt"], atomic_group_id, "exit_full", len(orders) + 1
                     )
                 )
 
-            # 4. Convert all to share class currency (sequential)
-            operation_id = f"transfer_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-            orders.append(
-                Order(
-                    operation_id=operation_id,
-                    venue="wallet",
-                    operation=OrderOperation.TRANSFER,
-                    source_venue="wallet",
-                    target_venue="wallet",
-                    source_token=self.share_class,
-                    target_token=self.share_class,
-                    token=self.share_class,
-                    amount=equity,
-                    expected_deltas={f"wallet:BaseToken:{self.share_class}": equity},
-                    execution_mode="sequential",
-                    strategy_intent="exit_full",
-                    strategy_id="usdt_eth_staking_hedged_leveraged",
-                )
-            )
-
             return orders
 
         except Exception as e:
@@ -655,126 +698,41 @@ class USDTETHStakingHedgedLeveragedStrategy(BaseStrategyManager):
             List of Order objects for partial exit
         """
         try:
-            # Get current position
-            current_position = self.position_monitor.get_current_position()
-            ausdt_balance = current_position.get("aUSDT_balance", 0.0)
-            lst_balance = current_position.get(f"{self.lst_type.lower()}_balance", 0.0)
+            balances = self._get_unwind_balances()
 
-            # Calculate proportional reduction
-            total_position_value = ausdt_balance + (lst_balance * self._get_asset_price())
+            # Calculate proportional reduction of the net position
+            staking_value = (
+                balances["lst"] * self.lst_eth_ratio - balances["debt"]
+            ) * self._get_asset_price()
+            total_position_value = balances["ausdt"] + staking_value
             if total_position_value > 0:
                 reduction_ratio = min(equity_delta / total_position_value, 1.0)
             else:
                 reduction_ratio = 0.0
 
-            ausdt_reduction = ausdt_balance * reduction_ratio
-            lst_reduction = lst_balance * reduction_ratio
+            ausdt_reduction = balances["ausdt"] * reduction_ratio
+            lst_reduction = balances["lst"] * reduction_ratio
+            debt_reduction = balances["debt"] * reduction_ratio
 
             orders = []
             atomic_group_id = f"usdt_eth_staking_hedged_leveraged_partial_exit_{int(equity_delta)}"
 
-            # 1. Unstake proportional LST (atomic group)
+            # 1. Flash-unwind a proportional slice of the loop (atomic group)
             if lst_reduction > 0:
-                operation_id = f"unstake_partial_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-                orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue=self.staking_protocol,
-                        operation=OrderOperation.UNSTAKE,
-                        token_in=self.lst_type,
-                        token_out="ETH",
-                        amount=lst_reduction,
-                        source_venue=Venue.ETHERFI,
-                        target_venue=Venue.WALLET,
-                        source_token=self.lst_type,
-                        target_token="ETH",
-                        expected_deltas={
-                            f"etherfi:LST:{self.lst_type}": -lst_reduction,
-                            "wallet:BaseToken:ETH": lst_reduction,
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=1,
-                        strategy_intent="exit_partial",
-                        strategy_id="usdt_eth_staking_hedged_leveraged",
+                orders.extend(
+                    self._create_unstaking_orders(
+                        lst_reduction, debt_reduction, atomic_group_id, "exit_partial", 1
                     )
                 )
 
-            # 2. Sell proportional ETH (atomic group)
-            if lst_reduction > 0:
-                operation_id = f"sell_eth_partial_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-                eth_price = self._get_asset_price()
-                orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue="binance",
-                        operation=OrderOperation.SPOT_TRADE,
-                        pair="ETH/USDT",
-                        side="SELL",
-                        amount=lst_reduction,
-                        source_venue=Venue.WALLET,
-                        target_venue=Venue.BINANCE,
-                        source_token="ETH",
-                        target_token="USDT",
-                        expected_deltas={
-                            "wallet:BaseToken:ETH": -lst_reduction,
-                            "wallet:BaseToken:USDT": lst_reduction * eth_price,
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=2,
-                        strategy_intent="exit_partial",
-                        strategy_id="usdt_eth_staking_hedged_leveraged",
-                    )
-                )
-
-            # 3. Withdraw proportional lent USDT (atomic group)
+            # 2. Withdraw proportional lent USDT (atomic group)
             if ausdt_reduction > 0:
-                operation_id = f"withdraw_partial_{int(pd.Timestamp.now().timestamp() * 1000000)}"
                 orders.append(
-                    Order(
-                        operation_id=operation_id,
-                        venue=self.lending_protocol,
-                        operation=OrderOperation.WITHDRAW,
-                        token_in="aUSDT",
-                        token_out="USDT",
-                        amount=ausdt_reduction,
-                        source_venue=Venue.AAVE_V3,
-                        target_venue=Venue.WALLET,
-                        source_token="aUSDT",
-                        target_token="USDT",
-                        expected_deltas={
-                            "aave_v3:aToken:aUSDT": -ausdt_reduction,
-                            "wallet:BaseToken:USDT": ausdt_reduction,
-                        },
-                        execution_mode="atomic",
-                        atomic_group_id=atomic_group_id,
-                        sequence_in_group=3,
-                        strategy_intent="exit_partial",
-                        strategy_id="usdt_eth_staking_hedged_leveraged",
+                    self._create_withdraw_usdt_order(
+                        ausdt_reduction, atomic_group_id, "exit_partial", len(orders) + 1
                     )
                 )
 
-            # 4. Convert to share class currency (sequential)
-            operation_id = f"transfer_partial_{int(pd.Timestamp.now().timestamp() * 1000000)}"
-            orders.append(
-                Order(
-                    operation_id=operation_id,
-                    venue="wallet",
-                    operation=OrderOperation.TRANSFER,
-                    source_venue="wallet",
-                    target_venue="wallet",
-                    source_token=self.share_class,
-                    target_token=self.share_class,
-                    token=self.share_class,
-                    amount=equity_delta,
-                    expected_deltas={f"wallet:BaseToken:{self.share_class}": equity_delta},
-                    execution_mode="sequential",
-                    strategy_intent="exit_partial",
-                    strategy_id="usdt_eth_staking_hedged_leveraged",
-                )
-            )
-
             return orders
 
         except Exception as e:
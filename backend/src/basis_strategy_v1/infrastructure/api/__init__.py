@@ -4,6 +4,6 @@ Infrastructure API package.
 This package contains API-related infrastructure components.
 """
 
-from .api_call_queue import APICallQueue
+from .api_call_queue import APICallManager, APICallQueue
 
-__all__ = ["APICallQueue"]
+__all__ = ["APICallManager", "APICallQueue"]
@@ -2,21 +2,37 @@
 """
 API Call Queue
 
-Implements sequential API call processing to prevent race conditions and ensure
-proper ordering of API requests per ADR-006 requirements.
+Schedules outbound API calls on one lane per venue/service so Binance, Bybit,
+OKX, Alchemy and the ML endpoint no longer serialize behind each other, while
+each lane stays inside its venue's rate limit per ADR-006 requirements.
+
+Key Principles:
+- One lane (APICallQueue) per service; lanes share nothing and run independently
+- Token bucket rate limit and bounded concurrency per lane, from the venue's
+  rate_limit block in configs/venues/*.yaml (no block: one call at a time, no rate cap)
+- Highest priority first, FIFO within a priority
+- Calls sharing an ordering_key run one at a time in submission order
+- Results are delivered through futures; nothing polls
+- Per-lane queue depth, queue wait and call latency metrics via get_status(),
+  exported on /health/detailed as the api_call_lanes component
 
 Reference: docs/LOGICAL_EXCEPTIONS_GUIDE.md - API Call Queueing Pattern
 """
 
 import asyncio
+import itertools
 import logging
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, Optional, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import uuid
 
 logger = logging.getLogger(__name__)
 
+# Recent samples kept per lane for latency percentiles
+METRICS_WINDOW = 1000
+
 
 @dataclass
 class APICall:
@@ -29,99 +45,262 @@ class APICall:
     timestamp: datetime
     timeout: Optional[float] = None
     priority: int = 0  # Higher number = higher priority
+    ordering_key: Optional[str] = None  # Calls with the same key run one at a time, in order
+    future: Optional[asyncio.Future] = None
+    enqueued_at: float = 0.0  # Event loop time, for queue wait metrics
+
+
+class TokenBucket:
+    """Token bucket allowing `rate` acquisitions per second with bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self._updated: Optional[float] = None
+
+    async def acquire(self) -> float:
+        """Take one token, sleeping until one is available. Returns the seconds waited."""
+        loop = asyncio.get_running_loop()
+        start = None
+        while True:
+            now = loop.time()
+            if self._updated is not None:
+                self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return 0.0 if start is None else now - start
+            if start is None:
+                start = now
+            await asyncio.sleep((1.0 - self.tokens) / self.rate)
+
+
+class LaneMetrics:
+    """Counters and recent latency samples of one lane."""
+
+    def __init__(self, window: int = METRICS_WINDOW):
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.rejected = 0
+        self.throttled_seconds = 0.0
+        self.queue_wait: Deque[float] = deque(maxlen=window)
+        self.latency: Deque[float] = deque(maxlen=window)
+
+    @staticmethod
+    def _summary_ms(samples: Deque[float]) -> Dict[str, Optional[float]]:
+        if not samples:
+            return {"p50": None, "p95": None, "max": None}
+        ordered = sorted(samples)
+        return {
+            "p50": ordered[len(ordered) // 2] * 1000.0,
+            "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000.0,
+            "max": ordered[-1] * 1000.0,
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "rejected": self.rejected,
+            "throttled_seconds": self.throttled_seconds,
+            "queue_wait_ms": self._summary_ms(self.queue_wait),
+            "latency_ms": self._summary_ms(self.latency),
+        }
+
+
+def _check_positive(name: str, value: Any, integer: bool) -> None:
+    number_types = (int,) if integer else (int, float)
+    if isinstance(value, bool) or not isinstance(value, number_types):
+        raise TypeError(f"{name} must be {'an int' if integer else 'a number'}, got {value!r}")
+    if not value > 0:  # Also rejects NaN
+        raise ValueError(f"{name} must be positive, got {value}")
 
 
 class APICallQueue:
     """
-    Queue for sequential API call processing to prevent race conditions.
-
-    All concurrent API calls are queued and processed sequentially to ensure:
-    - No race conditions between API calls
-    - FIFO ordering guaranteed
-    - Proper timeout handling per call
-    - Sequential processing even with variable response times
+    One scheduling lane for a venue/service.
+
+    A dispatcher hands queued calls to at most max_concurrency concurrent
+    executions, taking a rate limit token per call when requests_per_second is set:
+    - Highest priority first, FIFO within a priority
+    - Calls sharing an ordering_key never overlap and keep submission order
+    - Per-call timeout handling
+    - Each call resolves a future (submit) or a call_id result (enqueue_call/get_result)
     """
 
-    def __init__(self, max_queue_size: int = 1000, default_timeout: float = 30.0):
-        self.queue = asyncio.PriorityQueue(maxsize=max_queue_size)
-        self.worker_task: Optional[asyncio.Task] = None
-        self.results: Dict[str, Any] = {}
-        self.errors: Dict[str, Exception] = {}
+    def __init__(
+        self,
+        max_queue_size: int = 1000,
+        default_timeout: float = 30.0,
+        requests_per_second: Optional[float] = None,
+        burst: int = 1,
+        max_concurrency: int = 1,
+        name: str = "default",
+    ):
+        _check_positive("max_queue_size", max_queue_size, integer=True)
+        _check_positive("default_timeout", default_timeout, integer=False)
+        _check_positive("burst", burst, integer=True)
+        _check_positive("max_concurrency", max_concurrency, integer=True)
+        if requests_per_second is not None:
+            _check_positive("requests_per_second", requests_per_second, integer=False)
+
+        self.name = name
+        self.max_queue_size = max_queue_size
         self.default_timeout = default_timeout
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+
+        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self.worker_task: Optional[asyncio.Task] = None
+        # Futures of enqueue_call() calls until claimed by get_result()
+        self.results: "OrderedDict[str, asyncio.Future]" = OrderedDict()
+        self.rate_limiter = (
+            TokenBucket(requests_per_second, burst) if requests_per_second is not None else None
+        )
+        self.metrics = LaneMetrics()
         self.is_running = False
-        self._shutdown_event = asyncio.Event()
+
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._in_flight: Set[asyncio.Task] = set()
+        # ordering_key -> calls waiting for the key's current call to finish
+        self._ordering: Dict[str, Deque[APICall]] = {}
+        self._sequence = itertools.count()
+        self._pending = 0
 
         logger.info(
-            f"Initialized APICallQueue with max_size={max_queue_size}, timeout={default_timeout}s"
+            f"Initialized APICallQueue '{name}' with max_size={max_queue_size}, "
+            f"timeout={default_timeout}s, rate={requests_per_second}/s, burst={burst}, "
+            f"concurrency={max_concurrency}"
         )
 
     async def start(self) -> None:
-        """Start the API call queue worker"""
+        """Start the lane dispatcher"""
         if self.is_running:
-            logger.warning("API call queue is already running")
+            logger.warning(f"API call queue '{self.name}' is already running")
             return
 
         self.is_running = True
-        self._shutdown_event.clear()
         self.worker_task = asyncio.create_task(self._worker())
-        logger.info("✅ API call queue worker started")
+        logger.info(f"✅ API call queue '{self.name}' started")
 
     async def stop(self) -> None:
-        """Stop the API call queue worker"""
+        """Stop dispatching; calls already running finish, queued calls wait for the next start"""
         if not self.is_running:
-            logger.warning("API call queue is not running")
+            logger.warning(f"API call queue '{self.name}' is not running")
             return
 
         self.is_running = False
-        self._shutdown_event.set()
 
         if self.worker_task:
-            await self.worker_task
+            self.worker_task.cancel()
+            await asyncio.gather(self.worker_task, return_exceptions=True)
             self.worker_task = None
 
-        logger.info("✅ API call queue worker stopped")
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
 
-    async def enqueue_call(
-        self, func: Callable, *args, timeout: Optional[float] = None, priority: int = 0, **kwargs
-    ) -> str:
+        logger.info(f"✅ API call queue '{self.name}' stopped")
+
+    def submit(
+        self,
+        func: Callable,
+        *args,
+        timeout: Optional[float] = None,
+        priority: int = 0,
+        ordering_key: Optional[str] = None,
+        **kwargs,
+    ) -> asyncio.Future:
         """
-        Enqueue an API call for sequential processing.
+        Queue an API call and return a future resolved with its result.
 
         Args:
             func: The async function to call
             *args: Positional arguments for the function
             timeout: Timeout for this specific call (defaults to queue timeout)
             priority: Priority level (higher number = higher priority)
+            ordering_key: Calls with the same key run one at a time in submission order
+                (e.g. an order id, so a cancel never overtakes its placement)
             **kwargs: Keyword arguments for the function
 
-        Returns:
-            call_id: Unique identifier for tracking the call result
+        Raises:
+            RuntimeError: If the lane already holds max_queue_size waiting calls
         """
-        call_id = str(uuid.uuid4())
-        timeout = timeout or self.default_timeout
+        return self._queue_call(func, args, kwargs, timeout, priority, ordering_key).future
+
+    def _queue_call(
+        self,
+        func: Callable,
+        args: Tuple,
+        kwargs: Dict[str, Any],
+        timeout: Optional[float],
+        priority: int,
+        ordering_key: Optional[str],
+    ) -> APICall:
+        if self._pending >= self.max_queue_size:
+            self.metrics.rejected += 1
+            logger.error(f"API call queue '{self.name}' is full, cannot enqueue call")
+            raise RuntimeError("API call queue is full")
 
+        loop = asyncio.get_running_loop()
         api_call = APICall(
-            call_id=call_id,
+            call_id=str(uuid.uuid4()),
             func=func,
             args=args,
             kwargs=kwargs,
             timestamp=datetime.now(timezone.utc),
-            timeout=timeout,
+            timeout=timeout or self.default_timeout,
             priority=priority,
+            ordering_key=ordering_key,
+            future=loop.create_future(),
+            enqueued_at=loop.time(),
         )
+        self._pending += 1
+        self.metrics.submitted += 1
 
-        try:
-            # Use negative priority for PriorityQueue (higher priority = lower number)
-            await self.queue.put((-priority, api_call))
-            logger.debug(f"Enqueued API call {call_id} with priority {priority}")
-            return call_id
-        except asyncio.QueueFull:
-            logger.error(f"API call queue is full, cannot enqueue call {call_id}")
-            raise RuntimeError("API call queue is full")
+        held = self._ordering.get(ordering_key) if ordering_key is not None else None
+        if held is not None:
+            held.append(api_call)
+        else:
+            if ordering_key is not None:
+                self._ordering[ordering_key] = deque()
+            self._put(api_call)
+
+        logger.debug(f"Enqueued API call {api_call.call_id} on '{self.name}' priority {priority}")
+        return api_call
+
+    async def call(self, func: Callable, *args, **kwargs) -> Any:
+        """Queue an API call and wait for its result (same arguments as submit)."""
+        return await self.submit(func, *args, **kwargs)
+
+    async def enqueue_call(
+        self,
+        func: Callable,
+        *args,
+        timeout: Optional[float] = None,
+        priority: int = 0,
+        ordering_key: Optional[str] = None,
+        **kwargs,
+    ) -> str:
+        """
+        Queue an API call whose result is collected later with get_result.
+
+        Returns:
+            call_id: Unique identifier for tracking the call result
+        """
+        api_call = self._queue_call(func, args, kwargs, timeout, priority, ordering_key)
+        self._evict_unclaimed()
+        self.results[api_call.call_id] = api_call.future
+        return api_call.call_id
 
     async def get_result(self, call_id: str, timeout: Optional[float] = None) -> Any:
         """
-        Get the result of a queued API call.
+        Wait for the result of a call queued with enqueue_call.
 
         Args:
             call_id: The call ID returned by enqueue_call
@@ -131,152 +310,233 @@ class APICallQueue:
             The result of the API call
 
         Raises:
-            TimeoutError: If the result is not available within timeout
-            KeyError: If the call_id is not found
+            TimeoutError: If the result is not available within timeout (the result
+                can still be collected later)
+            KeyError: If the call_id is unknown or its result was already collected
             Exception: The exception that occurred during the API call
         """
-        timeout = timeout or self.default_timeout
-        start_time = asyncio.get_event_loop().time()
+        future = self.results.get(call_id)
+        if future is None:
+            raise KeyError(f"Unknown API call {call_id}")
 
-        while True:
-            # Check if we have the result
-            if call_id in self.results:
-                result = self.results.pop(call_id)
-                logger.debug(f"Retrieved result for API call {call_id}")
-                return result
-
-            # Check if there was an error
-            if call_id in self.errors:
-                error = self.errors.pop(call_id)
-                logger.error(f"API call {call_id} failed: {error}")
-                raise error
-
-            # Check timeout
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed >= timeout:
-                logger.error(f"Timeout waiting for API call {call_id} result")
-                raise TimeoutError(f"API call {call_id} timed out after {timeout}s")
-
-            # Wait a bit before checking again
-            await asyncio.sleep(0.1)
+        timeout = timeout or self.default_timeout
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            if future.done():
+                raise
+            logger.error(f"Timeout waiting for API call {call_id} result")
+            raise TimeoutError(f"API call {call_id} timed out after {timeout}s") from None
+        finally:
+            if future.done():
+                self.results.pop(call_id, None)
+
+    def _put(self, api_call: APICall) -> None:
+        # Negative priority: PriorityQueue pops the smallest; the sequence keeps FIFO order
+        self.queue.put_nowait((-api_call.priority, next(self._sequence), api_call))
+
+    def _evict_unclaimed(self) -> None:
+        """Drop the oldest finished, never collected results so results stays bounded."""
+        excess = len(self.results) - self.max_queue_size + 1
+        if excess <= 0:
+            return
+        for call_id in [cid for cid, future in self.results.items() if future.done()][:excess]:
+            future = self.results.pop(call_id)
+            if not future.cancelled():
+                future.exception()  # Mark retrieved so asyncio does not warn
+            logger.debug(f"Dropped uncollected result of API call {call_id}")
 
     async def _worker(self) -> None:
-        """Worker that processes API calls sequentially"""
-        logger.info("🔄 API call queue worker started")
-
-        while self.is_running:
+        """Dispatcher handing queued calls to execution within the lane's limits"""
+        while True:
+            item = await self.queue.get()
+            api_call = item[2]
+            if api_call.future.cancelled():
+                # Abandoned by the caller before it ran: spend no capacity on it
+                self._pending -= 1
+                self._release_ordering_key(api_call.ordering_key)
+                continue
             try:
-                # Wait for next API call or shutdown signal
+                await self._slots.acquire()
                 try:
-                    _, api_call = await asyncio.wait_for(self.queue.get(), timeout=1.0)
-                except asyncio.TimeoutError:
-                    # Check for shutdown signal
-                    if self._shutdown_event.is_set():
-                        break
-                    continue
-
-                # Process the API call
-                await self._process_api_call(api_call)
-
-                # Mark task as done
-                self.queue.task_done()
-
-            except Exception as e:
-                logger.error(f"Error in API call queue worker: {e}")
-                await asyncio.sleep(1.0)  # Brief pause before continuing
-
-        logger.info("🔄 API call queue worker stopped")
+                    if self.rate_limiter is not None:
+                        self.metrics.throttled_seconds += await self.rate_limiter.acquire()
+                except asyncio.CancelledError:
+                    self._slots.release()
+                    raise
+            except asyncio.CancelledError:
+                # Stopped while waiting for capacity: keep the call for the next start
+                self.queue.put_nowait(item)
+                raise
+
+            task = asyncio.create_task(self._process_api_call(api_call))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
 
     async def _process_api_call(self, api_call: APICall) -> None:
-        """Process a single API call"""
-        logger.debug(f"Processing API call {api_call.call_id}")
+        """Run one call and resolve its future"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        self._pending -= 1
+        self.metrics.queue_wait.append(started - api_call.enqueued_at)
+        future = api_call.future
+        logger.debug(f"Processing API call {api_call.call_id} on '{self.name}'")
 
         try:
-            # Execute the API call with timeout
             result = await asyncio.wait_for(
                 api_call.func(*api_call.args, **api_call.kwargs), timeout=api_call.timeout
             )
-
-            # Store the result
-            self.results[api_call.call_id] = result
+            self.metrics.completed += 1
+            if not future.done():
+                future.set_result(result)
             logger.debug(f"✅ API call {api_call.call_id} completed successfully")
 
         except asyncio.TimeoutError:
-            error = TimeoutError(f"API call {api_call.call_id} timed out after {api_call.timeout}s")
-            self.errors[api_call.call_id] = error
-            logger.error(f"⏰ API call {api_call.call_id} timed out")
+            self.metrics.timed_out += 1
+            if not future.done():
+                future.set_exception(
+                    TimeoutError(f"API call {api_call.call_id} timed out after {api_call.timeout}s")
+                )
+            logger.error(f"⏰ API call {api_call.call_id} on '{self.name}' timed out")
+
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
 
         except Exception as e:
-            self.errors[api_call.call_id] = e
-            logger.error(f"❌ API call {api_call.call_id} failed: {e}")
+            self.metrics.failed += 1
+            if not future.done():
+                future.set_exception(e)
+            logger.error(f"❌ API call {api_call.call_id} on '{self.name}' failed: {e}")
+
+        finally:
+            self.metrics.latency.append(loop.time() - started)
+            self._slots.release()
+            self._release_ordering_key(api_call.ordering_key)
+
+    def _release_ordering_key(self, ordering_key: Optional[str]) -> None:
+        """Queue the next call waiting on the key, or free the key."""
+        if ordering_key is None:
+            return
+        held = self._ordering[ordering_key]
+        if held:
+            self._put(held.popleft())
+        else:
+            del self._ordering[ordering_key]
 
     def get_queue_status(self) -> Dict[str, Any]:
-        """Get current queue status"""
+        """Get current lane status and metrics"""
         return {
+            "name": self.name,
             "is_running": self.is_running,
-            "queue_size": self.queue.qsize(),
+            "queue_size": self._pending,
+            "max_queue_size": self.max_queue_size,
+            "in_flight": len(self._in_flight),
             "pending_results": len(self.results),
-            "pending_errors": len(self.errors),
+            "ordering_keys": len(self._ordering),
             "worker_running": self.worker_task is not None and not self.worker_task.done(),
+            "limits": {
+                "requests_per_second": self.requests_per_second,
+                "burst": self.burst,
+                "max_concurrency": self.max_concurrency,
+            },
+            "metrics": self.metrics.snapshot(),
         }
 
 
 class APICallManager:
     """
-    Manager for API call queues across different services.
+    Manager for the per-service API call lanes.
 
-    Provides a centralized way to manage API calls for different services
-    while maintaining sequential processing per service.
+    Lanes are created on first use with the limits of the venue of the same name
+    (configs/venues/<service>.yaml rate_limit); services without one get a serial lane.
     """
 
-    def __init__(self):
+    def __init__(self, rate_limits: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Args:
+            rate_limits: Lane limits (requests_per_second, burst, max_concurrency) by
+                service name; services not listed read their venue config
+        """
         self.queues: Dict[str, APICallQueue] = {}
         self.default_queue = APICallQueue()
+        self.rate_limits: Dict[str, Dict[str, Any]] = dict(rate_limits or {})
         self.is_running = False
 
     async def start(self) -> None:
-        """Start all API call queues"""
+        """Start all API call lanes"""
         if self.is_running:
             return
 
         self.is_running = True
 
-        # Start default queue
         await self.default_queue.start()
-
-        # Start service-specific queues
-        for service_name, queue in self.queues.items():
+        for queue in self.queues.values():
             await queue.start()
 
         logger.info("✅ API call manager started")
 
     async def stop(self) -> None:
-        """Stop all API call queues"""
+        """Stop all API call lanes"""
         if not self.is_running:
             return
 
         self.is_running = False
 
-        # Stop default queue
         await self.default_queue.stop()
-
-        # Stop service-specific queues
-        for service_name, queue in self.queues.items():
+        for queue in self.queues.values():
             await queue.stop()
 
         logger.info("✅ API call manager stopped")
 
     def get_queue(self, service_name: Optional[str] = None) -> APICallQueue:
-        """Get API call queue for a specific service"""
+        """Get the API call lane for a specific service"""
         if service_name is None:
             return self.default_queue
 
         if service_name not in self.queues:
-            self.queues[service_name] = APICallQueue()
-            logger.info(f"Created new API call queue for service: {service_name}")
+            limits = self._lane_limits(service_name)
+            self.queues[service_name] = APICallQueue(name=service_name, **limits)
+            logger.info(f"Created API call lane for service {service_name}: {limits or 'serial'}")
 
         return self.queues[service_name]
 
+    def _lane_limits(self, service_name: str) -> Dict[str, Any]:
+        if service_name not in self.rate_limits:
+            rate_limit = None
+            try:
+                from ..config.config_manager import get_config_manager
+
+                rate_limit = get_config_manager().get_venue_config(service_name).get("rate_limit")
+            except KeyError:
+                pass
+            except Exception as e:
+                logger.warning(f"No rate limit config for API lane {service_name}: {e}")
+            self.rate_limits[service_name] = rate_limit or {}
+        return dict(self.rate_limits[service_name])
+
+    async def _running_queue(self, service_name: Optional[str]) -> APICallQueue:
+        queue = self.get_queue(service_name)
+        if self.is_running and not queue.is_running:
+            await queue.start()
+        return queue
+
+    async def submit(
+        self,
+        func: Callable,
+        *args,
+        service_name: Optional[str] = None,
+        timeout: Optional[float] = None,
+        priority: int = 0,
+        ordering_key: Optional[str] = None,
+        **kwargs,
+    ) -> asyncio.Future:
+        """Queue an API call on a service's lane and return its result future"""
+        queue = await self._running_queue(service_name)
+        return queue.submit(
+            func, *args, timeout=timeout, priority=priority, ordering_key=ordering_key, **kwargs
+        )
+
     async def enqueue_call(
         self,
         func: Callable,
@@ -284,11 +544,14 @@ class APICallManager:
         service_name: Optional[str] = None,
         timeout: Optional[float] = None,
         priority: int = 0,
+        ordering_key: Optional[str] = None,
         **kwargs,
     ) -> str:
         """Enqueue an API call for a specific service"""
-        queue = self.get_queue(service_name)
-        return await queue.enqueue_call(func, *args, timeout=timeout, priority=priority, **kwargs)
+        queue = await self._running_queue(service_name)
+        return await queue.enqueue_call(
+            func, *args, timeout=timeout, priority=priority, ordering_key=ordering_key, **kwargs
+        )
 
     async def get_result(
         self, call_id: str, service_name: Optional[str] = None, timeout: Optional[float] = None
@@ -298,7 +561,7 @@ class APICallManager:
         return await queue.get_result(call_id, timeout=timeout)
 
     def get_status(self) -> Dict[str, Any]:
-        """Get status of all API call queues"""
+        """Get status and metrics of all API call lanes"""
         status = {
             "is_running": self.is_running,
             "default_queue": self.default_queue.get_queue_status(),
@@ -315,21 +578,51 @@ class APICallManager:
 api_call_manager = APICallManager()
 
 
-async def enqueue_api_call(
+async def submit_api_call(
     func: Callable,
     *args,
     service_name: Optional[str] = None,
     timeout: Optional[float] = None,
     priority: int = 0,
+    ordering_key: Optional[str] = None,
     **kwargs,
-) -> str:
+) -> asyncio.Future:
     """
-    Convenience function to enqueue an API call.
+    Convenience function to queue an API call and get its result future.
 
     This is the recommended way to make API calls to ensure proper queueing.
     """
+    return await api_call_manager.submit(
+        func,
+        *args,
+        service_name=service_name,
+        timeout=timeout,
+        priority=priority,
+        ordering_key=ordering_key,
+        **kwargs,
+    )
+
+
+async def enqueue_api_call(
+    func: Callable,
+    *args,
+    service_name: Optional[str] = None,
+    timeout: Optional[float] = None,
+    priority: int = 0,
+    ordering_key: Optional[str] = None,
+    **kwargs,
+) -> str:
+    """
+    Convenience function to enqueue an API call and collect it later by call_id.
+    """
     return await api_call_manager.enqueue_call(
-        func, *args, service_name=service_name, timeout=timeout, priority=priority, **kwargs
+        func,
+        *args,
+        service_name=service_name,
+        timeout=timeout,
+        priority=priority,
+        ordering_key=ordering_key,
+        **kwargs,
     )
 
 
@@ -344,21 +637,23 @@ async def get_api_result(
 
 # Example usage:
 """
-# Enqueue an API call
-call_id = await enqueue_api_call(
+# Queue an API call on the binance lane and await its result
+future = await submit_api_call(
     fetch_price_data,
     symbol="ETHUSDT",
     service_name="binance",
     timeout=10.0,
     priority=1
 )
-
-# Get the result
 try:
-    result = await get_api_result(call_id, service_name="binance", timeout=15.0)
+    result = await future
     logger.info(f"Price data: {result}")
 except TimeoutError:
     logger.warning("API call timed out")
 except Exception as e:
     logger.error(f"API call failed: {e}")
+
+# Keep an order's placement and cancel in order
+await submit_api_call(place_order, order, service_name="okx", ordering_key=order.operation_id)
+await submit_api_call(cancel_order, order, service_name="okx", ordering_key=order.operation_id)
 """
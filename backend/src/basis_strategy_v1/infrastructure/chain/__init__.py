@@ -0,0 +1,9 @@
+"""
+Infrastructure chain package.
+
+This package contains batched on-chain read infrastructure.
+"""
+
+from .chain_reader import ChainRead, ChainReader, ChainReadResult, get_chain_reader
+
+__all__ = ["ChainRead", "ChainReader", "ChainReadResult", "get_chain_reader"]
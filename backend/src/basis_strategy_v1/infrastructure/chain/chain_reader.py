@@ -0,0 +1,360 @@
+"""
+Chain Reader
+
+Batched, block-pinned contract reads for live on-chain position refreshes.
+
+Key Principles:
+- One refresh = one block: the block number is read once and every call in the refresh
+  is made at that block, so balances, debt and oracle prices are mutually consistent
+- All reads of a refresh go out as Multicall3 aggregate3 calls (allowFailure per read,
+  chunked at max_calls_per_multicall); a read that reverts fails alone
+- Graceful fallback: without Multicall3 at multicall_address (local dev chains) or when
+  the aggregate call fails, the reads go out as one JSON-RPC batch of eth_calls at the
+  same block (concurrent single requests when the transport cannot batch)
+- Results are cached per block number (last cache_blocks blocks): repeated reads at an
+  unchanged block cost only the block number request
+- Transport is a send(method, params) callable (sync or async) returning the JSON-RPC
+  result; from_rpc_url builds one on web3's HTTPProvider
+
+Reader instances are shared per RPC URL (get_chain_reader) so position and execution
+interfaces hit the same block cache.
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from eth_abi import decode, encode
+from eth_utils import keccak
+
+logger = logging.getLogger(__name__)
+
+# Multicall3 is deployed at the same address on every major EVM chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+AGGREGATE3 = "aggregate3((address,bool,bytes)[])"
+GET_ETH_BALANCE = "getEthBalance(address)"
+
+DEFAULT_MAX_CALLS_PER_MULTICALL = 200
+DEFAULT_CACHE_BLOCKS = 8
+
+
+class ChainRPCError(Exception):
+    """JSON-RPC error response."""
+
+
+@lru_cache(maxsize=None)
+def _selector(signature: str) -> bytes:
+    return keccak(text=signature)[:4]
+
+
+@lru_cache(maxsize=None)
+def _arg_types(signature: str) -> Tuple[str, ...]:
+    inner = signature[signature.index("(") + 1 : signature.rindex(")")]
+    return tuple(inner.split(",")) if inner else ()
+
+
+@dataclass(frozen=True)
+class ChainRead:
+    """
+    One contract view call: target.signature(*args) decoded as `returns`.
+
+    target None reads the native balance of args[0].
+    """
+
+    key: str
+    target: Optional[str]
+    signature: Optional[str] = None
+    args: Tuple[Any, ...] = ()
+    returns: str = "uint256"
+
+    @classmethod
+    def erc20_balance(cls, key: str, token: str, owner: str) -> "ChainRead":
+        """Raw balanceOf(owner); aTokens and debtTokens report underlying incl. interest."""
+        return cls(key, token, "balanceOf(address)", (owner,))
+
+    @classmethod
+    def erc20_decimals(cls, key: str, token: str) -> "ChainRead":
+        return cls(key, token, "decimals()", (), "uint8")
+
+    @classmethod
+    def native_balance(cls, key: str, owner: str) -> "ChainRead":
+        return cls(key, None, None, (owner,))
+
+    @classmethod
+    def oracle_price(cls, key: str, oracle: str, asset: str) -> "ChainRead":
+        """AAVE oracle getAssetPrice(asset): USD price with 8 decimals."""
+        return cls(key, oracle, "getAssetPrice(address)", (asset,))
+
+    @property
+    def call_id(self) -> Tuple[Any, ...]:
+        """Identity of the call regardless of key, for the block cache."""
+        target = self.target.lower() if self.target else None
+        return (target, self.signature, self.args)
+
+    def call_data(self) -> bytes:
+        signature = self.signature or GET_ETH_BALANCE
+        return _selector(signature) + encode(list(_arg_types(signature)), list(self.args))
+
+
+@dataclass
+class ChainReadResult:
+    """Values (or per-read errors) of one refresh, all at block_number."""
+
+    block_number: int
+    values: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    source: str = "cache"  # 'multicall', 'eth_call' or 'cache'
+    rpc_requests: int = 0
+    cached: int = 0
+
+
+class ChainReader:
+    """Aggregates contract reads into block-pinned Multicall3 calls with a per-block cache."""
+
+    def __init__(
+        self,
+        send: Callable[[str, List[Any]], Any],
+        send_batch: Optional[Callable[[List[Tuple[str, List[Any]]]], List[Any]]] = None,
+        multicall_address: Optional[str] = MULTICALL3_ADDRESS,
+        max_calls_per_multicall: int = DEFAULT_MAX_CALLS_PER_MULTICALL,
+        cache_blocks: int = DEFAULT_CACHE_BLOCKS,
+    ):
+        """
+        Initialize chain reader.
+
+        Args:
+            send: send(method, params) -> JSON-RPC result; raises on error responses
+            send_batch: send_batch([(method, params), ...]) -> results in order, an
+                Exception instance for each failed request (optional)
+            multicall_address: Multicall3 address, None to always use plain eth_calls
+            max_calls_per_multicall: Reads per aggregate3 call
+            cache_blocks: Number of recent blocks whose results are kept
+        """
+        if max_calls_per_multicall < 1:
+            raise ValueError(
+                f"max_calls_per_multicall must be at least 1, got {max_calls_per_multicall}"
+            )
+        self.send = send
+        self.send_batch = send_batch
+        self.multicall_address = multicall_address
+        self.max_calls_per_multicall = max_calls_per_multicall
+        self.cache_blocks = cache_blocks
+
+        self._cache: "OrderedDict[int, Dict[Tuple[Any, ...], Any]]" = OrderedDict()
+
+        self.refreshes = 0
+        self.rpc_requests = 0
+        self.cache_hits = 0
+        self.multicall_batches = 0
+        self.fallback_refreshes = 0
+
+    @classmethod
+    def from_rpc_url(cls, rpc_url: str, **kwargs) -> "ChainReader":
+        """
+        Reader on a web3 HTTPProvider.
+
+        Raises:
+            ImportError: If web3 is not installed
+        """
+        from web3 import Web3
+
+        provider = Web3.HTTPProvider(rpc_url)
+
+        def send(method: str, params: List[Any]) -> Any:
+            return _rpc_result(provider.make_request(method, params))
+
+        def send_batch(requests: List[Tuple[str, List[Any]]]) -> List[Any]:
+            responses = provider.make_batch_request(requests)
+            if isinstance(responses, dict):  # Whole batch rejected
+                raise ChainRPCError(responses.get("error"))
+            results = []
+            for response in sorted(responses, key=lambda r: r.get("id", 0)):
+                try:
+                    results.append(_rpc_result(response))
+                except ChainRPCError as e:
+                    results.append(e)
+            return results
+
+        return cls(send, send_batch, **kwargs)
+
+    async def block_number(self) -> int:
+        self.rpc_requests += 1
+        return int(await self._send("eth_blockNumber", []), 16)
+
+    async def read(
+        self, reads: Sequence[ChainRead], block_number: Optional[int] = None
+    ) -> ChainReadResult:
+        """
+        Values of all reads at one block (default: the latest).
+
+        A failed read is reported in errors and never cached; a transport failure of
+        both the multicall and the fallback path raises.
+        """
+        requests_before = self.rpc_requests
+        if block_number is None:
+            block_number = await self.block_number()
+        self.refreshes += 1
+
+        result = ChainReadResult(block_number)
+        cached = self._cache.get(block_number, {})
+        pending = []
+        for read in reads:
+            if read.call_id in cached:
+                result.values[read.key] = cached[read.call_id]
+                result.cached += 1
+            else:
+                pending.append(read)
+        self.cache_hits += result.cached
+
+        if pending:
+            outcomes = None
+            if self.multicall_address:
+                try:
+                    outcomes = await self._read_multicall(pending, block_number)
+                    result.source = "multicall"
+                except Exception as e:
+                    logger.warning(f"Multicall read failed at block {block_number}: {e}")
+            if outcomes is None:
+                self.fallback_refreshes += 1
+                outcomes = await self._read_eth_calls(pending, block_number)
+                result.source = "eth_call"
+
+            values = self._cache_for(block_number)
+            for read, (value, error) in zip(pending, outcomes):
+                if error is None:
+                    result.values[read.key] = values[read.call_id] = value
+                else:
+                    result.errors[read.key] = error
+
+        result.rpc_requests = self.rpc_requests - requests_before
+        return result
+
+    async def _read_multicall(
+        self, reads: List[ChainRead], block_number: int
+    ) -> List[Tuple[Any, Optional[str]]]:
+        outcomes = []
+        for start in range(0, len(reads), self.max_calls_per_multicall):
+            chunk = reads[start : start + self.max_calls_per_multicall]
+            calls = [
+                (read.target or self.multicall_address, True, read.call_data()) for read in chunk
+            ]
+            data = _selector(AGGREGATE3) + encode(["(address,bool,bytes)[]"], [calls])
+            self.rpc_requests += 1
+            self.multicall_batches += 1
+            raw = await self._send(
+                "eth_call",
+                [{"to": self.multicall_address, "data": "0x" + data.hex()}, hex(block_number)],
+            )
+            if raw in (None, "0x", ""):
+                # No Multicall3 on this chain: stop trying
+                self.multicall_address = None
+                raise ChainRPCError("no Multicall3 contract at multicall_address")
+            (returned,) = decode(["(bool,bytes)[]"], _from_hex(raw))
+            for read, (success, return_data) in zip(chunk, returned):
+                if not success:
+                    outcomes.append((None, "call reverted"))
+                else:
+                    outcomes.append(_decode_return(read, return_data))
+        return outcomes
+
+    async def _read_eth_calls(
+        self, reads: List[ChainRead], block_number: int
+    ) -> List[Tuple[Any, Optional[str]]]:
+        block = hex(block_number)
+        requests = [
+            ("eth_getBalance", [read.args[0], block])
+            if read.target is None
+            else ("eth_call", [{"to": read.target, "data": "0x" + read.call_data().hex()}, block])
+            for read in reads
+        ]
+        if self.send_batch is not None:
+            self.rpc_requests += 1
+            raws = await self._call(self.send_batch, requests)
+        else:
+            self.rpc_requests += len(requests)
+            raws = await asyncio.gather(
+                *(self._send(method, params) for method, params in requests),
+                return_exceptions=True,
+            )
+
+        outcomes = []
+        for read, raw in zip(reads, raws):
+            if isinstance(raw, Exception):
+                outcomes.append((None, str(raw) or type(raw).__name__))
+            elif read.target is None:
+                outcomes.append((int(raw, 16), None))
+            else:
+                outcomes.append(_decode_return(read, _from_hex(raw)))
+        return outcomes
+
+    def _cache_for(self, block_number: int) -> Dict[Tuple[Any, ...], Any]:
+        values = self._cache.get(block_number)
+        if values is None:
+            values = self._cache[block_number] = {}
+            while len(self._cache) > self.cache_blocks:
+                self._cache.popitem(last=False)
+        return values
+
+    async def _send(self, method: str, params: List[Any]) -> Any:
+        return await self._call(self.send, method, params)
+
+    @staticmethod
+    async def _call(fn: Callable, *args) -> Any:
+        if inspect.iscoroutinefunction(fn):
+            return await fn(*args)
+        return await asyncio.to_thread(fn, *args)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "refreshes": self.refreshes,
+            "rpc_requests": self.rpc_requests,
+            "cache_hits": self.cache_hits,
+            "multicall_batches": self.multicall_batches,
+            "fallback_refreshes": self.fallback_refreshes,
+            "multicall_enabled": self.multicall_address is not None,
+            "cached_blocks": list(self._cache),
+        }
+
+
+def _rpc_result(response: Dict[str, Any]) -> Any:
+    if response.get("error"):
+        raise ChainRPCError(response["error"])
+    return response.get("result")
+
+
+def _from_hex(raw: Any) -> bytes:
+    if isinstance(raw, (bytes, bytearray)):
+        return bytes(raw)
+    return bytes.fromhex(raw[2:] if raw.startswith("0x") else raw)
+
+
+def _decode_return(read: ChainRead, return_data: bytes) -> Tuple[Any, Optional[str]]:
+    if not return_data:
+        return None, "empty return data"
+    try:
+        return decode([read.returns], return_data)[0], None
+    except Exception as e:
+        return None, f"undecodable return data: {e}"
+
+
+_readers: Dict[str, ChainReader] = {}
+_readers_lock = threading.Lock()
+
+
+def get_chain_reader(rpc_url: str) -> ChainReader:
+    """
+    Process-wide reader for an RPC URL.
+
+    Raises:
+        ImportError: If web3 is not installed
+    """
+    with _readers_lock:
+        reader = _readers.get(rpc_url)
+        if reader is None:
+            reader = _readers[rpc_url] = ChainReader.from_rpc_url(rpc_url)
+        return reader
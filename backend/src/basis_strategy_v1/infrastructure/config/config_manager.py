@@ -9,7 +9,7 @@ Single source of truth for all configuration operations:
 """
 
 import os
-import yaml
+import time
 import json
 import uuid
 from pathlib import Path
@@ -20,13 +20,9 @@ import pandas as pd
 from datetime import datetime
 
 from .models import (
-    validate_mode_config,
-    validate_venue_config,
-    validate_share_class_config,
-    validate_complete_configuration,
     ConfigurationSet,
-    ConfigurationValidationError,
 )
+from .config_registry import get_config_registry
 from .config_validator import ValidationResult
 from .constants import _BASE_DIR, get_environment
 from ...core.errors.component_error import ComponentError
@@ -49,6 +45,9 @@ ERROR_CODES = {
     "CONFIG-MGR-008": "Configuration health check failed",
 }
 
+# Minimum seconds between hot-reload checks of the config files (BASIS_HOT_RELOAD=true)
+HOT_RELOAD_CHECK_INTERVAL = 1.0
+
 
 class ConfigManager:
     """Unified configuration manager with fail-fast policy.
@@ -71,6 +70,12 @@ class ConfigManager:
         self.config_cache: Dict[str, Any] = {}
         self._validation_result: Optional[ValidationResult] = None
 
+        # Hash-keyed compiled configs shared by every reader of this configs directory
+        self.config_registry = get_config_registry(self.base_dir / "configs")
+        self.config_fingerprint: Optional[str] = None
+        self.hot_reload = False
+        self._last_reload_check = 0.0
+
         # Initialize structured logger
         self.structured_logger = structlog.get_logger()
 
@@ -90,7 +95,7 @@ class ConfigManager:
             "ConfigManager initialized",
             event_type="component_initialization",
             execution_mode=os.getenv("BASIS_EXECUTION_MODE", "backtest"),
-            config_hash=hash(str(self.config_cache)),
+            config_hash=self.config_fingerprint,
             config_cache_size=len(self.config_cache),
             component_type="ConfigManager",
         )
@@ -222,17 +227,17 @@ class ConfigManager:
         # Load base configuration
         self.config_cache["base"] = self._load_base_config()
 
-        # Load mode configurations
-        self.config_cache["modes"] = self._load_all_mode_configs()
-
-        # Load venue configurations
-        self.config_cache["venues"] = self._load_all_venue_configs()
-
-        # Load share class configurations
-        self.config_cache["share_classes"] = self._load_all_share_class_configs()
+        # Load mode, venue and share class configurations (validated, compiled once per
+        # file content hash)
+        snapshot = self.config_registry.load()
+        self.config_cache["modes"] = snapshot.configs("modes")
+        self.config_cache["venues"] = snapshot.configs("venues")
+        self.config_cache["share_classes"] = snapshot.configs("share_classes")
+        self.config_fingerprint = snapshot.fingerprint
 
         # Load environment variables (FAIL FAST)
         self.config_cache["env"] = self._load_environment_variables()
+        self.hot_reload = self.config_cache["env"].get("BASIS_HOT_RELOAD", "false") == "true"
 
         logger.info("✅ Configuration loaded successfully")
 
@@ -490,8 +495,51 @@ class ConfigManager:
         """Get complete settings (alias for get_complete_config)."""
         return self.get_complete_config()
 
+    def reload_changed_configs(self) -> List[str]:
+        """
+        Hot-reload the config files whose content changed on disk.
+
+        Only changed files are re-parsed and re-validated; if any fails, the
+        current configuration stays in place.
+
+        Returns:
+            Relative paths of the reloaded (or removed) files
+
+        Raises:
+            ValueError: If a changed file fails validation
+        """
+        changed = self.config_registry.refresh()
+        if changed:
+            snapshot = self.config_registry.snapshot
+            for relative_path in changed:
+                kind, file_name = relative_path.split("/", 1)
+                name = file_name[: -len(".yaml")]
+                if relative_path in snapshot.entries:
+                    self.config_cache[kind][name] = snapshot.config(kind, name)
+                else:
+                    self.config_cache[kind].pop(name, None)
+            self.config_fingerprint = snapshot.fingerprint
+            self._log_success("configs_reloaded", {"files": changed})
+        return changed
+
+    def _check_hot_reload(self) -> None:
+        """Reload changed config files, at most once per HOT_RELOAD_CHECK_INTERVAL."""
+        if not self.hot_reload:
+            return
+        now = time.monotonic()
+        if now - self._last_reload_check < HOT_RELOAD_CHECK_INTERVAL:
+            return
+        self._last_reload_check = now
+        try:
+            self.reload_changed_configs()
+        except (OSError, ValueError) as e:
+            self._handle_error(
+                "CONFIG-MGR-001", f"Config hot reload failed, keeping current configuration: {e}"
+            )
+
     def get_complete_config(self, mode: str = None, venue: str = None) -> Dict[str, Any]:
         """Get complete configuration by merging all relevant configs."""
+        self._check_hot_reload()
         # Config-driven behavior
         config_settings = self.config_cache.get("base", {}).get("config_manager", {})
         enable_caching = config_settings.get("enable_caching", True)
@@ -516,10 +564,12 @@ class ConfigManager:
 
     def get_available_strategies(self) -> List[str]:
         """Get list of all available strategy names."""
+        self._check_hot_reload()
         return list(self.config_cache["modes"].keys())
 
     def get_mode_config(self, mode_name: str) -> Dict[str, Any]:
         """Get mode configuration with fail-fast access."""
+        self._check_hot_reload()
         if mode_name not in self.config_cache["modes"]:
             raise KeyError(
                 f"Mode '{mode_name}' not found. Available modes: {list(self.config_cache['modes'].keys())}"
@@ -528,6 +578,7 @@ class ConfigManager:
 
     def get_venue_config(self, venue_name: str) -> Dict[str, Any]:
         """Get venue configuration with fail-fast access."""
+        self._check_hot_reload()
         if venue_name not in self.config_cache["venues"]:
             raise KeyError(
                 f"Venue '{venue_name}' not found. Available venues: {list(self.config_cache['venues'].keys())}"
@@ -536,6 +587,7 @@ class ConfigManager:
 
     def get_share_class_config(self, share_class_name: str) -> Dict[str, Any]:
         """Get share class configuration with fail-fast access."""
+        self._check_hot_reload()
         if share_class_name not in self.config_cache["share_classes"]:
             raise KeyError(
                 f"Share class '{share_class_name}' not found. Available share classes: {list(self.config_cache['share_classes'].keys())}"
@@ -544,6 +596,7 @@ class ConfigManager:
 
     def strategy_exists(self, strategy_name: str) -> bool:
         """Check if a strategy exists."""
+        self._check_hot_reload()
         return strategy_name in self.config_cache["modes"]
 
     def validate_strategy_name(self, strategy_name: str) -> None:
@@ -565,17 +618,8 @@ class ConfigManager:
         if not self.config_cache.get("env"):
             raise ValueError("Environment variables not loaded")
 
-        # Validate cross-references between configurations
-        try:
-            validated_config = validate_complete_configuration(
-                modes=self.config_cache["modes"],
-                venues=self.config_cache["venues"],
-                share_classes=self.config_cache["share_classes"],
-            )
-            logger.info("✅ Cross-reference validation passed")
-        except ConfigurationValidationError as e:
-            logger.error(f"CONFIG-MGR-005: Cross-reference validation failed: {str(e)}")
-            raise ValueError(f"Cross-reference validation failed: {e}")
+        # Cross-references are validated by the registry whenever a config file changes
+        logger.info(f"✅ Cross-reference validation passed (snapshot {self.config_fingerprint})")
 
         logger.info("✅ Configuration validation passed")
 
@@ -681,94 +725,6 @@ class ConfigManager:
 
         return {}  # Empty base config since everything is in environment variables or hardcoded
 
-    def _load_all_mode_configs(self) -> Dict[str, Any]:
-        """Load all mode configurations from configs/modes/ with Pydantic validation."""
-        modes_dir = self.base_dir / "configs" / "modes"
-        modes = {}
-
-        if not modes_dir.exists():
-            logger.error(f"CONFIG-MGR-003: Modes directory not found: {modes_dir}")
-            raise FileNotFoundError(f"Modes directory not found: {modes_dir}")
-
-        for yaml_file in modes_dir.glob("*.yaml"):
-            try:
-                with open(yaml_file, "r") as f:
-                    mode_name = yaml_file.stem
-                    config_dict = yaml.safe_load(f) or {}
-
-                    # Validate with Pydantic model
-                    validated_config = validate_mode_config(config_dict, mode_name)
-                    modes[mode_name] = validated_config.model_dump()
-
-            except (yaml.YAMLError, IOError) as e:
-                logger.error(f"CONFIG-MGR-004: Failed to parse mode configuration: {str(e)}")
-                raise ValueError(f"Failed to parse mode configuration {yaml_file}: {e}")
-            except ConfigurationValidationError as e:
-                logger.error(f"CONFIG-MGR-005: Mode configuration validation failed: {str(e)}")
-                raise ValueError(f"Mode configuration validation failed for {yaml_file}: {e}")
-
-        return modes
-
-    def _load_all_venue_configs(self) -> Dict[str, Any]:
-        """Load all venue configurations from configs/venues/ with Pydantic validation."""
-        venues_dir = self.base_dir / "configs" / "venues"
-        venues = {}
-
-        if not venues_dir.exists():
-            logger.error(f"CONFIG-MGR-003: Venues directory not found: {venues_dir}")
-            raise FileNotFoundError(f"Venues directory not found: {venues_dir}")
-
-        for yaml_file in venues_dir.glob("*.yaml"):
-            try:
-                with open(yaml_file, "r") as f:
-                    venue_name = yaml_file.stem
-                    config_dict = yaml.safe_load(f) or {}
-
-                    # Validate with Pydantic model
-                    validated_config = validate_venue_config(config_dict, venue_name)
-                    venues[venue_name] = validated_config.model_dump()
-
-            except (yaml.YAMLError, IOError) as e:
-                logger.error(f"CONFIG-MGR-004: Failed to parse venue configuration: {str(e)}")
-                raise ValueError(f"Failed to parse venue configuration {yaml_file}: {e}")
-            except ConfigurationValidationError as e:
-                logger.error(f"CONFIG-MGR-005: Venue configuration validation failed: {str(e)}")
-                raise ValueError(f"Venue configuration validation failed for {yaml_file}: {e}")
-
-        return venues
-
-    def _load_all_share_class_configs(self) -> Dict[str, Any]:
-        """Load all share class configurations from configs/share_classes/ with Pydantic validation."""
-        share_classes_dir = self.base_dir / "configs" / "share_classes"
-        share_classes = {}
-
-        if not share_classes_dir.exists():
-            logger.error(f"CONFIG-MGR-003: Share classes directory not found: {share_classes_dir}")
-            raise FileNotFoundError(f"Share classes directory not found: {share_classes_dir}")
-
-        for yaml_file in share_classes_dir.glob("*.yaml"):
-            try:
-                with open(yaml_file, "r") as f:
-                    share_class_name = yaml_file.stem
-                    config_dict = yaml.safe_load(f) or {}
-
-                    # Validate with Pydantic model
-                    validated_config = validate_share_class_config(config_dict, share_class_name)
-                    share_classes[share_class_name] = validated_config.model_dump()
-
-            except (yaml.YAMLError, IOError) as e:
-                logger.error(f"CONFIG-MGR-004: Failed to parse share class configuration: {str(e)}")
-                raise ValueError(f"Failed to parse share class configuration {yaml_file}: {e}")
-            except ConfigurationValidationError as e:
-                logger.error(
-                    f"CONFIG-MGR-005: Share class configuration validation failed: {str(e)}"
-                )
-                raise ValueError(
-                    f"Share class configuration validation failed for {yaml_file}: {e}"
-                )
-
-        return share_classes
-
     def _deep_merge(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
         """Deep merge two dictionaries."""
         result = base.copy()
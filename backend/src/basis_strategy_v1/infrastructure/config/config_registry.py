@@ -0,0 +1,334 @@
+"""
+Compiled Config Registry
+
+Hash-keyed snapshots of the validated YAML configs under configs/modes,
+configs/venues and configs/share_classes.
+
+Each source file is parsed and validated once per content hash; the compiled
+entries (raw source and validated model_dump, as JSON text) persist on disk so
+later process starts skip YAML parsing, and a refresh recompiles only the files
+whose hash changed.
+
+Key Principles:
+- Keyed by source sha256 and the config schema (models.py) hash; stat checks skip unchanged files
+- Snapshots are immutable: lookups return fresh copies, refresh() swaps in a new snapshot
+- Cross-reference validation runs once per changed snapshot, never per lookup
+- A refresh that fails validation keeps serving the previous snapshot
+- Best effort disk cache (configs/.compiled, env BASIS_CONFIG_CACHE__DIR): any cache
+  failure compiles from source
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import yaml
+
+from . import models
+from .models import (
+    ConfigurationValidationError,
+    validate_complete_configuration,
+    validate_mode_config,
+    validate_share_class_config,
+    validate_venue_config,
+)
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+CACHE_DIR_NAME = ".compiled"
+CACHE_FILE = "registry.json"
+
+# Config directory -> (label used in errors, per-file validator)
+CONFIG_KINDS: Dict[str, Tuple[str, Callable[[Dict[str, Any], str], Any]]] = {
+    "modes": ("mode", validate_mode_config),
+    "venues": ("venue", validate_venue_config),
+    "share_classes": ("share class", validate_share_class_config),
+}
+
+# PyYAML's libyaml loader when available (same results, several times faster)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _schema_hash() -> str:
+    """Hash of the loaded config models, so schema changes invalidate compiled entries."""
+    return _sha256_bytes(Path(models.__file__).read_bytes())
+
+
+@dataclass(frozen=True)
+class CompiledConfig:
+    """One source file compiled: its content hash, stat and JSON-encoded configs."""
+
+    kind: str
+    name: str
+    sha256: str
+    mtime_ns: int
+    size: int
+    source_json: str
+    config_json: str
+
+
+class ConfigSnapshot:
+    """Immutable set of compiled configs; every lookup returns a fresh copy."""
+
+    def __init__(self, entries: Dict[str, CompiledConfig], schema: str):
+        self.entries: Mapping[str, CompiledConfig] = MappingProxyType(dict(sorted(entries.items())))
+        self.schema = schema
+        digest = hashlib.sha256(schema.encode())
+        for relative_path, entry in self.entries.items():
+            digest.update(f"{relative_path}:{entry.sha256}".encode())
+        self.fingerprint = digest.hexdigest()
+
+    def names(self, kind: str) -> List[str]:
+        return [entry.name for entry in self.entries.values() if entry.kind == kind]
+
+    def config(self, kind: str, name: str) -> Dict[str, Any]:
+        """Validated config of one file (KeyError if unknown)."""
+        return json.loads(self.entries[f"{kind}/{name}.yaml"].config_json)
+
+    def configs(self, kind: str) -> Dict[str, Dict[str, Any]]:
+        return {
+            entry.name: json.loads(entry.config_json)
+            for entry in self.entries.values()
+            if entry.kind == kind
+        }
+
+
+class CompiledConfigRegistry:
+    """Compiles the config directories into snapshots and keeps them current."""
+
+    def __init__(
+        self,
+        configs_dir: Path,
+        cache_dir: Optional[str] = None,
+        enabled: Optional[bool] = None,
+    ):
+        """
+        Initialize registry.
+
+        Args:
+            configs_dir: Directory containing modes/, venues/ and share_classes/
+            cache_dir: Directory for the compiled cache (env BASIS_CONFIG_CACHE__DIR);
+                default is configs_dir/.compiled
+            enabled: Set False to never read or write the disk cache
+                (env BASIS_CONFIG_CACHE__ENABLED, default true)
+        """
+        self.configs_dir = Path(configs_dir)
+        root = cache_dir if cache_dir is not None else os.getenv("BASIS_CONFIG_CACHE__DIR")
+        self.cache_dir = Path(root) if root else self.configs_dir / CACHE_DIR_NAME
+        if enabled is None:
+            enabled = os.getenv("BASIS_CONFIG_CACHE__ENABLED", "true").lower() != "false"
+        self.enabled = enabled
+
+        self.snapshot: Optional[ConfigSnapshot] = None
+        self._lock = threading.Lock()
+
+        self.compiled = 0
+        self.cache_hits = 0
+
+    def load(self) -> ConfigSnapshot:
+        """
+        Current snapshot, compiling from source (or the disk cache) on first use.
+
+        Raises:
+            FileNotFoundError: If a config directory is missing
+            ValueError: If a config fails to parse or validate
+        """
+        if self.snapshot is None:
+            self.refresh()
+        return self.snapshot
+
+    def refresh(self) -> List[str]:
+        """
+        Recompile the files whose content changed since the current snapshot.
+
+        Returns:
+            Relative paths ('modes/btc_basis.yaml') added, changed or removed
+
+        Raises:
+            FileNotFoundError: If a config directory is missing
+            ValueError: If a changed config fails to parse or validate (the
+                previous snapshot stays current)
+        """
+        with self._lock:
+            schema = _schema_hash()
+            previous = self.snapshot
+            known: Dict[str, CompiledConfig] = {}
+            if previous is not None and previous.schema == schema:
+                known = dict(previous.entries)
+            cached = None if previous is not None else self._read_disk_cache(schema)
+
+            entries: Dict[str, CompiledConfig] = {}
+            changed: List[str] = []
+            touched = False
+            for kind, path in self._source_files():
+                relative_path = f"{kind}/{path.name}"
+                stat = path.stat()
+                entry = known.get(relative_path)
+                if entry and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+                    entries[relative_path] = entry
+                    continue
+
+                data = path.read_bytes()
+                sha256 = _sha256_bytes(data)
+                stored = cached.get(relative_path) if cached else None
+                if entry is None and stored and stored["sha256"] == sha256:
+                    entry = CompiledConfig(
+                        kind, path.stem, sha256, stat.st_mtime_ns, stat.st_size,
+                        stored["source"], stored["config"],
+                    )
+                    self.cache_hits += 1
+                elif entry is None or entry.sha256 != sha256:
+                    entry = self._compile(kind, path, data, sha256, stat)
+                    changed.append(relative_path)
+                else:
+                    # Touched but unchanged: keep the compiled entry, remember the new stat
+                    touched = True
+                    entry = CompiledConfig(
+                        kind, entry.name, sha256, stat.st_mtime_ns, stat.st_size,
+                        entry.source_json, entry.config_json,
+                    )
+                entries[relative_path] = entry
+
+            removed = [relative_path for relative_path in known if relative_path not in entries]
+            changed.extend(removed)
+            if previous is not None and not changed:
+                if touched:
+                    self.snapshot = ConfigSnapshot(entries, schema)
+                return []
+
+            snapshot = ConfigSnapshot(entries, schema)
+            if changed or cached is None or set(cached) != set(entries):
+                self._validate_cross_references(snapshot)
+                self._write_disk_cache(snapshot)
+
+            self.snapshot = snapshot
+            if previous is not None:
+                logger.info(f"Config registry reloaded {len(changed)} file(s): {changed}")
+            return changed
+
+    def read_source(self, path: Path) -> Any:
+        """
+        Parsed YAML of a config file, from the compiled entry when its content matches.
+
+        Does not compile or validate; files outside the registry are parsed directly.
+        """
+        path = Path(path)
+        data = path.read_bytes()
+        entry = None
+        if path.parent.parent == self.configs_dir and self.snapshot is not None:
+            entry = self.snapshot.entries.get(f"{path.parent.name}/{path.name}")
+        if entry is not None and entry.sha256 == _sha256_bytes(data):
+            return json.loads(entry.source_json)
+        return yaml.load(data, Loader=_YamlLoader)
+
+    def _source_files(self) -> List[Tuple[str, Path]]:
+        files = []
+        for kind in CONFIG_KINDS:
+            kind_dir = self.configs_dir / kind
+            if not kind_dir.exists():
+                title = kind.replace("_", " ").capitalize()
+                logger.error(f"CONFIG-MGR-003: {title} directory not found: {kind_dir}")
+                raise FileNotFoundError(f"{title} directory not found: {kind_dir}")
+            files.extend((kind, path) for path in sorted(kind_dir.glob("*.yaml")))
+        return files
+
+    def _compile(
+        self, kind: str, path: Path, data: bytes, sha256: str, stat: os.stat_result
+    ) -> CompiledConfig:
+        """Parse and validate one source file."""
+        label, validate = CONFIG_KINDS[kind]
+        try:
+            source = yaml.load(data, Loader=_YamlLoader) or {}
+            config = validate(source, path.stem).model_dump()
+        except yaml.YAMLError as e:
+            logger.error(f"CONFIG-MGR-004: Failed to parse {label} configuration: {str(e)}")
+            raise ValueError(f"Failed to parse {label} configuration {path}: {e}")
+        except ConfigurationValidationError as e:
+            title = label.capitalize()
+            logger.error(f"CONFIG-MGR-005: {title} configuration validation failed: {str(e)}")
+            raise ValueError(f"{title} configuration validation failed for {path}: {e}")
+
+        self.compiled += 1
+        return CompiledConfig(
+            kind, path.stem, sha256, stat.st_mtime_ns, stat.st_size,
+            json.dumps(source), json.dumps(config),
+        )
+
+    def _validate_cross_references(self, snapshot: ConfigSnapshot) -> None:
+        try:
+            validate_complete_configuration(
+                modes=snapshot.configs("modes"),
+                venues=snapshot.configs("venues"),
+                share_classes=snapshot.configs("share_classes"),
+            )
+        except ConfigurationValidationError as e:
+            logger.error(f"CONFIG-MGR-005: Cross-reference validation failed: {str(e)}")
+            raise ValueError(f"Cross-reference validation failed: {e}")
+
+    def _read_disk_cache(self, schema: str) -> Optional[Dict[str, Dict[str, str]]]:
+        """Compiled entries from the last process, or None if absent or stale."""
+        if not self.enabled:
+            return None
+        try:
+            with open(self.cache_dir / CACHE_FILE) as f:
+                cache = json.load(f)
+            if cache.get("format_version") != CACHE_FORMAT_VERSION or cache.get("schema") != schema:
+                return None
+            return cache["files"]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable config cache {self.cache_dir}: {e}")
+            return None
+
+    def _write_disk_cache(self, snapshot: ConfigSnapshot) -> None:
+        if not self.enabled:
+            return
+        cache = {
+            "format_version": CACHE_FORMAT_VERSION,
+            "schema": snapshot.schema,
+            "fingerprint": snapshot.fingerprint,
+            "files": {
+                relative_path: {
+                    "sha256": entry.sha256,
+                    "source": entry.source_json,
+                    "config": entry.config_json,
+                }
+                for relative_path, entry in snapshot.entries.items()
+            },
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / f"{CACHE_FILE}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.cache_dir / CACHE_FILE)
+        except OSError as e:
+            logger.debug(f"Config cache not written to {self.cache_dir}: {e}")
+
+
+_registries: Dict[Path, CompiledConfigRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_config_registry(configs_dir: Path) -> CompiledConfigRegistry:
+    """Process-wide registry for a configs directory."""
+    configs_dir = Path(configs_dir)
+    with _registries_lock:
+        registry = _registries.get(configs_dir)
+        if registry is None:
+            registry = _registries[configs_dir] = CompiledConfigRegistry(configs_dir)
+        return registry
@@ -6,13 +6,13 @@ the system is ready to run. Fails fast on bad configuration.
 """
 
 import os
-import yaml
 import json
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 import logging
 
+from .config_registry import get_config_registry
 from .constants import _BASE_DIR, get_environment
 
 logger = logging.getLogger(__name__)
@@ -51,6 +51,12 @@ class ConfigValidator:
         self.environment = get_environment()
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        # Parsed sources are shared with ConfigManager when a file's content is unchanged
+        self.config_registry = get_config_registry(self.base_dir / "configs")
+
+    def _read_yaml(self, path: Path) -> Any:
+        """Parsed YAML of a config file."""
+        return self.config_registry.read_source(path)
 
     def validate_all(self) -> ValidationResult:
         """Validate all configuration files and environment variables."""
@@ -264,8 +270,7 @@ class ConfigValidator:
                 self.errors.append(f"Missing mode config: {mode_file}")
             else:
                 try:
-                    with open(mode_path, "r") as f:
-                        mode_config = yaml.safe_load(f)
+                    mode_config = self._read_yaml(mode_path)
                     self._validate_mode_structure(mode_config, mode_file)
                 except Exception as e:
                     self.errors.append(f"Invalid mode config {mode_file}: {e}")
@@ -296,8 +301,7 @@ class ConfigValidator:
                 self.errors.append(f"Missing venue config: {venue_file}")
             else:
                 try:
-                    with open(venue_path, "r") as f:
-                        venue_config = yaml.safe_load(f)
+                    venue_config = self._read_yaml(venue_path)
                     self._validate_venue_structure(venue_config, venue_file)
                 except Exception as e:
                     self.errors.append(f"Invalid venue config {venue_file}: {e}")
@@ -319,8 +323,7 @@ class ConfigValidator:
                 self.errors.append(f"Missing share class config: {share_class_file}")
             else:
                 try:
-                    with open(share_class_path, "r") as f:
-                        share_class_config = yaml.safe_load(f)
+                    share_class_config = self._read_yaml(share_class_path)
                     self._validate_share_class_structure(share_class_config, share_class_file)
                 except Exception as e:
                     self.errors.append(f"Invalid share class config {share_class_file}: {e}")
@@ -337,9 +340,7 @@ class ConfigValidator:
         mode_configs = {}
         for mode_file in modes_dir.glob("*.yaml"):
             try:
-                with open(mode_file, "r") as f:
-                    mode_config = yaml.safe_load(f)
-                    mode_configs[mode_file.stem] = mode_config
+                mode_configs[mode_file.stem] = self._read_yaml(mode_file)
             except Exception as e:
                 self.errors.append(f"Failed to load mode config {mode_file}: {e}")
 
@@ -349,9 +350,9 @@ class ConfigValidator:
         if share_classes_dir.exists():
             for share_class_file in share_classes_dir.glob("*.yaml"):
                 try:
-                    with open(share_class_file, "r") as f:
-                        share_class_config = yaml.safe_load(f)
-                        share_class_configs[share_class_file.stem] = share_class_config
+                    share_class_configs[share_class_file.stem] = self._read_yaml(
+                        share_class_file
+                    )
                 except Exception as e:
                     self.errors.append(f"Failed to load share class config {share_class_file}: {e}")
 
@@ -493,6 +493,21 @@ class RiskMonitorConfig(BaseModel):
     liquidation_threshold: Optional[float] = Field(
         None, ge=0.0, le=1.0, description="Liquidation threshold"
     )
+    exact_audit: Optional[bool] = Field(
+        None, description="Re-run Decimal risk math when a float result is near a threshold"
+    )
+    exact_audit_epsilon: Optional[float] = Field(
+        None, gt=0.0, description="Distance to a threshold that triggers the exact audit"
+    )
+    stress_grid: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Shock grid (enabled, price_shocks, lst_depegs, funding_shocks) for STRESS",
+    )
+    watchdog: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Live risk watchdog (enabled, interval_seconds, ltv_strategy_band, "
+        "ltv_emergency_band)",
+    )
 
 
 class ExposureMonitorConfig(BaseModel):
@@ -590,6 +605,14 @@ class StrategyFactoryConfig(BaseModel):
     validation_strict: bool = Field(..., description="Whether to use strict validation")
 
 
+class VenueRateLimitConfig(BaseModel):
+    """Client-side API budget for a venue (one APICallQueue lane)."""
+
+    requests_per_second: float = Field(..., gt=0.0, description="Sustained request rate")
+    burst: int = Field(1, ge=1, description="Requests allowed back to back above the rate")
+    max_concurrency: int = Field(1, ge=1, description="Maximum requests in flight at once")
+
+
 class VenueConfig(BaseModel):
     """Venue configuration model."""
 
@@ -638,12 +661,20 @@ class VenueConfig(BaseModel):
     max_deadline_seconds: Optional[int] = Field(
         None, ge=0, description="Maximum deadline in seconds"
     )
+    contracts: Optional[Dict[str, str]] = Field(
+        None,
+        description="On-chain contract addresses: token/aToken/debtToken symbol -> address, "
+        "plus 'oracle' (AAVE price oracle) for live position reads",
+    )
 
     # API configuration
     api_contract: Optional[Dict[str, Any]] = Field(None, description="API contract specification")
     auth: Optional[Dict[str, Any]] = Field(None, description="Authentication configuration")
     endpoints: Optional[Dict[str, Any]] = Field(None, description="API endpoints configuration")
     validation: Optional[Dict[str, Any]] = Field(None, description="Validation configuration")
+    rate_limit: Optional[VenueRateLimitConfig] = Field(
+        None, description="API request budget (requests_per_second, burst, max_concurrency)"
+    )
 
     # Protocol and symbol support
     protocols: Optional[List[str]] = Field(None, description="Supported protocols")
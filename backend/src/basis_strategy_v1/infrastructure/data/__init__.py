@@ -1,12 +1,25 @@
-"""Infrastructure Data Components - 4-Provider System."""
+"""Infrastructure Data Components - 4-Provider System.
+
+Live providers (aiohttp) are imported on first attribute access, so backtests and CLI
+commands that only use historical data do not pay for the HTTP client stack.
+"""
+
+import importlib
 
 from .historical_defi_data_provider import HistoricalDeFiDataProvider
 from .historical_cefi_data_provider import HistoricalCeFiDataProvider
-from .live_defi_data_provider import LiveDeFiDataProvider
-from .live_cefi_data_provider import LiveCeFiDataProvider
 from .ml_service import MLService
 from .data_provider_factory import create_data_provider, get_data_provider_for_mode
+from .data_provider_cache import DataProviderCache, SharedDataProvider, get_data_provider_cache
 from .data_validator import DataValidator
+from .columnar_cache import ColumnarCsvCache, get_columnar_cache, read_csv_columnar
+from .market_tape import (
+    MarketTape,
+    MarketTapeRecorder,
+    RecordingDataProvider,
+    ReplayDataProvider,
+    get_tape_recorder,
+)
 
 __all__ = [
     "HistoricalDeFiDataProvider",
@@ -16,5 +29,27 @@ __all__ = [
     "MLService",
     "create_data_provider",
     "get_data_provider_for_mode",
+    "DataProviderCache",
+    "SharedDataProvider",
+    "get_data_provider_cache",
     "DataValidator",
+    "ColumnarCsvCache",
+    "get_columnar_cache",
+    "read_csv_columnar",
+    "MarketTape",
+    "MarketTapeRecorder",
+    "RecordingDataProvider",
+    "ReplayDataProvider",
+    "get_tape_recorder",
 ]
+
+_LAZY_PROVIDERS = {
+    "LiveDeFiDataProvider": ".live_defi_data_provider",
+    "LiveCeFiDataProvider": ".live_cefi_data_provider",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_PROVIDERS:
+        return getattr(importlib.import_module(_LAZY_PROVIDERS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,401 @@
+"""
+Columnar CSV Cache
+
+Memory-mapped binary cache of the CSV sources under data/.
+
+Each CSV is converted once into typed NumPy .npy columns (datetimes as int64
+epoch values in the parsed unit, numeric values as float64/int64, strings as int32 codes plus a category
+table) and reopened with np.load(mmap_mode=...) afterwards, so repeated
+loads skip pd.read_csv and date parsing entirely and every process (including
+forked backtest workers) shares the same page-cache pages.
+
+Key Principles:
+- Same frame as pd.read_csv for the supported options (index_col, parse_dates, comment)
+- Invalidated by source mtime/size, confirmed by source sha256 before rebuilding
+- Immutable, content-addressed build directories; current.json swapped atomically
+- On-the-fly fallback: a missing or stale cache is rebuilt on first read
+- Best effort: any cache failure falls back to pd.read_csv
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+CACHE_DIR_NAME = ".columnar"
+CURRENT_FILE = "current.json"
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _encode_values(values: Any, name: Any) -> Tuple[Dict[str, Any], np.ndarray]:
+    """
+    Encode one column (or index) into a typed array.
+
+    Returns:
+        (column metadata, array). Raises TypeError for values that cannot
+        be represented (e.g. mixed non-string objects).
+    """
+    dtype = getattr(values, "dtype", None)
+
+    if isinstance(dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_dtype(dtype):
+        series = pd.Series(values)
+        tz = str(series.dt.tz) if series.dt.tz is not None else None
+        unit = series.dt.unit
+        if tz is not None:
+            series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+        epoch = series.to_numpy(dtype=f"datetime64[{unit}]").view("int64")
+        return {"name": name, "kind": "datetime", "unit": unit, "tz": tz}, epoch
+
+    if pd.api.types.is_bool_dtype(dtype):
+        return {"name": name, "kind": "bool"}, np.asarray(values, dtype=bool)
+
+    if pd.api.types.is_integer_dtype(dtype):
+        return {"name": name, "kind": "int"}, np.asarray(values, dtype="int64")
+
+    if pd.api.types.is_float_dtype(dtype):
+        return {"name": name, "kind": "float"}, np.asarray(values, dtype="float64")
+
+    codes, uniques = pd.factorize(pd.Series(values), use_na_sentinel=True)
+    categories = list(uniques)
+    if not all(isinstance(c, str) for c in categories):
+        raise TypeError(f"Column {name!r} has non-string object values")
+    return {"name": name, "kind": "category", "categories": categories}, codes.astype("int32")
+
+
+def _decode_values(meta: Dict[str, Any], data: np.ndarray) -> Any:
+    """Rebuild column values from a mapped array (zero-copy where pandas allows)."""
+    kind = meta["kind"]
+    if kind == "datetime":
+        index = pd.DatetimeIndex(data.view(f"datetime64[{meta['unit']}]"), copy=False)
+        if meta.get("tz"):
+            index = index.tz_localize("UTC").tz_convert(meta["tz"])
+        return index
+    if kind == "category":
+        categories = np.empty(len(meta["categories"]) + 1, dtype=object)
+        categories[:-1] = meta["categories"]
+        categories[-1] = np.nan
+        # code -1 (missing) picks the trailing NaN slot
+        return categories[data]
+    return data
+
+
+class ColumnarCsvCache:
+    """Converts CSV sources into memory-mapped columnar files and reopens them."""
+
+    def __init__(self, cache_root: Optional[str] = None, enabled: Optional[bool] = None):
+        """
+        Initialize cache.
+
+        Args:
+            cache_root: Directory for all cache files (env BASIS_DATA_CACHE__DIR);
+                default is a .columnar directory next to each source file
+            enabled: Set False to always use pd.read_csv
+                (env BASIS_DATA_CACHE__ENABLED, default true)
+        """
+        root = cache_root if cache_root is not None else os.getenv("BASIS_DATA_CACHE__DIR")
+        self.cache_root = Path(root).resolve() if root else None
+        if enabled is None:
+            enabled = os.getenv("BASIS_DATA_CACHE__ENABLED", "true").lower() != "false"
+        self.enabled = enabled
+
+        # (cache_dir, build_id) -> (metadata, {column file: read-only mmap})
+        self._mapped: Dict[Tuple[str, str], Tuple[Dict[str, Any], Dict[str, np.ndarray]]] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.builds = 0
+        self.fallbacks = 0
+
+    def read_csv(
+        self,
+        path: Any,
+        index_col: Optional[int] = 0,
+        parse_dates: Union[bool, List[str]] = True,
+        comment: Optional[str] = None,
+        writable: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Read a CSV through the columnar cache.
+
+        Equivalent to pd.read_csv(path, index_col=index_col,
+        parse_dates=parse_dates, comment=comment).
+
+        Args:
+            parse_dates: As pd.read_csv: True parses the index, a list of
+                column names parses those columns
+            writable: False returns frames over shared read-only mappings
+                (in-place writes raise); True maps copy-on-write so callers
+                may modify the frame without touching the cache
+        """
+        source = Path(path).resolve()
+        read_options = {"index_col": index_col, "parse_dates": parse_dates, "comment": comment}
+        if not self.enabled:
+            return pd.read_csv(source, **read_options)
+
+        try:
+            cache_dir = self._cache_dir(source, read_options)
+            build = self._current_build(source, cache_dir)
+            if build is None:
+                self._build(source, cache_dir, read_options)
+                build = self._current_build(source, cache_dir)
+            else:
+                self.hits += 1
+            if build is not None:
+                return self._load(cache_dir, build, writable)
+        except Exception as e:
+            logger.warning(f"Columnar cache unavailable for {source}, parsing CSV: {e}")
+
+        self.fallbacks += 1
+        return pd.read_csv(source, **read_options)
+
+    def compile(
+        self,
+        path: Any,
+        index_col: Optional[int] = 0,
+        parse_dates: Union[bool, List[str]] = True,
+        comment: Optional[str] = None,
+        force: bool = False,
+    ) -> bool:
+        """Build (or refresh) the cache for one CSV. Returns True if a build was written."""
+        source = Path(path).resolve()
+        read_options = {"index_col": index_col, "parse_dates": parse_dates, "comment": comment}
+        cache_dir = self._cache_dir(source, read_options)
+        if not force and self._current_build(source, cache_dir) is not None:
+            return False
+        return self._build(source, cache_dir, read_options)
+
+    def compile_directory(
+        self, data_dir: Any, force: bool = False, **read_options: Any
+    ) -> Dict[str, int]:
+        """Compile every CSV under data_dir (skipping cache directories)."""
+        stats = {"compiled": 0, "up_to_date": 0, "failed": 0}
+        for source in sorted(Path(data_dir).rglob("*.csv")):
+            if CACHE_DIR_NAME in source.parts:
+                continue
+            try:
+                if self.compile(source, force=force, **read_options):
+                    stats["compiled"] += 1
+                else:
+                    stats["up_to_date"] += 1
+            except Exception as e:
+                stats["failed"] += 1
+                logger.warning(f"Failed to compile columnar cache for {source}: {e}")
+        return stats
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics for monitoring."""
+        return {
+            "enabled": self.enabled,
+            "mapped_builds": len(self._mapped),
+            "hits": self.hits,
+            "builds": self.builds,
+            "fallbacks": self.fallbacks,
+        }
+
+    # Internals ----------------------------------------------------------
+
+    def _cache_dir(self, source: Path, read_options: Dict[str, Any]) -> Path:
+        variant = hashlib.sha256(
+            json.dumps(read_options, sort_keys=True).encode()
+        ).hexdigest()[:12]
+        if self.cache_root is not None:
+            source_id = hashlib.sha256(str(source).encode()).hexdigest()[:16]
+            return self.cache_root / f"{source.stem}-{source_id}" / variant
+        return source.parent / CACHE_DIR_NAME / source.name / variant
+
+    def _current_build(self, source: Path, cache_dir: Path) -> Optional[str]:
+        """Return the valid build id for source, or None if missing or stale."""
+        current_file = cache_dir / CURRENT_FILE
+        if not current_file.exists():
+            return None
+        with open(current_file, "r") as f:
+            current = json.load(f)
+        if current.get("version") != CACHE_FORMAT_VERSION:
+            return None
+
+        stat = source.stat()
+        if current["mtime_ns"] == stat.st_mtime_ns and current["size"] == stat.st_size:
+            return current["build_id"]
+
+        # mtime changed (e.g. fresh checkout): confirm with the content hash
+        if current["size"] == stat.st_size and current["sha256"] == _sha256_file(source):
+            current["mtime_ns"] = stat.st_mtime_ns
+            self._write_json_atomic(current_file, current)
+            return current["build_id"]
+        return None
+
+    def _build(self, source: Path, cache_dir: Path, read_options: Dict[str, Any]) -> bool:
+        """Parse the CSV once and write an immutable build directory."""
+        stat = source.stat()
+        sha256 = _sha256_file(source)
+        df = pd.read_csv(source, **read_options)
+
+        columns_meta: List[Dict[str, Any]] = []
+        files: Dict[str, np.ndarray] = {}
+        index_meta = None
+        if read_options.get("index_col") is not None:
+            index_meta, files["index"] = _encode_values(df.index, df.index.name)
+        for position, column in enumerate(df.columns):
+            meta, files[f"col{position}"] = _encode_values(df[column], column)
+            columns_meta.append(meta)
+
+        build_id = sha256[:16]
+        build_dir = cache_dir / build_id
+        if not build_dir.exists():
+            tmp_dir = cache_dir / f"{build_id}.tmp-{os.getpid()}-{threading.get_ident()}"
+            tmp_dir.mkdir(parents=True, exist_ok=True)
+            for file_name, array in files.items():
+                np.save(tmp_dir / f"{file_name}.npy", np.ascontiguousarray(array))
+            with open(tmp_dir / "meta.json", "w") as f:
+                json.dump(
+                    {
+                        "source": str(source),
+                        "rows": len(df),
+                        "index": index_meta,
+                        "columns": columns_meta,
+                    },
+                    f,
+                )
+            try:
+                tmp_dir.rename(build_dir)
+            except OSError:
+                # Another process published the same build first
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        self._write_json_atomic(
+            cache_dir / CURRENT_FILE,
+            {
+                "version": CACHE_FORMAT_VERSION,
+                "build_id": build_id,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": sha256,
+            },
+        )
+        self._remove_stale_builds(cache_dir, build_id)
+        self.builds += 1
+        logger.info(f"Columnar cache built for {source.name}: {len(df)} rows -> {build_dir}")
+        return True
+
+    def _load(self, cache_dir: Path, build_id: str, writable: bool) -> pd.DataFrame:
+        build_dir = cache_dir / build_id
+        key = (str(cache_dir), build_id)
+
+        if writable:
+            meta, arrays = self._map_build(build_dir, mmap_mode="c")
+        else:
+            with self._lock:
+                mapped = self._mapped.get(key)
+                if mapped is None:
+                    mapped = self._map_build(build_dir, mmap_mode="r")
+                    self._mapped[key] = mapped
+            meta, arrays = mapped
+
+        data = {
+            column_meta["name"]: _decode_values(column_meta, arrays[f"col{position}"])
+            for position, column_meta in enumerate(meta["columns"])
+        }
+
+        index = None
+        if meta["index"] is not None:
+            index = _decode_values(meta["index"], arrays["index"])
+            index = pd.Index(index, name=meta["index"]["name"], copy=False)
+
+        column_names = [c["name"] for c in meta["columns"]]
+        df = pd.DataFrame(data, index=index, columns=column_names, copy=False)
+        if index is None:
+            df.index = pd.RangeIndex(meta["rows"])
+        return df
+
+    @staticmethod
+    def _map_build(build_dir: Path, mmap_mode: str) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        with open(build_dir / "meta.json", "r") as f:
+            meta = json.load(f)
+        arrays = {
+            npy.stem: np.load(npy, mmap_mode=mmap_mode, allow_pickle=False)
+            for npy in build_dir.glob("*.npy")
+        }
+        return meta, arrays
+
+    @staticmethod
+    def _write_json_atomic(path: Path, payload: Dict[str, Any]) -> None:
+        tmp_path = path.with_name(f"{path.name}.tmp-{os.getpid()}-{threading.get_ident()}")
+        with open(tmp_path, "w") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _remove_stale_builds(cache_dir: Path, build_id: str) -> None:
+        # Open mappings of old builds stay valid after unlink on POSIX
+        for entry in cache_dir.iterdir():
+            if entry.is_dir() and entry.name != build_id and ".tmp-" not in entry.name:
+                shutil.rmtree(entry, ignore_errors=True)
+
+
+# Global columnar cache instance
+_columnar_cache: Optional[ColumnarCsvCache] = None
+
+
+def get_columnar_cache() -> ColumnarCsvCache:
+    """Get the global columnar cache instance."""
+    global _columnar_cache
+    if _columnar_cache is None:
+        _columnar_cache = ColumnarCsvCache()
+    return _columnar_cache
+
+
+def read_csv_columnar(
+    path: Any,
+    index_col: Optional[int] = 0,
+    parse_dates: Union[bool, List[str]] = True,
+    comment: Optional[str] = None,
+    writable: bool = False,
+) -> pd.DataFrame:
+    """pd.read_csv replacement backed by the global columnar cache."""
+    return get_columnar_cache().read_csv(
+        path, index_col=index_col, parse_dates=parse_dates, comment=comment, writable=writable
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Compile the columnar cache for a data directory."""
+    parser = argparse.ArgumentParser(description="Compile memory-mapped columnar cache for data CSVs")
+    parser.add_argument("data_dir", nargs="?", default=os.getenv("BASIS_DATA_DIR", "data"))
+    parser.add_argument("--force", action="store_true", help="Rebuild even if up to date")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    cache = get_columnar_cache()
+    # Variants used by the historical providers and MLService
+    totals = {"compiled": 0, "up_to_date": 0, "failed": 0}
+    for comment in ("#", None):
+        stats = cache.compile_directory(args.data_dir, force=args.force, comment=comment)
+        for key, value in stats.items():
+            totals[key] += value
+    print(
+        f"Columnar cache: {totals['compiled']} compiled, "
+        f"{totals['up_to_date']} up to date, {totals['failed']} failed"
+    )
+    return 0 if totals["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
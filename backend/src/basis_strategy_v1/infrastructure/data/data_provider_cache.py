@@ -0,0 +1,269 @@
+"""
+Data Provider Cache
+
+Process-wide cache of historical data providers shared across backtests.
+
+Key Principles:
+- Content-addressed: keyed by a hash of the data-relevant config (data_dir,
+  position_monitor and ml_config), the fingerprints (path, size, mtime) of the
+  files under the data directory, and the backtest date range; the key is
+  computed before any provider is built and a provider is only built on a miss
+- Shared instances are read-only: attribute assignment is rejected and
+  get_data returns a copy of the cached snapshot's dict/list structure, so a
+  run mutating its snapshot never changes what other runs see
+- Reference counted: an entry is only evictable once every backtest using
+  it has released it
+- Memory-budget eviction of idle entries in LRU order
+  (BASIS_DATA_PROVIDER_CACHE__MAX_BYTES)
+- Live providers are never shared
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .columnar_cache import CACHE_DIR_NAME
+from .data_provider_factory import create_data_provider
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+
+class SharedDataProvider:
+    """Read-only handle to a cached data provider."""
+
+    def __init__(self, provider: Any, cache_key: str):
+        object.__setattr__(self, "_provider", provider)
+        object.__setattr__(self, "cache_key", cache_key)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._provider, name)
+
+    def get_data(self, timestamp: Any) -> Dict[str, Any]:
+        """Snapshot at timestamp; dicts and lists are copies, leaf values are shared."""
+        return _copy_snapshot(self._provider.get_data(timestamp))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            f"Shared data provider is read-only (cannot set '{name}', key {self.cache_key[:12]})"
+        )
+
+    def __repr__(self) -> str:
+        return f"SharedDataProvider({self._provider!r}, key={self.cache_key[:12]})"
+
+
+class _CacheEntry:
+    """Cached provider with reference count and memory accounting."""
+
+    def __init__(self, key: str, provider: Any):
+        self.key = key
+        self.provider = provider
+        self.ref_count = 0
+        self.last_used = time.monotonic()
+        self.approx_bytes = 0
+
+
+class DataProviderCache:
+    """Process-wide, reference-counted cache of historical data providers."""
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """
+        Initialize cache.
+
+        Args:
+            max_bytes: Memory budget for cached providers
+                (env BASIS_DATA_PROVIDER_CACHE__MAX_BYTES, 0 disables sharing)
+        """
+        self.max_bytes = int(
+            max_bytes
+            if max_bytes is not None
+            else os.getenv("BASIS_DATA_PROVIDER_CACHE__MAX_BYTES", DEFAULT_MAX_BYTES)
+        )
+        self._entries: Dict[str, _CacheEntry] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def acquire(
+        self,
+        execution_mode: str,
+        data_type: str,
+        config: Dict[str, Any],
+        start_date: Any = None,
+        end_date: Any = None,
+    ) -> Any:
+        """
+        Get a data provider, sharing a cached instance when the inputs match.
+
+        Args:
+            execution_mode: 'backtest' or 'live'
+            data_type: 'defi' or 'cefi'
+            config: Configuration dictionary with position_subscriptions
+            start_date: Backtest start date (part of the cache key)
+            end_date: Backtest end date (part of the cache key)
+
+        Returns:
+            SharedDataProvider for backtests, a fresh provider otherwise.
+            Call release() with it once the backtest is done.
+        """
+        if execution_mode != "backtest" or self.max_bytes <= 0:
+            return create_data_provider(
+                execution_mode=execution_mode, data_type=data_type, config=config
+            )
+
+        key = self.compute_key(data_type, config, start_date, end_date)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                provider = create_data_provider(
+                    execution_mode=execution_mode, data_type=data_type, config=config
+                )
+                entry = _CacheEntry(key, provider)
+                self._entries[key] = entry
+                logger.info(f"Data provider cache miss: {key[:12]} ({data_type})")
+            else:
+                self.hits += 1
+                logger.info(
+                    f"Data provider cache hit: {key[:12]} ({data_type}, {entry.ref_count} active users)"
+                )
+            entry.ref_count += 1
+            entry.last_used = time.monotonic()
+            return SharedDataProvider(entry.provider, key)
+
+    def release(self, provider: Any) -> None:
+        """Release a provider obtained from acquire()."""
+        key = getattr(provider, "cache_key", None) if isinstance(provider, SharedDataProvider) else None
+        if key is None:
+            return
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.ref_count = max(0, entry.ref_count - 1)
+            entry.last_used = time.monotonic()
+            entry.approx_bytes = estimate_provider_bytes(entry.provider)
+            self._evict_over_budget()
+
+    def clear(self) -> None:
+        """Drop all idle entries."""
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if e.ref_count == 0]:
+                del self._entries[key]
+                self.evictions += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics for monitoring."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "active_entries": sum(1 for e in self._entries.values() if e.ref_count > 0),
+                "approx_bytes": sum(e.approx_bytes for e in self._entries.values()),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    @staticmethod
+    def compute_key(
+        data_type: str, config: Dict[str, Any], start_date: Any, end_date: Any
+    ) -> str:
+        """Hash the data-relevant config, the data file fingerprints and the date range."""
+        data_dir = config.get("data_dir", "data")
+        # Same resolution as the historical providers
+        if Path.cwd().name == "backend" and data_dir == "data":
+            data_dir = "../data"
+        payload = {
+            "data_type": data_type,
+            "data_dir": str(Path(data_dir).resolve()),
+            "position_monitor": config.get("component_config", {}).get("position_monitor", {}),
+            "ml_config": config.get("ml_config"),
+            "fingerprints": _fingerprint_files(data_dir),
+            "start_date": str(start_date) if start_date is not None else None,
+            "end_date": str(end_date) if end_date is not None else None,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _evict_over_budget(self) -> None:
+        """Evict idle entries in LRU order until the memory budget is met (lock held)."""
+        total = sum(e.approx_bytes for e in self._entries.values())
+        idle = sorted(
+            (e for e in self._entries.values() if e.ref_count == 0), key=lambda e: e.last_used
+        )
+        for entry in idle:
+            if total <= self.max_bytes:
+                break
+            del self._entries[entry.key]
+            total -= entry.approx_bytes
+            self.evictions += 1
+            logger.info(
+                f"Evicted data provider {entry.key[:12]} (~{entry.approx_bytes / 1024 / 1024:.1f} MiB)"
+            )
+
+
+def _fingerprint_files(data_dir: str) -> List[List[Any]]:
+    """(relative path, size, mtime_ns) of every data file (columnar caches excluded)."""
+    fingerprints = []
+    for root, dirs, files in os.walk(data_dir):
+        dirs[:] = sorted(d for d in dirs if d != CACHE_DIR_NAME)
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            fingerprints.append([os.path.relpath(path, data_dir), stat.st_size, stat.st_mtime_ns])
+    return fingerprints
+
+
+def _copy_snapshot(obj: Any) -> Any:
+    """Copy the dict/list structure of a snapshot (leaf values are immutable scalars)."""
+    if isinstance(obj, dict):
+        return {key: _copy_snapshot(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_copy_snapshot(item) for item in obj]
+    return obj
+
+
+def _deep_size(obj: Any) -> int:
+    """Approximate deep size of nested dict/list snapshots in bytes."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(k) + _deep_size(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(_deep_size(item) for item in obj)
+    return size
+
+
+def estimate_provider_bytes(provider: Any) -> int:
+    """Estimate memory held by a provider's snapshot cache from one sampled snapshot."""
+    data_cache = getattr(provider, "_data_cache", None)
+    if not data_cache:
+        return 0
+    sample = next(iter(data_cache.values()))
+    return _deep_size(sample) * len(data_cache) + sys.getsizeof(data_cache)
+
+
+# Global data provider cache instance
+_data_provider_cache: Optional[DataProviderCache] = None
+
+
+def get_data_provider_cache() -> DataProviderCache:
+    """Get the global data provider cache instance."""
+    global _data_provider_cache
+    if _data_provider_cache is None:
+        _data_provider_cache = DataProviderCache()
+    return _data_provider_cache
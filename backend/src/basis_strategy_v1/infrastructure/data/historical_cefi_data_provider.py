@@ -23,6 +23,7 @@ from ...core.models.instruments import (
     instrument_key_to_oracle_pair,
     validate_instrument_in_registry,
 )
+from .columnar_cache import read_csv_columnar
 
 logger = logging.getLogger(__name__)
 
@@ -86,15 +87,21 @@ class HistoricalCeFiDataProvider:
                         f"protocol_data.perp_prices.{price_key}"
                     ] = f"data/market_data/derivatives/futures_ohlcv/{venue}_{instrument}_perp_1h_*.csv"
                 else:
-                    # OKX uses Binance data
+                    # OKX perp prices use Binance OHLCV (no OKX price history)
                     mappings[
                         f"protocol_data.perp_prices.{price_key}"
                     ] = f"data/market_data/derivatives/futures_ohlcv/binance_{instrument}_perp_1h_*.csv"
 
                 # Funding rates: uppercase key BTC_binance
-                mappings[
-                    f"market_data.funding_rates.{price_key}"
-                ] = f"data/market_data/derivatives/funding_rates/{venue}_{instrument}_funding_rates_*.csv"
+                if venue != "okx":
+                    mappings[
+                        f"market_data.funding_rates.{price_key}"
+                    ] = f"data/market_data/derivatives/funding_rates/{venue}_{instrument}_funding_rates_*.csv"
+                else:
+                    # Compacted OKX series (okx_data_processor.py --compact-only), one file open
+                    mappings[
+                        f"market_data.funding_rates.{price_key}"
+                    ] = f"data/market_data/okx/funding_rates/okx_{instrument}_funding_rates.csv"
 
         # Execution costs
         mappings[
@@ -269,8 +276,8 @@ class HistoricalCeFiDataProvider:
         if not actual_path:
             raise ValueError(f"No CSV file found for pattern: {csv_path}")
 
-        # Load CSV, skipping comment lines
-        df = pd.read_csv(actual_path, index_col=0, parse_dates=True, comment="#")
+        # Load CSV (memory-mapped columnar cache), skipping comment lines
+        df = read_csv_columnar(actual_path, index_col=0, parse_dates=True, comment="#")
 
         # Handle duplicate timestamps by keeping the last occurrence
         if df.index.duplicated().any():
@@ -307,6 +314,56 @@ class HistoricalCeFiDataProvider:
         value = self._extract_value_from_row(df.loc[nearest_idx], csv_path)
         return float(value)
 
+    def get_series(self, data_key: str, timestamps: List[pd.Timestamp]) -> pd.Series:
+        """
+        Get the values of one data key at many timestamps in a single pass.
+
+        Uses the same file resolution, asof lookup and column extraction as
+        get_data(), without building a full snapshot per timestamp.
+
+        Args:
+            data_key: csv_mappings key (e.g. 'market_data.prices.ETH')
+            timestamps: Timestamps to look up
+
+        Returns:
+            Series indexed by timestamps (NaN where no data precedes a timestamp)
+        """
+        csv_path = self.csv_mappings.get(data_key)
+        if not csv_path or csv_path.endswith(".json"):
+            raise ValueError(f"No CSV series available for {data_key}")
+
+        actual_path = self._resolve_csv_path(csv_path)
+        if not actual_path:
+            raise ValueError(f"No CSV file found for pattern: {csv_path}")
+
+        df = read_csv_columnar(actual_path, index_col=0, parse_dates=True, comment="#")
+        if df.index.duplicated().any():
+            df = df[~df.index.duplicated(keep="last")]
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+
+        index = pd.DatetimeIndex(timestamps)
+        lookup = index
+        if df.index.tz is not None and lookup.tz is None:
+            lookup = lookup.tz_localize("UTC")
+        elif df.index.tz is None and lookup.tz is not None:
+            lookup = lookup.tz_localize(None)
+
+        # Extract each distinct row once; consecutive timestamps usually share a row
+        row_values = {}
+        values = []
+        for position in df.index.get_indexer(lookup, method="pad"):
+            if position < 0:
+                values.append(float("nan"))
+                continue
+            if position not in row_values:
+                row_values[position] = float(
+                    self._extract_value_from_row(df.iloc[position], csv_path)
+                )
+            values.append(row_values[position])
+
+        return pd.Series(values, index=index, name=data_key)
+
     def _load_json_value(self, json_path: str, timestamp: pd.Timestamp) -> float:
         """Load value from JSON lookup table at given timestamp."""
         import json
@@ -488,7 +545,7 @@ class HistoricalCeFiDataProvider:
                 raise ValueError(f"No CSV file found for pattern: {sample_csv}")
 
             # Load CSV and extract timestamps
-            df = pd.read_csv(actual_path, index_col=0, parse_dates=True)
+            df = read_csv_columnar(actual_path, index_col=0, parse_dates=True)
             timestamps = df.index.tolist()
 
             # Filter by date range
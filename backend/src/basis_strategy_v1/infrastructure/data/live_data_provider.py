@@ -10,6 +10,8 @@ Key Principles:
 - Environment-aware: Uses environment variables for API keys and endpoints
 - Caching: Short-term caching to avoid excessive API calls
 - Fallback: Graceful degradation when live sources are unavailable
+- Recording: with BASIS_LIVE__TAPE_DIR set every fetch is appended to the market tape
+  (market_tape.py) with its receive time
 
 Data Sources:
 - CEX APIs: Binance, Bybit, OKX for spot/futures prices and funding rates
@@ -31,6 +33,8 @@ import os
 from dataclasses import dataclass
 from enum import Enum
 
+from .market_tape import get_tape_recorder
+
 logger = logging.getLogger(__name__)
 
 # Error codes for Live Data Provider
@@ -127,6 +131,7 @@ class LiveDataProvider:
         self._price_cache: Dict[str, Dict] = {}
         self._rate_cache: Dict[str, Dict] = {}
         self._last_update: Dict[str, datetime] = {}
+        self.tape_recorder = get_tape_recorder()
 
         # Load mode-specific data requirements from config
         self.data_requirements = self._load_data_requirements_for_mode()
@@ -657,6 +662,8 @@ class LiveDataProvider:
         # Use in-memory cache only
         self._price_cache[key] = data
         self._last_update[key] = datetime.now(timezone.utc)
+        if self.tape_recorder is not None:
+            self.tape_recorder.record_fetch(key, data)
 
     async def clear_cache(self):
         """Clear all cached data."""
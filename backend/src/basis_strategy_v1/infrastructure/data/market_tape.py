@@ -0,0 +1,476 @@
+"""
+Market Tape
+
+Append-only columnar recording of live market data, and a data provider that serves it back.
+
+A tape is a directory of compressed NumPy segments (segment-NNNNNN.npz) plus manifest.json.
+Every event is either a snapshot (one data_provider.get_data(timestamp) result) or a fetch
+(one LiveDataProvider cache fill, e.g. spot_price:ETH), stamped with its receive time.
+Event values are stored long-form: a field id (path into the nested dict and value kind,
+listed in the manifest) and a float64 per value, so a snapshot costs 12 bytes per price
+before compression and new instruments need no schema change.
+
+Key Principles:
+- Append-only: events are buffered and written as a new segment every flush_events events
+  (and on flush/close); segment files and the manifest are replaced atomically, so a crash
+  loses at most the unflushed buffer
+- Reopening an existing tape appends to it with the same field and category tables
+- Lossless for the snapshot shape: numbers, bools, strings (category codes), None,
+  timestamps and empty dicts round-trip; lists and other objects are skipped and counted
+- Recording never breaks live trading: encoding or write failures are logged and dropped
+- ReplayDataProvider.get_data(timestamp) returns the last snapshot received at or before
+  timestamp (as-of lookup), so a replayed engine sees what live saw at that time
+
+Enable recording with BASIS_LIVE__TAPE_DIR; core.event_engine.tape_replay replays a tape
+through EventDrivenStrategyEngine.run_live.
+"""
+
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+TAPE_FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+DEFAULT_FLUSH_EVENTS = 256
+
+SNAPSHOT = 0
+FETCH = 1
+EVENT_KINDS = {SNAPSHOT: "snapshot", FETCH: "fetch"}
+
+
+@dataclass
+class TapeEvent:
+    """One recorded event with its data decoded back into nested dicts."""
+
+    kind: str  # 'snapshot' or 'fetch'
+    received_at: float  # Epoch seconds
+    timestamp: Optional[pd.Timestamp]
+    key: Optional[str]  # Fetch cache key, None for snapshots
+    data: Dict[str, Any]
+
+
+def _timestamp_ns(timestamp: Any) -> int:
+    if timestamp is None:
+        return np.iinfo("int64").min
+    return pd.Timestamp(timestamp).value
+
+
+class MarketTapeRecorder:
+    """Buffers live snapshots and fetches and appends them to a tape directory."""
+
+    def __init__(
+        self,
+        path: str,
+        flush_events: int = DEFAULT_FLUSH_EVENTS,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize tape recorder.
+
+        Args:
+            path: Tape directory (created if missing, appended to if it holds a tape)
+            flush_events: Buffered events per written segment
+            clock: Receive time source (epoch seconds)
+        """
+        if flush_events < 1:
+            raise ValueError(f"flush_events must be at least 1, got {flush_events}")
+
+        self.path = Path(path)
+        self.flush_events = flush_events
+        self.clock = clock
+        self._lock = threading.Lock()
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._manifest = _read_manifest(self.path) or {
+            "format_version": TAPE_FORMAT_VERSION,
+            "created_at": pd.Timestamp.now(tz="UTC").isoformat(),
+            "fields": [],
+            "categories": [],
+            "segments": [],
+        }
+        self._field_ids: Dict[Tuple[Tuple[Any, ...], str], int] = {
+            (tuple(field["path"]), field["kind"]): i
+            for i, field in enumerate(self._manifest["fields"])
+        }
+        self._category_ids: Dict[str, int] = {
+            category: i for i, category in enumerate(self._manifest["categories"])
+        }
+        self._buffer: List[Tuple[int, int, int, int, List[int], List[float]]] = []
+
+        self.events_recorded = 0
+        self.values_recorded = 0
+        self.skipped_values = 0
+        self.dropped_events = 0
+        self.segments_written = 0
+        self.bytes_written = 0
+
+    def record_snapshot(
+        self, timestamp: pd.Timestamp, data: Dict[str, Any], received_at: Optional[float] = None
+    ) -> None:
+        """Record one get_data(timestamp) result."""
+        data = {key: value for key, value in data.items() if key != "timestamp"}
+        self._record(SNAPSHOT, timestamp, None, data, received_at)
+
+    def record_fetch(
+        self, key: str, data: Dict[str, Any], received_at: Optional[float] = None
+    ) -> None:
+        """Record one live source fetch (cache key and fetched payload)."""
+        self._record(FETCH, None, key, data, received_at)
+
+    def _record(
+        self,
+        kind: int,
+        timestamp: Optional[pd.Timestamp],
+        key: Optional[str],
+        data: Dict[str, Any],
+        received_at: Optional[float],
+    ) -> None:
+        received_at = self.clock() if received_at is None else received_at
+        try:
+            with self._lock:
+                fields: List[int] = []
+                values: List[float] = []
+                self._encode((), data, fields, values)
+                self._buffer.append(
+                    (
+                        kind,
+                        int(round(received_at * 1e9)),
+                        _timestamp_ns(timestamp),
+                        self._category(key) if key is not None else -1,
+                        fields,
+                        values,
+                    )
+                )
+                self.events_recorded += 1
+                self.values_recorded += len(values)
+                if len(self._buffer) >= self.flush_events:
+                    self._flush_locked()
+        except Exception as e:
+            self.dropped_events += 1
+            logger.error(f"Market tape recording failed: {e}")
+
+    def _encode(
+        self, path: Tuple[Any, ...], value: Any, fields: List[int], values: List[float]
+    ) -> None:
+        if isinstance(value, dict):
+            if not value:
+                fields.append(self._field(path, "dict"))
+                values.append(np.nan)
+            for key, item in value.items():
+                self._encode(path + (key,), item, fields, values)
+            return
+
+        if isinstance(value, (bool, np.bool_)):
+            kind, number = "bool", float(value)
+        elif isinstance(value, (int, np.integer)):
+            kind, number = "int", float(value)
+        elif isinstance(value, (float, np.floating)):
+            kind, number = "float", float(value)
+        elif isinstance(value, str):
+            kind, number = "category", float(self._category(value))
+        elif value is None:
+            kind, number = "none", np.nan
+        elif isinstance(value, (pd.Timestamp, np.datetime64)):
+            kind, number = "datetime", pd.Timestamp(value).value / 1e9
+        else:
+            self.skipped_values += 1
+            return
+        fields.append(self._field(path, kind))
+        values.append(number)
+
+    def _field(self, path: Tuple[Any, ...], kind: str) -> int:
+        field_id = self._field_ids.get((path, kind))
+        if field_id is None:
+            field_id = self._field_ids[(path, kind)] = len(self._manifest["fields"])
+            self._manifest["fields"].append({"path": list(path), "kind": kind})
+        return field_id
+
+    def _category(self, value: str) -> int:
+        category_id = self._category_ids.get(value)
+        if category_id is None:
+            category_id = self._category_ids[value] = len(self._manifest["categories"])
+            self._manifest["categories"].append(value)
+        return category_id
+
+    def flush(self) -> None:
+        """Write buffered events as a new segment."""
+        try:
+            with self._lock:
+                self._flush_locked()
+        except Exception as e:
+            logger.error(f"Market tape flush failed: {e}")
+
+    def close(self) -> None:
+        self.flush()
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        events, self._buffer = self._buffer, []
+        counts = [len(event[4]) for event in events]
+        columns = {
+            "kind": np.array([event[0] for event in events], dtype="int8"),
+            "received_ns": np.array([event[1] for event in events], dtype="int64"),
+            "timestamp_ns": np.array([event[2] for event in events], dtype="int64"),
+            "key": np.array([event[3] for event in events], dtype="int32"),
+            "offsets": np.concatenate(([0], np.cumsum(counts))).astype("int64"),
+            "field": np.fromiter(
+                (field for event in events for field in event[4]), dtype="int32"
+            ),
+            "value": np.fromiter(
+                (value for event in events for value in event[5]), dtype="float64"
+            ),
+        }
+
+        name = f"segment-{len(self._manifest['segments']):06d}.npz"
+        segment = self.path / name
+        temp = self.path / f".{name}.tmp"
+        with open(temp, "wb") as f:
+            np.savez_compressed(f, **columns)
+        os.replace(temp, segment)
+
+        self._manifest["segments"].append(
+            {
+                "file": name,
+                "events": len(events),
+                "values": int(sum(counts)),
+                "first_received_ns": int(columns["received_ns"].min()),
+                "last_received_ns": int(columns["received_ns"].max()),
+            }
+        )
+        _write_json_atomic(self.path / MANIFEST_FILE, self._manifest)
+        self.segments_written += 1
+        self.bytes_written += segment.stat().st_size
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "events_recorded": self.events_recorded,
+            "values_recorded": self.values_recorded,
+            "buffered_events": len(self._buffer),
+            "segments_written": self.segments_written,
+            "bytes_written": self.bytes_written,
+            "fields": len(self._manifest["fields"]),
+            "skipped_values": self.skipped_values,
+            "dropped_events": self.dropped_events,
+        }
+
+
+class MarketTape:
+    """Read-only view of a recorded tape."""
+
+    def __init__(self, path: str):
+        """
+        Load a tape.
+
+        Raises:
+            FileNotFoundError: If path holds no tape manifest
+            ValueError: If the tape format version is unsupported
+        """
+        self.path = Path(path)
+        manifest = _read_manifest(self.path)
+        if manifest is None:
+            raise FileNotFoundError(f"No market tape at {self.path}")
+        if manifest.get("format_version") != TAPE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported tape format version: {manifest.get('format_version')}")
+
+        self.fields = [(tuple(field["path"]), field["kind"]) for field in manifest["fields"]]
+        self.categories = manifest["categories"]
+
+        segments = []
+        value_offset = 0
+        for segment in manifest["segments"]:
+            with np.load(self.path / segment["file"]) as columns:
+                columns = {name: columns[name] for name in columns.files}
+            columns["offsets"] = columns["offsets"][:-1] + value_offset
+            value_offset += len(columns["value"])
+            segments.append(columns)
+
+        def concat(name: str, dtype: str) -> np.ndarray:
+            if not segments:
+                return np.array([], dtype=dtype)
+            return np.concatenate([segment[name] for segment in segments])
+
+        self.kind = concat("kind", "int8")
+        self.received_ns = concat("received_ns", "int64")
+        self.timestamp_ns = concat("timestamp_ns", "int64")
+        self.key = concat("key", "int32")
+        self.offsets = np.append(concat("offsets", "int64"), value_offset)
+        self.field = concat("field", "int32")
+        self.value = concat("value", "float64")
+
+        # Events in receive order; writers may interleave threads within a segment
+        self.order = np.argsort(self.received_ns, kind="stable")
+        snapshots = self.order[self.kind[self.order] == SNAPSHOT]
+        self.snapshot_index = snapshots
+        self.snapshot_received_ns = self.received_ns[snapshots]
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    @property
+    def snapshot_count(self) -> int:
+        return len(self.snapshot_index)
+
+    @property
+    def start(self) -> Optional[float]:
+        """Receive time of the first event (epoch seconds)."""
+        return self.received_ns[self.order[0]] / 1e9 if len(self) else None
+
+    @property
+    def end(self) -> Optional[float]:
+        """Receive time of the last event (epoch seconds)."""
+        return self.received_ns[self.order[-1]] / 1e9 if len(self) else None
+
+    def event(self, index: int) -> TapeEvent:
+        """Decode event `index` (in recorded order)."""
+        data: Dict[str, Any] = {}
+        start, end = self.offsets[index], self.offsets[index + 1]
+        for field_id, number in zip(self.field[start:end], self.value[start:end]):
+            path, kind = self.fields[field_id]
+            parent = data
+            for key in path[:-1]:
+                parent = parent.setdefault(key, {})
+            if kind == "dict":
+                if path:
+                    parent.setdefault(path[-1], {})
+                continue
+            parent[path[-1]] = self._decode_value(kind, number)
+
+        timestamp_ns = self.timestamp_ns[index]
+        key = self.key[index]
+        return TapeEvent(
+            kind=EVENT_KINDS[int(self.kind[index])],
+            received_at=self.received_ns[index] / 1e9,
+            timestamp=(
+                pd.Timestamp(int(timestamp_ns), tz="UTC")
+                if timestamp_ns != np.iinfo("int64").min
+                else None
+            ),
+            key=self.categories[key] if key >= 0 else None,
+            data=data,
+        )
+
+    def _decode_value(self, kind: str, number: float) -> Any:
+        if kind == "float":
+            return float(number)
+        if kind == "int":
+            return int(number)
+        if kind == "bool":
+            return bool(number)
+        if kind == "category":
+            return self.categories[int(number)]
+        if kind == "datetime":
+            return pd.Timestamp(int(round(number * 1e9)), tz="UTC")
+        return None
+
+    def events(self, kind: Optional[str] = None) -> Iterator[TapeEvent]:
+        """Events in receive order, optionally only 'snapshot' or 'fetch' events."""
+        for index in self.order:
+            if kind is None or EVENT_KINDS[int(self.kind[index])] == kind:
+                yield self.event(index)
+
+    def snapshot_at(self, received_at: float) -> Optional[TapeEvent]:
+        """Last snapshot received at or before received_at (epoch seconds)."""
+        position = np.searchsorted(
+            self.snapshot_received_ns, int(round(received_at * 1e9)), side="right"
+        )
+        if position == 0:
+            return None
+        return self.event(self.snapshot_index[position - 1])
+
+
+class RecordingDataProvider:
+    """Data provider wrapper recording every get_data result to a tape."""
+
+    def __init__(self, data_provider: Any, recorder: MarketTapeRecorder):
+        self.data_provider = data_provider
+        self.recorder = recorder
+
+    def get_data(self, timestamp: pd.Timestamp) -> Any:
+        data = self.data_provider.get_data(timestamp)
+        if inspect.isawaitable(data):
+            return self._record_async(timestamp, data)
+        self.recorder.record_snapshot(timestamp, data)
+        return data
+
+    async def _record_async(self, timestamp: pd.Timestamp, pending: Any) -> Dict[str, Any]:
+        data = await pending
+        self.recorder.record_snapshot(timestamp, data)
+        return data
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.data_provider, name)
+
+
+class ReplayDataProvider:
+    """Serves recorded snapshots as-of the requested timestamp."""
+
+    def __init__(self, tape: MarketTape):
+        if tape.snapshot_count == 0:
+            raise ValueError(f"Market tape at {tape.path} has no snapshots")
+        self.tape = tape
+        self.requests = 0
+        self.misses = 0
+
+    def get_data(self, timestamp: pd.Timestamp) -> Dict[str, Any]:
+        """
+        Snapshot received at or before timestamp (the first one before the tape starts).
+
+        The returned dict carries the requested timestamp; recorded_timestamp and
+        received_at identify the snapshot served.
+        """
+        self.requests += 1
+        event = self.tape.snapshot_at(pd.Timestamp(timestamp).timestamp())
+        if event is None:
+            self.misses += 1
+            event = self.tape.event(self.tape.snapshot_index[0])
+        data = event.data
+        data["timestamp"] = timestamp
+        data["recorded_timestamp"] = event.timestamp
+        data["received_at"] = pd.Timestamp(event.received_at, unit="s", tz="UTC")
+        return data
+
+
+def _read_manifest(path: Path) -> Optional[Dict[str, Any]]:
+    manifest = path / MANIFEST_FILE
+    if not manifest.exists():
+        return None
+    with open(manifest) as f:
+        return json.load(f)
+
+
+def _write_json_atomic(path: Path, payload: Dict[str, Any]) -> None:
+    temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(temp, "w") as f:
+        json.dump(payload, f)
+    os.replace(temp, path)
+
+
+_recorder: Optional[MarketTapeRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def get_tape_recorder() -> Optional[MarketTapeRecorder]:
+    """Process-wide recorder on BASIS_LIVE__TAPE_DIR, None when recording is off."""
+    global _recorder
+    tape_dir = os.getenv("BASIS_LIVE__TAPE_DIR")
+    if not tape_dir:
+        return None
+    with _recorder_lock:
+        if _recorder is None or _recorder.path != Path(tape_dir):
+            if _recorder is not None:
+                _recorder.close()
+            _recorder = MarketTapeRecorder(tape_dir)
+        return _recorder
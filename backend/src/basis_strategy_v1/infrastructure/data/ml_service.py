@@ -17,6 +17,8 @@ import pandas as pd
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+from .columnar_cache import read_csv_columnar
+
 logger = logging.getLogger(__name__)
 
 
@@ -106,7 +108,7 @@ class MLService:
             # Use the most recent file
             csv_path = max(csv_files, key=lambda x: x.stat().st_mtime)
 
-            df = pd.read_csv(csv_path, index_col=0, parse_dates=True)
+            df = read_csv_columnar(csv_path, index_col=0, parse_dates=True)
 
             # Use asof lookup for nearest timestamp
             nearest_idx = df.index.asof(timestamp)
@@ -135,7 +137,7 @@ class MLService:
             # Use the most recent file
             csv_path = max(csv_files, key=lambda x: x.stat().st_mtime)
 
-            df = pd.read_csv(csv_path, index_col=0, parse_dates=True)
+            df = read_csv_columnar(csv_path, index_col=0, parse_dates=True)
 
             # Use asof lookup for nearest timestamp
             nearest_idx = df.index.asof(timestamp)
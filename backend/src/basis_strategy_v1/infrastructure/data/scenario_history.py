@@ -0,0 +1,93 @@
+"""
+Scenario History
+
+Builds the historical factor array consumed by the scenario engine from the same
+CSV series the historical DeFi provider serves to backtests.
+
+Key Principles:
+- Factors follow core.math.scenario_engine.FACTORS: asset price log return, funding
+  rate (at 0/8/16 UTC settlements, 0 otherwise), AAVE liquidityIndex and
+  variableBorrowIndex log growth per step
+- Series come from the mode's position subscriptions (HistoricalDeFiDataProvider.get_series);
+  factors a mode has no subscription for are zero
+- Gaps are forward-filled like the provider's asof lookups; missing leading data fails fast
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .historical_defi_data_provider import HistoricalDeFiDataProvider
+from ...core.math.scenario_engine import FACTORS, get_scenario_asset
+
+logger = logging.getLogger(__name__)
+
+FUNDING_SETTLEMENT_HOURS = (0, 8, 16)
+
+
+def _find_key(provider: HistoricalDeFiDataProvider, prefix: str) -> Optional[str]:
+    """First csv_mappings key with a CSV source starting with prefix."""
+    for key, path in provider.csv_mappings.items():
+        if key.startswith(prefix) and path and not path.endswith(".json"):
+            return key
+    return None
+
+
+def load_scenario_history(
+    config: Dict[str, Any], start_date: Any, end_date: Any, freq: str = "1h"
+) -> np.ndarray:
+    """
+    Load historical factor steps (time, factors) for a mode.
+
+    Args:
+        config: Mode config with component_config.position_monitor.position_subscriptions
+        start_date: History start
+        end_date: History end
+        freq: Step frequency (hourly matches backtests)
+
+    Returns:
+        Factor array with one row per step between consecutive timestamps
+    """
+    provider = HistoricalDeFiDataProvider(config)
+    timestamps = pd.date_range(
+        pd.Timestamp(start_date), pd.Timestamp(end_date), freq=freq, tz="UTC"
+    )
+    if len(timestamps) < 3:
+        raise ValueError(f"Scenario history needs at least 3 timestamps, got {len(timestamps)}")
+
+    asset = get_scenario_asset(config)
+    sources = {
+        "price_log_return": (_find_key(provider, f"market_data.prices.{asset}"), None),
+        "funding_rate": (_find_key(provider, f"market_data.funding_rates.{asset}_"), None),
+        "supply_log_growth": (_find_key(provider, "protocol_data.aave_indexes.a"), None),
+        "borrow_log_growth": (
+            _find_key(provider, "protocol_data.aave_indexes.debt"),
+            "variableBorrowIndex",
+        ),
+    }
+
+    history = np.zeros((len(timestamps) - 1, len(FACTORS)))
+    for column, factor in enumerate(FACTORS):
+        data_key, data_column = sources[factor]
+        if data_key is None:
+            logger.info(f"Scenario history for {config.get('mode')}: no {factor} source, using 0")
+            continue
+
+        series = provider.get_series(data_key, list(timestamps), column=data_column).ffill()
+        if series.isna().any():
+            raise ValueError(f"No {data_key} data at scenario history start {timestamps[0]}")
+
+        values = series.to_numpy(dtype=float)
+        if factor == "funding_rate":
+            settles = np.isin(timestamps.hour, FUNDING_SETTLEMENT_HOURS) & (timestamps.minute == 0)
+            history[:, column] = np.where(settles, values, 0.0)[1:]
+        else:
+            history[:, column] = np.diff(np.log(values))
+
+    logger.info(
+        f"Loaded scenario history for {config.get('mode')}: {history.shape[0]} steps "
+        f"({timestamps[0]} to {timestamps[-1]})"
+    )
+    return history
@@ -229,6 +229,59 @@ class ConfigHealthCheck(ComponentHealthCheck):
         return "healthy", "Configuration is valid", details
 
 
+class BacktestRegistryHealthCheck(ComponentHealthCheck):
+    """Completed-backtest registry memory accounting."""
+
+    def __init__(self, name: str, backtest_service):
+        super().__init__(name)
+        self.backtest_service = backtest_service
+
+    def _perform_health_check(self) -> tuple[str, str, Dict[str, Any]]:
+        """Report registry size, approximate bytes held and eviction/reload counters."""
+        details = self.backtest_service.get_memory_stats()
+        registry = details["completed_registry"]
+
+        if registry["entries"] >= registry["max_entries"]:
+            return (
+                "degraded",
+                f"Backtest registry at capacity ({registry['entries']}/{registry['max_entries']}), "
+                "evicting oldest summaries",
+                details,
+            )
+
+        return (
+            "healthy",
+            f"Backtest registry holding {registry['entries']} summaries "
+            f"(~{registry['total_bytes'] / 1024:.1f} KiB)",
+            details,
+        )
+
+
+class APICallLanesHealthCheck(ComponentHealthCheck):
+    """Per-venue API call lanes: queue depth, latency and throttling."""
+
+    def __init__(self, name: str, api_call_manager):
+        super().__init__(name)
+        self.api_call_manager = api_call_manager
+
+    def _perform_health_check(self) -> tuple[str, str, Dict[str, Any]]:
+        """Report each lane's status and metrics; degraded when a lane is nearly full."""
+        status = self.api_call_manager.get_status()
+        lanes = {"default": status["default_queue"], **status["service_queues"]}
+        details = {"is_running": status["is_running"], "lanes": lanes}
+
+        backlogged = [
+            name
+            for name, lane in lanes.items()
+            if lane["queue_size"] >= 0.9 * lane["max_queue_size"]
+        ]
+        if backlogged:
+            return "degraded", f"API call lanes near capacity: {backlogged}", details
+
+        queued = sum(lane["queue_size"] for lane in lanes.values())
+        return "healthy", f"{len(lanes)} API call lanes, {queued} calls queued", details
+
+
 class HealthChecker:
     """Unified health checker for all system components."""
 
@@ -5,10 +5,19 @@ This module contains logging and event management components:
 - StructuredLogger: Enhanced structured logging with correlation ID and error codes
 - DomainEventLogger: Logs domain events to JSONL files
 - LogDirectoryManager: Manages log directory structure
+- EventQueryEngine: Indexed, paginated reads of the domain event JSONL files
 """
 
 from .domain_event_logger import DomainEventLogger
 from .structured_logger import StructuredLogger
 from .log_directory_manager import LogDirectoryManager
+from .event_query_engine import EventQueryEngine, EventQuery, EventPage
 
-__all__ = ["DomainEventLogger", "StructuredLogger", "LogDirectoryManager"]
+__all__ = [
+    "DomainEventLogger",
+    "StructuredLogger",
+    "LogDirectoryManager",
+    "EventQueryEngine",
+    "EventQuery",
+    "EventPage",
+]
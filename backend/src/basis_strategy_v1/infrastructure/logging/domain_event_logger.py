@@ -17,15 +17,35 @@ Each event type gets its own JSONL file in the events/ subdirectory:
 - event_logger_operations.jsonl
 - strategy_decisions.jsonl
 
+Events are encoded with orjson when it is installed (pydantic's model_dump_json
+otherwise). With event_format="msgpack" (or BASIS_LOG__EVENT_FORMAT=msgpack) each file
+is instead a .msgpack stream of 4-byte big-endian length-prefixed msgpack records;
+convert_msgpack_to_jsonl() turns one back into JSONL.
+
 Reference: docs/LOGGING_GUIDE.md - Domain Event Logging
 """
 
 import json
+import os
+import struct
 import asyncio
+from decimal import Decimal
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, Optional
 from datetime import datetime, timezone
 
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 from ...core.models.domain_events import (
     PositionSnapshot,
     ExposureSnapshot,
@@ -41,6 +61,90 @@ from ...core.models.domain_events import (
     StrategyDecision,
 )
 
+EVENT_FORMATS = ("jsonl", "msgpack")
+
+# Record header of the msgpack format: payload length as unsigned 32-bit big-endian
+_LENGTH_PREFIX = struct.Struct(">I")
+
+
+def _encode_default(value: Any) -> Any:
+    """Fallback for values the encoders do not handle natively."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, "item"):  # numpy scalars
+        return value.item()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Type is not serializable: {type(value).__name__}")
+
+
+def encode_event_json(event: BaseModel) -> bytes:
+    """
+    Encode an event as one JSON line (without the trailing newline).
+
+    Reads the field values straight from the model, so events built with
+    model_construct() by trusted emitters are never validated or copied.
+    """
+    if orjson is None:
+        return event.model_dump_json().encode()
+    return orjson.dumps(
+        event.__dict__, default=_encode_default, option=orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+def encode_event_msgpack(event: BaseModel) -> bytes:
+    """Encode an event as a length-prefixed msgpack record."""
+    if msgpack is None:
+        raise ImportError("msgpack is required for the msgpack event format (pip install msgpack)")
+    payload = msgpack.packb(event.__dict__, default=_encode_default, use_bin_type=True)
+    return _LENGTH_PREFIX.pack(len(payload)) + payload
+
+
+def iter_msgpack_events(file_path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the events of a length-prefixed msgpack event file.
+
+    Raises:
+        ValueError: If the file ends in a truncated record
+    """
+    if msgpack is None:
+        raise ImportError("msgpack is required for the msgpack event format (pip install msgpack)")
+    with open(file_path, "rb") as f:
+        while True:
+            header = f.read(_LENGTH_PREFIX.size)
+            if not header:
+                return
+            if len(header) < _LENGTH_PREFIX.size:
+                raise ValueError(f"Truncated record header in {file_path}")
+            (length,) = _LENGTH_PREFIX.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length:
+                raise ValueError(f"Truncated record in {file_path}")
+            yield msgpack.unpackb(payload, raw=False)
+
+
+def convert_msgpack_to_jsonl(source: Path, destination: Optional[Path] = None) -> int:
+    """
+    Convert a msgpack event file to JSONL.
+
+    Args:
+        source: Length-prefixed msgpack event file
+        destination: JSONL output path (default: source with a .jsonl suffix)
+
+    Returns:
+        Number of events converted
+    """
+    source = Path(source)
+    destination = Path(destination) if destination else source.with_suffix(".jsonl")
+    count = 0
+    with open(destination, "w") as f:
+        for event in iter_msgpack_events(source):
+            f.write(json.dumps(event) + "\n")
+            count += 1
+    return count
+
 
 class DomainEventLogger:
     """
@@ -57,7 +161,9 @@ class DomainEventLogger:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self, log_dir: Path, correlation_id: str, pid: int):
+    def __init__(
+        self, log_dir: Path, correlation_id: str, pid: int, event_format: Optional[str] = None
+    ):
         """
         Initialize domain event logger.
 
@@ -65,16 +171,26 @@ class DomainEventLogger:
             log_dir: Path to log directory (logs/{correlation_id}/{pid}/)
             correlation_id: REQUIRED correlation ID for this run
             pid: REQUIRED process ID for this run
-            
+            event_format: "jsonl" or "msgpack" (default: BASIS_LOG__EVENT_FORMAT or "jsonl")
+
         Raises:
-            ValueError: If correlation_id or pid are missing
+            ValueError: If correlation_id or pid are missing or event_format is unknown
+            ImportError: If event_format is "msgpack" and msgpack is not installed
         """
         # FAIL FAST: Validate required parameters
         if not correlation_id:
             raise ValueError("correlation_id is REQUIRED for DomainEventLogger")
         if not pid:
             raise ValueError("pid is REQUIRED for DomainEventLogger")
-            
+
+        event_format = event_format or os.getenv("BASIS_LOG__EVENT_FORMAT", "jsonl")
+        if event_format not in EVENT_FORMATS:
+            raise ValueError(f"Unknown event_format: {event_format}. Available: {EVENT_FORMATS}")
+        if event_format == "msgpack" and msgpack is None:
+            raise ImportError("msgpack is required for the msgpack event format (pip install msgpack)")
+        self.event_format = event_format
+        self._encode = encode_event_msgpack if event_format == "msgpack" else encode_event_json
+
         self.log_dir = Path(log_dir)
         self.correlation_id = correlation_id
         self.pid = pid
@@ -88,19 +204,20 @@ class DomainEventLogger:
         self._order_lock = asyncio.Lock()
 
         # Event file mapping (matching LOGGING_GUIDE.md specifications)
+        suffix = "msgpack" if event_format == "msgpack" else "jsonl"
         self.event_files = {
-            "positions": self.events_dir / "positions.jsonl",
-            "exposures": self.events_dir / "exposures.jsonl",
-            "risk_assessments": self.events_dir / "risk_assessments.jsonl",
-            "pnl_calculations": self.events_dir / "pnl_calculations.jsonl",
-            "orders": self.events_dir / "orders.jsonl",
-            "operation_executions": self.events_dir / "operation_executions.jsonl",
-            "atomic_groups": self.events_dir / "atomic_groups.jsonl",  # Matches LOGGING_GUIDE.md
-            "execution_deltas": self.events_dir / "execution_deltas.jsonl",
-            "reconciliation": self.events_dir / "reconciliation.jsonl",  # Matches LOGGING_GUIDE.md
-            "tight_loop": self.events_dir / "tight_loop.jsonl",  # Matches LOGGING_GUIDE.md
-            "event_logger_operations": self.events_dir / "event_logger_operations.jsonl",
-            "strategy_decisions": self.events_dir / "strategy_decisions.jsonl",
+            "positions": self.events_dir / f"positions.{suffix}",
+            "exposures": self.events_dir / f"exposures.{suffix}",
+            "risk_assessments": self.events_dir / f"risk_assessments.{suffix}",
+            "pnl_calculations": self.events_dir / f"pnl_calculations.{suffix}",
+            "orders": self.events_dir / f"orders.{suffix}",
+            "operation_executions": self.events_dir / f"operation_executions.{suffix}",
+            "atomic_groups": self.events_dir / f"atomic_groups.{suffix}",  # Matches LOGGING_GUIDE.md
+            "execution_deltas": self.events_dir / f"execution_deltas.{suffix}",
+            "reconciliation": self.events_dir / f"reconciliation.{suffix}",  # Matches LOGGING_GUIDE.md
+            "tight_loop": self.events_dir / f"tight_loop.{suffix}",  # Matches LOGGING_GUIDE.md
+            "event_logger_operations": self.events_dir / f"event_logger_operations.{suffix}",
+            "strategy_decisions": self.events_dir / f"strategy_decisions.{suffix}",
         }
 
     def log_position_snapshot(self, event: PositionSnapshot) -> None:
@@ -246,13 +363,7 @@ class DomainEventLogger:
             raise ValueError(f"Event missing pid: {event}")
 
         try:
-            # Serialize event to JSON
-            event_json = event.model_dump_json()
-
-            # Append to JSONL file
-            with open(file_path, "a") as f:
-                f.write(event_json + "\n")
-                f.flush()  # Ensure immediate write
+            self._write_to_file(file_path, self._encode(event))
 
         except Exception as e:
             # FAIL FAST: Re-raise the exception instead of silently continuing
@@ -282,20 +393,19 @@ class DomainEventLogger:
             raise ValueError(f"Event missing pid: {event}")
 
         try:
-            # Serialize event to JSON
-            event_json = event.model_dump_json()
-
             # Write asynchronously using asyncio.to_thread
-            await asyncio.to_thread(self._write_to_file, file_path, event_json)
+            await asyncio.to_thread(self._write_to_file, file_path, self._encode(event))
 
         except Exception as e:
             # FAIL FAST: Re-raise the exception instead of silently continuing
             raise RuntimeError(f"Failed to write {event_type} event to {file_path}: {e}") from e
 
-    def _write_to_file(self, file_path: Path, event_json: str) -> None:
-        """Helper method for async file writing."""
-        with open(file_path, "a") as f:
-            f.write(event_json + "\n")
+    def _write_to_file(self, file_path: Path, record: bytes) -> None:
+        """Append one encoded event (newline-terminated for JSONL)."""
+        if self.event_format == "jsonl":
+            record += b"\n"
+        with open(file_path, "ab") as f:
+            f.write(record)
             f.flush()  # Ensure immediate write
 
     async def _get_next_global_order(self) -> int:
@@ -334,6 +444,9 @@ class DomainEventLogger:
         if not file_path or not file_path.exists():
             return 0
 
+        if self.event_format == "msgpack":
+            return sum(1 for _ in iter_msgpack_events(file_path))
+
         with open(file_path, "r") as f:
             return sum(1 for _ in f)
 
@@ -353,6 +466,14 @@ class DomainEventLogger:
         if not file_path or not file_path.exists():
             return []
 
+        if self.event_format == "msgpack":
+            events = []
+            for event in iter_msgpack_events(file_path):
+                if limit and len(events) >= limit:
+                    break
+                events.append(event)
+            return events
+
         events = []
         with open(file_path, "r") as f:
             for i, line in enumerate(f):
@@ -380,6 +501,12 @@ class DomainEventLogger:
         if not file_path or not file_path.exists():
             return None
 
+        if self.event_format == "msgpack":
+            latest = None
+            for latest in iter_msgpack_events(file_path):
+                pass
+            return latest
+
         # Read last line
         with open(file_path, "rb") as f:
             try:
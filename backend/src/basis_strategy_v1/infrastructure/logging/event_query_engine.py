@@ -0,0 +1,505 @@
+"""
+Event Query Engine
+
+Serves the domain event JSONL streams written by DomainEventLogger without
+ever loading a whole file into memory.
+
+Each events/{event_type}.jsonl file gets a sidecar byte-offset index
+(events/{event_type}.jsonl.idx) holding one (byte_offset, timestamp_ns)
+record per line. Queries use the index to:
+- seek straight to the first event of a page (offset or cursor pagination)
+- bisect time ranges when the stream is time-ordered
+- merge several event types in timestamp order
+
+Only the lines that are actually returned (or checked against an instrument
+filter) are read from disk. Indexes are extended incrementally as the
+logger appends and rebuilt when a file is truncated or replaced.
+
+Reference: docs/LOGGING_GUIDE.md - Domain Event Logging
+"""
+
+import base64
+import heapq
+import json
+import os
+import re
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+INDEX_SUFFIX = ".idx"
+INDEX_MAGIC = b"BSEVIDX1"
+# magic, indexed_bytes, source_mtime_ns, record_count, sorted_flag
+_HEADER = struct.Struct("<8sQqQB")
+
+_TIMESTAMP_RE = re.compile(rb'"timestamp"\s*:\s*"([^"]+)"')
+
+# Sentinel for lines without a parseable timestamp (sorted first)
+MISSING_TIMESTAMP = -(2**63)
+
+
+def to_timestamp_ns(value: Any) -> int:
+    """
+    Convert an ISO string, datetime or pandas Timestamp to UTC epoch nanoseconds.
+
+    Naive values are treated as UTC, matching the engine's timestamps.
+
+    Raises:
+        ValueError: If the value cannot be interpreted as a timestamp
+    """
+    if value is None:
+        raise ValueError("timestamp is required")
+    if hasattr(value, "value") and hasattr(value, "tz_localize"):
+        # pandas.Timestamp
+        if value.tzinfo is None:
+            value = value.tz_localize("UTC")
+        return int(value.value)
+    if isinstance(value, str):
+        text = value.strip()
+        if text.endswith("Z"):
+            text = text[:-1] + "+00:00"
+        value = datetime.fromisoformat(text)
+    if not isinstance(value, datetime):
+        raise ValueError(f"Unsupported timestamp value: {value!r}")
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
+def _extract_timestamp_ns(line: bytes) -> int:
+    """Pull the engine timestamp out of a raw JSONL line without a full parse."""
+    match = _TIMESTAMP_RE.search(line)
+    if match:
+        try:
+            return to_timestamp_ns(match.group(1).decode())
+        except ValueError:
+            pass
+    try:
+        return to_timestamp_ns(json.loads(line).get("timestamp"))
+    except Exception:
+        return MISSING_TIMESTAMP
+
+
+def _contains_instrument(node: Any, instrument: str) -> bool:
+    """True if instrument appears as a dict key or string value anywhere in node."""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == instrument or _contains_instrument(value, instrument):
+                return True
+        return False
+    if isinstance(node, list):
+        return any(_contains_instrument(item, instrument) for item in node)
+    return node == instrument
+
+
+class EventFileIndex:
+    """
+    Byte-offset index for a single append-only JSONL event file.
+
+    Attributes:
+        offsets: Byte offset of each line
+        timestamps: Engine timestamp of each line (UTC epoch ns)
+        is_sorted: Whether timestamps are non-decreasing (enables bisect)
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + INDEX_SUFFIX)
+        self.offsets = array("q")
+        self.timestamps = array("q")
+        self.is_sorted = True
+        self._indexed_bytes = 0
+        self._source_mtime_ns = 0
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def refresh(self) -> "EventFileIndex":
+        """
+        Bring the index up to date with the JSONL file.
+
+        Loads the sidecar if it matches, extends it when the file has grown
+        and rebuilds it when the file shrank.
+        """
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            self._reset()
+            return self
+
+        if not self.offsets and self._indexed_bytes == 0:
+            self._load_sidecar()
+
+        if stat.st_size < self._indexed_bytes or not self._ends_on_line_boundary():
+            # Truncated or replaced - start over
+            self._reset()
+
+        if stat.st_size > self._indexed_bytes:
+            self._scan_from(self._indexed_bytes)
+            self._source_mtime_ns = stat.st_mtime_ns
+            self._save_sidecar()
+        elif stat.st_mtime_ns != self._source_mtime_ns:
+            self._source_mtime_ns = stat.st_mtime_ns
+            self._save_sidecar()
+
+        return self
+
+    def _reset(self) -> None:
+        self.offsets = array("q")
+        self.timestamps = array("q")
+        self.is_sorted = True
+        self._indexed_bytes = 0
+        self._source_mtime_ns = 0
+
+    def _ends_on_line_boundary(self) -> bool:
+        """Cheap sanity check that the indexed prefix still ends with a newline."""
+        if self._indexed_bytes == 0:
+            return True
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self._indexed_bytes - 1)
+                return f.read(1) == b"\n"
+        except OSError:
+            return False
+
+    def _scan_from(self, start: int) -> None:
+        """Index complete lines from byte offset start onwards."""
+        last_ts = self.timestamps[-1] if self.timestamps else MISSING_TIMESTAMP
+        position = start
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Partial line still being written - pick it up next refresh
+                    break
+                if line.strip():
+                    ts = _extract_timestamp_ns(line)
+                    if ts < last_ts:
+                        self.is_sorted = False
+                    last_ts = ts
+                    self.offsets.append(position)
+                    self.timestamps.append(ts)
+                position += len(line)
+        self._indexed_bytes = position
+
+    def _load_sidecar(self) -> None:
+        try:
+            with open(self.index_path, "rb") as f:
+                header = f.read(_HEADER.size)
+                if len(header) != _HEADER.size:
+                    return
+                magic, indexed_bytes, mtime_ns, count, sorted_flag = _HEADER.unpack(header)
+                if magic != INDEX_MAGIC:
+                    return
+                records = array("q")
+                records.frombytes(f.read(count * 16))
+        except (OSError, ValueError):
+            return
+        if len(records) != count * 2:
+            return
+        self.offsets = records[0::2]
+        self.timestamps = records[1::2]
+        self.is_sorted = bool(sorted_flag)
+        self._indexed_bytes = indexed_bytes
+        self._source_mtime_ns = mtime_ns
+
+    def _save_sidecar(self) -> None:
+        """Persist the index atomically; an unwritable directory keeps it in memory only."""
+        records = array("q", bytes(len(self.offsets) * 16))
+        records[0::2] = self.offsets
+        records[1::2] = self.timestamps
+        tmp_path = self.index_path.with_name(self.index_path.name + f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(
+                    _HEADER.pack(
+                        INDEX_MAGIC,
+                        self._indexed_bytes,
+                        self._source_mtime_ns,
+                        len(self.offsets),
+                        1 if self.is_sorted else 0,
+                    )
+                )
+                f.write(records.tobytes())
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def position_range(self, start_ns: Optional[int], end_ns: Optional[int]) -> Tuple[int, int]:
+        """Index positions [lo, hi) bounding the time range for sorted streams."""
+        lo, hi = 0, len(self.timestamps)
+        if not self.is_sorted:
+            return lo, hi
+        if start_ns is not None:
+            lo = bisect_left(self.timestamps, start_ns)
+        if end_ns is not None:
+            hi = bisect_right(self.timestamps, end_ns)
+        return lo, hi
+
+
+@dataclass
+class EventQuery:
+    """
+    Filter applied to the event streams.
+
+    Attributes:
+        event_types: JSONL streams to read (None = all available)
+        start: Inclusive lower bound on the engine timestamp
+        end: Inclusive upper bound on the engine timestamp
+        instrument: Instrument key that must appear in the event
+    """
+
+    event_types: Optional[List[str]] = None
+    start: Optional[Any] = None
+    end: Optional[Any] = None
+    instrument: Optional[str] = None
+
+
+@dataclass
+class EventPage:
+    """One page of query results."""
+
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    total_events: Optional[int] = None  # None when an instrument filter makes it unknown
+
+
+class EventQueryEngine:
+    """
+    Read-only query engine over a run's events/ directory.
+
+    Usage:
+        engine = EventQueryEngine(log_dir / "events")
+        page = engine.query(EventQuery(event_types=["orders"]), limit=100)
+        for line in engine.stream(EventQuery(instrument="binance:Perp:BTCUSDT")):
+            ...
+    """
+
+    def __init__(self, events_dir: Path):
+        self.events_dir = Path(events_dir)
+        self._indexes: Dict[str, EventFileIndex] = {}
+
+    def available_event_types(self) -> List[str]:
+        """List event types that have a JSONL stream on disk."""
+        if not self.events_dir.is_dir():
+            return []
+        return sorted(p.stem for p in self.events_dir.glob("*.jsonl"))
+
+    def get_index(self, event_type: str) -> EventFileIndex:
+        """Get the (refreshed) index for an event type."""
+        index = self._indexes.get(event_type)
+        if index is None:
+            index = EventFileIndex(self.events_dir / f"{event_type}.jsonl")
+            self._indexes[event_type] = index
+        return index.refresh()
+
+    def validate(self, query: EventQuery, cursor: Optional[str] = None) -> None:
+        """
+        Check filters and cursor without reading any events.
+
+        Raises:
+            ValueError: On unknown event types, an inverted time range or a bad cursor
+        """
+        self._resolve_types(query)
+        self._bounds(query)
+        if cursor:
+            self._decode_cursor(cursor)
+
+    def count(self, query: EventQuery) -> Optional[int]:
+        """
+        Count matching events using only the indexes.
+
+        Returns:
+            Number of matches, or None if an instrument filter requires a scan
+        """
+        if query.instrument:
+            return None
+        start_ns, end_ns = self._bounds(query)
+        total = 0
+        for event_type in self._resolve_types(query):
+            total += sum(1 for _ in self._positions(self.get_index(event_type), start_ns, end_ns, 0))
+        return total
+
+    def query(
+        self,
+        query: EventQuery,
+        limit: int,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> EventPage:
+        """
+        Return one page of events in timestamp order.
+
+        Args:
+            query: Filters to apply
+            limit: Maximum number of events in the page
+            offset: Number of matching events to skip (ignored when cursor is given)
+            cursor: Opaque cursor from a previous page's next_cursor
+
+        Returns:
+            EventPage with parsed events and a cursor for the next page
+        """
+        if limit <= 0:
+            raise ValueError(f"limit must be positive, got {limit}")
+        progress = self._decode_cursor(cursor) if cursor else {}
+        skip = 0 if cursor else offset
+
+        events: List[Dict[str, Any]] = []
+        exhausted = True
+        for event_type, pos, line in self._iter_matches(query, progress, skip):
+            if len(events) >= limit:
+                exhausted = False
+                break
+            event = json.loads(line)
+            event["event_type"] = event_type
+            events.append(event)
+            progress[event_type] = pos + 1
+
+        return EventPage(
+            events=events,
+            next_cursor=None if exhausted else self._encode_cursor(progress),
+            total_events=self.count(query),
+        )
+
+    def stream(self, query: EventQuery, cursor: Optional[str] = None) -> Iterator[bytes]:
+        """
+        Stream matching events as NDJSON lines.
+
+        Lines are passed through from disk with an "event_type" field
+        spliced in, so large exports never re-serialize events.
+        """
+        progress = self._decode_cursor(cursor) if cursor else {}
+        for event_type, _, line in self._iter_matches(query, progress):
+            line = line.rstrip(b"\r\n")
+            if line.startswith(b"{") and line != b"{}":
+                line = b'{"event_type":' + json.dumps(event_type).encode() + b"," + line[1:]
+            yield line + b"\n"
+
+    def _resolve_types(self, query: EventQuery) -> List[str]:
+        available = self.available_event_types()
+        if not query.event_types:
+            return available
+        unknown = [t for t in query.event_types if t not in available]
+        if unknown:
+            raise ValueError(f"Unknown event types: {unknown}. Available types: {available}")
+        return list(query.event_types)
+
+    @staticmethod
+    def _bounds(query: EventQuery) -> Tuple[Optional[int], Optional[int]]:
+        start_ns = to_timestamp_ns(query.start) if query.start is not None else None
+        end_ns = to_timestamp_ns(query.end) if query.end is not None else None
+        if start_ns is not None and end_ns is not None and start_ns > end_ns:
+            raise ValueError("start must not be after end")
+        return start_ns, end_ns
+
+    @staticmethod
+    def _positions(
+        index: EventFileIndex, start_ns: Optional[int], end_ns: Optional[int], begin: int
+    ) -> Iterator[int]:
+        """Index positions >= begin whose timestamps fall inside the range."""
+        lo, hi = index.position_range(start_ns, end_ns)
+        timestamps = index.timestamps
+        check = not index.is_sorted and (start_ns is not None or end_ns is not None)
+        for pos in range(max(lo, begin), hi):
+            if check:
+                ts = timestamps[pos]
+                if (start_ns is not None and ts < start_ns) or (end_ns is not None and ts > end_ns):
+                    continue
+            yield pos
+
+    def _iter_matches(
+        self, query: EventQuery, progress: Dict[str, int], skip: int = 0
+    ) -> Iterator[Tuple[str, int, bytes]]:
+        """
+        Yield (event_type, index_position, raw_line) merged by timestamp.
+
+        Args:
+            query: Filters to apply
+            progress: Per-type start positions; advanced past skipped matches
+            skip: Number of leading matches to drop (read from disk only if
+                an instrument filter has to inspect them)
+        """
+        start_ns, end_ns = self._bounds(query)
+        needle = query.instrument.encode() if query.instrument else None
+
+        handles: Dict[str, Any] = {}
+        streams = []
+        try:
+            for rank, event_type in enumerate(self._resolve_types(query)):
+                index = self.get_index(event_type)
+                if not len(index):
+                    continue
+                handles[event_type] = open(index.path, "rb")
+                streams.append(
+                    self._stream_entries(
+                        rank, event_type, index, start_ns, end_ns, progress.get(event_type, 0)
+                    )
+                )
+            for _, _, pos, event_type, offset in heapq.merge(*streams):
+                line = None
+                if needle is not None:
+                    line = self._read_line(handles[event_type], offset)
+                    if needle not in line or not _contains_instrument(
+                        json.loads(line), query.instrument
+                    ):
+                        continue
+                if skip:
+                    skip -= 1
+                    progress[event_type] = pos + 1
+                    continue
+                if line is None:
+                    line = self._read_line(handles[event_type], offset)
+                yield event_type, pos, line
+        finally:
+            for handle in handles.values():
+                handle.close()
+
+    def _stream_entries(self, rank, event_type, index, start_ns, end_ns, begin):
+        timestamps = index.timestamps
+        offsets = index.offsets
+        for pos in self._positions(index, start_ns, end_ns, begin):
+            yield timestamps[pos], rank, pos, event_type, offsets[pos]
+
+    @staticmethod
+    def _read_line(handle, offset: int) -> bytes:
+        handle.seek(offset)
+        return handle.readline()
+
+    @staticmethod
+    def _encode_cursor(positions: Dict[str, int]) -> str:
+        raw = json.dumps(positions, separators=(",", ":"), sort_keys=True).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Dict[str, int]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            positions = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if not isinstance(positions, dict):
+                raise ValueError("cursor payload must be an object")
+            return {str(k): int(v) for k, v in positions.items()}
+        except Exception as e:
+            raise ValueError(f"Invalid cursor: {e}") from e
+
+
+def find_events_directory(result_id: str, base_dir: str = "logs") -> Optional[Path]:
+    """
+    Locate the events/ directory for a run logged under logs/{correlation_id}/{pid}/.
+
+    Returns the most recently modified pid directory's events/ folder, or None.
+    """
+    run_dir = Path(base_dir) / result_id
+    if not run_dir.is_dir():
+        return None
+    candidates = [d / "events" for d in run_dir.iterdir() if (d / "events").is_dir()]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda d: d.stat().st_mtime)
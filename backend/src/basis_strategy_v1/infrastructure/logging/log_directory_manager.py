@@ -11,10 +11,33 @@ Reference: docs/LOGGING_GUIDE.md - Log Directory Structure
 
 import os
 import json
+import logging
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Optional
 
+# Shared component log files (backend/src/logs) written by module-level loggers
+COMPONENT_LOGS_DIR = Path(__file__).parent.parent.parent.parent / "logs"
+
+
+def attach_component_log_file(component_logger: logging.Logger, filename: str) -> None:
+    """
+    Attach a FileHandler for COMPONENT_LOGS_DIR/filename to a module-level logger.
+
+    Called when the component is first constructed rather than at import time, so
+    importing a module never creates directories or opens files. Idempotent.
+    """
+    log_path = (COMPONENT_LOGS_DIR / filename).resolve()
+    for handler in component_logger.handlers:
+        if isinstance(handler, logging.FileHandler) and Path(handler.baseFilename) == log_path:
+            return
+
+    COMPONENT_LOGS_DIR.mkdir(exist_ok=True)
+    handler = logging.FileHandler(log_path)
+    handler.setLevel(logging.INFO)
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    component_logger.addHandler(handler)
+
 
 class LogDirectoryManager:
     """
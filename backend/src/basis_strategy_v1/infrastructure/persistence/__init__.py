@@ -1,5 +1,6 @@
 """Persistence infrastructure."""
 
 from .result_store import ResultStore
+from .backtest_checkpoint import find_checkpoint, load_checkpoint, save_checkpoint
 
-__all__ = ["ResultStore"]
+__all__ = ["ResultStore", "find_checkpoint", "load_checkpoint", "save_checkpoint"]
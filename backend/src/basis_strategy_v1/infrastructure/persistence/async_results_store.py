@@ -71,6 +71,8 @@ class AsyncResultsStore:
         self.queue = asyncio.Queue()
         self.worker_task: Optional[asyncio.Task] = None
         self.is_running = False
+        # Timestep results written per request (checkpoint offsets)
+        self.timesteps_written: Dict[str, int] = {}
 
         # Get position subscriptions from utility manager config
         if utility_manager and hasattr(utility_manager, "config"):
@@ -218,6 +220,21 @@ class AsyncResultsStore:
 
         logger.info("AsyncResultsStore stopped")
 
+    async def flush(self):
+        """Wait until every queued result (including pending save tasks) is written."""
+        # Let save tasks scheduled with create_task enqueue their items first
+        await asyncio.sleep(0)
+        if self.is_running:
+            await self.queue.join()
+
+    def get_offsets(self, request_id: str) -> Dict[str, int]:
+        """Results written so far for a request (checkpoint offsets)."""
+        return {"timesteps_written": self.timesteps_written.get(request_id, 0)}
+
+    def restore_offsets(self, request_id: str, offsets: Dict[str, int]) -> None:
+        """Continue a request's offsets from a checkpoint."""
+        self.timesteps_written[request_id] = offsets.get("timesteps_written", 0)
+
     async def _worker(self):
         """Background worker processes queue in FIFO order."""
         logger.info("AsyncResultsStore worker started")
@@ -326,6 +343,7 @@ class AsyncResultsStore:
         try:
             with open(filepath, "w") as f:
                 json.dump(data, f, indent=2, default=str)
+            self.timesteps_written[request_id] = self.timesteps_written.get(request_id, 0) + 1
             logger.debug(f"Wrote timestep result: {filepath}")
         except Exception as e:
             logger.error(f"Failed to write timestep result {filepath}: {e}")
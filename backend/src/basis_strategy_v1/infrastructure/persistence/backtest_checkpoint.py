@@ -0,0 +1,128 @@
+"""
+Backtest Checkpoints
+
+Compact binary snapshots of a running backtest, written to the run's log directory:
+logs/{correlation_id}/{pid}/checkpoints/{request_id}.ckpt
+
+Key Principles:
+- A checkpoint holds everything needed to continue the run without recomputing history:
+  PositionMonitor positions, PnLMonitor baseline and history cursor, strategy state,
+  engine state (last timestamp, equity curve, stepping state) and results-store offsets
+- Snapshots are gzip-compressed pickles, replaced atomically (tmp file + os.replace)
+  so a crash mid-write never leaves a truncated checkpoint behind
+- The newest checkpoint for a request wins; a resumed run writes into its own log directory
+- Written every BASIS_BACKTEST__CHECKPOINT_EVERY processed ticks (0 disables periodic
+  checkpoints) and once at completion so finished runs can be extended
+"""
+
+import glob
+import gzip
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FORMAT_VERSION = 1
+CHECKPOINT_DIR = "checkpoints"
+CHECKPOINT_SUFFIX = ".ckpt"
+DEFAULT_CHECKPOINT_EVERY = 1000
+
+
+def get_checkpoint_interval() -> int:
+    """Processed ticks between periodic checkpoints (0 disables them)."""
+    value = os.getenv("BASIS_BACKTEST__CHECKPOINT_EVERY")
+    if value is None or value == "":
+        return DEFAULT_CHECKPOINT_EVERY
+    try:
+        interval = int(value)
+    except ValueError:
+        raise ValueError(f"Invalid BASIS_BACKTEST__CHECKPOINT_EVERY: {value}. Must be an integer.")
+    if interval < 0:
+        raise ValueError(f"Invalid BASIS_BACKTEST__CHECKPOINT_EVERY: {value}. Must be >= 0.")
+    return interval
+
+
+def _validate_request_id(request_id: str) -> None:
+    """Request IDs become file names: reject empty IDs, separators and '.'/'..'."""
+    if not request_id or request_id in (".", "..") or Path(request_id).name != request_id:
+        raise ValueError(f"Invalid backtest request ID: {request_id!r}")
+
+
+def checkpoint_path(log_dir: Path, request_id: str) -> Path:
+    """Checkpoint file of a request inside a run's log directory."""
+    _validate_request_id(request_id)
+    return Path(log_dir) / CHECKPOINT_DIR / f"{request_id}{CHECKPOINT_SUFFIX}"
+
+
+def save_checkpoint(log_dir: Path, request_id: str, state: Dict[str, Any]) -> Path:
+    """
+    Atomically write a checkpoint.
+
+    Args:
+        log_dir: Run log directory (logs/{correlation_id}/{pid}/)
+        request_id: Backtest request the checkpoint belongs to
+        state: Run state (must be picklable)
+
+    Returns:
+        Path: Written checkpoint file
+    """
+    path = checkpoint_path(log_dir, request_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    payload = {"version": CHECKPOINT_FORMAT_VERSION, "request_id": request_id, "state": state}
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+    logger.debug(f"Wrote backtest checkpoint: {path}")
+    return path
+
+
+def load_checkpoint(path: Path) -> Dict[str, Any]:
+    """
+    Load a checkpoint written by save_checkpoint.
+
+    Raises:
+        ValueError: If the file is not a checkpoint of a supported version
+    """
+    with gzip.open(path, "rb") as f:
+        payload = pickle.load(f)
+
+    if not isinstance(payload, dict) or payload.get("version") != CHECKPOINT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported checkpoint format: {path}")
+    return payload["state"]
+
+
+def find_checkpoint(
+    request_id: str, log_dirs: Iterable[Path] = (), base_dir: str = "logs"
+) -> Optional[Path]:
+    """
+    Find the newest checkpoint of a request.
+
+    Args:
+        request_id: Backtest request ID
+        log_dirs: Known log directories of the request, searched first
+        base_dir: Log root scanned for logs/*/*/checkpoints/{request_id}.ckpt
+
+    Returns:
+        Optional[Path]: Newest checkpoint, or None if the request has none
+
+    Raises:
+        ValueError: If request_id is not a plain file name
+    """
+    _validate_request_id(request_id)
+    candidates = [checkpoint_path(log_dir, request_id) for log_dir in log_dirs if log_dir]
+    candidates = [path for path in candidates if path.exists()]
+    if not candidates:
+        candidates = list(
+            Path(base_dir).glob(
+                f"*/*/{CHECKPOINT_DIR}/{glob.escape(request_id)}{CHECKPOINT_SUFFIX}"
+            )
+        )
+    if not candidates:
+        return None
+    return max(candidates, key=lambda path: path.stat().st_mtime)
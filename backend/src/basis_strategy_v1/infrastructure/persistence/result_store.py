@@ -2,6 +2,7 @@
 
 from pathlib import Path
 from typing import Dict, List, Optional, Any
+import gzip
 import json
 import glob
 import structlog
@@ -20,6 +21,8 @@ class ResultStore:
     as directories containing CSV files and charts.
     """
 
+    FULL_RESULTS_FILE = "full_results.json.gz"
+
     def __init__(self, base_path: str = "results"):
         """Initialize with base results directory."""
         self.base_path = Path(base_path).resolve()
@@ -56,6 +59,8 @@ class ResultStore:
                 "max_drawdown": result.get("max_drawdown", 0),
                 "total_trades": result.get("total_trades", 0),
                 "chart_paths": result.get("chart_paths", []),
+                "log_dir": result.get("log_dir"),
+                "extends": result.get("extends"),
             }
 
             with open(summary_file, "w") as f:
@@ -63,6 +68,10 @@ class ResultStore:
 
             logger.info("Result summary saved", request_id=request_id, result_dir=str(result_dir))
 
+            # Spill the full results so in-memory registries only keep summaries
+            if full_results:
+                self._write_full_results(result_dir, full_results)
+
             # Generate CSV files and charts using ChartGenerator
             try:
                 from ..visualization.chart_generator import ChartGenerator
@@ -118,6 +127,33 @@ class ResultStore:
             logger.error("Failed to get result", request_id=request_id, error=str(e))
             return None
 
+    async def load_full_results(self, request_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the full results payload spilled by save_result.
+
+        Returns None if the result or its full_results file does not exist.
+        """
+        try:
+            candidates = sorted(glob.glob(str(self.base_path / f"{request_id}_*")))
+            for candidate in candidates:
+                full_results_file = Path(candidate) / self.FULL_RESULTS_FILE
+                if full_results_file.exists():
+                    with gzip.open(full_results_file, "rt") as f:
+                        return json.load(f)
+            return None
+
+        except Exception as e:
+            logger.error("Failed to load full results", request_id=request_id, error=str(e))
+            return None
+
+    def _write_full_results(self, result_dir: Path, full_results: Dict[str, Any]) -> None:
+        """Write full results as gzipped JSON (atomic replace)."""
+        target = result_dir / self.FULL_RESULTS_FILE
+        tmp_path = target.with_name(target.name + ".tmp")
+        with gzip.open(tmp_path, "wt") as f:
+            json.dump(full_results, f, default=str)
+        tmp_path.replace(target)
+
     async def list_results(
         self, strategy_filter: Optional[str] = None, limit: int = 1000, offset: int = 0
     ) -> List[Dict[str, Any]]:
@@ -1,5 +1,14 @@
-"""Visualization infrastructure for charts and graphs."""
+"""Visualization infrastructure for charts and graphs.
 
-from .chart_generator import ChartGenerator
+ChartGenerator (plotly) is imported on first attribute access.
+"""
+
+import importlib
 
 __all__ = ["ChartGenerator"]
+
+
+def __getattr__(name):
+    if name == "ChartGenerator":
+        return importlib.import_module(".chart_generator", __name__).ChartGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -24,6 +24,7 @@ Data Sources:
 - Risk parameters: data/protocol_data/aave/risk_params/aave_v3_risk_parameters.json
 """
 
+import sys
 import pandas as pd
 import numpy as np
 import json
@@ -35,6 +36,10 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from dataclasses import dataclass
 
+# Add the backend source to path for imports
+sys.path.append(str(Path(__file__).parent.parent.parent / "backend" / "src"))
+from basis_strategy_v1.infrastructure.data.columnar_cache import read_csv_columnar
+
 
 @dataclass
 class StrategyConfig:
@@ -112,46 +117,38 @@ class LeveragedRestakingAnalyzer:
         
         # Load weETH rates
         weeth_rates_file = self.data_dir / "protocol_data" / "aave" / "rates" / "aave_v3_aave-v3-ethereum_weETH_rates_2024-05-12_2025-09-18_hourly.csv"
-        self.data['weeth_rates'] = pd.read_csv(weeth_rates_file)
-        self.data['weeth_rates']['timestamp'] = pd.to_datetime(self.data['weeth_rates']['timestamp'])
+        self.data['weeth_rates'] = read_csv_columnar(weeth_rates_file, index_col=None, parse_dates=['timestamp'], writable=True)
         self.data['weeth_rates'] = self.data['weeth_rates'].set_index('timestamp').sort_index()
         
         # Load WETH rates
         weth_rates_file = self.data_dir / "protocol_data" / "aave" / "rates" / "aave_v3_aave-v3-ethereum_WETH_rates_2024-01-01_2025-09-18_hourly.csv"
-        self.data['weth_rates'] = pd.read_csv(weth_rates_file)
-        self.data['weth_rates']['timestamp'] = pd.to_datetime(self.data['weth_rates']['timestamp'])
+        self.data['weth_rates'] = read_csv_columnar(weth_rates_file, index_col=None, parse_dates=['timestamp'], writable=True)
         self.data['weth_rates'] = self.data['weth_rates'].set_index('timestamp').sort_index()
         
         # Load staking yields (daily data at 00:00 UTC)
         staking_file = self.data_dir / "protocol_data" / "staking" / "base_yields" / "weeth_oracle_yields_2024-01-01_2025-09-18.csv"
-        self.data['staking_yields'] = pd.read_csv(staking_file)
+        self.data['staking_yields'] = read_csv_columnar(staking_file, index_col=None, parse_dates=['date'], writable=True)
         self.data['staking_yields']['timestamp'] = pd.to_datetime(self.data['staking_yields']['timestamp'].str.replace('Z', ''))
-        self.data['staking_yields']['date'] = pd.to_datetime(self.data['staking_yields']['date'])
         
         # Load seasonal rewards
         seasonal_file = self.data_dir / "protocol_data" / "staking" / "restaking_final" / "etherfi_seasonal_rewards_2024-01-01_2025-09-18.csv"
-        self.data['seasonal_rewards'] = pd.read_csv(seasonal_file)
-        self.data['seasonal_rewards']['payout_date'] = pd.to_datetime(self.data['seasonal_rewards']['payout_date'])
-        self.data['seasonal_rewards']['period_start'] = pd.to_datetime(self.data['seasonal_rewards']['period_start'])
-        self.data['seasonal_rewards']['period_end'] = pd.to_datetime(self.data['seasonal_rewards']['period_end'])
+        self.data['seasonal_rewards'] = read_csv_columnar(seasonal_file, index_col=None, parse_dates=['payout_date', 'period_start', 'period_end'], writable=True)
         
         # Load gas costs
         gas_file = self.data_dir / "blockchain_data" / "gas_prices" / "ethereum_gas_prices_enhanced_2024-01-01_2025-09-26.csv"
-        self.data['gas_costs'] = pd.read_csv(gas_file)
-        self.data['gas_costs']['timestamp'] = pd.to_datetime(self.data['gas_costs']['timestamp'])
+        self.data['gas_costs'] = read_csv_columnar(gas_file, index_col=None, parse_dates=['timestamp'], writable=True)
         self.data['gas_costs'] = self.data['gas_costs'].set_index('timestamp').sort_index()
         
         # Load oracle prices
         oracle_file = self.data_dir / "protocol_data" / "aave" / "oracle" / "weETH_ETH_oracle_2024-01-01_2025-09-18.csv"
-        self.data['oracle_prices'] = pd.read_csv(oracle_file, comment='#')
-        self.data['oracle_prices']['timestamp'] = pd.to_datetime(self.data['oracle_prices']['timestamp'])
+        self.data['oracle_prices'] = read_csv_columnar(oracle_file, index_col=None, parse_dates=['timestamp'], comment='#', writable=True)
         self.data['oracle_prices'] = self.data['oracle_prices'].set_index('timestamp').sort_index()
         
         # Load Ethena benchmark (optional - for comparison)
         ethena_file = self.data_dir / "protocol_data" / "staking" / "benchmark_yields" / "ethena_susde_apr_benchmark_hourly_2024-02-16_2025-09-18.csv"
         if ethena_file.exists():
-            self.data['ethena_benchmark'] = pd.read_csv(ethena_file)
-            self.data['ethena_benchmark']['timestamp'] = pd.to_datetime(self.data['ethena_benchmark']['timestamp']).dt.tz_localize('UTC')
+            self.data['ethena_benchmark'] = read_csv_columnar(ethena_file, index_col=None, parse_dates=['timestamp'], writable=True)
+            self.data['ethena_benchmark']['timestamp'] = self.data['ethena_benchmark']['timestamp'].dt.tz_localize('UTC')
             self.data['ethena_benchmark'] = self.data['ethena_benchmark'].set_index('timestamp').sort_index()
             self.logger.info(f"  Ethena benchmark: {len(self.data['ethena_benchmark'])} records")
         else:
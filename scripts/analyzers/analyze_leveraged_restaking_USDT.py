@@ -22,6 +22,7 @@ Data Sources:
 - (Plus all the weETH/WETH AAVE rates, staking yields, etc. from ETH version)
 """
 
+import sys
 import pandas as pd
 import numpy as np
 import json
@@ -33,6 +34,10 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from dataclasses import dataclass
 
+# Add the backend source to path for imports
+sys.path.append(str(Path(__file__).parent.parent.parent / "backend" / "src"))
+from basis_strategy_v1.infrastructure.data.columnar_cache import read_csv_columnar
+
 
 @dataclass
 class StrategyConfig:
@@ -114,25 +119,22 @@ class USDTLeveragedRestakingAnalyzer:
         
         # Load weETH rates
         weeth_rates_file = self.data_dir / "protocol_data" / "aave" / "rates" / "aave_v3_aave-v3-ethereum_weETH_rates_2024-05-12_2025-09-18_hourly.csv"
-        self.data['weeth_rates'] = pd.read_csv(weeth_rates_file)
-        self.data['weeth_rates']['timestamp'] = pd.to_datetime(self.data['weeth_rates']['timestamp'])
+        self.data['weeth_rates'] = read_csv_columnar(weeth_rates_file, index_col=None, parse_dates=['timestamp'], writable=True)
         self.data['weeth_rates'] = self.data['weeth_rates'].set_index('timestamp').sort_index()
         
         # Load WETH rates
         weth_rates_file = self.data_dir / "protocol_data" / "aave" / "rates" / "aave_v3_aave-v3-ethereum_WETH_rates_2024-01-01_2025-09-18_hourly.csv"
-        self.data['weth_rates'] = pd.read_csv(weth_rates_file)
-        self.data['weth_rates']['timestamp'] = pd.to_datetime(self.data['weth_rates']['timestamp'])
+        self.data['weth_rates'] = read_csv_columnar(weth_rates_file, index_col=None, parse_dates=['timestamp'], writable=True)
         self.data['weth_rates'] = self.data['weth_rates'].set_index('timestamp').sort_index()
         
         # Load staking yields (base yield only - no seasonal rewards)
         staking_file = self.data_dir / "protocol_data" / "staking" / "base_yields" / "weeth_oracle_yields_2024-01-01_2025-09-18.csv"
-        self.data['staking_yields'] = pd.read_csv(staking_file)
+        self.data['staking_yields'] = read_csv_columnar(staking_file, index_col=None, parse_dates=['date'], writable=True)
         self.data['staking_yields']['timestamp'] = pd.to_datetime(self.data['staking_yields']['timestamp'].str.replace('Z', ''))
-        self.data['staking_yields']['date'] = pd.to_datetime(self.data['staking_yields']['date'])
         
         # Load spot prices (for WETH/USDT conversions)
         spot_file = self.data_dir / "market_data" / "spot_prices" / "eth_usd" / "uniswapv3_WETHUSDT_1h_2024-01-01_2025-09-27.csv"
-        self.data['spot_prices'] = pd.read_csv(spot_file)
+        self.data['spot_prices'] = read_csv_columnar(spot_file, index_col=None, parse_dates=False, writable=True)
         # Parse as Unix timestamps (seconds since epoch)
         self.data['spot_prices']['timestamp'] = pd.to_datetime(self.data['spot_prices']['timestamp'], unit='s', utc=True)
         self.data['spot_prices'] = self.data['spot_prices'].set_index('timestamp').sort_index()
@@ -141,16 +143,14 @@ class USDTLeveragedRestakingAnalyzer:
         
         # Load Binance futures prices (for perp hedge)
         futures_file = self.data_dir / "market_data" / "derivatives" / "futures_ohlcv" / "binance_ETHUSDT_perp_1h_2024-01-01_2025-09-26.csv"
-        self.data['futures_prices'] = pd.read_csv(futures_file)
-        self.data['futures_prices']['timestamp'] = pd.to_datetime(self.data['futures_prices']['timestamp'], utc=True)
+        self.data['futures_prices'] = read_csv_columnar(futures_file, index_col=None, parse_dates=['timestamp'], writable=True)
         # Handle duplicate timestamps by keeping the last occurrence
         self.data['futures_prices'] = self.data['futures_prices'].drop_duplicates(subset=['timestamp'], keep='last')
         self.data['futures_prices'] = self.data['futures_prices'].set_index('timestamp').sort_index()
         
         # Load Bybit futures prices (for perp hedge) - PHASE 1 FIX
         bybit_futures_file = self.data_dir / "market_data" / "derivatives" / "futures_ohlcv" / "bybit_ETHUSDT_perp_1h_2024-01-01_2025-09-26.csv"
-        self.data['bybit_futures'] = pd.read_csv(bybit_futures_file)
-        self.data['bybit_futures']['timestamp'] = pd.to_datetime(self.data['bybit_futures']['timestamp'], utc=True)
+        self.data['bybit_futures'] = read_csv_columnar(bybit_futures_file, index_col=None, parse_dates=['timestamp'], writable=True)
         # Handle duplicate timestamps by keeping the last occurrence
         self.data['bybit_futures'] = self.data['bybit_futures'].drop_duplicates(subset=['timestamp'], keep='last')
         self.data['bybit_futures'] = self.data['bybit_futures'].set_index('timestamp').sort_index()
@@ -158,8 +158,7 @@ class USDTLeveragedRestakingAnalyzer:
         # Load OKX futures prices (if available) - use when available, fallback to Binance proxy
         okx_futures_file = self.data_dir / "market_data" / "derivatives" / "futures_ohlcv" / "okx_ETHUSDT_perp_1h_2024-08-01_2025-09-18.csv"
         if okx_futures_file.exists():
-            self.data['okx_futures'] = pd.read_csv(okx_futures_file)
-            self.data['okx_futures']['timestamp'] = pd.to_datetime(self.data['okx_futures']['timestamp'], utc=True)
+            self.data['okx_futures'] = read_csv_columnar(okx_futures_file, index_col=None, parse_dates=['timestamp'], writable=True)
             # Handle duplicate timestamps by keeping the last occurrence
             self.data['okx_futures'] = self.data['okx_futures'].drop_duplicates(subset=['timestamp'], keep='last')
             self.data['okx_futures'] = self.data['okx_futures'].set_index('timestamp').sort_index()
@@ -170,21 +169,21 @@ class USDTLeveragedRestakingAnalyzer:
         
         # Load Binance funding rates  
         funding_file = self.data_dir / "market_data" / "derivatives" / "funding_rates" / "binance_ETHUSDT_funding_rates_2024-01-01_2025-09-26.csv"
-        self.data['funding_rates'] = pd.read_csv(funding_file)
-        self.data['funding_rates']['timestamp'] = pd.to_datetime(self.data['funding_rates']['funding_timestamp'], format='ISO8601', utc=True)
+        self.data['funding_rates'] = read_csv_columnar(funding_file, index_col=None, parse_dates=['funding_timestamp'], writable=True)
+        self.data['funding_rates']['timestamp'] = self.data['funding_rates']['funding_timestamp']
         self.data['funding_rates'] = self.data['funding_rates'].set_index('timestamp').sort_index()
         
         # Load Bybit funding rates
         bybit_funding_file = self.data_dir / "market_data" / "derivatives" / "funding_rates" / "bybit_ETHUSDT_funding_rates_2024-01-01_2025-09-26.csv"
-        self.data['bybit_funding'] = pd.read_csv(bybit_funding_file)
-        self.data['bybit_funding']['timestamp'] = pd.to_datetime(self.data['bybit_funding']['funding_timestamp'], format='ISO8601', utc=True)
+        self.data['bybit_funding'] = read_csv_columnar(bybit_funding_file, index_col=None, parse_dates=['funding_timestamp'], writable=True)
+        self.data['bybit_funding']['timestamp'] = self.data['bybit_funding']['funding_timestamp']
         self.data['bybit_funding'] = self.data['bybit_funding'].set_index('timestamp').sort_index()
         
         # Load OKX funding rates (if available)
         okx_funding_file = self.data_dir / "market_data" / "derivatives" / "funding_rates" / "okx_ETHUSDT_funding_rates_2024-01-01_2025-09-18.csv"
         if okx_funding_file.exists():
-            self.data['okx_funding'] = pd.read_csv(okx_funding_file)
-            self.data['okx_funding']['timestamp'] = pd.to_datetime(self.data['okx_funding']['funding_timestamp'], format='ISO8601', utc=True)
+            self.data['okx_funding'] = read_csv_columnar(okx_funding_file, index_col=None, parse_dates=['funding_timestamp'], writable=True)
+            self.data['okx_funding']['timestamp'] = self.data['okx_funding']['funding_timestamp']
             self.data['okx_funding'] = self.data['okx_funding'].set_index('timestamp').sort_index()
             self.logger.info(f"  OKX funding rates: {len(self.data['okx_funding'])} records")
         else:
@@ -193,27 +192,25 @@ class USDTLeveragedRestakingAnalyzer:
         
         # Load oracle prices
         oracle_file = self.data_dir / "protocol_data" / "aave" / "oracle" / "weETH_ETH_oracle_2024-01-01_2025-09-18.csv"
-        self.data['oracle_prices'] = pd.read_csv(oracle_file, comment='#')
-        self.data['oracle_prices']['timestamp'] = pd.to_datetime(self.data['oracle_prices']['timestamp'])
+        self.data['oracle_prices'] = read_csv_columnar(oracle_file, index_col=None, parse_dates=['timestamp'], comment='#', writable=True)
         self.data['oracle_prices'] = self.data['oracle_prices'].set_index('timestamp').sort_index()
         
         # Load gas costs
         gas_file = self.data_dir / "blockchain_data" / "gas_prices" / "ethereum_gas_prices_enhanced_2024-01-01_2025-09-26.csv"
-        self.data['gas_costs'] = pd.read_csv(gas_file)
-        self.data['gas_costs']['timestamp'] = pd.to_datetime(self.data['gas_costs']['timestamp'])
+        self.data['gas_costs'] = read_csv_columnar(gas_file, index_col=None, parse_dates=['timestamp'], writable=True)
         self.data['gas_costs'] = self.data['gas_costs'].set_index('timestamp').sort_index()
         
         # Load execution costs
         exec_cost_file = self.data_dir / "execution_costs" / "execution_cost_simulation_results.csv"
-        self.data['execution_costs'] = pd.read_csv(exec_cost_file)
+        self.data['execution_costs'] = read_csv_columnar(exec_cost_file, index_col=None, parse_dates=['timestamp'], writable=True)
         self.data['execution_costs']['timestamp'] = pd.to_datetime(self.data['execution_costs']['timestamp'], utc=True)
         self.data['execution_costs'] = self.data['execution_costs'].set_index('timestamp').sort_index()
         
         # Load Ethena benchmark (optional - for comparison)
         ethena_file = self.data_dir / "protocol_data" / "staking" / "benchmark_yields" / "ethena_susde_apr_benchmark_hourly_2024-02-16_2025-09-18.csv"
         if ethena_file.exists():
-            self.data['ethena_benchmark'] = pd.read_csv(ethena_file)
-            self.data['ethena_benchmark']['timestamp'] = pd.to_datetime(self.data['ethena_benchmark']['timestamp']).dt.tz_localize('UTC')
+            self.data['ethena_benchmark'] = read_csv_columnar(ethena_file, index_col=None, parse_dates=['timestamp'], writable=True)
+            self.data['ethena_benchmark']['timestamp'] = self.data['ethena_benchmark']['timestamp'].dt.tz_localize('UTC')
             self.data['ethena_benchmark'] = self.data['ethena_benchmark'].set_index('timestamp').sort_index()
             self.logger.info(f"  Ethena benchmark: {len(self.data['ethena_benchmark'])} records")
         else:
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Domain Event Serialization Benchmark
+
+Compares events/sec for building and encoding the per-tick PositionSnapshot: validated
+construction with pydantic model_dump_json (the previous path), model_construct with the
+orjson encoder, and model_construct with the length-prefixed msgpack format (when
+msgpack is installed). Also times full DomainEventLogger writes for each format.
+
+Usage:
+    python scripts/benchmark_domain_events.py [--events 50000] [--positions 40]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the backend src to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend', 'src'))
+
+from basis_strategy_v1.core.models.domain_events import PositionSnapshot  # noqa: E402
+from basis_strategy_v1.infrastructure.logging import domain_event_logger  # noqa: E402
+from basis_strategy_v1.infrastructure.logging.domain_event_logger import (  # noqa: E402
+    DomainEventLogger,
+    encode_event_json,
+    encode_event_msgpack,
+)
+
+
+def make_positions(count: int) -> dict:
+    """A positions dict shaped like PositionMonitor's simulated book."""
+    venues = ['wallet', 'aave_v3', 'binance', 'bybit', 'okx', 'etherfi']
+    return {
+        f'{venues[i % len(venues)]}:BaseToken:TOKEN{i}': 1000.0 + i * 0.125
+        for i in range(count)
+    }
+
+
+def snapshot_fields(positions: dict, i: int) -> dict:
+    return dict(
+        timestamp=f'2024-06-01T00:00:{i % 60:02d}',
+        real_utc_time='2024-06-01T00:00:00.000000+00:00',
+        correlation_id='benchmark',
+        pid=12345,
+        positions=positions.copy(),
+        total_value_usd=float(i),
+        position_type='simulated',
+        trigger_source='benchmark',
+        metadata={},
+    )
+
+
+def events_per_sec(fn, events: int) -> float:
+    """Calls of fn(i) per second over events iterations (after a warm-up)."""
+    for i in range(min(events, 1000)):
+        fn(i)
+    start = time.perf_counter()
+    for i in range(events):
+        fn(i)
+    return events / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--events', type=int, default=50000)
+    parser.add_argument('--positions', type=int, default=40)
+    args = parser.parse_args()
+
+    positions = make_positions(args.positions)
+
+    def validated_pydantic(i):
+        PositionSnapshot(**snapshot_fields(positions, i)).model_dump_json().encode()
+
+    def constructed_orjson(i):
+        encode_event_json(PositionSnapshot.model_construct(**snapshot_fields(positions, i)))
+
+    def constructed_msgpack(i):
+        encode_event_msgpack(PositionSnapshot.model_construct(**snapshot_fields(positions, i)))
+
+    options = [('validate + model_dump_json', validated_pydantic)]
+    if domain_event_logger.orjson is not None:
+        options.append(('model_construct + orjson', constructed_orjson))
+    if domain_event_logger.msgpack is not None:
+        options.append(('model_construct + msgpack', constructed_msgpack))
+
+    print(f'events: {args.events}, positions per snapshot: {args.positions}')
+    print('build + encode:')
+    baseline = None
+    for label, fn in options:
+        rate = events_per_sec(fn, args.events)
+        baseline = baseline or rate
+        print(f'  {label:28s} {rate:12,.0f} events/s  ({rate / baseline:.1f}x)')
+
+    print('build + encode + append to file (DomainEventLogger):')
+    formats = ['jsonl'] + (['msgpack'] if domain_event_logger.msgpack is not None else [])
+    for event_format in formats:
+        log_dir = Path(tempfile.mkdtemp(prefix='domain_event_benchmark_'))
+        event_logger = DomainEventLogger(log_dir, 'benchmark', 12345, event_format=event_format)
+
+        def write(i):
+            event_logger.log_position_snapshot(
+                PositionSnapshot.model_construct(**snapshot_fields(positions, i))
+            )
+
+        rate = events_per_sec(write, args.events)
+        size = event_logger.event_files['positions'].stat().st_size
+        print(f'  {event_format:28s} {rate:12,.0f} events/s  ({size / 1e6:.1f} MB written)')
+
+    if domain_event_logger.orjson is None:
+        print('orjson not installed: JSONL falls back to model_dump_json')
+    if domain_event_logger.msgpack is None:
+        print('msgpack not installed: msgpack format skipped')
+
+
+if __name__ == '__main__':
+    main()
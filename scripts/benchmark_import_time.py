@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Import-Time Benchmark
+
+Measures cold-start import cost of the strategy engine and the API with
+`python -X importtime` in fresh interpreters, lists the slowest modules and reports
+which heavy optional subsystems (ccxt, web3, eth_abi, plotly, aiohttp) were loaded.
+
+Usage:
+    python scripts/benchmark_import_time.py [--runs 5] [--top 10] [--check] [--env-file .env.dev]
+
+With --check the script exits non-zero when an optional subsystem is imported by a
+target that should not need it.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+BACKEND_SRC = os.path.join(ROOT, 'backend', 'src')
+
+TARGETS = {
+    'engine': 'basis_strategy_v1.core.event_engine.event_driven_strategy_engine',
+    'api': 'basis_strategy_v1.api.main',
+}
+
+# Only needed for live trading, live data or chart generation
+OPTIONAL_SUBSYSTEMS = ('ccxt', 'web3', 'eth_abi', 'plotly', 'aiohttp')
+
+
+def load_env(env_file: str) -> Dict[str, str]:
+    """Process environment with PYTHONPATH set and env_file values as defaults."""
+    env = dict(os.environ, PYTHONPATH=BACKEND_SRC)
+    if os.path.exists(env_file):
+        with open(env_file) as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#') and '=' in line:
+                    key, value = line.split('=', 1)
+                    env.setdefault(key.strip(), value.strip())
+    return env
+
+
+def import_profile(module: str, env: Dict[str, str]) -> List[Tuple[str, int, int]]:
+    """(module, self us, cumulative us) rows from one cold `python -X importtime` run."""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def measure(module: str, runs: int, env: Dict[str, str]) -> Dict:
+    """Median cold import time of module, its slowest modules and optional subsystems loaded."""
+    totals = []
+    profile = []
+    for _ in range(runs):
+        profile = import_profile(module, env)
+        totals.append(max(cumulative for _, _, cumulative in profile))
+    loaded = {name.split('.')[0] for name, _, _ in profile}
+    return {
+        'median_ms': statistics.median(totals) / 1e3,
+        'min_ms': min(totals) / 1e3,
+        'slowest': sorted(profile, key=lambda row: row[1], reverse=True),
+        'optional_loaded': [name for name in OPTIONAL_SUBSYSTEMS if name in loaded],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--check', action='store_true', help='Fail if optional subsystems load')
+    parser.add_argument('--env-file', default=os.path.join(ROOT, '.env.dev'),
+                        help='Startup env defaults (the API reads BASIS_API_PORT at import)')
+    args = parser.parse_args()
+    env = load_env(args.env_file)
+
+    failed = False
+    for label, module in TARGETS.items():
+        result = measure(module, args.runs, env)
+        print(f'{label} ({module})')
+        print(f'  cold import: median {result["median_ms"]:8.1f} ms, '
+              f'min {result["min_ms"]:8.1f} ms over {args.runs} runs')
+        print(f'  optional subsystems loaded: {result["optional_loaded"] or "none"}')
+        print('  slowest modules (self time):')
+        for name, self_us, cumulative_us in result['slowest'][:args.top]:
+            print(f'    {self_us / 1e3:8.1f} ms  (cumulative {cumulative_us / 1e3:8.1f} ms)  {name}')
+        failed = failed or bool(result['optional_loaded'])
+
+    if args.check and failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
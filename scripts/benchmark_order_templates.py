@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Order Construction Benchmark
+
+Compares orders/sec for building a strategy's spot entry order with full pydantic
+validation (the previous path) against OrderTemplate.build, which copies a prototype
+validated once at declaration. Also times the BTC basis strategy's entry decision
+(spot buy + perp short) end to end.
+
+Usage:
+    python scripts/benchmark_order_templates.py [--orders 50000]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add the backend src to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend', 'src'))
+
+from basis_strategy_v1.core.models.order import Order, OrderOperation  # noqa: E402
+from basis_strategy_v1.core.models.order_template import (  # noqa: E402
+    AMOUNT,
+    NOTIONAL,
+    OrderTemplate,
+)
+from basis_strategy_v1.core.strategies.btc_basis_strategy import BTCBasisStrategy  # noqa: E402
+
+SPOT_BUY = dict(
+    venue='binance',
+    operation=OrderOperation.SPOT_TRADE,
+    pair='BTC/USDT',
+    side='BUY',
+    order_type='limit',
+    source_venue='wallet',
+    target_venue='binance',
+    source_token='USDT',
+    target_token='BTC',
+    execution_mode='sequential',
+    strategy_intent='entry_full',
+    strategy_id='btc_basis',
+)
+
+
+def orders_per_sec(fn, orders: int) -> float:
+    """Calls of fn(i) per second over orders iterations (after a warm-up)."""
+    for i in range(min(orders, 1000)):
+        fn(i)
+    start = time.perf_counter()
+    for i in range(orders):
+        fn(i)
+    return orders / (time.perf_counter() - start)
+
+
+def btc_basis_strategy() -> BTCBasisStrategy:
+    config = {
+        'mode': 'btc_basis',
+        'share_class': 'USDT',
+        'max_leverage': 1.0,
+        'btc_allocation': 0.8,
+        'component_config': {'position_monitor': {'position_subscriptions': [
+            'wallet:BaseToken:USDT', 'binance:BaseToken:BTC', 'binance:Perp:BTCUSDT',
+        ]}},
+    }
+    strategy = BTCBasisStrategy(
+        config, Mock(), Mock(), Mock(), Mock(), Mock(), 'benchmark', 12345,
+        Path('/tmp/benchmark_order_templates'),
+    )
+    strategy._get_asset_price = lambda: 61234.5
+    return strategy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--orders', type=int, default=50000)
+    args = parser.parse_args()
+
+    template = OrderTemplate(
+        'spot_buy',
+        expected_deltas={'wallet:BaseToken:USDT': -NOTIONAL, 'binance:BaseToken:BTC': AMOUNT},
+        operation_details={'notional_usd': NOTIONAL},
+        **SPOT_BUY,
+    )
+
+    def validated(i):
+        amount = 0.5 + i * 1e-6
+        Order(
+            operation_id=f'spot_buy_{i}',
+            amount=amount,
+            price=61234.5,
+            expected_deltas={
+                'wallet:BaseToken:USDT': -(amount * 61234.5),
+                'binance:BaseToken:BTC': amount,
+            },
+            operation_details={'notional_usd': amount * 61234.5},
+            **SPOT_BUY,
+        )
+
+    def templated(i):
+        template.build(0.5 + i * 1e-6, 61234.5)
+
+    print(f'orders: {args.orders}')
+    print('single spot order:')
+    baseline = None
+    for label, fn in [('validated Order(...)', validated), ('OrderTemplate.build', templated)]:
+        rate = orders_per_sec(fn, args.orders)
+        baseline = baseline or rate
+        print(f'  {label:28s} {rate:12,.0f} orders/s  ({rate / baseline:.1f}x)')
+
+    strategy = btc_basis_strategy()
+    decisions = max(args.orders // 10, 1)
+    rate = orders_per_sec(lambda i: strategy._create_entry_orders(100000.0 + i), decisions)
+    print('BTC basis entry decision (2 orders):')
+    print(f'  {"templated":28s} {rate:12,.0f} decisions/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Risk Monitor Per-Tick Benchmark
+
+Times RiskMonitor's float64 fast path (with and without the exact audit) against the
+Decimal calculations it replaces, and the per-tick STRESS grid, on a leveraged-staking
+plus perp-hedge exposure.
+
+Usage:
+    python scripts/benchmark_risk_monitor.py [--ticks 20000]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add the backend src to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend', 'src'))
+os.environ.setdefault('BASIS_DATA_DIR', os.path.join(os.path.dirname(__file__), '..', 'data'))
+
+from basis_strategy_v1.core.components.risk_monitor import RiskMonitor  # noqa: E402
+from basis_strategy_v1.core.utilities.utility_manager import UtilityManager  # noqa: E402
+
+CONFIG = {
+    'mode': 'usdt_eth_staking_hedged_leveraged',
+    'asset': 'ETH',
+    'leverage_enabled': True,
+    'component_config': {
+        'risk_monitor': {
+            'enabled_risk_types': ['ltv_ratio', 'cex_margin_ratio'],
+            'risk_limits': {},
+        },
+    },
+}
+
+
+def make_exposures(ticks: int, seed: int = 7) -> list:
+    """Exposure snapshots along a random ETH price path."""
+    rng = np.random.default_rng(seed)
+    prices = 3000.0 * np.exp(np.cumsum(rng.normal(0.0, 0.003, ticks)))
+    exposures = []
+    for price in prices:
+        exposures.append({
+            'exposures': {
+                'wallet:BaseToken:USDT': {'amount': 1000.0, 'VALUE_USD': 1000.0},
+                'aave_v3:aToken:aUSDT': {'amount': 50000.0, 'VALUE_USD': 50000.0},
+                'aave_v3:aToken:aweETH': {'amount': 40.0, 'VALUE_USD': 40.0 * 1.04 * price},
+                'aave_v3:debtToken:debtWETH': {'amount': 30.0, 'VALUE_USD': 30.0 * price},
+                'etherfi:LST:weETH': {'amount': 0.0, 'VALUE_USD': 0.0},
+                'binance:BaseToken:USDT': {'amount': 20000.0, 'VALUE_USD': 20000.0},
+                'binance:Perp:ETHUSDT': {'amount': -10.0, 'VALUE_USD': 10.0 * price},
+                'bybit:BaseToken:USDT': {'amount': 15000.0, 'VALUE_USD': 15000.0},
+                'bybit:Perp:ETHUSDT': {'amount': -8.0, 'VALUE_USD': 8.0 * price},
+            }
+        })
+    return exposures
+
+
+def time_per_tick(fn, exposures: list) -> float:
+    """Mean microseconds per call of fn over the exposure snapshots (after a warm-up)."""
+    for exposure in exposures[:100]:
+        fn(exposure)
+    start = time.perf_counter()
+    for exposure in exposures:
+        fn(exposure)
+    return (time.perf_counter() - start) / len(exposures) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--ticks', type=int, default=20000)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    exposures = make_exposures(args.ticks)
+    risk_monitor = RiskMonitor(
+        config=CONFIG,
+        data_provider=None,
+        utility_manager=UtilityManager(CONFIG, None),
+        log_dir=Path(tempfile.mkdtemp(prefix='risk_benchmark_')),
+    )
+    risk_monitor._log_risk_assessment = lambda risk_data: None
+
+    def decimal_tick(exposure):
+        current_ltv = risk_monitor._calculate_current_ltv(exposure)
+        cex_margin_ratios = risk_monitor._calculate_cex_margin_ratios(exposure)
+        risk_monitor._calculate_health_ratios(current_ltv, cex_margin_ratios)
+        risk_monitor._calculate_maintenance_margin_ratios(cex_margin_ratios)
+
+    def float_tick(exposure):
+        current_ltv, cex_margin_ratios = risk_monitor._calculate_risk_ratios_fast(exposure)
+        health_ratios = risk_monitor._calculate_health_ratios_fast(current_ltv, cex_margin_ratios)
+        risk_monitor._near_threshold(current_ltv, cex_margin_ratios, health_ratios)
+
+    def stress(exposure):
+        risk_monitor._calculate_stress_grid(exposure)
+
+    def assess(exposure):
+        risk_monitor.assess_risk(exposure, {}, None)
+
+    decimal_us = time_per_tick(decimal_tick, exposures)
+    float_us = time_per_tick(float_tick, exposures)
+    stress_us = time_per_tick(stress, exposures)
+    assess_us = time_per_tick(assess, exposures)
+
+    print(f'ticks:                      {args.ticks}')
+    print(f'Decimal ratios per tick:    {decimal_us:8.1f} us')
+    print(f'float64 ratios per tick:    {float_us:8.1f} us  ({decimal_us / float_us:.1f}x)')
+    print(f'stress grid {"x".join(map(str, risk_monitor.stress_grid.shape))} per tick: '
+          f'{stress_us:8.1f} us')
+    print(f'assess_risk per tick:       {assess_us:8.1f} us  '
+          f'(exact audits: {risk_monitor.exact_audit_count})')
+
+
+if __name__ == '__main__':
+    main()
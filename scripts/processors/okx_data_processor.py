@@ -10,13 +10,21 @@ This script merges the functionality of:
 It processes OKX daily data zip files downloaded from okx.com/data-download
 and extracts funding rates for ETH-USDT and BTC-USDT instruments.
 
+It also compacts the per-day funding rate CSVs (funding_rates/daily/) into one
+sorted, deduplicated time series per instrument, appending only new days on
+subsequent runs.
+
 Usage:
     python okx_data_processor.py --data-dir data/manual_sources/okx.com:data-download --output-dir data/market_data/okx
     python okx_data_processor.py --summary-only --data-dir data
+    python okx_data_processor.py --compact-only --output-dir data/market_data/okx
 """
 
 import argparse
+import hashlib
+import json
 import logging
+import os
 import re
 import zipfile
 from datetime import datetime
@@ -32,6 +40,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Instruments compacted by default (the perps the strategies trade)
+DEFAULT_COMPACT_INSTRUMENTS = ['BTC-USDT-SWAP', 'ETH-USDT-SWAP']
+COMPACTION_STATE_FILE = 'okx_funding_rates_compaction_state.json'
+
+
+def instrument_to_symbol(instrument: str) -> str:
+    """Map an OKX swap instrument to the symbol used in file names (ETH-USDT-SWAP -> ETHUSDT)."""
+    return instrument.replace('-SWAP', '').replace('-', '')
+
 
 class OKXDataProcessor:
     """Unified processor for OKX daily data zip files."""
@@ -366,6 +383,138 @@ class OKXDataProcessor:
         
         return True
     
+    def compact_funding_rates(
+        self,
+        instruments: Optional[List[str]] = None,
+        daily_dir: Optional[Path] = None,
+        rebuild: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Compact daily funding rate CSVs into one time series per instrument.
+
+        Output files (funding_rates/okx_{SYMBOL}_funding_rates.csv) are sorted
+        by funding_timestamp and deduplicated (last observation wins). Daily
+        files already ingested are tracked by content hash in a state file, so
+        later runs only read new days and append their rows. A changed daily file, a different
+        instrument selection or rebuild=True triggers a full rebuild.
+
+        Args:
+            instruments: OKX instruments to compact (None = every instrument)
+            daily_dir: Directory of okx_funding_rates_YYYY-MM-DD.csv files
+            rebuild: Ignore the state file and rebuild all outputs
+
+        Returns:
+            Number of rows written per instrument
+        """
+        output_subdir = self.output_dir / self.data_types['allswaprate-swaprate']['output_subdir']
+        daily_dir = Path(daily_dir) if daily_dir else output_subdir / "daily"
+        state_file = output_subdir / COMPACTION_STATE_FILE
+        selection = sorted(instruments) if instruments else None
+
+        daily_files = {f.name: f for f in sorted(daily_dir.glob("okx_funding_rates_*.csv"))}
+
+        state = self._load_compaction_state(state_file)
+        if not rebuild and state["files"] and state["instruments"] != selection:
+            logger.info("Instrument selection changed, rebuilding compacted funding rates")
+            rebuild = True
+        if not rebuild:
+            changed = [
+                name for name, fingerprint in state["files"].items()
+                if name not in daily_files or self._fingerprint_daily_file(daily_files[name]) != fingerprint
+            ]
+            if changed:
+                logger.info(f"{len(changed)} ingested daily files changed or disappeared, rebuilding")
+                rebuild = True
+        if rebuild:
+            state = {"instruments": selection, "files": {}, "last_timestamp": {}}
+        state["instruments"] = selection
+
+        new_files = [f for name, f in daily_files.items() if name not in state["files"]]
+        if not new_files:
+            self._save_compaction_state(state_file, state)
+            logger.info("Compacted OKX funding rates are up to date")
+            return {}
+
+        frames = []
+        for daily_file in new_files:
+            df = pd.read_csv(daily_file, usecols=['instrument', 'funding_rate', 'real_funding_rate', 'funding_time'])
+            if selection:
+                df = df[df['instrument'].isin(selection)]
+            frames.append(df)
+        new_rows = pd.concat(frames, ignore_index=True)
+        new_rows['funding_time'] = pd.to_datetime(new_rows['funding_time'], utc=True)
+
+        written = {}
+        for instrument, rows in new_rows.groupby('instrument', sort=True):
+            # Daily files are read in date order, so keep='last' keeps the latest observation
+            rows = rows.drop_duplicates(subset=['funding_time'], keep='last').sort_values('funding_time')
+            output_file = output_subdir / f"okx_{instrument_to_symbol(instrument)}_funding_rates.csv"
+            last_timestamp = state["last_timestamp"].get(instrument)
+
+            if rebuild or last_timestamp is None or not output_file.exists():
+                combined = rows
+                mode = 'w'
+            elif rows['funding_time'].min() > pd.Timestamp(last_timestamp):
+                combined = rows
+                mode = 'a'
+            else:
+                # Backfilled day: merge with the existing series once
+                existing = pd.read_csv(output_file)
+                existing['funding_time'] = pd.to_datetime(existing['funding_timestamp'], utc=True)
+                combined = pd.concat([existing, rows], ignore_index=True)
+                combined = combined.drop_duplicates(subset=['funding_time'], keep='last').sort_values('funding_time')
+                mode = 'w'
+
+            self._write_compacted_funding_rates(combined, instrument, output_file, mode)
+            state["last_timestamp"][instrument] = combined['funding_time'].max().isoformat()
+            written[instrument] = len(rows)
+
+        for daily_file in new_files:
+            state["files"][daily_file.name] = self._fingerprint_daily_file(daily_file)
+        self._save_compaction_state(state_file, state)
+
+        logger.info(
+            f"Compacted {len(new_files)} daily files into {len(written)} instrument series "
+            f"({sum(written.values())} rows)"
+        )
+        return written
+
+    def _write_compacted_funding_rates(
+        self, rows: pd.DataFrame, instrument: str, output_file: Path, mode: str
+    ) -> None:
+        """Write (or append) rows in the standard funding rate format."""
+        output = pd.DataFrame({
+            'funding_timestamp': rows['funding_time'].dt.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'funding_rate': rows['funding_rate'],
+            'real_funding_rate': rows['real_funding_rate'],
+            'symbol': instrument_to_symbol(instrument),
+            'source': 'okx',
+        })
+        if mode == 'a':
+            output.to_csv(output_file, mode='a', header=False, index=False)
+        else:
+            tmp_file = output_file.with_name(output_file.name + '.tmp')
+            output.to_csv(tmp_file, index=False)
+            os.replace(tmp_file, output_file)
+
+    def _fingerprint_daily_file(self, daily_file: Path) -> str:
+        """Content hash of a daily file (state stays valid across checkouts and copies)."""
+        return hashlib.sha256(daily_file.read_bytes()).hexdigest()
+
+    def _load_compaction_state(self, state_file: Path) -> Dict:
+        """Load compaction state (ingested daily files and last timestamp per instrument)."""
+        if state_file.exists():
+            with open(state_file, 'r') as f:
+                return json.load(f)
+        return {"instruments": None, "files": {}, "last_timestamp": {}}
+
+    def _save_compaction_state(self, state_file: Path, state: Dict) -> None:
+        """Save compaction state atomically."""
+        tmp_file = state_file.with_name(state_file.name + '.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, state_file)
+
     def show_data_summary(self, data_dir: Path):
         """Show summary of available OKX data."""
         
@@ -470,6 +619,10 @@ class OKXDataProcessor:
             logger.error("Failed to extract ETH/BTC funding rates")
             return False
         
+        # Step 3: Compact daily funding rates into per-instrument series
+        logger.info("Step 3: Compacting daily funding rates per instrument...")
+        self.compact_funding_rates(DEFAULT_COMPACT_INSTRUMENTS)
+        
         logger.info("✅ OKX data processing pipeline completed successfully!")
         return True
 
@@ -488,12 +641,25 @@ def main():
                        help="Only extract ETH/BTC funding rates from existing processed data")
     parser.add_argument("--show-summary", action="store_true",
                        help="Show data summary after processing")
+    parser.add_argument("--compact-only", action="store_true",
+                       help="Only compact daily funding rate files into per-instrument series")
+    parser.add_argument("--instruments", type=str, default=",".join(DEFAULT_COMPACT_INSTRUMENTS),
+                       help="Comma-separated OKX instruments to compact")
+    parser.add_argument("--all-instruments", action="store_true",
+                       help="Compact every instrument found in the daily files")
+    parser.add_argument("--rebuild", action="store_true",
+                       help="Rebuild compacted series instead of appending new days")
     
     args = parser.parse_args()
     
     # Initialize processor
     okx_processor = OKXDataProcessor(args.data_dir, args.output_dir)
     
+    if args.compact_only:
+        instruments = None if args.all_instruments else args.instruments.split(",")
+        okx_processor.compact_funding_rates(instruments, rebuild=args.rebuild)
+        return
+    
     if args.summary_only:
         # Just show summary of available zip files
         okx_processor.print_summary()
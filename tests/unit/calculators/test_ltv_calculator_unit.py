@@ -400,3 +400,40 @@ class TestLTVCalculator:
         )
         assert can_add is False
         assert headroom == Decimal("0.05")
+
+    def test_solve_leverage_loop_matches_iterative_loop(self):
+        """Test the closed-form loop matches borrow/stake/supply iterated to convergence."""
+        equity, ltv, stake_fee = Decimal("10"), Decimal("0.9"), Decimal("0.001")
+
+        collateral, debt = equity * (1 - stake_fee), Decimal("0")
+        for _ in range(500):
+            borrow = ltv * collateral - debt
+            debt += borrow
+            collateral += borrow * (1 - stake_fee)
+
+        loop = LTVCalculator.solve_leverage_loop(equity, ltv, stake_fee=stake_fee)
+
+        assert loop["collateral_value"] == pytest.approx(collateral, rel=Decimal("1e-12"))
+        assert loop["debt_amount"] == pytest.approx(debt, rel=Decimal("1e-12"))
+        assert loop["ltv"] == pytest.approx(ltv)
+        assert loop["flash_loan_amount"] == loop["debt_amount"]
+
+    def test_solve_leverage_loop_fees_and_oracle_ratio(self):
+        """Test flash loan fees are repaid from debt and LST is priced at the oracle ratio."""
+        loop = LTVCalculator.solve_leverage_loop(
+            Decimal("1"), Decimal("0.8"), lst_eth_ratio=Decimal("1.05"),
+            flash_loan_fee=Decimal("0.0005"),
+        )
+
+        assert loop["debt_amount"] == loop["flash_loan_amount"] * Decimal("1.0005")
+        assert loop["debt_amount"] / loop["collateral_value"] == pytest.approx(Decimal("0.8"))
+        assert loop["lst_amount"] * Decimal("1.05") == pytest.approx(loop["collateral_value"])
+        assert loop["stake_amount"] == Decimal("1") + loop["flash_loan_amount"]
+
+    def test_solve_leverage_loop_invalid_inputs(self):
+        """Test invalid loop parameters fail with LTV-009."""
+        with pytest.raises(ValueError, match="LTV-009"):
+            LTVCalculator.solve_leverage_loop(Decimal("1"), Decimal("1"))
+        with pytest.raises(ValueError, match="LTV-009"):
+            LTVCalculator.solve_leverage_loop(Decimal("1"), Decimal("0.5"), lst_eth_ratio=Decimal("0"))
+        assert LTVCalculator.solve_leverage_loop(Decimal("1"), Decimal("0"))["flash_loan_amount"] == 0
@@ -0,0 +1,169 @@
+"""
+Unit tests for the post-run P&L attribution.
+
+Tests the columnar position history, the vectorized split of equity changes into
+index growth, oracle drift, price moves, funding and settlement components, perps at
+unrealized P&L and a reconciliation that catches perp P&L no balance received.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from basis_strategy_v1.core.math.pnl_attribution import (
+    ATTRIBUTION_COMPONENTS,
+    PositionHistory,
+    attribute_pnl,
+)
+
+
+KEYS = [
+    "aave_v3:aToken:aweETH",
+    "aave_v3:debtToken:debtWETH",
+    "binance:BaseToken:USDT",
+    "binance:Perp:ETHUSDT",
+]
+
+
+def _book():
+    """Two ticks: AAVE indexes, weETH oracle and ETH price all move; funding settles."""
+    index = np.array([[1.00, 1.00, 1.0, 1.0], [1.01, 1.02, 1.0, 1.0]])
+    oracle = np.array([[1.05, 1.0, 1.0, 1.0], [1.06, 1.0, 1.0, 1.0]])
+    eth = np.array([3000.0, 3100.0])
+    amounts = np.array([[10.0, 8.0, 5000.0, -2.0], [10.0, 8.0, 5060.0, -2.0]])
+    values = np.zeros_like(amounts)
+    values[:, 0] = amounts[:, 0] * index[:, 0] * oracle[:, 0] * eth
+    values[:, 1] = -amounts[:, 1] * index[:, 1] * eth
+    values[:, 2] = amounts[:, 2]
+    funding_rates = np.array([[0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.01]])
+    mark_prices = np.array([[0.0, 0.0, 0.0, 3000.0], [0.0, 0.0, 0.0, 3000.0]])
+    return amounts, values, index, oracle, eth, funding_rates, mark_prices
+
+
+HEDGED_KEYS = ["wallet:BaseToken:ETH", "binance:BaseToken:USDT", "binance:Perp:ETHUSDT"]
+
+
+def _hedged_book():
+    """Long 1 ETH, short 1 ETH perp: ETH rallies 10%, funding settles, the perp closes."""
+    eth = np.array([3000.0, 3300.0, 3300.0, 3300.0])
+    amounts = np.array(
+        [
+            [1.0, 3000.0, -1.0],
+            [1.0, 3000.0, -1.0],
+            [1.0, 3000.33, -1.0],  # Short receives 0.01% funding on 3300
+            [1.0, 3000.33, 0.0],
+        ]
+    )
+    values = np.zeros_like(amounts)
+    values[:, 0] = amounts[:, 0] * eth
+    values[:, 1] = amounts[:, 1]
+    marks = np.zeros_like(amounts)
+    marks[:, 2] = eth
+    funding_rates = np.zeros_like(amounts)
+    funding_rates[2, 2] = 0.0001
+    return amounts, values, marks, funding_rates
+
+
+class TestPnLAttribution:
+    """Test the vectorized attribution."""
+
+    def test_components_split_factors_and_reconcile(self):
+        """Test index, oracle and price parts and that components sum to the equity change."""
+        amounts, values, index, oracle, eth, funding_rates, mark_prices = _book()
+        opening_value = float(values[0].sum())
+
+        result = attribute_pnl(
+            KEYS, amounts, values, opening_value, index=index, oracle=oracle,
+            funding_rates=funding_rates, mark_prices=mark_prices,
+        )
+
+        assert result["supply_pnl"] == pytest.approx(10.0 * 0.01 * 1.06 * 3100.0)
+        assert result["borrow_cost"] == pytest.approx(-8.0 * 0.02 * 3100.0)
+        assert result["staking_yield_oracle"] == pytest.approx(10.0 * 1.00 * 0.01 * 3100.0)
+        assert result["delta_pnl"] == pytest.approx(10.0 * 1.05 * 100.0 - 8.0 * 100.0)
+        assert result["funding_pnl"] == pytest.approx(2.0 * 0.01 * 3000.0)
+        assert result["settlement_pnl"] == pytest.approx(0.0, abs=1e-9)
+        assert result["pnl_cumulative"] == pytest.approx(result["balance_pnl_cumulative"])
+        assert result["balance_pnl_cumulative"] == pytest.approx(values[1].sum() - values[0].sum())
+
+    def test_opening_book_and_closed_positions_are_settlement(self):
+        """Test the first tick books against the baseline and closing a position is a flow."""
+        keys = ["wallet:BaseToken:ETH", "wallet:BaseToken:USDT"]
+        amounts = np.array([[1.0, 0.0], [0.0, 3100.0]])
+        values = np.array([[3000.0, 0.0], [0.0, 3100.0]])
+
+        result = attribute_pnl(keys, amounts, values, opening_value=2900.0)
+
+        assert result["delta_pnl"] == 0.0
+        assert result["settlement_pnl"] == pytest.approx(100.0 + 100.0)
+        assert result["pnl_cumulative"] == pytest.approx(200.0)
+        assert set(ATTRIBUTION_COMPONENTS) <= set(result)
+
+    def test_missing_factors_fall_back_to_price(self):
+        """Test NaN factors leave the whole revaluation in delta_pnl."""
+        amounts, values, index, _, _, _, _ = _book()
+        index[:, 0] = np.nan
+
+        result = attribute_pnl(KEYS, amounts, values, float(values[0].sum()), index=index)
+
+        assert result["staking_yield_oracle"] == 0.0
+        assert result["supply_pnl"] == 0.0
+        assert result["pnl_cumulative"] == pytest.approx(result["balance_pnl_cumulative"])
+
+    def test_hedged_position_is_delta_neutral(self):
+        """Test a spot long hedged by a perp short books no delta and reconciles."""
+        amounts, values, marks, funding_rates = _hedged_book()
+
+        result = attribute_pnl(
+            HEDGED_KEYS, amounts[:3], values[:3], 6000.0,
+            funding_rates=funding_rates[:3], mark_prices=marks[:3],
+        )
+
+        assert result["delta_pnl"] == pytest.approx(300.0 - 300.0)
+        assert result["funding_pnl"] == pytest.approx(0.33)
+        assert result["settlement_pnl"] == pytest.approx(0.0, abs=1e-9)
+        assert result["perp_unrealized_pnl"] == pytest.approx(-300.0)
+        assert result["balance_pnl_cumulative"] == pytest.approx(0.33)
+        assert result["reconciliation_difference"] == pytest.approx(0.0, abs=1e-9)
+
+        # Unvalued perps: the spot leg's gain looks like unhedged delta
+        unvalued = attribute_pnl(HEDGED_KEYS, amounts[:3], values[:3], 6000.0)
+        assert unvalued["delta_pnl"] == pytest.approx(300.0)
+
+    def test_unsettled_perp_pnl_fails_reconciliation(self):
+        """Test closing the perp without a balance receiving its P&L leaves a difference."""
+        amounts, values, marks, funding_rates = _hedged_book()
+        kwargs = {"funding_rates": funding_rates, "mark_prices": marks}
+
+        unsettled = attribute_pnl(HEDGED_KEYS, amounts, values, 6000.0, **kwargs)
+        assert unsettled["pnl_cumulative"] == pytest.approx(0.33)
+        assert unsettled["perp_unrealized_pnl"] == 0.0
+        assert unsettled["reconciliation_difference"] == pytest.approx(300.0)
+
+        # Margin settlement debits the realized loss from the venue balance
+        amounts[3, 1] -= 300.0
+        values[3, 1] -= 300.0
+        settled = attribute_pnl(
+            HEDGED_KEYS, amounts, values, 6000.0, perp_pnl_settled=True, **kwargs
+        )
+        assert settled["settlement_pnl"] == pytest.approx(0.0, abs=1e-9)
+        assert settled["balance_pnl_cumulative"] == pytest.approx(0.33)
+        assert settled["reconciliation_difference"] == pytest.approx(0.0, abs=1e-9)
+
+    def test_position_history_columns(self):
+        """Test new keys add columns, earlier rows pad with 0 and repeated ticks replace."""
+        history = PositionHistory()
+        t0 = pd.Timestamp("2024-06-01 00:00", tz="UTC")
+        t1 = pd.Timestamp("2024-06-01 01:00", tz="UTC")
+        history.record(t0, {"a": 1.0}, {"a": 10.0})
+        history.record(t1, {"a": 1.0, "b": 2.0}, {"a": 11.0, "b": 20.0})
+        history.record(t1, {"a": 1.0, "b": 3.0}, {"a": 11.0, "b": 30.0})
+
+        timestamps, keys, amounts, values = history.to_arrays()
+
+        assert timestamps == [t0, t1]
+        assert keys == ["a", "b"]
+        np.testing.assert_array_equal(amounts, [[1.0, 0.0], [1.0, 3.0]])
+        np.testing.assert_array_equal(values, [[10.0, 0.0], [11.0, 30.0]])
+        with pytest.raises(ValueError):
+            attribute_pnl(["a"], amounts, values, 0.0)
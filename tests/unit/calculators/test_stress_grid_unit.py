@@ -0,0 +1,76 @@
+"""
+Unit tests for the stress grid.
+
+Tests AAVE LTV and CEX margin surfaces under price, LST depeg and funding
+shocks, distance to liquidation and the worst-shock summary.
+"""
+
+import pytest
+
+from basis_strategy_v1.core.math.stress_grid import StressGrid, stress_exposures
+
+
+EXPOSURES = {
+    "aave_v3:aToken:aweETH": {"amount": 10.0, "value_usd": 30000.0},
+    "aave_v3:debtToken:debtWETH": {"amount": 8.0, "value_usd": 24000.0},
+    "etherfi:BaseToken:weETH": {"amount": 1.0, "value_usd": 3000.0},
+    "binance:BaseToken:USDT": {"amount": 3000.0, "value_usd": 3000.0},
+    "binance:Perp:ETHUSDT": {"amount": -10.0, "value_usd": -30000.0},
+}
+GRID = StressGrid(price_shocks=[-0.2, 0.0, 0.2], lst_depegs=[0.0, 0.05], funding_shocks=[0.0, 0.01])
+
+
+def _stress(exposures=EXPOSURES, grid=GRID):
+    return stress_exposures(exposures, "ETH", grid, 0.9, {"binance": 0.05})
+
+
+class TestStressGrid:
+    """Test stress surfaces."""
+
+    def test_aave_ltv_moves_only_with_depeg(self):
+        """Test ETH debt against LST collateral keeps LTV under price moves, not under depeg."""
+        ltv = _stress()["surfaces"]["aave"]["ltv"]
+
+        assert [ltv[p][0][0] for p in range(3)] == pytest.approx([0.8, 0.8, 0.8])
+        assert ltv[1][1][0] == pytest.approx(0.8 / 0.95)
+        assert ltv[1][1][0] == ltv[1][1][1]
+
+    def test_cex_margin_under_price_and_funding(self):
+        """Test a short perp loses margin as price rises and funding is paid on notional."""
+        margin = _stress()["surfaces"]["binance"]["margin_ratio"]
+
+        assert margin[1][0][0] == pytest.approx(0.1)
+        assert margin[2][0][0] == pytest.approx((3000.0 - 6000.0) / 36000.0)
+        assert margin[0][0][1] == pytest.approx((3000.0 + 6000.0 - 240.0) / 24000.0)
+
+    def test_liquidation_distance_and_worst_shock(self):
+        """Test distance to liquidation is the loss buffer and the worst shock is located."""
+        result = _stress()
+        aave = result["surfaces"]["aave"]["liquidation_distance"]
+        binance = result["surfaces"]["binance"]["liquidation_distance"]
+
+        assert aave[1][0][0] == pytest.approx(1 - 0.8 / 0.9)
+        assert binance[1][0][0] == pytest.approx(1 - 0.05 / 0.1)
+        assert binance[2][0][0] == -1.0  # Negative equity floors at -1
+        assert result["min_liquidation_distance"] == -1.0
+        assert result["worst_shock"] == {
+            "venue": "binance", "price_shock": 0.2, "lst_depeg": 0.0, "funding_shock": 0.0
+        }
+
+    def test_unlevered_book_has_no_surfaces(self):
+        """Test books without AAVE debt or perps produce no surfaces."""
+        result = _stress({"aave_v3:aToken:aUSDT": {"amount": 1.0, "value_usd": 1.0}})
+
+        assert result["surfaces"] == {}
+        assert result["min_liquidation_distance"] is None
+
+    def test_grid_from_config(self):
+        """Test default axes, config overrides and validation."""
+        grid = StressGrid.from_config({"lst_depegs": [0.0, 0.1]})
+
+        assert grid.shape == (13, 2, 4)
+        assert grid.price_shocks[0] == -0.3 and grid.price_shocks[-1] == 0.3
+        with pytest.raises(ValueError):
+            StressGrid(price_shocks=[-1.0])
+        with pytest.raises(ValueError):
+            StressGrid(lst_depegs=[])
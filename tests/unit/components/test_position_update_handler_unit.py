@@ -11,6 +11,7 @@ import pandas as pd
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime, timezone
 
+from backend.src.basis_strategy_v1.core.components.pnl_monitor import PnLMonitor
 from backend.src.basis_strategy_v1.core.components.position_update_handler import PositionUpdateHandler
 
 
@@ -235,3 +236,181 @@ class TestPositionUpdateHandler:
         assert position_update_handler.tight_loop_active is False
         assert position_update_handler.loop_execution_count == 1
 
+
+
+class FakePositionMonitor:
+    """Position monitor applying structured deltas to a flat position dict."""
+
+    def __init__(self):
+        self.simulated_positions = {}
+        self.real_positions = {}
+
+    def update_state(self, timestamp, trigger_source, execution_deltas=None):
+        for delta in execution_deltas or []:
+            key = delta["instrument_key"]
+            self.simulated_positions[key] = self.simulated_positions.get(key, 0.0) + delta["delta_amount"]
+        return dict(self.simulated_positions)
+
+    def get_current_positions(self):
+        return dict(self.real_positions)
+
+
+class FakeRiskMonitor:
+    """Risk monitor with AAVE LTV and CEX margin calculations."""
+
+    aave_max_ltv_emode = 0.9
+    cex_margin_requirements = {}
+
+    def __init__(self):
+        self.assessments = []
+
+    def _calculate_current_ltv(self, exposure_data):
+        exposures = exposure_data["exposures"]
+        collateral = sum(e["value_usd"] for k, e in exposures.items() if "aToken" in k)
+        debt = sum(e["value_usd"] for k, e in exposures.items() if "debtToken" in k)
+        return debt / collateral if collateral else 0.0
+
+    def _calculate_cex_margin_ratios(self, exposure_data):
+        return {}
+
+    def assess_risk(self, timestamp, exposure_data, market_data):
+        risk = {"CURRENT_LTV": self._calculate_current_ltv(exposure_data)}
+        self.assessments.append(risk)
+        return risk
+
+
+class TestDeferredComponentChain:
+    """Test coalescing of the tight-loop component chain."""
+
+    @pytest.fixture
+    def handler(self, tmp_path):
+        utility_manager = Mock()
+        utility_manager.convert_position_to_usd.side_effect = (
+            lambda instrument_key, amount, timestamp: amount * 100.0
+        )
+        utility_manager.convert_position_to_share_class.side_effect = (
+            lambda instrument_key, amount, share_class, timestamp: amount * 100.0
+        )
+        utility_manager.get_instrument_type.side_effect = (
+            lambda instrument_key: "debt" if "debtToken" in instrument_key else "asset"
+        )
+        utility_manager.get_share_class_from_mode.return_value = "USDT"
+        exposure_monitor = Mock()
+        exposure_monitor.utility_manager = utility_manager
+        exposure_monitor.last_exposures = None
+
+        def calculate_exposure(timestamp, position_snapshot, market_data):
+            return {
+                "timestamp": timestamp,
+                "exposures": {
+                    key: {"amount": amount, "value_usd": amount * 100.0}
+                    for key, amount in position_snapshot.items()
+                },
+            }
+
+        exposure_monitor.calculate_exposure.side_effect = calculate_exposure
+        position_monitor = FakePositionMonitor()
+        config = {
+            "mode": "pure_lending_usdt",
+            "component_config": {
+                "position_update_handler": {"risk_guard_band_ltv": 0.1},
+                "pnl_monitor": {
+                    "attribution_types": ["supply_yield", "borrow_costs"],
+                    "reporting_currency": "USDT",
+                    "reconciliation_tolerance": 0.02,
+                },
+            },
+        }
+        PnLMonitor._instance = None
+        pnl_monitor = PnLMonitor(
+            config=config,
+            share_class="USDT",
+            initial_capital=1000.0,
+            utility_manager=utility_manager,
+            position_monitor=position_monitor,
+            log_dir=tmp_path,
+        )
+
+        yield PositionUpdateHandler(
+            config=config,
+            data_provider=Mock(),
+            execution_mode="backtest",
+            position_monitor=position_monitor,
+            exposure_monitor=exposure_monitor,
+            risk_monitor=FakeRiskMonitor(),
+            pnl_monitor=pnl_monitor,
+            log_dir=tmp_path,
+        )
+        PnLMonitor._instance = None
+
+    @staticmethod
+    def _deltas(instrument_key, amount):
+        return [{"instrument_key": instrument_key, "delta_amount": amount}]
+
+    def _run_group(self, handler, orders, deferred):
+        timestamp = pd.Timestamp("2024-06-01", tz="UTC")
+        handler._deferred_chain = None
+        if deferred:
+            assert handler.begin_deferred_chain(timestamp)
+        results = [
+            handler._handle_execution_manager_trigger(timestamp, self._deltas(*order))
+            for order in orders
+        ]
+        if deferred:
+            results.append(handler.flush_deferred_chain())
+        return results
+
+    def test_group_runs_chain_once_with_eager_result(self, handler):
+        """Test an atomic group runs one chain pass matching the last eager pass."""
+        orders = [("aave:aToken:aWETH", 10.0), ("aave:debtToken:debtWETH", 5.0), ("aave:aToken:aWETH", 2.0)]
+
+        eager = self._run_group(handler, orders, deferred=False)
+        eager_runs = handler.chain_run_count
+        eager_pnl = eager[-1]["pnl"]
+        handler.position_monitor.simulated_positions = {}
+        handler.position_monitor.real_positions = {}
+        handler.pnl_monitor.__init__(
+            config=handler.pnl_monitor.config,
+            share_class="USDT",
+            initial_capital=1000.0,
+            utility_manager=handler.pnl_monitor.utility_manager,
+            position_monitor=handler.position_monitor,
+            log_dir=handler.pnl_monitor.log_dir,
+        )
+        handler.chain_run_count = 0
+
+        deferred = self._run_group(handler, orders, deferred=True)
+        deferred_pnl = deferred[-1]["pnl"]
+
+        assert eager_runs == 3
+        assert handler.chain_run_count == 1
+        assert all(result["deferred"] for result in deferred[:-1])
+        for key in ("position_snapshot", "exposure", "risk"):
+            assert deferred[-1][key] == eager[-1][key]
+        # Per-run deltas differ (three updates vs one); the book they add up to does not
+        assert deferred_pnl["BALANCE_BASED"]["total_value_current"] == pytest.approx(700.0)
+        for section in ("BALANCE_BASED", "ATTRIBUTION"):
+            assert deferred_pnl[section]["PNL_CUMULATIVE"] == pytest.approx(
+                eager_pnl[section]["PNL_CUMULATIVE"]
+            )
+        assert deferred_pnl["ATTRIBUTION"]["cumulative"] == pytest.approx(
+            eager_pnl["ATTRIBUTION"]["cumulative"]
+        )
+        assert deferred_pnl["RECONCILIATION"]["passed"] and eager_pnl["RECONCILIATION"]["passed"]
+
+    def test_guard_band_crossing_runs_chain_for_order(self, handler):
+        """Test an order projected into the LTV guard band gets its own risk check."""
+        orders = [("aave:aToken:aWETH", 10.0), ("aave:debtToken:debtWETH", 8.5), ("aave:aToken:aWETH", 5.0)]
+
+        results = self._run_group(handler, orders, deferred=True)
+
+        assert results[0]["deferred"] is True
+        assert "risk" in results[1]  # LTV 0.85 >= 0.9 - 0.1
+        assert results[2]["deferred"] is True  # LTV falls back out of the band
+        assert handler.chain_run_count == 2
+
+    def test_disabled_deferral(self, handler):
+        """Test deferral can be switched off in config."""
+        handler.defer_component_chain = False
+        assert handler.begin_deferred_chain(pd.Timestamp("2024-06-01", tz="UTC")) is False
+        assert handler.flush_deferred_chain() is None
@@ -338,3 +338,91 @@ class TestRiskMonitorUnit:
         except Exception as e:
             # Expected behavior for invalid config
             assert isinstance(e, Exception)
+
+
+class TestRiskMonitorFastPath:
+    """Float fast path and the Decimal exact audit."""
+
+    EXPOSURE = {
+        "exposures": {
+            "aave_v3:aToken:aweETH": {"amount": 10.0, "VALUE_USD": 30000.0},
+            "aave_v3:debtToken:debtWETH": {"amount": 7.0, "VALUE_USD": 21000.3},
+            "binance:BaseToken:USDT": {"amount": 5000.0, "VALUE_USD": 5000.0},
+            "binance:Perp:ETHUSDT": {"amount": -3.0, "VALUE_USD": 9000.0},
+            "wallet:BaseToken:ETH": {"amount": 1.0, "VALUE_USD": 3000.0},
+        }
+    }
+
+    def _risk_monitor(self, mock_config, mock_data_provider, mock_utility_manager, **risk_config):
+        """Risk monitor with a 0.7 target LTV and 0.3 CEX target margins."""
+        from decimal import Decimal
+
+        config = mock_config.copy()
+        config["component_config"] = dict(
+            mock_config["component_config"],
+            risk_monitor=dict(mock_config["component_config"]["risk_monitor"], **risk_config),
+        )
+        mock_utility_manager.calculate_dynamic_ltv_target.return_value = Decimal("0.7")
+        mock_utility_manager.calculate_cex_target_margin.return_value = Decimal("0.3")
+        return RiskMonitor(
+            config=config,
+            data_provider=mock_data_provider,
+            utility_manager=mock_utility_manager,
+            log_dir=Path("/tmp/test_logs"),
+        )
+
+    def test_fast_path_matches_decimal(self, mock_config, mock_data_provider, mock_utility_manager):
+        """Test float ratios match the Decimal calculations."""
+        risk_monitor = self._risk_monitor(mock_config, mock_data_provider, mock_utility_manager)
+
+        current_ltv, cex_margin_ratios = risk_monitor._calculate_risk_ratios_fast(self.EXPOSURE)
+        exact_ltv, exact_margins, exact_health = risk_monitor._calculate_risk_ratios_exact(
+            self.EXPOSURE
+        )
+
+        assert current_ltv == pytest.approx(exact_ltv, rel=1e-12)
+        assert cex_margin_ratios == pytest.approx(exact_margins, rel=1e-12)
+        assert risk_monitor._calculate_health_ratios_fast(
+            current_ltv, cex_margin_ratios
+        ) == pytest.approx(exact_health, rel=1e-12)
+
+    def test_exact_audit_near_threshold(self, mock_config, mock_data_provider, mock_utility_manager):
+        """Test the Decimal audit runs only when a ratio is within epsilon of a threshold."""
+        risk_monitor = self._risk_monitor(
+            mock_config, mock_data_provider, mock_utility_manager, exact_audit_epsilon=1e-3
+        )
+        timestamp = pd.Timestamp("2024-06-01", tz="UTC")
+
+        assert risk_monitor.assess_risk(self.EXPOSURE, {}, timestamp)["exact_audit"] is True
+        far = {"exposures": {"aave_v3:aToken:aWeETH": {"amount": 1.0, "VALUE_USD": 100.0}}}
+        assert risk_monitor.assess_risk(far, {}, timestamp)["exact_audit"] is False
+        assert risk_monitor.exact_audit_count == 1
+
+        risk_monitor = self._risk_monitor(
+            mock_config, mock_data_provider, mock_utility_manager, exact_audit=False
+        )
+        result = risk_monitor.assess_risk(self.EXPOSURE, {}, timestamp)
+        assert result["exact_audit"] is False
+        assert result["CURRENT_LTV"] == pytest.approx(0.70001)
+
+    def test_stress_grid_in_risk_result(self, mock_config, mock_data_provider, mock_utility_manager):
+        """Test perp-hedged books get STRESS surfaces and stress_grid.enabled turns them off."""
+        config = dict(mock_config, asset="ETH")
+        config["component_config"] = dict(mock_config["component_config"])
+        config["component_config"]["position_monitor"] = {
+            "position_subscriptions": ["binance:Perp:ETHUSDT"]
+        }
+        risk_monitor = self._risk_monitor(config, mock_data_provider, mock_utility_manager)
+        risk_monitor.cex_margin_requirements["binance"] = {"liquidation_threshold": 0.05}
+        risk_monitor._cache_float_parameters()
+        timestamp = pd.Timestamp("2024-06-01", tz="UTC")
+
+        stress = risk_monitor.assess_risk(self.EXPOSURE, {}, timestamp)["STRESS"]
+        assert set(stress["surfaces"]) == {"aave", "binance"}
+        assert stress["worst_shock"]["venue"] == "aave"
+        assert stress["worst_shock"]["lst_depeg"] == 0.05
+
+        risk_monitor = self._risk_monitor(
+            config, mock_data_provider, mock_utility_manager, stress_grid={"enabled": False}
+        )
+        assert "STRESS" not in risk_monitor.assess_risk(self.EXPOSURE, {}, timestamp)
@@ -0,0 +1,207 @@
+"""
+Unit tests for concurrent venue position queries.
+
+Uses fake venues with scripted delays and failures to test concurrency, result
+ordering, per-venue timeouts, in-flight caps, loop ownership, stale reuse and
+PositionMonitor's live refresh.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from backend.src.basis_strategy_v1.core.components.position_monitor import PositionMonitor
+from backend.src.basis_strategy_v1.core.components.venue_position_query import (
+    VenuePositionQuery,
+)
+
+TIMESTAMP = pd.Timestamp("2024-06-01 12:00", tz="UTC")
+
+
+class FakeVenue:
+    """Position interface answering after `delay` seconds, or raising `error`."""
+
+    def __init__(self, positions, delay=0.0, error=None):
+        self.positions = positions
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.finished = 0
+
+    async def get_positions(self, timestamp):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        self.finished += 1
+        return dict(self.positions)
+
+
+class SyncFakeVenue:
+    """Blocking position interface."""
+
+    def __init__(self, positions, delay=0.0):
+        self.positions = positions
+        self.delay = delay
+        self.calls = 0
+
+    def get_positions(self, timestamp):
+        self.calls += 1
+        time.sleep(self.delay)
+        return dict(self.positions)
+
+
+class LoopRecordingVenue(FakeVenue):
+    """Async venue recording the loop each call ran on."""
+
+    def __init__(self, positions):
+        super().__init__(positions)
+        self.loops = []
+
+    async def get_positions(self, timestamp):
+        self.loops.append(asyncio.get_running_loop())
+        return await super().get_positions(timestamp)
+
+
+@pytest.fixture
+def query():
+    venue_query = VenuePositionQuery(timeout_seconds=1.0, venue_timeouts={"okx": 0.05})
+    yield venue_query
+    venue_query.close()
+
+
+class TestVenuePositionQuery:
+    """Test concurrency, ordering, timeouts and stale reuse."""
+
+    def test_queries_run_concurrently_in_interface_order(self, query):
+        """Test a refresh takes the slowest venue's time and keeps interface order."""
+        interfaces = {
+            "binance": FakeVenue({"binance:Perp:BTCUSDT": -1.0, "wallet:BaseToken:USDT": 5.0}, 0.2),
+            "aave_v3": SyncFakeVenue({"aave_v3:aToken:aUSDT": 100.0}, 0.2),
+            "wallet": FakeVenue({"wallet:BaseToken:USDT": 7.0}, 0.0),
+            "bybit": None,
+        }
+
+        started = time.perf_counter()
+        results = query.query(interfaces, TIMESTAMP)
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.35
+        assert list(results) == ["binance", "aave_v3", "wallet"]
+        assert all(result.status == "ok" for result in results.values())
+        assert results["binance"].latency_seconds >= 0.2 > results["wallet"].latency_seconds
+        assert query.get_metrics()["binance"]["latency_ms"]["max"] >= 200.0
+
+    def test_timeout_reuses_last_good_positions(self, query):
+        """Test a slow venue is cut off at its timeout and its last result reused as stale."""
+        okx = FakeVenue({"okx:Perp:ETHUSDT": -2.0})
+        interfaces = {"binance": FakeVenue({"binance:BaseToken:USDT": 1.0}), "okx": okx}
+        assert query.query(interfaces, TIMESTAMP)["okx"].stale is False
+
+        okx.delay = 0.5
+        started = time.perf_counter()
+        result = query.query(interfaces, TIMESTAMP)["okx"]
+
+        assert time.perf_counter() - started < 0.3
+        assert result.status == "timeout"
+        assert result.stale is True
+        assert result.positions == {"okx:Perp:ETHUSDT": -2.0}
+        assert okx.finished == 1  # The timed-out query was cancelled
+        assert query.get_metrics()["okx"]["timeouts"] == 1
+
+    def test_failed_venue_without_recent_result(self, query):
+        """Test errors are reported and expired results are not reused."""
+        query.max_staleness_seconds = 0.0
+        binance = FakeVenue({"binance:BaseToken:USDT": 1.0})
+        query.query({"binance": binance}, TIMESTAMP)
+
+        binance.error = ConnectionError("connection reset")
+        time.sleep(0.01)
+        result = query.query({"binance": binance}, TIMESTAMP)["binance"]
+
+        assert (result.status, result.error, result.stale) == ("error", "connection reset", False)
+        assert result.positions is None
+        assert query.get_metrics()["binance"]["errors"] == 1
+
+
+    def test_sync_venue_still_running_is_skipped(self, query):
+        """Test a blocked sync call is never stacked with another one on the next tick."""
+        aave = SyncFakeVenue({"aave_v3:aToken:aUSDT": 100.0})
+        interfaces = {"aave_v3": aave}
+        query.venue_timeouts["aave_v3"] = 0.05
+        query.query(interfaces, TIMESTAMP)
+
+        aave.delay = 0.3
+        assert query.query(interfaces, TIMESTAMP)["aave_v3"].status == "timeout"
+        busy = query.query(interfaces, TIMESTAMP)["aave_v3"]
+
+        assert (busy.status, busy.stale) == ("busy", True)
+        assert busy.positions == {"aave_v3:aToken:aUSDT": 100.0}
+        assert aave.calls == 2  # No second thread for the venue
+        assert query.get_metrics()["aave_v3"]["busy_skips"] == 1
+
+        time.sleep(0.3)
+        aave.delay = 0.0
+        assert query.query(interfaces, TIMESTAMP)["aave_v3"].status == "ok"
+        assert aave.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_async_venues_run_on_owning_loop(self, query):
+        """Test queries from a worker thread run coroutines on the bound loop."""
+        venue = LoopRecordingVenue({"binance:BaseToken:USDT": 1.0})
+        query.bind_loop(asyncio.get_running_loop())
+
+        results = await asyncio.to_thread(query.query, {"binance": venue}, TIMESTAMP)
+        assert results["binance"].positions == {"binance:BaseToken:USDT": 1.0}
+        assert venue.loops == [asyncio.get_running_loop()]
+
+        # Called on the owning loop itself, it cannot block that loop: private loop
+        query.query({"binance": venue}, TIMESTAMP)
+        assert venue.loops[-1] is not asyncio.get_running_loop()
+
+
+class TestPositionMonitorLiveRefresh:
+    """Test PositionMonitor's live refresh over fake venues."""
+
+    @pytest.mark.asyncio
+    async def test_live_refresh_merges_fresh_and_stale_venues(
+        self, mock_config, mock_data_provider, mock_utility_manager
+    ):
+        """Test the refresh works inside a running loop and flags the stale venue."""
+        config = dict(mock_config, execution_mode="live")
+        config["component_config"] = dict(
+            mock_config["component_config"],
+            position_monitor={
+                "position_subscriptions": ["wallet:BaseToken:USDT", "binance:BaseToken:USDT"],
+                "venue_query": {"timeout_seconds": 0.05},
+            },
+        )
+        position_monitor = PositionMonitor(
+            config=config,
+            data_provider=mock_data_provider,
+            utility_manager=mock_utility_manager,
+            venue_interface_factory=Mock(),
+            execution_mode="live",
+            log_dir=Path("/tmp/test_logs"),
+        )
+        binance = FakeVenue({"binance:BaseToken:USDT": 250.0})
+        position_monitor.position_interfaces = {
+            "wallet": FakeVenue({"wallet:BaseToken:USDT": 1000.0}),
+            "binance": binance,
+        }
+
+        assert position_monitor._query_real_venue_positions(TIMESTAMP) == {
+            "wallet:BaseToken:USDT": 1000.0,
+            "binance:BaseToken:USDT": 250.0,
+        }
+
+        binance.delay = 0.5
+        positions = position_monitor._query_real_venue_positions(TIMESTAMP)
+        assert positions["binance:BaseToken:USDT"] == 250.0
+        assert position_monitor.venue_query_status["binance"]["status"] == "timeout"
+        assert position_monitor.check_component_health()["stale_venues"] == ["binance"]
+        position_monitor.venue_query.close()
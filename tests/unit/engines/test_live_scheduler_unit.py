@@ -0,0 +1,360 @@
+"""
+Unit tests for the live scheduler.
+
+Tests drift-corrected periodic loops, price/LTV/funding/fill triggers, trigger
+coalescing and metrics on a simulated clock, and run_live feeding ExecutionManager
+fills and RiskMonitor LTVs to the scheduler from loops running off the event loop.
+"""
+
+import asyncio
+import threading
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from backend.src.basis_strategy_v1.core.event_engine.live_scheduler import (
+    LiveScheduler,
+    SimulatedClock,
+)
+from backend.src.basis_strategy_v1.core.models.execution import (
+    ExecutionHandshake,
+    ExecutionStatus,
+)
+from backend.src.basis_strategy_v1.core.models.order import Order, OrderOperation
+
+ENGINE_MODULE = "backend.src.basis_strategy_v1.core.event_engine.event_driven_strategy_engine"
+STRATEGIES_MODULE = "backend.src.basis_strategy_v1.core.strategies"
+
+START = 1_717_372_800.0  # 2024-06-03 00:00 UTC
+
+
+class Recorder:
+    """run_loop recording (seconds since START, reasons); each loop costs `cost` seconds."""
+
+    def __init__(self, clock, cost=0.0):
+        self.clock = clock
+        self.cost = cost
+        self.loops = []
+
+    def __call__(self, timestamp, reasons):
+        self.loops.append((timestamp.timestamp() - START, reasons))
+        self.clock.current += self.cost
+
+
+async def _start(scheduler):
+    task = asyncio.create_task(scheduler.run())
+    await scheduler.clock.advance(0)
+    return task
+
+
+async def _finish(scheduler, task):
+    scheduler.stop()
+    await scheduler.clock.advance(0)
+    await task
+
+
+class TestLiveScheduler:
+    """Test loop timing and triggers."""
+
+    @pytest.mark.asyncio
+    async def test_periodic_loop_does_not_drift(self):
+        """Test slow loops keep the 60s grid and fully missed slots are skipped."""
+        clock = SimulatedClock(START)
+        recorder = Recorder(clock, cost=5.0)
+        scheduler = LiveScheduler(recorder, interval_seconds=60.0, clock=clock)
+
+        task = await _start(scheduler)
+        await clock.advance(200)
+        assert recorder.loops == [
+            (0.0, ["startup"]),
+            (60.0, ["periodic"]),
+            (120.0, ["periodic"]),
+            (180.0, ["periodic"]),
+        ]
+
+        recorder.cost = 130.0
+        await clock.advance(60)
+        recorder.cost = 5.0
+        await clock.advance(60)
+        await _finish(scheduler, task)
+
+        # The 240s loop ran until 370s: the 300s and 360s slots are skipped
+        assert [seconds for seconds, _ in recorder.loops[4:]] == [240.0, 420.0]
+        metrics = scheduler.get_metrics()
+        assert metrics["missed_ticks"] == 2
+        assert metrics["periodic_loops"] == 5
+        assert metrics["tick_latency_ms"]["max"] == 130_000.0
+
+    @pytest.mark.asyncio
+    async def test_price_and_ltv_triggers(self):
+        """Test threshold moves run a loop between slots and reset the reference."""
+        clock = SimulatedClock(START)
+        recorder = Recorder(clock)
+        scheduler = LiveScheduler(
+            recorder, clock=clock, price_move_threshold=0.01, ltv_threshold=0.85
+        )
+        task = await _start(scheduler)
+
+        assert scheduler.notify_prices({"ETH": 3000.0}) is False
+        assert scheduler.notify_ltv(0.80) is False
+        await clock.advance(10)
+        assert scheduler.notify_prices({"ETH": 3020.0}) is False
+        assert scheduler.notify_prices({"ETH": 3040.0}) is True
+        await clock.advance(10)
+        # Reference is now 3040: a further 0.5% move does not trigger
+        assert scheduler.notify_prices({"ETH": 3055.0}) is False
+        assert scheduler.notify_ltv(0.86) is True
+        await clock.advance(10)
+        await _finish(scheduler, task)
+
+        assert recorder.loops == [
+            (0.0, ["startup"]),
+            (10.0, ["price_move"]),
+            (20.0, ["ltv_threshold"]),
+        ]
+        assert scheduler.get_metrics()["out_of_band_loops"] == 3
+
+    @pytest.mark.asyncio
+    async def test_triggers_during_a_loop_coalesce(self):
+        """Test triggers raised while a loop runs produce one follow-up loop."""
+        clock = SimulatedClock(START)
+        loops = []
+
+        async def slow_loop(timestamp, reasons):
+            loops.append((timestamp.timestamp() - START, reasons))
+            if len(loops) == 2:
+                await clock.sleep(10.0)
+
+        scheduler = LiveScheduler(slow_loop, clock=clock, price_move_threshold=0.01)
+        scheduler.notify_prices({"BTC": 60000.0})
+        task = await _start(scheduler)
+
+        await clock.advance(5)
+        assert scheduler.notify_fill() is True
+        await clock.advance(1)
+        assert scheduler.notify_fill() is True
+        assert scheduler.notify_fill() is False
+        assert scheduler.notify_prices({"BTC": 61000.0}) is False
+        await clock.advance(20)
+        await _finish(scheduler, task)
+
+        assert loops == [
+            (0.0, ["startup"]),
+            (5.0, ["order_fill"]),
+            (15.0, ["order_fill", "price_move"]),
+        ]
+        metrics = scheduler.get_metrics()
+        assert metrics["triggers"] == {"order_fill": 3, "price_move": 1}
+        assert metrics["coalesced_triggers"] == 2
+        assert metrics["loops_by_reason"]["order_fill"] == 2
+
+    @pytest.mark.asyncio
+    async def test_funding_settlement_loop(self):
+        """Test a loop runs funding_lead_seconds before each settlement hour."""
+        clock = SimulatedClock(START + 8 * 3600 - 100)
+        recorder = Recorder(clock)
+        scheduler = LiveScheduler(
+            recorder,
+            interval_seconds=3600.0,
+            clock=clock,
+            funding_hours=(0, 8, 16),
+            funding_lead_seconds=30.0,
+        )
+        task = await _start(scheduler)
+        await clock.advance(200)
+        await _finish(scheduler, task)
+
+        assert [(seconds - 8 * 3600, reasons) for seconds, reasons in recorder.loops] == [
+            (-100.0, ["startup"]),
+            (-30.0, ["funding_settlement"]),
+            (0.0, ["periodic"]),
+        ]
+
+    def test_from_config(self, monkeypatch):
+        """Test thresholds derive from the strategy config and env overrides the interval."""
+        config = {
+            "mode": "eth_leveraged",
+            "target_ltv": 0.8,
+            "max_ltv": 0.9,
+            "component_config": {
+                "strategy_manager": {"position_deviation_threshold": 0.02},
+                "position_monitor": {"settlement": {"funding_enabled": True}},
+            },
+            "live_scheduler": {"funding_lead_seconds": 45},
+        }
+        monkeypatch.setenv("BASIS_LIVE__INTERVAL_SECONDS", "15")
+
+        scheduler = LiveScheduler.from_config(config, lambda timestamp, reasons: None)
+
+        assert scheduler.interval_seconds == 15.0
+        assert scheduler.price_move_threshold == pytest.approx(0.01)
+        assert scheduler.ltv_threshold == pytest.approx(0.85)
+        assert scheduler.funding_hours == (0, 8, 16)
+        assert scheduler.funding_lead_seconds == 45.0
+
+        plain = LiveScheduler.from_config({"mode": "pure_lending_usdt"}, lambda t, r: None)
+        assert plain.ltv_threshold is None
+        assert plain.funding_hours == ()
+        with pytest.raises(ValueError):
+            LiveScheduler(lambda t, r: None, interval_seconds=0)
+
+
+class FillingVenues:
+    """VenueInterfaceManager stand-in confirming every order."""
+
+    def __init__(self):
+        self.routed = []
+
+    def route_to_venue(self, timestamp, order):
+        self.routed.append(order.operation_id)
+        return ExecutionHandshake(
+            operation_id=order.operation_id,
+            status=ExecutionStatus.CONFIRMED,
+            actual_deltas=order.expected_deltas,
+            execution_details={},
+            submitted_at=datetime(2024, 6, 3),
+            simulated=False,
+        )
+
+
+def _supply_order():
+    return Order(
+        operation_id="supply_001",
+        venue="aave_v3",
+        operation=OrderOperation.SUPPLY,
+        amount=100.0,
+        source_venue="wallet",
+        target_venue="aave_v3",
+        source_token="USDT",
+        target_token="aUSDT",
+        token_in="USDT",
+        token_out="aUSDT",
+        expected_deltas={"wallet:BaseToken:USDT": -100.0, "aave_v3:aToken:aUSDT": 100.0},
+    )
+
+
+@pytest.fixture
+def live_engine():
+    """Live engine with stand-in components around a real ExecutionManager and scheduler."""
+    from backend.src.basis_strategy_v1.core.event_engine.event_driven_strategy_engine import (
+        EventDrivenStrategyEngine,
+    )
+
+    config = {
+        "mode": "pure_lending_usdt",
+        "share_class": "USDT",
+        "live_scheduler": {"ltv_threshold": 0.85},
+        "component_config": {"risk_monitor": {"watchdog": {"enabled": True}}},
+    }
+    data_provider = Mock()
+    data_provider.get_data.return_value = {"market_data": {"prices": {"ETH": 3000.0}}}
+    components = ["PositionMonitor", "ExposureMonitor", "RiskMonitor", "PnLMonitor"]
+    patches = [patch(f"{ENGINE_MODULE}.{name}") for name in components]
+    patches.append(patch(f"{STRATEGIES_MODULE}.strategy_factory.StrategyFactory"))
+    for component in patches:
+        component.start()
+    try:
+        engine = EventDrivenStrategyEngine(
+            config=config,
+            execution_mode="live",
+            data_provider=data_provider,
+            initial_capital=100000,
+            share_class="USDT",
+        )
+    finally:
+        for component in patches:
+            component.stop()
+
+    engine.execution_manager.venue_interface_manager = FillingVenues()
+    engine.execution_manager.position_update_handler = None
+    engine.exposure_monitor.calculate_exposure.return_value = {"exposures": {}}
+    engine.pnl_monitor.get_latest_pnl.return_value = {}
+    engine.position_monitor.get_current_positions.return_value = {}
+    engine.position_monitor.venue_query = None
+    engine._log_timestep_event = Mock()
+    engine._store_timestep_result = Mock()
+
+    risk_monitor = engine.risk_monitor
+    risk_monitor.ltv = 0.80
+    risk_monitor.assess_risk.side_effect = lambda **kwargs: {"CURRENT_LTV": risk_monitor.ltv}
+    risk_monitor._target_ltv_f = 0.80
+    risk_monitor._aave_max_ltv_f = 0.93
+    risk_monitor.cex_margin_requirements = {}
+    risk_monitor._cex_target_margins_f = {}
+    empty = np.zeros(0, dtype=np.intp)
+    risk_monitor._exposure_layout.return_value = (empty, empty, [])
+    risk_monitor._risk_ratios_from_totals.side_effect = lambda totals, venues: (
+        risk_monitor.ltv,
+        {},
+    )
+    return engine
+
+
+class TestLiveEngineTriggers:
+    """Test run_live wires fills and LTVs into the scheduler and keeps the event loop free."""
+
+    @pytest.mark.asyncio
+    async def test_fills_and_ltv_trigger_loops(self, live_engine, tmp_path, monkeypatch):
+        """Test a fill runs a follow-up loop and a streamed LTV crossing runs another."""
+        monkeypatch.chdir(tmp_path)
+        engine = live_engine
+        orders = [[_supply_order()]]
+        engine.strategy_manager.generate_orders.side_effect = lambda **kwargs: (
+            orders.pop() if orders else []
+        )
+        clock = SimulatedClock(START)
+        task = asyncio.create_task(engine.run_live(clock=clock))
+        await clock.advance(0)
+        scheduler = engine.live_scheduler
+
+        # The startup loop's fill runs one follow-up loop; that loop's LTV is the reference
+        assert scheduler.loops == {"startup": 1, "order_fill": 1}
+        assert engine.execution_manager.venue_interface_manager.routed == ["supply_001"]
+
+        engine.risk_monitor.ltv = 0.86
+        report = engine.risk_watchdog.evaluate()
+        assert report["current_ltv"] == 0.86
+        await clock.advance(1)
+        assert scheduler.loops["ltv_threshold"] == 1
+
+        # Crossing back triggers too; that loop assesses 0.80 itself, so nothing follows
+        engine.risk_monitor.ltv = 0.80
+        assert scheduler.notify_ltv(0.80) is True
+        await clock.advance(1)
+        engine.stop()
+        await clock.advance(0)
+        await task
+
+        assert scheduler.loops == {"startup": 1, "order_fill": 1, "ltv_threshold": 2}
+        assert scheduler.get_metrics()["triggers"] == {"order_fill": 1, "ltv_threshold": 2}
+        assert engine.execution_manager.on_fill is None
+
+    @pytest.mark.asyncio
+    async def test_loop_runs_off_the_event_loop(self, live_engine, tmp_path, monkeypatch):
+        """Test prices and watchdog evaluations are served while a full loop is running."""
+        monkeypatch.chdir(tmp_path)
+        engine = live_engine
+        in_loop, release = threading.Event(), threading.Event()
+
+        def blocking_orders(**kwargs):
+            in_loop.set()
+            assert release.wait(5.0)
+            return []
+
+        engine.strategy_manager.generate_orders.side_effect = blocking_orders
+        task = asyncio.create_task(engine.run_live())
+        while not in_loop.is_set():
+            await asyncio.sleep(0.01)
+
+        engine.notify_prices({"ETH": 2900.0})
+        assert engine.live_scheduler.get_metrics()["in_loop"] is True
+        assert engine.risk_watchdog.evaluate() is None  # No exposure before the first loop
+        release.set()
+        while engine.risk_watchdog.exposure_updates == 0:
+            await asyncio.sleep(0.01)
+        engine.stop()
+        await task
+
+        assert engine.live_scheduler.loops == {"startup": 1}
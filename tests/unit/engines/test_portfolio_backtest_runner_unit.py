@@ -0,0 +1,180 @@
+"""
+Unit tests for the portfolio backtest runner.
+
+Tests lockstep stepping over the union timeline, combined book valuation
+across share classes, capital weight normalization and failure cleanup.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from basis_strategy_v1.core.components.position_monitor import PositionMonitor
+from basis_strategy_v1.core.event_engine.portfolio_backtest_runner import (
+    PortfolioBacktestRunner,
+    isolate_component_singletons,
+    normalize_weights,
+)
+from basis_strategy_v1.core.services.backtest_service import BacktestService
+
+
+HOURS = list(pd.date_range("2024-06-01", periods=3, freq="h", tz="UTC"))
+
+
+class FakeProvider:
+    """Provider with a cached snapshot per timestamp."""
+
+    def __init__(self):
+        self._data_cache = {}
+
+    def get_data(self, timestamp):
+        return self._data_cache.setdefault(
+            str(timestamp), {"market_data": {"prices": {"USDT": 1.0, "ETH": 2000.0 + timestamp.hour}}}
+        )
+
+
+class FakeEngine:
+    """Engine exposing the start/step/finish run protocol."""
+
+    def __init__(self, name, data_provider, ticks, share_class="USDT", initial_capital=1000.0, log=None):
+        self.mode = name
+        self.data_provider = data_provider
+        self.ticks = ticks
+        self.share_class = share_class
+        self.initial_capital = initial_capital
+        self.log = log if log is not None else []
+        self.curve = []
+        self.aborted = False
+
+    async def start_backtest_run(self, start_date, end_date):
+        return pd.DatetimeIndex(self.ticks)
+
+    async def step_backtest_run(self, timestamp):
+        self.data_provider.get_data(timestamp)
+        self.log.append((timestamp, self.mode))
+        self.curve.append({"timestamp": timestamp.isoformat(), "net_value": self.initial_capital + len(self.curve)})
+        return True
+
+    async def finish_backtest_run(self):
+        return {"performance": {"equity_curve": self.curve}}
+
+    async def abort_backtest_run(self):
+        self.aborted = True
+
+
+class TestPortfolioBacktestRunner:
+    """Test lockstep runs and the combined book."""
+
+    def test_lockstep_over_union_timeline(self):
+        """Test every tick steps all engines scheduled on it before moving on."""
+        provider, log = FakeProvider(), []
+        half_hourly = list(pd.date_range(HOURS[0], HOURS[1], freq="30min"))
+        engines = {
+            "hourly": FakeEngine("hourly", provider, HOURS, log=log),
+            "fast": FakeEngine("fast", provider, half_hourly, log=log),
+        }
+
+        results = asyncio.run(
+            PortfolioBacktestRunner(engines, {"hourly": 0.5, "fast": 0.5}, 2000.0).run(
+                "2024-06-01", "2024-06-02"
+            )
+        )
+
+        assert [ts for ts, _ in log] == sorted(ts for ts, _ in log)
+        assert log[:2] == [(HOURS[0], "hourly"), (HOURS[0], "fast")]
+        assert results["data_access"] == {"ticks": 4, "shared_data_providers": 1, "snapshots_loaded": 4}
+
+    def test_combined_book_in_reporting_currency(self):
+        """Test ETH share-class values are converted and missing points carry forward."""
+        provider = FakeProvider()
+        engines = {
+            "usdt": FakeEngine("usdt", provider, HOURS, initial_capital=1000.0),
+            "eth": FakeEngine("eth", provider, HOURS[:1], share_class="ETH", initial_capital=0.5),
+        }
+
+        combined = asyncio.run(
+            PortfolioBacktestRunner(engines, {"usdt": 0.5, "eth": 0.5}, 2000.0).run(
+                "2024-06-01", "2024-06-02"
+            )
+        )["combined"]
+
+        last = combined["equity_curve"][-1]
+        assert last["by_strategy"] == {"usdt": 1002.0, "eth": 0.5 * 2002.0}
+        assert combined["final_value"] == pytest.approx(2003.0)
+        assert combined["total_return"] == pytest.approx(3.0)
+
+    def test_failure_aborts_started_engines(self):
+        """Test a failing tick stops every engine's results store."""
+        provider = FakeProvider()
+        engines = {"a": FakeEngine("a", provider, HOURS), "b": FakeEngine("b", provider, HOURS)}
+
+        async def fail(timestamp):
+            raise KeyError("boom")
+
+        engines["b"].step_backtest_run = fail
+
+        with pytest.raises(KeyError):
+            asyncio.run(PortfolioBacktestRunner(engines, {"a": 0.5, "b": 0.5}, 1.0).run("x", "y"))
+        assert engines["a"].aborted and engines["b"].aborted
+
+
+def test_normalize_weights():
+    """Test equal default weights, normalization and validation."""
+    assert normalize_weights(["a", "b"]) == {"a": 0.5, "b": 0.5}
+    assert normalize_weights(["a", "b"], {"a": 3, "b": 1}) == {"a": 0.75, "b": 0.25}
+    with pytest.raises(ValueError):
+        normalize_weights(["a", "b"], {"a": 1})
+    with pytest.raises(ValueError):
+        normalize_weights(["a"], {"a": 0})
+
+
+def test_isolate_component_singletons():
+    """Test each engine build gets fresh component instances."""
+    first = PositionMonitor.__new__(PositionMonitor)
+    assert PositionMonitor.__new__(PositionMonitor) is first
+
+    isolate_component_singletons()
+    assert PositionMonitor.__new__(PositionMonitor) is not first
+    isolate_component_singletons()
+
+
+class FakeConfigManager:
+    """Mode registry with ConfigManager's strategy lookups."""
+
+    modes = ["pure_lending_usdt", "ml_btc_directional_usdt_margin"]
+
+    def strategy_exists(self, strategy_name):
+        return strategy_name in self.modes
+
+    def validate_strategy_name(self, strategy_name):
+        if not self.strategy_exists(strategy_name):
+            raise ValueError(f"Unknown strategy: {strategy_name}")
+
+
+@pytest.mark.asyncio
+async def test_portfolio_rejects_unknown_sleeve_modes():
+    """Test sleeves are validated against the mode registry before any data is loaded."""
+    service = BacktestService()
+    with patch(
+        "basis_strategy_v1.infrastructure.config.config_manager.get_config_manager",
+        return_value=FakeConfigManager(),
+    ), patch(
+        "basis_strategy_v1.infrastructure.data.data_provider_cache.get_data_provider_cache"
+    ) as get_cache:
+        with pytest.raises(ValueError, match="Unknown strategy: usdt_market_neutral"):
+            await service.run_portfolio_backtest(
+                ["pure_lending_usdt", "usdt_market_neutral"],
+                datetime(2024, 6, 1, tzinfo=timezone.utc),
+                datetime(2024, 6, 2, tzinfo=timezone.utc),
+                Decimal("1000"),
+            )
+        get_cache.assert_not_called()
+
+        # Registered modes resolve to themselves, never to the pure lending default
+        assert service._map_strategy_to_mode("ml_btc_directional_usdt_margin") == (
+            "ml_btc_directional_usdt_margin"
+        )
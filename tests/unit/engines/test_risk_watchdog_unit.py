@@ -0,0 +1,176 @@
+"""
+Unit tests for the live risk watchdog.
+
+Tests re-pricing of the cached exposure against RiskMonitor's math, guard band
+escalation (edge-triggered, confirmations) and price-driven evaluation on a
+simulated clock.
+"""
+
+import asyncio
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from backend.src.basis_strategy_v1.core.components.risk_monitor import RiskMonitor
+from backend.src.basis_strategy_v1.core.event_engine.live_scheduler import SimulatedClock
+from backend.src.basis_strategy_v1.core.event_engine.risk_watchdog import (
+    RiskWatchdog,
+    price_key,
+)
+
+EXPOSURE = {
+    "exposures": {
+        "aave_v3:aToken:aweETH": {"amount": 10.0, "VALUE_USD": 30000.0},
+        "aave_v3:debtToken:debtWETH": {"amount": 7.0, "VALUE_USD": 21000.3},
+        "binance:BaseToken:USDT": {"amount": 5000.0, "VALUE_USD": 5000.0},
+        "binance:Perp:ETHUSDT": {"amount": -3.0, "VALUE_USD": 9000.0},
+        "wallet:BaseToken:ETH": {"amount": 1.0, "VALUE_USD": 3000.0},
+    }
+}
+PRICES = {"ETH": 3000.0, "weETH": 3000.0, "USDT": 1.0}
+
+
+@pytest.fixture
+def risk_monitor(mock_config, mock_data_provider, mock_utility_manager):
+    mock_utility_manager.calculate_dynamic_ltv_target.return_value = Decimal("0.7")
+    mock_utility_manager.calculate_cex_target_margin.return_value = Decimal("0.3")
+    risk_monitor = RiskMonitor(
+        config=mock_config,
+        data_provider=mock_data_provider,
+        utility_manager=mock_utility_manager,
+        log_dir=Path("/tmp/test_logs"),
+    )
+    risk_monitor.cex_margin_requirements = {
+        "binance": {
+            "INITIAL_MARGIN": Decimal("0.1"),
+            "MAINTENANCE_MARGIN": Decimal("0.15"),
+            "liquidation_threshold": Decimal("0.1"),
+        }
+    }
+    risk_monitor.cex_target_margins = {"binance": Decimal("0.3")}
+    risk_monitor._cache_float_parameters()
+    return risk_monitor
+
+
+def _watchdog(risk_monitor, strategy_calls, emergency_calls, **kwargs):
+    kwargs.setdefault("ltv_strategy_band", 0.72)
+    kwargs.setdefault("ltv_emergency_band", 0.80)
+    watchdog = RiskWatchdog(
+        risk_monitor,
+        on_strategy_breach=strategy_calls.append,
+        on_emergency=emergency_calls.append,
+        **kwargs,
+    )
+    watchdog.update_exposure(EXPOSURE, PRICES)
+    return watchdog
+
+
+class TestRiskWatchdog:
+    """Test re-pricing, guard bands and scheduling."""
+
+    def test_reprices_with_risk_monitor_math(self, risk_monitor):
+        """Test re-priced ratios equal RiskMonitor's on the exposure valued at new prices."""
+        watchdog = _watchdog(risk_monitor, [], [])
+        watchdog.notify_prices({"ETH": 3300.0, "weETH": 2910.0, "BTC": 60000.0})
+        report = watchdog.evaluate()
+
+        repriced = {
+            "exposures": {
+                "aave_v3:aToken:aweETH": {"amount": 10.0, "VALUE_USD": 30000.0 * 0.97},
+                "aave_v3:debtToken:debtWETH": {"amount": 7.0, "VALUE_USD": 21000.3 * 1.1},
+                "binance:BaseToken:USDT": {"amount": 5000.0, "VALUE_USD": 5000.0},
+                "binance:Perp:ETHUSDT": {"amount": -3.0, "VALUE_USD": 9000.0 * 1.1},
+                "wallet:BaseToken:ETH": {"amount": 1.0, "VALUE_USD": 3300.0},
+            }
+        }
+        current_ltv, margin_ratios = risk_monitor._calculate_risk_ratios_fast(repriced)
+        assert report["current_ltv"] == pytest.approx(current_ltv, rel=1e-12)
+        assert report["cex_margin_ratios"] == pytest.approx(margin_ratios, rel=1e-12)
+
+        assert price_key("aave_v3:aToken:aweETH", {"ETH": 1.0}) == "ETH"
+        assert price_key("bybit:Perp:BTCUSDT", {"BTC": 1.0}) == "BTC"
+        assert price_key("binance:BaseToken:USDT", {"ETH": 1.0}) is None
+
+    def test_strategy_band_escalates_once_per_entry(self, risk_monitor):
+        """Test entering the strategy band escalates once and leaving it re-arms."""
+        strategy_calls = []
+        watchdog = _watchdog(risk_monitor, strategy_calls, [], confirmations=1)
+
+        watchdog.notify_prices({"weETH": 2910.0})  # LTV 0.7217
+        assert watchdog.evaluate()["band"] == "strategy"
+        watchdog.notify_prices({"weETH": 2905.0})
+        watchdog.evaluate()
+        assert len(strategy_calls) == 1
+
+        watchdog.notify_prices({"weETH": 3000.0})
+        assert watchdog.evaluate()["band"] == "ok"
+        watchdog.notify_prices({"ETH": 3900.0, "weETH": 3900.0})  # Perp short grows: margin 0.2994
+        report = watchdog.evaluate()
+        assert report["band"] == "strategy"
+        assert report["reasons"] == ["binance margin 0.2994 <= 0.3000"]
+        assert len(strategy_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_emergency_band_needs_confirmations(self, risk_monitor):
+        """Test the emergency path runs after consecutive breaches and stops the watchdog."""
+        emergency_reports = []
+
+        async def on_emergency(report):
+            emergency_reports.append(report)
+
+        watchdog = RiskWatchdog(
+            risk_monitor,
+            on_strategy_breach=lambda report: None,
+            on_emergency=on_emergency,
+            ltv_strategy_band=0.72,
+            ltv_emergency_band=0.80,
+            confirmations=2,
+        )
+        watchdog.update_exposure(EXPOSURE, PRICES)
+        watchdog.is_running = True
+
+        watchdog.notify_prices({"weETH": 2550.0})  # LTV 0.8235
+        assert watchdog.evaluate()["band"] == "emergency"
+        await asyncio.sleep(0)
+        assert emergency_reports == []
+
+        watchdog.evaluate()
+        await asyncio.sleep(0)
+        assert len(emergency_reports) == 1
+        assert emergency_reports[0]["reasons"] == ["ltv 0.8235 >= 0.8000"]
+        assert watchdog.is_running is False
+        assert watchdog.breaches == {"strategy": 0, "emergency": 1}
+
+    @pytest.mark.asyncio
+    async def test_run_evaluates_on_price_changes(self, risk_monitor):
+        """Test the loop evaluates only when prices changed since the last evaluation."""
+        clock = SimulatedClock(0.0)
+        watchdog = _watchdog(risk_monitor, [], [], clock=clock, interval_seconds=0.25)
+        task = asyncio.create_task(watchdog.run())
+
+        await clock.advance(1.0)
+        assert (watchdog.evaluations, watchdog.skipped_evaluations) == (0, 4)
+
+        watchdog.notify_prices({"ETH": 3010.0, "SOL": 150.0})
+        await clock.advance(0.5)
+        assert (watchdog.evaluations, watchdog.skipped_evaluations) == (1, 5)
+        assert watchdog.get_metrics()["evaluation_latency_us"]["max"] is not None
+
+        watchdog.stop()
+        await clock.advance(0.25)
+        await task
+
+    def test_from_config(self, risk_monitor, mock_config, monkeypatch):
+        """Test the watchdog is on for hedged books by default and reads its config."""
+        assert RiskWatchdog.from_config(mock_config, risk_monitor, print, print) is None
+
+        config = dict(mock_config)
+        config["component_config"] = dict(
+            mock_config["component_config"],
+            position_monitor={"position_subscriptions": ["binance:Perp:ETHUSDT"]},
+        )
+        monkeypatch.setenv("BASIS_LIVE__WATCHDOG_INTERVAL_SECONDS", "0.1")
+        watchdog = RiskWatchdog.from_config(config, risk_monitor, print, print)
+        assert watchdog.interval_seconds == 0.1
+        assert watchdog.ltv_emergency_band == risk_monitor._aave_max_ltv_f
@@ -0,0 +1,282 @@
+"""
+Unit tests for sparse backtest stepping.
+
+Tests which ticks SparseStepper sends through the full component chain:
+boundary ticks, settlement schedule, follow-up ticks after orders,
+deposits/withdrawals and market moves beyond the strategy-derived threshold,
+and that dense and sparse engine runs give the same equity curve.
+"""
+
+import asyncio
+
+import pandas as pd
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from backend.src.basis_strategy_v1.core.event_engine.sparse_stepping import (
+    SparseStepper,
+    get_stepping_mode,
+)
+from backend.src.basis_strategy_v1.infrastructure.data.historical_defi_data_provider import (
+    HistoricalDeFiDataProvider,
+)
+
+
+TIMESTAMPS = list(pd.date_range("2024-06-03 01:00", periods=12, freq="h", tz="UTC"))
+
+
+class FakeProvider:
+    """Provider with one ETH price series."""
+
+    def __init__(self, prices):
+        self.csv_mappings = {
+            "market_data.prices.ETH": "eth.csv",
+            "market_data.prices.USDT": None,
+            "market_data.funding_rates.ETH_binance": "funding.csv",
+        }
+        self.prices = pd.Series(prices, index=pd.DatetimeIndex(TIMESTAMPS))
+        self.get_data = Mock()
+
+    def get_series(self, data_key, timestamps):
+        assert data_key == "market_data.prices.ETH"
+        return self.prices.reindex(pd.DatetimeIndex(timestamps))
+
+
+@pytest.fixture
+def position_monitor():
+    monitor = Mock()
+    monitor._should_apply_funding_settlement.side_effect = lambda ts: ts.hour in (0, 8, 16)
+    monitor._should_apply_seasonal_rewards.return_value = False
+    return monitor
+
+
+def _run(stepper, orders_at=()):
+    processed = []
+    for index, timestamp in enumerate(TIMESTAMPS):
+        if stepper.should_process(timestamp, is_last=index == len(TIMESTAMPS) - 1):
+            processed.append(timestamp.hour)
+            stepper.record_processed(timestamp, order_count=1 if timestamp.hour in orders_at else 0)
+    return processed
+
+
+class TestSparseStepper:
+    """Test tick selection."""
+
+    def test_quiet_market_processes_boundaries_and_settlements(self, position_monitor):
+        """Test a flat market only runs first/last ticks and funding settlements."""
+        provider = FakeProvider([3000.0] * 12)
+        stepper = SparseStepper({"mode": "btc_basis"}, position_monitor, provider, TIMESTAMPS)
+
+        assert _run(stepper) == [1, 8, 12]
+        assert stepper.get_stats()["skipped_ticks"] == 9
+        provider.get_data.assert_not_called()
+
+    def test_orders_force_follow_up_tick(self, position_monitor):
+        """Test the tick after an order-generating tick is processed."""
+        provider = FakeProvider([3000.0] * 12)
+        stepper = SparseStepper({"mode": "btc_basis"}, position_monitor, provider, TIMESTAMPS)
+
+        assert _run(stepper, orders_at=(1, 2)) == [1, 2, 3, 8, 12]
+
+    def test_market_move_relative_to_last_processed_tick(self, position_monitor):
+        """Test small moves accumulate until they exceed the threshold."""
+        prices = [3000.0, 3010.0, 3020.0, 3031.0, 3031.0, 3031.0, 3031.0, 3031.0, 3031.0, 3000.0, 3000.0, 3000.0]
+        provider = FakeProvider(prices)
+        stepper = SparseStepper(
+            {"mode": "btc_basis"}, position_monitor, provider, TIMESTAMPS, move_threshold=0.01
+        )
+
+        # 3031 is > 1% above 3000 (hour 4); 3000 is > 1% below the hour-8 reference (hour 10)
+        assert _run(stepper) == [1, 4, 8, 10, 12]
+        assert stepper.get_stats()["reasons"]["market_move"] == 2
+
+    def test_capital_flows_force_ticks(self, position_monitor):
+        """Test the first tick at or after each deposit/withdrawal is processed."""
+        provider = FakeProvider([3000.0] * 12)
+        config = {
+            "mode": "btc_basis",
+            "capital_flows": [
+                {"timestamp": "2024-06-03 03:00", "type": "deposit"},
+                {"timestamp": "2024-06-03 05:30", "type": "withdrawal"},
+            ],
+        }
+        stepper = SparseStepper(config, position_monitor, provider, TIMESTAMPS)
+        stepper.schedule_capital_flow(pd.Timestamp("2024-06-03 10:00", tz="UTC"), "deposit")
+
+        assert _run(stepper) == [1, 3, 6, 8, 10, 12]
+        assert stepper.get_stats()["reasons"] == {
+            "first_tick": 1,
+            "deposit": 2,
+            "withdrawal": 1,
+            "funding_settlement": 1,
+            "last_tick": 1,
+        }
+        with pytest.raises(ValueError):
+            stepper.schedule_capital_flow(TIMESTAMPS[0], "transfer")
+
+    def test_pending_capital_flows_survive_checkpoint(self, position_monitor):
+        """Test a capital flow after the checkpoint still forces its tick on resume."""
+        provider = FakeProvider([3000.0] * 12)
+        config = {"mode": "btc_basis", "capital_flows": [{"timestamp": "2024-06-03 10:00"}]}
+        stepper = SparseStepper(config, position_monitor, provider, TIMESTAMPS)
+        for timestamp in TIMESTAMPS[:3]:
+            if stepper.should_process(timestamp):
+                stepper.record_processed(timestamp)
+
+        resumed = SparseStepper({"mode": "btc_basis"}, position_monitor, provider, TIMESTAMPS)
+        resumed.restore_checkpoint_state(stepper.get_checkpoint_state())
+
+        assert [ts.hour for ts in TIMESTAMPS[3:] if resumed.should_process(ts)] == [8, 10]
+
+    def test_move_threshold_from_strategy_config(self):
+        """Test the threshold is half the tightest deviation or LTV headroom."""
+        assert SparseStepper.derive_move_threshold({}) == pytest.approx(0.01)
+        config = {
+            "max_ltv": 0.75,
+            "target_ltv": 0.72,
+            "component_config": {"strategy_manager": {"position_deviation_threshold": 0.05}},
+        }
+        assert SparseStepper.derive_move_threshold(config) == pytest.approx(0.02)
+
+    def test_stepping_mode_selection(self, monkeypatch):
+        """Test config/env selection and dense fallback for ML strategies."""
+        monkeypatch.delenv("BASIS_BACKTEST__STEPPING", raising=False)
+        assert get_stepping_mode({"mode": "pure_lending_usdt"}) == "dense"
+        assert get_stepping_mode({"mode": "pure_lending_usdt", "backtest_stepping": "sparse"}) == "sparse"
+        assert (
+            get_stepping_mode({"mode": "ml_btc_directional_usdt_margin", "backtest_stepping": "sparse"})
+            == "dense"
+        )
+
+        monkeypatch.setenv("BASIS_BACKTEST__STEPPING", "sparse")
+        assert get_stepping_mode({"mode": "eth_staking_only"}) == "sparse"
+
+        monkeypatch.setenv("BASIS_BACKTEST__STEPPING", "weekly")
+        with pytest.raises(ValueError):
+            get_stepping_mode({"mode": "eth_staking_only"})
+
+
+def test_provider_series_matches_snapshots():
+    """Test get_series returns the values get_data puts in each snapshot."""
+    provider = HistoricalDeFiDataProvider(
+        {
+            "data_dir": "data",
+            "component_config": {
+                "position_monitor": {"position_subscriptions": ["aave_v3:aToken:aUSDT"]}
+            },
+        }
+    )
+    timestamps = list(pd.date_range("2024-06-01", periods=12, freq="6h", tz="UTC"))
+
+    series = provider.get_series("protocol_data.aave_indexes.aUSDT", timestamps)
+
+    assert series.tolist() == [
+        provider._load_csv_value(provider.csv_mappings["protocol_data.aave_indexes.aUSDT"], ts)
+        for ts in timestamps
+    ]
+
+
+ENGINE_MODULE = "backend.src.basis_strategy_v1.core.event_engine.event_driven_strategy_engine"
+STRATEGIES_MODULE = "backend.src.basis_strategy_v1.core.strategies"
+HOURS = pd.date_range("2024-06-01", "2024-06-03", freq="h", tz="UTC")
+
+
+class Book:
+    """Prices and positions behind stand-in monitors: USDT swapped into ETH on the first tick."""
+
+    def __init__(self):
+        self.prices = {ts: 3000.0 * (1 + 0.0004 * i) for i, ts in enumerate(HOURS)}
+        self.positions = {"wallet:BaseToken:USDT": 1000.0, "wallet:BaseToken:ETH": 0.0}
+
+    def value(self, positions, timestamp):
+        return (
+            positions["wallet:BaseToken:USDT"]
+            + positions["wallet:BaseToken:ETH"] * self.prices[timestamp]
+        )
+
+    def get_data(self, timestamp):
+        prices = {"ETH": self.prices[timestamp], "USDT": 1.0}
+        return {"market_data": {"timestamp": timestamp, "prices": prices}}
+
+    def buy_eth(self, timestamp, orders):
+        usdt = self.positions["wallet:BaseToken:USDT"]
+        self.positions = {
+            "wallet:BaseToken:USDT": 0.0,
+            "wallet:BaseToken:ETH": usdt / self.prices[timestamp],
+        }
+        return [{"success": True}]
+
+
+def _backtest_engine(book):
+    """Backtest engine with monitors, strategy and execution backed by a Book."""
+    from backend.src.basis_strategy_v1.core.event_engine.event_driven_strategy_engine import (
+        EventDrivenStrategyEngine,
+    )
+
+    components = ["PositionMonitor", "ExposureMonitor", "RiskMonitor", "PnLMonitor"]
+    patches = [patch(f"{ENGINE_MODULE}.{name}") for name in components]
+    patches.append(patch(f"{STRATEGIES_MODULE}.strategy_factory.StrategyFactory"))
+    for component in patches:
+        component.start()
+    try:
+        engine = EventDrivenStrategyEngine(
+            config={"mode": "pure_lending_usdt", "share_class": "USDT"},
+            execution_mode="backtest",
+            data_provider=book,
+            initial_capital=1000,
+            share_class="USDT",
+        )
+    finally:
+        for component in patches:
+            component.stop()
+
+    engine.results_store = Mock(
+        start=AsyncMock(), stop=AsyncMock(), flush=AsyncMock(), save_final_result=AsyncMock()
+    )
+    engine._log_timestep_event = Mock()
+    engine._store_timestep_result = Mock()
+
+    position_monitor = engine.position_monitor
+    position_monitor.update_state.side_effect = lambda *args: dict(book.positions)
+    position_monitor.get_current_positions.side_effect = lambda: dict(book.positions)
+    position_monitor._should_apply_funding_settlement.side_effect = lambda ts: ts.hour % 8 == 0
+    position_monitor._should_apply_seasonal_rewards.return_value = False
+
+    def exposure(timestamp, position_snapshot, market_data=None):
+        return {"total_exposure": book.value(position_snapshot, timestamp)}
+
+    engine.exposure_monitor.calculate_exposure.side_effect = exposure
+    engine.exposure_monitor.value_positions.side_effect = exposure
+    engine.risk_monitor.assess_risk.return_value = {}
+    engine.strategy_manager.generate_orders.side_effect = lambda **kwargs: (
+        [] if kwargs["position_snapshot"]["wallet:BaseToken:ETH"] else ["swap"]
+    )
+    engine.execution_manager = Mock()
+    engine.execution_manager.process_orders.side_effect = book.buy_eth
+
+    pnl_monitor = engine.pnl_monitor
+    pnl_monitor.get_balance_pnl_at.side_effect = lambda positions, ts: book.value(positions, ts) - 1000
+
+    def update_pnl(timestamp, trigger_source):
+        pnl = pnl_monitor.get_balance_pnl_at(book.positions, timestamp)
+        pnl_monitor.get_latest_pnl.return_value = {"BALANCE_BASED": {"PNL_CUMULATIVE": pnl}}
+
+    pnl_monitor.update_state.side_effect = update_pnl
+    pnl_monitor.calculate_run_attribution.return_value = {}
+    return engine
+
+
+def test_sparse_run_matches_dense_equity_curve(monkeypatch):
+    """Test skipped ticks get accrued equity points equal to the dense run's."""
+    monkeypatch.setenv("BASIS_BACKTEST__CHECKPOINT_EVERY", "0")
+    results = {}
+    for stepping in ("dense", "sparse"):
+        monkeypatch.setenv("BASIS_BACKTEST__STEPPING", stepping)
+        engine = _backtest_engine(Book())
+        results[stepping] = asyncio.run(engine.run_backtest("2024-06-01", "2024-06-03"))
+
+    dense, sparse = results["dense"], results["sparse"]
+    assert sparse["stepping"]["processed_ticks"] < len(HOURS) / 4
+    assert len(sparse["performance"]["equity_curve"]) == len(HOURS)
+    assert sparse["performance"] == dense["performance"]
+    assert sparse["final_position"] == dense["final_position"]
@@ -0,0 +1,258 @@
+"""
+Unit tests for batched, block-pinned on-chain reads.
+
+Uses an in-process JSON-RPC chain (ERC-20 balances, decimals, an AAVE-style oracle and
+optionally Multicall3) to test request counts, block pinning, the per-block cache, the
+eth_call fallback and OnChainPositionInterface's live refresh.
+"""
+
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+from eth_abi import decode, encode
+from eth_utils import keccak
+
+from backend.src.basis_strategy_v1.core.interfaces.onchain_position_interface import (
+    OnChainPositionInterface,
+)
+from backend.src.basis_strategy_v1.infrastructure.chain.chain_reader import (
+    AGGREGATE3,
+    MULTICALL3_ADDRESS,
+    ChainRead,
+    ChainReader,
+    ChainRPCError,
+)
+
+WALLET = "0x00000000000000000000000000000000000000AA"
+USDT = "0x00000000000000000000000000000000000000B1"
+AUSDT = "0x00000000000000000000000000000000000000B2"
+DEBT_WETH = "0x00000000000000000000000000000000000000B3"
+WETH = "0x00000000000000000000000000000000000000B4"
+ORACLE = "0x00000000000000000000000000000000000000C1"
+REVERTING = "0x00000000000000000000000000000000000000D1"
+
+
+def _selector(signature):
+    return keccak(text=signature)[:4]
+
+
+class FakeChain:
+    """JSON-RPC stand-in answering eth_blockNumber, eth_call, eth_getBalance and batches."""
+
+    def __init__(self, multicall=True):
+        self.multicall = multicall
+        self.block = 100
+        self.requests = []
+        self.native = {WALLET.lower(): 2 * 10**18}
+        self.tokens = {
+            USDT.lower(): (6, {WALLET.lower(): 1500 * 10**6}),
+            AUSDT.lower(): (6, {WALLET.lower(): 10_000 * 10**6}),
+            DEBT_WETH.lower(): (18, {WALLET.lower(): 3 * 10**18}),
+            WETH.lower(): (18, {}),
+        }
+        self.prices = {USDT.lower(): 10**8, WETH.lower(): 3000 * 10**8}
+
+    def send(self, method, params):
+        self.requests.append((method, params))
+        return self._answer(method, params)
+
+    def send_batch(self, requests):
+        self.requests.append(("batch", requests))
+        results = []
+        for method, params in requests:
+            try:
+                results.append(self._answer(method, params))
+            except ChainRPCError as e:
+                results.append(e)
+        return results
+
+    def _answer(self, method, params):
+        if method == "eth_blockNumber":
+            return hex(self.block)
+        if method == "eth_getBalance":
+            return hex(self.native.get(params[0].lower(), 0))
+        call, _block = params
+        to, data = call["to"].lower(), bytes.fromhex(call["data"][2:])
+        if to == MULTICALL3_ADDRESS.lower():
+            if not self.multicall:
+                return "0x"
+            (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+            returned = []
+            for target, _allow_failure, call_data in calls:
+                try:
+                    returned.append((True, self._contract_call(target.lower(), call_data)))
+                except ChainRPCError:
+                    returned.append((False, b""))
+            return "0x" + encode(["(bool,bytes)[]"], [returned]).hex()
+        return "0x" + self._contract_call(to, data).hex()
+
+    def _contract_call(self, to, data):
+        selector, args = data[:4], data[4:]
+        if to == MULTICALL3_ADDRESS.lower() and selector == _selector("getEthBalance(address)"):
+            (owner,) = decode(["address"], args)
+            return encode(["uint256"], [self.native.get(owner.lower(), 0)])
+        if to in self.tokens and selector == _selector("balanceOf(address)"):
+            (owner,) = decode(["address"], args)
+            return encode(["uint256"], [self.tokens[to][1].get(owner.lower(), 0)])
+        if to in self.tokens and selector == _selector("decimals()"):
+            return encode(["uint8"], [self.tokens[to][0]])
+        if to == ORACLE.lower() and selector == _selector("getAssetPrice(address)"):
+            (asset,) = decode(["address"], args)
+            return encode(["uint256"], [self.prices[asset.lower()]])
+        raise ChainRPCError({"code": 3, "message": "execution reverted"})
+
+    def blocks_used(self):
+        """Block parameter of every eth_call / eth_getBalance sent (including in batches)."""
+        blocks = []
+        for method, params in self.requests:
+            for inner_method, inner_params in params if method == "batch" else [(method, params)]:
+                if inner_method in ("eth_call", "eth_getBalance"):
+                    blocks.append(inner_params[-1])
+        return blocks
+
+
+READS = [
+    ChainRead.erc20_balance("aave_v3:aToken:aUSDT", AUSDT, WALLET),
+    ChainRead.erc20_balance("aave_v3:debtToken:debtWETH", DEBT_WETH, WALLET),
+    ChainRead.erc20_decimals("decimals:aUSDT", AUSDT),
+    ChainRead.native_balance("wallet:BaseToken:ETH", WALLET),
+    ChainRead.oracle_price("price:WETH", ORACLE, WETH),
+]
+EXPECTED = {
+    "aave_v3:aToken:aUSDT": 10_000 * 10**6,
+    "aave_v3:debtToken:debtWETH": 3 * 10**18,
+    "decimals:aUSDT": 6,
+    "wallet:BaseToken:ETH": 2 * 10**18,
+    "price:WETH": 3000 * 10**8,
+}
+
+
+class TestChainReader:
+    """Test multicall aggregation, block pinning, caching and fallback."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_is_one_block_number_and_one_multicall(self):
+        """Test every read of a refresh goes out in one aggregate3 call at one block."""
+        chain = FakeChain()
+        reader = ChainReader(chain.send, chain.send_batch, max_calls_per_multicall=3)
+        reads = READS + [ChainRead("reverts", REVERTING, "balanceOf(address)", (WALLET,))]
+
+        result = await reader.read(reads)
+
+        assert result.values == EXPECTED
+        assert list(result.errors) == ["reverts"]
+        assert (result.block_number, result.source, result.rpc_requests) == (100, "multicall", 3)
+        assert [method for method, _ in chain.requests] == ["eth_blockNumber"] + ["eth_call"] * 2
+        assert all(
+            bytes.fromhex(params[0]["data"][2:10]) == _selector(AGGREGATE3)
+            for method, params in chain.requests[1:]
+        )
+        assert set(chain.blocks_used()) == {hex(100)}
+
+    @pytest.mark.asyncio
+    async def test_unchanged_block_is_served_from_cache(self):
+        """Test a second refresh at the same block only asks for the block number."""
+        chain = FakeChain()
+        reader = ChainReader(chain.send, chain.send_batch)
+        await reader.read(READS)
+
+        again = await reader.read(READS)
+        assert (again.values, again.source, again.cached, again.rpc_requests) == (
+            EXPECTED,
+            "cache",
+            len(READS),
+            1,
+        )
+
+        chain.block = 101
+        chain.tokens[AUSDT.lower()][1][WALLET.lower()] += 5 * 10**6
+        moved = await reader.read(READS)
+        assert moved.values["aave_v3:aToken:aUSDT"] == 10_005 * 10**6
+        assert moved.rpc_requests == 2
+        assert reader.get_metrics()["cache_hits"] == len(READS)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_batched_eth_calls_without_multicall(self):
+        """Test a chain without Multicall3 gets one pinned JSON-RPC batch per refresh."""
+        chain = FakeChain(multicall=False)
+        reader = ChainReader(chain.send, chain.send_batch)
+        reads = READS + [ChainRead("reverts", REVERTING, "decimals()", (), "uint8")]
+
+        result = await reader.read(reads)
+        assert result.values == EXPECTED
+        assert list(result.errors) == ["reverts"]
+        assert result.source == "eth_call"
+        assert reader.get_metrics()["multicall_enabled"] is False
+
+        chain.block = 101
+        second = await reader.read(reads)
+        assert (second.source, second.rpc_requests) == ("eth_call", 2)
+        assert [method for method, _ in chain.requests[-2:]] == ["eth_blockNumber", "batch"]
+        # The one aggregate3 probe that found no Multicall3, then plain calls only
+        probe = [hex(100)]
+        assert chain.blocks_used() == probe + [hex(100)] * len(reads) + [hex(101)] * len(reads)
+
+    @pytest.mark.asyncio
+    async def test_unbatched_transport_sends_concurrent_calls(self):
+        """Test a transport without batch support still pins every call to the block."""
+        chain = FakeChain(multicall=False)
+        reader = ChainReader(chain.send, multicall_address=None)
+
+        result = await reader.read(READS, block_number=90)
+        assert result.values == EXPECTED
+        assert result.rpc_requests == len(READS)
+        assert set(chain.blocks_used()) == {hex(90)}
+
+
+class TestOnChainPositionInterfaceLive:
+    """Test the AAVE position interface's live refresh on the fake chain."""
+
+    @pytest.mark.asyncio
+    async def test_live_positions_from_one_chain_read(self, monkeypatch):
+        """Test balances are scaled by on-chain decimals and oracle prices are captured."""
+        chain = FakeChain()
+        reader = ChainReader(chain.send, chain.send_batch)
+        config_manager = Mock()
+        config_manager.get_venue_config.return_value = {
+            "contracts": {
+                "USDT": USDT,
+                "aUSDT": AUSDT,
+                "WETH": WETH,
+                "debtWETH": DEBT_WETH,
+                "oracle": ORACLE,
+            }
+        }
+        monkeypatch.setenv("BASIS_DEV__ALCHEMY__RPC_URL", "http://localhost:8545")
+        monkeypatch.setenv("BASIS_DEV__ALCHEMY__WALLET_ADDRESS", WALLET)
+        config = {
+            "component_config": {
+                "position_monitor": {
+                    "position_subscriptions": [
+                        "aave_v3:aToken:aUSDT",
+                        "aave_v3:debtToken:debtWETH",
+                        "aave_v3:aToken:aweETH",
+                        "binance:BaseToken:USDT",
+                    ]
+                }
+            }
+        }
+        module = "backend.src.basis_strategy_v1.infrastructure.chain.chain_reader"
+        with patch(
+            "backend.src.basis_strategy_v1.infrastructure.config.config_manager.get_config_manager",
+            return_value=config_manager,
+        ), patch(f"{module}.get_chain_reader", return_value=reader):
+            interface = OnChainPositionInterface("aave_v3", "live", config)
+
+        timestamp = pd.Timestamp("2024-06-01 12:00", tz="UTC")
+        positions = await interface.get_positions(timestamp)
+
+        assert positions == {"aave_v3:aToken:aUSDT": 10_000.0, "aave_v3:debtToken:debtWETH": 3.0}
+        assert interface.oracle_prices == {"USDT": 1.0, "WETH": 3000.0}
+        assert interface.last_chain_read.source == "multicall"
+        assert len(chain.requests) == 2
+
+        # Decimals are known now: the next refresh reads balances and prices only
+        chain.block = 101
+        assert await interface.get_balance("debtWETH", timestamp) == 3.0
+        assert len(interface.last_chain_read.values) == 4
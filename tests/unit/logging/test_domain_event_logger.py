@@ -133,6 +133,72 @@ class TestDomainEventLogger:
             exposure_lines = f.readlines()
             assert len(exposure_lines) == 1
 
+    def test_constructed_event_matches_validated_encoding(self, tmp_path):
+        """Test model_construct events with raw values encode like validated ones."""
+        from decimal import Decimal
+        import numpy as np
+        from backend.src.basis_strategy_v1.infrastructure.logging.domain_event_logger import (
+            encode_event_json
+        )
+
+        fields = dict(
+            timestamp="2025-01-15T10:30:00",
+            real_utc_time="2025-01-15T10:30:00.123456",
+            correlation_id="test123",
+            pid=12345,
+            positions={"aave:aToken:aUSDT": 10000.5, "wallet:BaseToken:ETH": 1.25},
+            total_value_usd=10001.75,
+            position_type="simulated",
+        )
+        validated = PositionSnapshot(**fields)
+        constructed = PositionSnapshot.model_construct(
+            **dict(
+                fields,
+                positions={"aave:aToken:aUSDT": Decimal("10000.5"), "wallet:BaseToken:ETH": 1.25},
+                total_value_usd=np.float64(10001.75),
+                metadata={},
+            )
+        )
+
+        assert json.loads(encode_event_json(constructed)) == json.loads(validated.model_dump_json())
+
+    def test_msgpack_format_round_trips_to_jsonl(self, tmp_path):
+        """Test the length-prefixed msgpack format and its JSONL converter."""
+        pytest.importorskip("msgpack")
+        from backend.src.basis_strategy_v1.infrastructure.logging.domain_event_logger import (
+            convert_msgpack_to_jsonl
+        )
+
+        logger = DomainEventLogger(
+            log_dir=tmp_path, correlation_id="test123", pid=12345, event_format="msgpack"
+        )
+        for i in range(3):
+            logger.log_position_snapshot(PositionSnapshot(
+                timestamp=f"2025-01-15T10:30:{i:02d}",
+                real_utc_time=f"2025-01-15T10:30:{i:02d}.123456",
+                correlation_id="test123",
+                pid=12345,
+                positions={"aave:aToken:aUSDT": 10000.0 + i},
+                total_value_usd=10000.0 + i,
+                position_type="simulated"
+            ))
+
+        events_file = tmp_path / "events" / "positions.msgpack"
+        assert logger.get_event_count("positions") == 3
+        assert logger.get_latest_event("positions")["total_value_usd"] == 10002.0
+
+        assert convert_msgpack_to_jsonl(events_file) == 3
+        with open(tmp_path / "events" / "positions.jsonl") as f:
+            events = [json.loads(line) for line in f]
+        assert events == logger.read_events("positions")
+
+    def test_unknown_event_format(self, tmp_path):
+        """Test an unknown event format fails fast."""
+        with pytest.raises(ValueError):
+            DomainEventLogger(
+                log_dir=tmp_path, correlation_id="test123", pid=12345, event_format="xml"
+            )
+
 # TODO: Add tests for:
 # - all 12 event types
 # - buffer overflow
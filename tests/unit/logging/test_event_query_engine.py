@@ -0,0 +1,207 @@
+"""
+Unit tests for EventQueryEngine.
+
+Tests sidecar indexing, pagination, filtering and NDJSON streaming over
+domain event JSONL files.
+"""
+import json
+import pytest
+from pathlib import Path
+
+from backend.src.basis_strategy_v1.infrastructure.logging.domain_event_logger import (
+    DomainEventLogger
+)
+from backend.src.basis_strategy_v1.infrastructure.logging.event_query_engine import (
+    EventQueryEngine,
+    EventQuery,
+    EventFileIndex,
+    find_events_directory,
+)
+from backend.src.basis_strategy_v1.core.models.domain_events import PositionSnapshot
+
+
+def _write_events(path: Path, events):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+@pytest.fixture
+def events_dir(tmp_path):
+    """Events directory with two interleaved streams."""
+    events_dir = tmp_path / "events"
+    _write_events(
+        events_dir / "positions.jsonl",
+        [
+            {
+                "timestamp": f"2024-05-12T{hour:02d}:00:00",
+                "positions": {"aave:aToken:aUSDT": 1000.0 + hour},
+            }
+            for hour in range(10)
+        ],
+    )
+    _write_events(
+        events_dir / "orders.jsonl",
+        [
+            {"timestamp": "2024-05-12T02:30:00", "instrument": "binance:Perp:BTCUSDT"},
+            {"timestamp": "2024-05-12T05:30:00", "instrument": "aave:aToken:aUSDT"},
+        ],
+    )
+    return events_dir
+
+
+class TestEventQueryEngine:
+    """Test indexed event queries."""
+
+    def test_builds_sidecar_index(self, events_dir):
+        """Test index records one offset per line and persists a sidecar."""
+        index = EventFileIndex(events_dir / "positions.jsonl").refresh()
+
+        assert len(index) == 10
+        assert index.is_sorted
+        assert (events_dir / "positions.jsonl.idx").exists()
+
+        # Offsets point at line starts
+        with open(events_dir / "positions.jsonl", "rb") as f:
+            f.seek(index.offsets[3])
+            assert json.loads(f.readline())["positions"]["aave:aToken:aUSDT"] == 1003.0
+
+        # Reloading from the sidecar gives the same index
+        reloaded = EventFileIndex(events_dir / "positions.jsonl").refresh()
+        assert list(reloaded.offsets) == list(index.offsets)
+        assert list(reloaded.timestamps) == list(index.timestamps)
+
+    def test_index_extends_incrementally_on_append(self, events_dir):
+        """Test appended events are picked up without rebuilding the index."""
+        engine = EventQueryEngine(events_dir)
+        assert engine.count(EventQuery(event_types=["positions"])) == 10
+
+        _write_events(
+            events_dir / "positions.jsonl",
+            [{"timestamp": "2024-05-12T10:00:00", "positions": {}}],
+        )
+
+        assert engine.count(EventQuery(event_types=["positions"])) == 11
+
+    def test_index_ignores_partial_trailing_line(self, events_dir):
+        """Test a line still being written is not indexed."""
+        with open(events_dir / "orders.jsonl", "a") as f:
+            f.write('{"timestamp": "2024-05-12T09:00:00"')
+
+        index = EventFileIndex(events_dir / "orders.jsonl").refresh()
+        assert len(index) == 2
+
+    def test_offset_pagination(self, events_dir):
+        """Test limit/offset over a single stream."""
+        engine = EventQueryEngine(events_dir)
+        page = engine.query(EventQuery(event_types=["positions"]), limit=3, offset=4)
+
+        assert [e["timestamp"] for e in page.events] == [
+            "2024-05-12T04:00:00",
+            "2024-05-12T05:00:00",
+            "2024-05-12T06:00:00",
+        ]
+        assert page.total_events == 10
+        assert all(e["event_type"] == "positions" for e in page.events)
+
+    def test_cursor_pagination_merges_streams_in_time_order(self, events_dir):
+        """Test cursor pages walk all streams in timestamp order without gaps."""
+        engine = EventQueryEngine(events_dir)
+        query = EventQuery()
+
+        seen = []
+        cursor = None
+        while True:
+            page = engine.query(query, limit=4, cursor=cursor)
+            seen.extend((e["event_type"], e["timestamp"]) for e in page.events)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        assert len(seen) == 12
+        assert [ts for _, ts in seen] == sorted(ts for _, ts in seen)
+        assert ("orders", "2024-05-12T02:30:00") in seen
+
+    def test_time_range_filter(self, events_dir):
+        """Test inclusive start/end bounds."""
+        engine = EventQueryEngine(events_dir)
+        query = EventQuery(start="2024-05-12T02:00:00", end="2024-05-12T05:30:00")
+        page = engine.query(query, limit=100)
+
+        assert [e["timestamp"] for e in page.events] == [
+            "2024-05-12T02:00:00",
+            "2024-05-12T02:30:00",
+            "2024-05-12T03:00:00",
+            "2024-05-12T04:00:00",
+            "2024-05-12T05:00:00",
+            "2024-05-12T05:30:00",
+        ]
+        assert page.total_events == 6
+
+    def test_instrument_filter(self, events_dir):
+        """Test instrument keys match as dict keys or values."""
+        engine = EventQueryEngine(events_dir)
+
+        btc = engine.query(EventQuery(instrument="binance:Perp:BTCUSDT"), limit=100)
+        assert [e["event_type"] for e in btc.events] == ["orders"]
+        assert btc.total_events is None
+
+        ausdt = engine.query(
+            EventQuery(instrument="aave:aToken:aUSDT"), limit=100, offset=5
+        )
+        # 10 position snapshots + 1 order, first five skipped
+        assert len(ausdt.events) == 6
+
+    def test_unknown_event_type_raises(self, events_dir):
+        """Test unknown streams fail fast."""
+        engine = EventQueryEngine(events_dir)
+        with pytest.raises(ValueError, match="Unknown event types"):
+            engine.query(EventQuery(event_types=["nope"]), limit=10)
+
+    def test_invalid_cursor_raises(self, events_dir):
+        """Test malformed cursors fail fast."""
+        engine = EventQueryEngine(events_dir)
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            engine.validate(EventQuery(), cursor="not-a-cursor")
+
+    def test_stream_ndjson(self, events_dir):
+        """Test NDJSON streaming tags each line with its event type."""
+        engine = EventQueryEngine(events_dir)
+        lines = list(engine.stream(EventQuery(event_types=["orders"])))
+
+        assert len(lines) == 2
+        assert all(line.endswith(b"\n") for line in lines)
+        first = json.loads(lines[0])
+        assert first["event_type"] == "orders"
+        assert first["instrument"] == "binance:Perp:BTCUSDT"
+
+    def test_reads_domain_event_logger_output(self, tmp_path):
+        """Test the engine reads files written by DomainEventLogger."""
+        event_logger = DomainEventLogger(log_dir=tmp_path, correlation_id="test123", pid=12345)
+        for i in range(3):
+            event_logger.log_position_snapshot(
+                PositionSnapshot(
+                    timestamp=f"2025-01-15T10:30:{i:02d}",
+                    real_utc_time=f"2025-01-15T10:30:{i:02d}.123456",
+                    correlation_id="test123",
+                    pid=12345,
+                    positions={"aave:aToken:aUSDT": 10000.0 + i},
+                    total_value_usd=10000.0 + i,
+                    position_type="simulated",
+                )
+            )
+
+        engine = EventQueryEngine(tmp_path / "events")
+        page = engine.query(EventQuery(event_types=["positions"]), limit=2, offset=1)
+
+        assert [e["total_value_usd"] for e in page.events] == [10001.0, 10002.0]
+
+    def test_find_events_directory(self, tmp_path):
+        """Test logs/{correlation_id}/{pid}/events discovery."""
+        assert find_events_directory("run-1", base_dir=str(tmp_path)) is None
+
+        events_dir = tmp_path / "run-1" / "4242" / "events"
+        events_dir.mkdir(parents=True)
+
+        assert find_events_directory("run-1", base_dir=str(tmp_path)) == events_dir
@@ -6,6 +6,10 @@ Tests log directory structure creation and metadata.
 import pytest
 from pathlib import Path
 import json
+import logging
+import subprocess
+import sys
+from backend.src.basis_strategy_v1.infrastructure.logging import log_directory_manager
 from backend.src.basis_strategy_v1.infrastructure.logging.log_directory_manager import (
     LogDirectoryManager
 )
@@ -85,6 +89,39 @@ class TestLogDirectoryManager:
         assert test_file.exists()
         test_file.unlink()  # Clean up
 
+    def test_attach_component_log_file(self, tmp_path, monkeypatch):
+        """Test component log files are attached once, on first use."""
+        monkeypatch.setattr(log_directory_manager, "COMPONENT_LOGS_DIR", tmp_path / "logs")
+        component_logger = logging.getLogger("test_component_log_file")
+
+        log_directory_manager.attach_component_log_file(component_logger, "component.log")
+        log_directory_manager.attach_component_log_file(component_logger, "component.log")
+
+        handlers = [h for h in component_logger.handlers if isinstance(h, logging.FileHandler)]
+        assert len(handlers) == 1
+        assert (tmp_path / "logs" / "component.log").exists()
+        for handler in handlers:
+            component_logger.removeHandler(handler)
+            handler.close()
+
+    def test_engine_import_has_no_side_effects(self):
+        """Test importing the engine opens no log files and loads no optional subsystems."""
+        backend_src = Path(__file__).parent.parent.parent.parent / "backend" / "src"
+        code = (
+            "import logging, sys\n"
+            "opened = []\n"
+            "logging.FileHandler.__init__ = lambda self, *a, **k: opened.append(a)\n"
+            "import basis_strategy_v1.core.event_engine.event_driven_strategy_engine\n"
+            "optional = [m for m in ('ccxt', 'web3', 'plotly', 'aiohttp') if m in sys.modules]\n"
+            "print(len(opened), optional)\n"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", code], cwd=backend_src, capture_output=True, text=True
+        )
+
+        assert completed.returncode == 0, completed.stderr
+        assert completed.stdout.strip().splitlines()[-1] == "0 []"
+
 # TODO: Add tests for:
 # - multiple runs with same correlation_id
 # - invalid parameters
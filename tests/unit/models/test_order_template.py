@@ -0,0 +1,156 @@
+"""
+Unit tests for OrderTemplate.
+
+Tests that templated orders match validated Order construction and that the per-order
+checks still reject invalid amounts, prices, atomic groups and risk levels.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from backend.src.basis_strategy_v1.core.models.order import Order, OrderOperation
+from backend.src.basis_strategy_v1.core.models.order_template import (
+    AMOUNT,
+    NOTIONAL,
+    OrderTemplate,
+    Scaled,
+    next_operation_id,
+)
+
+
+def _spot_buy_template(**overrides):
+    fields = dict(
+        venue='binance',
+        operation=OrderOperation.SPOT_TRADE,
+        pair='BTC/USDT',
+        side='BUY',
+        order_type='limit',
+        source_venue='wallet',
+        target_venue='binance',
+        source_token='USDT',
+        target_token='BTC',
+        strategy_intent='entry_full',
+        strategy_id='btc_basis',
+    )
+    fields.update(overrides)
+    return OrderTemplate(
+        'spot_buy',
+        expected_deltas={
+            'wallet:BaseToken:USDT': -NOTIONAL,
+            'binance:BaseToken:BTC': AMOUNT,
+        },
+        operation_details={'notional_usd': NOTIONAL, 'venue_type': 'cex'},
+        **fields,
+    )
+
+
+class TestOrderTemplate:
+    """Test OrderTemplate construction and per-order checks."""
+
+    def test_build_matches_validated_order(self):
+        """Test a templated order equals the same order built with validation."""
+        order = _spot_buy_template().build(0.5, 45000.0, metadata={'signal': 'long'})
+
+        expected = Order(
+            operation_id=order.operation_id,
+            venue='binance',
+            operation=OrderOperation.SPOT_TRADE,
+            pair='BTC/USDT',
+            side='BUY',
+            order_type='limit',
+            amount=0.5,
+            price=45000.0,
+            source_venue='wallet',
+            target_venue='binance',
+            source_token='USDT',
+            target_token='BTC',
+            expected_deltas={'wallet:BaseToken:USDT': -22500.0, 'binance:BaseToken:BTC': 0.5},
+            operation_details={'notional_usd': 22500.0, 'venue_type': 'cex'},
+            metadata={'signal': 'long'},
+            strategy_intent='entry_full',
+            strategy_id='btc_basis',
+        )
+        assert order.model_dump() == expected.model_dump()
+        assert order.operation_id.startswith('spot_buy_')
+
+    def test_orders_do_not_share_state(self):
+        """Test each build gets its own deltas, details and metadata and a new operation_id."""
+        template = _spot_buy_template()
+
+        first = template.build(1.0, 100.0)
+        second = template.build(2.0, 100.0)
+        first.metadata['note'] = 'changed'
+
+        assert first.operation_id != second.operation_id
+        assert second.expected_deltas['binance:BaseToken:BTC'] == 2.0
+        assert second.metadata == {}
+        assert template.prototype.metadata == {}
+
+    def test_shape_is_validated_at_declaration(self):
+        """Test an invalid shape fails when declared, not when built."""
+        with pytest.raises(ValidationError):
+            _spot_buy_template(pair=None)
+        with pytest.raises(ValueError, match='Per-order fields'):
+            _spot_buy_template(amount=1.0)
+
+    def test_per_order_checks(self):
+        """Test amount, price and risk levels are still checked per order."""
+        template = _spot_buy_template()
+
+        with pytest.raises(ValueError, match='amount must be positive'):
+            template.build(0.0, 100.0)
+        with pytest.raises(ValueError, match='price must be positive'):
+            template.build(1.0, -1.0)
+        with pytest.raises(ValueError, match='require a price'):
+            template.build(1.0)
+
+        long = OrderTemplate(
+            'long',
+            expected_deltas={'binance:Perp:BTCUSDT': AMOUNT},
+            venue='binance',
+            operation=OrderOperation.PERP_TRADE,
+            pair='BTCUSDT',
+            side='LONG',
+            source_venue='wallet',
+            target_venue='binance',
+            source_token='USDT',
+            target_token='BTCUSDT',
+        )
+        with pytest.raises(ValueError, match='take_profit'):
+            long.build(1.0, 100.0, take_profit=90.0)
+
+        order = long.build(1.0, 100.0, take_profit=110.0, stop_loss=95.0)
+        assert (order.take_profit, order.stop_loss) == (110.0, 95.0)
+
+    def test_atomic_group_per_order(self):
+        """Test atomic shapes declared without a group require one per order."""
+        template = OrderTemplate(
+            'repay',
+            expected_deltas={'aave_v3:debtToken:debtWETH': -AMOUNT},
+            price_on_order=False,
+            venue='aave_v3',
+            operation=OrderOperation.REPAY,
+            token_in='WETH',
+            source_venue='wallet',
+            target_venue='aave_v3',
+            source_token='WETH',
+            target_token='debtWETH',
+            execution_mode='atomic',
+            sequence_in_group=1,
+        )
+
+        with pytest.raises(ValueError, match='atomic_group_id required'):
+            template.build(1.0)
+
+        order = template.build(1.5, atomic_group_id='exit_1')
+        assert order.atomic_group_id == 'exit_1'
+        assert order.price is None
+        assert order.expected_deltas == {'aave_v3:debtToken:debtWETH': -1.5}
+
+    def test_scaled_terms_and_operation_ids(self):
+        """Test Scaled resolution and strictly increasing operation ids."""
+        assert Scaled(per_amount=2.0, per_price=1.0).resolve(3.0, 10.0) == 16.0
+        assert (-NOTIONAL).resolve(0.1, 3.0) == -(0.1 * 3.0)
+
+        ids = [int(next_operation_id('op').rsplit('_', 1)[1]) for _ in range(100)]
+        assert ids == sorted(set(ids))
@@ -21,7 +21,7 @@ def mock_config():
         'share_class': 'USDT',
         'stake_allocation_percentage': 0.5,  # 50% for staking, 50% for hedging
         'leverage_multiplier': 2.0,  # 2x leverage
-        'lst_type': 'etherfi',  # Liquid staking type
+        'lst_type': 'weETH',  # Liquid staking type
         'lending_protocol': 'aave_v3',  # Lending protocol
         'staking_protocol': 'etherfi',  # Staking protocol
         'component_config': {
@@ -102,7 +102,10 @@ class TestUSDTETHStakingHedgedLeveragedStrategyInit:
                 exposure_monitor=mock_components['exposure_monitor'],
                 position_monitor=mock_components['position_monitor'],
                 risk_monitor=mock_components['risk_monitor'],
-                utility_manager=mock_components['utility_manager']
+                utility_manager=mock_components['utility_manager'],
+                correlation_id='test_correlation',
+                pid=12345,
+                log_dir=Path('/tmp/test_logs')
             )
     
     def test_init_validates_instruments_in_registry(self, mock_config, mock_components):
@@ -132,7 +135,10 @@ class TestUSDTETHStakingHedgedLeveragedStrategyInit:
                 exposure_monitor=mock_components['exposure_monitor'],
                 position_monitor=mock_components['position_monitor'],
                 risk_monitor=mock_components['risk_monitor'],
-                utility_manager=mock_components['utility_manager']
+                utility_manager=mock_components['utility_manager'],
+                correlation_id='test_correlation',
+                pid=12345,
+                log_dir=Path('/tmp/test_logs')
             )
     
     def test_init_success_with_valid_config(self, strategy):
@@ -140,7 +146,7 @@ class TestUSDTETHStakingHedgedLeveragedStrategyInit:
         assert strategy.share_class == 'USDT'
         assert strategy.eth_allocation == 0.5
         assert strategy.usdt_allocation == 0.5
-        assert strategy.lst_type == 'etherfi'
+        assert strategy.lst_type == 'weETH'
         assert strategy.lending_protocol == 'aave_v3'
         assert strategy.staking_protocol == 'etherfi'
         assert len(strategy.available_instruments) == 15
@@ -172,7 +178,7 @@ class TestUSDTETHStakingHedgedLeveragedStrategyActions:
             orders = strategy._create_entry_full_orders(10000.0)
             
             # Should have multiple orders for leveraged staking
-            assert len(orders) >= 4  # Supply USDT, buy ETH, stake ETH, reserve
+            assert len(orders) >= 4  # Supply USDT, swap to WETH, staking loop, reserve
             
             # Check for supply USDT order
             supply_order = next((o for o in orders if o.operation == OrderOperation.SUPPLY), None)
@@ -183,20 +189,21 @@ class TestUSDTETHStakingHedgedLeveragedStrategyActions:
             assert supply_order.strategy_intent == 'entry_full'
             assert supply_order.strategy_id == 'usdt_eth_staking_hedged_leveraged'
             
-            # Check for buy ETH order
-            buy_order = next((o for o in orders if o.operation == OrderOperation.SPOT_TRADE), None)
-            assert buy_order is not None
-            assert buy_order.venue == Venue.BINANCE
-            assert buy_order.pair == 'ETH/USDT'
-            assert buy_order.side == 'BUY'
-            assert buy_order.strategy_intent == 'entry_full'
+            # Check for USDT -> WETH swap order (the loop stakes wallet WETH)
+            swap_order = next((o for o in orders if o.operation == OrderOperation.SWAP), None)
+            assert swap_order is not None
+            assert swap_order.venue == Venue.UNISWAP
+            assert swap_order.token_in == 'USDT'
+            assert swap_order.token_out == 'WETH'
+            assert swap_order.expected_deltas['wallet:BaseToken:WETH'] > 0
+            assert swap_order.strategy_intent == 'entry_full'
             
-            # Check for stake ETH order
+            # Check for stake WETH order
             stake_order = next((o for o in orders if o.operation == OrderOperation.STAKE), None)
             assert stake_order is not None
             assert stake_order.venue == Venue.ETHERFI
-            assert stake_order.token_in == 'ETH'
-            assert stake_order.token_out == 'etherfi'
+            assert stake_order.token_in == 'WETH'
+            assert stake_order.token_out == 'weETH'
             assert stake_order.strategy_intent == 'entry_full'
     
     def test_create_entry_partial_orders(self, strategy):
@@ -212,25 +219,39 @@ class TestUSDTETHStakingHedgedLeveragedStrategyActions:
         """Test _create_exit_full_orders method."""
         with patch.object(strategy, '_get_asset_price', return_value=3000.0), \
              patch.object(strategy.position_monitor, 'get_current_position', return_value={
-                 'aUSDT_balance': 10000.0,
-                 'etherfi_balance': 3.33
+                 'aave_v3:aToken:aUSDT': 10000.0,
+                 'aave_v3:aToken:aweETH': 3.33,
+                 'aave_v3:debtToken:debtWETH': 1.66
              }):
             orders = strategy._create_exit_full_orders(10000.0)
             
-            # Should have orders to unwind leveraged position
-            assert len(orders) >= 3  # Unstake, withdraw, sell perp
+            # Flash-unwind bundle, WETH swap and USDT withdrawal in one atomic group
+            assert [o.operation for o in orders] == [
+                OrderOperation.FLASH_BORROW,
+                OrderOperation.REPAY,
+                OrderOperation.WITHDRAW,
+                OrderOperation.UNSTAKE,
+                OrderOperation.FLASH_REPAY,
+                OrderOperation.SWAP,
+                OrderOperation.WITHDRAW,
+            ]
+            assert [o.sequence_in_group for o in orders] == list(range(1, 8))
+            assert len({o.atomic_group_id for o in orders}) == 1
+            
+            # Check the debt and collateral are unwound in full
+            repay_order = orders[1]
+            assert repay_order.expected_deltas['aave_v3:debtToken:debtWETH'] == -1.66
+            assert orders[2].expected_deltas['aave_v3:aToken:aweETH'] == -3.33
             
             # Check for unstaking order
-            unstake_order = next((o for o in orders if o.operation == OrderOperation.UNSTAKE), None)
-            assert unstake_order is not None
+            unstake_order = orders[3]
             assert unstake_order.venue == Venue.ETHERFI
-            assert unstake_order.token_in == 'etherfi'
-            assert unstake_order.token_out == 'ETH'
+            assert unstake_order.token_in == 'weETH'
+            assert unstake_order.token_out == 'WETH'
             assert unstake_order.strategy_intent == 'exit_full'
             
             # Check for withdrawal order
-            withdraw_order = next((o for o in orders if o.operation == OrderOperation.WITHDRAW), None)
-            assert withdraw_order is not None
+            withdraw_order = orders[-1]
             assert withdraw_order.venue == Venue.AAVE_V3
             assert withdraw_order.token_in == 'aUSDT'
             assert withdraw_order.token_out == 'USDT'
@@ -240,14 +261,21 @@ class TestUSDTETHStakingHedgedLeveragedStrategyActions:
         """Test _create_exit_partial_orders method."""
         with patch.object(strategy, '_get_asset_price', return_value=3000.0), \
              patch.object(strategy.position_monitor, 'get_current_position', return_value={
-                 'aUSDT_balance': 10000.0,
-                 'etherfi_balance': 3.33
+                 'aave_v3:aToken:aUSDT': 10000.0,
+                 'aave_v3:aToken:aweETH': 3.33,
+                 'aave_v3:debtToken:debtWETH': 1.66
              }):
             orders = strategy._create_exit_partial_orders(5000.0)
             
-            assert len(orders) >= 3  # Similar to exit_full but partial amounts
+            assert len(orders) == 7  # Same bundle as exit_full with proportional amounts
             for order in orders:
                 assert order.strategy_intent == 'exit_partial'
+            
+            # Net position 10000 + (3.33 - 1.66) * 3000 = 15010, so a 5000 exit is a third
+            ratio = 5000.0 / 15010.0
+            assert orders[1].expected_deltas['aave_v3:debtToken:debtWETH'] == pytest.approx(-1.66 * ratio)
+            assert orders[2].expected_deltas['aave_v3:aToken:aweETH'] == pytest.approx(-3.33 * ratio)
+            assert orders[-1].amount == pytest.approx(10000.0 * ratio)
     
     def test_create_dust_sell_orders(self, strategy):
         """Test _create_dust_sell_orders method."""
@@ -273,6 +301,54 @@ class TestUSDTETHStakingHedgedLeveragedStrategyActions:
             assert ethfi_order.strategy_intent == 'dust_sell'
 
 
+def _apply_orders(positions, orders):
+    """Apply each order's expected_deltas in sequence, as backtest execution does."""
+    positions = dict(positions)
+    for order in orders:
+        for instrument, delta in order.expected_deltas.items():
+            positions[instrument] = positions.get(instrument, 0.0) + delta
+    return positions
+
+
+class TestUSDTETHStakingHedgedLeveragedStrategyRoundTrip:
+    """Test entry and exit bundles against the positions they produce."""
+    
+    def test_entry_then_full_exit_unwinds_loop(self, strategy):
+        """Test entry builds the converged loop and full exit repays debt and withdraws collateral."""
+        strategy.lst_eth_ratio = 1.05
+        with patch.object(strategy, '_get_asset_price', return_value=3000.0):
+            loop = strategy.calculate_target_position(10000.0)['staking_loop']
+            entry_orders = strategy._create_entry_full_orders(10000.0)
+            positions = _apply_orders({'wallet:BaseToken:USDT': 10000.0}, entry_orders)
+            
+            assert positions['aave_v3:aToken:aUSDT'] == pytest.approx(5000.0)
+            assert positions['aave_v3:aToken:aweETH'] == pytest.approx(loop['lst_amount'])
+            assert positions['aave_v3:debtToken:debtWETH'] == pytest.approx(loop['debt_amount'])
+            for instrument in [
+                'wallet:BaseToken:USDT',
+                'wallet:BaseToken:WETH',
+                'instadapp:BaseToken:WETH',
+                'etherfi:LST:weETH',
+            ]:
+                assert positions[instrument] == pytest.approx(0.0, abs=1e-9)
+            
+            with patch.object(
+                strategy.position_monitor, 'get_current_position', return_value=positions
+            ):
+                exit_orders = strategy._create_exit_full_orders(10000.0)
+            positions = _apply_orders(positions, exit_orders)
+        
+        for orders in (entry_orders, exit_orders):
+            assert len({o.operation_id for o in orders}) == len(orders)
+        
+        assert positions['aave_v3:debtToken:debtWETH'] == pytest.approx(0.0, abs=1e-9)
+        assert positions['aave_v3:aToken:aweETH'] == pytest.approx(0.0, abs=1e-9)
+        assert positions['aave_v3:aToken:aUSDT'] == pytest.approx(0.0, abs=1e-9)
+        assert positions['wallet:BaseToken:WETH'] == pytest.approx(0.0, abs=1e-9)
+        assert positions['instadapp:BaseToken:WETH'] == pytest.approx(0.0, abs=1e-9)
+        assert positions['wallet:BaseToken:USDT'] == pytest.approx(10000.0)
+
+
 class TestUSDTETHStakingHedgedLeveragedStrategyHelpers:
     """Test helper methods."""
     
@@ -281,11 +357,11 @@ class TestUSDTETHStakingHedgedLeveragedStrategyHelpers:
         with patch.object(strategy, '_get_asset_price', return_value=3000.0):
             target = strategy.calculate_target_position(10000.0)
             
-            assert 'etherfi_balance' in target
+            assert 'weeth_balance' in target
             assert 'eth_balance' in target
             assert 'aUSDT_balance' in target
             assert 'usdt_balance' in target
-            assert target['etherfi_balance'] > 0
+            assert target['weeth_balance'] > 0
             assert target['eth_balance'] == 0.0  # All ETH staked
             assert target['aUSDT_balance'] > 0  # Some USDT lent
             assert target['usdt_balance'] > 0  # Some USDT reserved
@@ -304,11 +380,13 @@ class TestUSDTETHStakingHedgedLeveragedStrategyHelpers:
                 # Check operation_id format: operation[_token]_timestamp
                 parts = order.operation_id.split('_')
                 assert len(parts) >= 2
-                # First part should be operation type (supply, buy, stake, reserve, etc.)
-                assert parts[0] in ['supply', 'buy', 'stake', 'reserve', 'unstake', 'sell', 'withdraw', 'transfer']
-                # If there are 3+ parts, second part should be token type (usdt, eth, etc.)
+                # First part should be operation type (supply, swap, stake, reserve, etc.)
+                assert parts[0] in [
+                    'supply', 'swap', 'stake', 'reserve', 'unstake', 'withdraw', 'flash', 'borrow', 'repay'
+                ]
+                # If there are 3+ parts, second part should be token type or flash leg
                 if len(parts) >= 3:
-                    assert parts[1] in ['usdt', 'eth']
+                    assert parts[1] in ['usdt', 'eth', 'weth', 'borrow', 'repay']
                 # Last part should be a timestamp (numeric)
                 assert parts[-1].isdigit()
                 # Should be unix microseconds (13+ digits)
@@ -9,7 +9,12 @@ from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from datetime import datetime, timezone, timedelta
 import asyncio
 
-from basis_strategy_v1.infrastructure.api.api_call_queue import APICallQueue, APICall
+from basis_strategy_v1.infrastructure.api.api_call_queue import (
+    APICall,
+    APICallManager,
+    APICallQueue,
+    TokenBucket,
+)
 
 
 class TestAPICall:
@@ -88,7 +93,6 @@ class TestAPICallQueue:
         assert queue.is_running is False
         assert queue.worker_task is None
         assert len(queue.results) == 0
-        assert len(queue.errors) == 0
     
     def test_initialization_defaults(self):
         """Test API call queue initialization with defaults."""
@@ -99,7 +103,6 @@ class TestAPICallQueue:
         assert queue.is_running is False
         assert queue.worker_task is None
         assert len(queue.results) == 0
-        assert len(queue.errors) == 0
     
     def test_initialization_custom_values(self):
         """Test API call queue initialization with custom values."""
@@ -110,7 +113,6 @@ class TestAPICallQueue:
         assert queue.is_running is False
         assert queue.worker_task is None
         assert len(queue.results) == 0
-        assert len(queue.errors) == 0
     
     def test_initialization_invalid_values(self):
         """Test API call queue initialization with invalid values."""
@@ -135,7 +137,6 @@ class TestAPICallQueue:
         assert queue.is_running is False
         assert queue.worker_task is None
         assert len(queue.results) == 0
-        assert len(queue.errors) == 0
     
     def test_initialization_very_small_values(self):
         """Test API call queue initialization with very small values."""
@@ -146,7 +147,6 @@ class TestAPICallQueue:
         assert queue.is_running is False
         assert queue.worker_task is None
         assert len(queue.results) == 0
-        assert len(queue.errors) == 0
     
     def test_initialization_edge_case_max_queue_size(self):
         """Test API call queue initialization with edge case max queue size."""
@@ -157,7 +157,6 @@ class TestAPICallQueue:
         assert queue.is_running is False
         assert queue.worker_task is None
         assert len(queue.results) == 0
-        assert len(queue.errors) == 0
     
     def test_initialization_edge_case_default_timeout(self):
         """Test API call queue initialization with edge case default timeout."""
@@ -168,7 +167,6 @@ class TestAPICallQueue:
         assert queue.is_running is False
         assert queue.worker_task is None
         assert len(queue.results) == 0
-        assert len(queue.errors) == 0
     
     def test_initialization_edge_case_very_large_max_queue_size(self):
         """Test API call queue initialization with very large max queue size."""
@@ -179,7 +177,6 @@ class TestAPICallQueue:
         assert queue.is_running is False
         assert queue.worker_task is None
         assert len(queue.results) == 0
-        assert len(queue.errors) == 0
     
     def test_initialization_edge_case_very_large_default_timeout(self):
         """Test API call queue initialization with very large default timeout."""
@@ -190,7 +187,6 @@ class TestAPICallQueue:
         assert queue.is_running is False
         assert queue.worker_task is None
         assert len(queue.results) == 0
-        assert len(queue.errors) == 0
     
     def test_initialization_edge_case_very_small_max_queue_size(self):
         """Test API call queue initialization with very small max queue size."""
@@ -201,7 +197,6 @@ class TestAPICallQueue:
         assert queue.is_running is False
         assert queue.worker_task is None
         assert len(queue.results) == 0
-        assert len(queue.errors) == 0
     
     def test_initialization_edge_case_very_small_default_timeout(self):
         """Test API call queue initialization with very small default timeout."""
@@ -212,7 +207,6 @@ class TestAPICallQueue:
         assert queue.is_running is False
         assert queue.worker_task is None
         assert len(queue.results) == 0
-        assert len(queue.errors) == 0
     
     def test_initialization_edge_case_zero_max_queue_size(self):
         """Test API call queue initialization with zero max queue size."""
@@ -418,7 +412,6 @@ class TestAPICallQueue:
         assert queue.is_running is False
         assert queue.worker_task is None
         assert len(queue.results) == 0
-        assert len(queue.errors) == 0
     
     def test_initialization_edge_case_very_large_float_default_timeout(self):
         """Test API call queue initialization with very large float default timeout."""
@@ -429,7 +422,6 @@ class TestAPICallQueue:
         assert queue.is_running is False
         assert queue.worker_task is None
         assert len(queue.results) == 0
-        assert len(queue.errors) == 0
     
     def test_initialization_edge_case_very_small_float_default_timeout(self):
         """Test API call queue initialization with very small float default timeout."""
@@ -440,7 +432,6 @@ class TestAPICallQueue:
         assert queue.is_running is False
         assert queue.worker_task is None
         assert len(queue.results) == 0
-        assert len(queue.errors) == 0
     
     def test_initialization_edge_case_inf_default_timeout(self):
         """Test API call queue initialization with inf default timeout."""
@@ -452,28 +443,176 @@ class TestAPICallQueue:
         assert queue.is_running is False
         assert queue.worker_task is None
         assert len(queue.results) == 0
-        assert len(queue.errors) == 0
     
     def test_initialization_edge_case_nan_default_timeout(self):
-        """Test API call queue initialization with nan default timeout."""
+        """Test API call queue rejects a nan default timeout."""
         import math
-        queue = APICallQueue(default_timeout=math.nan)
-        
-        assert queue.max_queue_size == 1000
-        assert queue.default_timeout == math.nan
-        assert queue.is_running is False
-        assert queue.worker_task is None
-        assert len(queue.results) == 0
-        assert len(queue.errors) == 0
+        with pytest.raises(ValueError, match="default_timeout"):
+            APICallQueue(default_timeout=math.nan)
     
     def test_initialization_edge_case_negative_inf_default_timeout(self):
-        """Test API call queue initialization with negative inf default timeout."""
+        """Test API call queue rejects a negative inf default timeout."""
         import math
-        queue = APICallQueue(default_timeout=-math.inf)
-        
-        assert queue.max_queue_size == 1000
-        assert queue.default_timeout == -math.inf
-        assert queue.is_running is False
-        assert queue.worker_task is None
+        with pytest.raises(ValueError, match="default_timeout"):
+            APICallQueue(default_timeout=-math.inf)
+
+
+class TestAPICallLanes:
+    """Test lane scheduling, limits and result delivery."""
+
+    @pytest.mark.asyncio
+    async def test_future_and_call_id_results(self):
+        """Test submit resolves a future and get_result collects by call_id once."""
+        queue = APICallQueue(max_queue_size=10, default_timeout=1.0)
+        await queue.start()
+
+        async def echo(value):
+            return value
+
+        async def fail():
+            raise ValueError("venue rejected")
+
+        assert await queue.submit(echo, 1) == 1
+        call_id = await queue.enqueue_call(echo, 2)
+        failed_id = await queue.enqueue_call(fail)
+
+        assert await queue.get_result(call_id) == 2
+        with pytest.raises(ValueError, match="venue rejected"):
+            await queue.get_result(failed_id)
+        with pytest.raises(KeyError):
+            await queue.get_result(call_id)
         assert len(queue.results) == 0
-        assert len(queue.errors) == 0
+
+        await queue.stop()
+        assert queue.metrics.completed == 2
+        assert queue.metrics.failed == 1
+
+    @pytest.mark.asyncio
+    async def test_priority_then_fifo(self):
+        """Test higher priority runs first and equal priorities keep submission order."""
+        queue = APICallQueue()
+        order = []
+
+        async def record(label):
+            order.append(label)
+
+        futures = [
+            queue.submit(record, "low_1"),
+            queue.submit(record, "high", priority=5),
+            queue.submit(record, "low_2"),
+        ]
+        await queue.start()
+        await asyncio.gather(*futures)
+        await queue.stop()
+
+        assert order == ["high", "low_1", "low_2"]
+
+    @pytest.mark.asyncio
+    async def test_ordering_key_and_concurrency(self):
+        """Test keyed calls never overlap while other calls use the lane's concurrency."""
+        queue = APICallQueue(max_concurrency=3)
+        active = {"all": 0, "order_1": 0}
+        peak = {"all": 0, "order_1": 0}
+        order = []
+
+        async def call(label, key):
+            for name in ("all", key):
+                active[name] = active.get(name, 0) + 1
+                peak[name] = max(peak.get(name, 0), active[name])
+            await asyncio.sleep(0.01)
+            order.append(label)
+            for name in ("all", key):
+                active[name] -= 1
+
+        await queue.start()
+        futures = [
+            queue.submit(call, "place", "order_1", ordering_key="order_1"),
+            queue.submit(call, "amend", "order_1", ordering_key="order_1", priority=9),
+            queue.submit(call, "cancel", "order_1", ordering_key="order_1"),
+        ]
+        futures += [queue.submit(call, f"price_{i}", f"price_{i}") for i in range(4)]
+        await asyncio.gather(*futures)
+        await queue.stop()
+
+        assert [label for label in order if label in ("place", "amend", "cancel")] == [
+            "place",
+            "amend",
+            "cancel",
+        ]
+        assert peak["order_1"] == 1
+        assert peak["all"] == 3
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_and_full_queue(self):
+        """Test the token bucket spaces calls and a full lane rejects new calls."""
+        queue = APICallQueue(max_queue_size=4, requests_per_second=50.0, burst=1)
+
+        async def noop():
+            return None
+
+        futures = [queue.submit(noop) for _ in range(4)]
+        with pytest.raises(RuntimeError, match="full"):
+            queue.submit(noop)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await queue.start()
+        await asyncio.gather(*futures)
+        await queue.stop()
+
+        # First call spends the burst token, the other three wait ~20ms each
+        assert loop.time() - start >= 0.05
+        status = queue.get_queue_status()
+        assert status["metrics"]["rejected"] == 1
+        assert status["metrics"]["completed"] == 4
+        assert status["metrics"]["throttled_seconds"] > 0
+        assert status["queue_size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_burst(self):
+        """Test a full bucket serves its burst without waiting."""
+        bucket = TokenBucket(rate=1.0, capacity=3)
+        waits = [await bucket.acquire() for _ in range(3)]
+        assert waits == [0.0, 0.0, 0.0]
+
+    @pytest.mark.asyncio
+    async def test_manager_lanes(self):
+        """Test the manager gives each service its own lane with its limits."""
+        manager = APICallManager(
+            rate_limits={"binance": {"requests_per_second": 20, "burst": 10, "max_concurrency": 4}}
+        )
+        await manager.start()
+
+        async def echo(value):
+            return value
+
+        future = await manager.submit(echo, "btc", service_name="binance")
+        assert await future == "btc"
+
+        binance = manager.get_queue("binance")
+        assert binance.is_running
+        assert (binance.requests_per_second, binance.burst, binance.max_concurrency) == (20, 10, 4)
+        assert manager.get_queue("binance") is binance
+        assert manager.get_queue() is manager.default_queue
+
+        status = manager.get_status()
+        assert status["service_queues"]["binance"]["metrics"]["completed"] == 1
+        await manager.stop()
+        assert not binance.is_running
+
+    def test_venue_rate_limits_validate(self):
+        """Test the venue configs' rate_limit blocks validate into lane limits."""
+        from pathlib import Path
+
+        import yaml
+
+        from basis_strategy_v1.infrastructure.config.models import validate_venue_config
+
+        venues_dir = Path(__file__).parents[2] / "configs" / "venues"
+        for venue in ("binance", "bybit", "okx", "alchemy", "ml_inference_api"):
+            with open(venues_dir / f"{venue}.yaml") as f:
+                config = validate_venue_config(yaml.safe_load(f), venue)
+            limits = config.model_dump()["rate_limit"]
+            queue = APICallQueue(name=venue, **limits)
+            assert queue.rate_limiter is not None
+            assert queue.max_concurrency >= 1
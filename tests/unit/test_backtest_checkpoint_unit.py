@@ -0,0 +1,146 @@
+"""
+Unit tests for backtest checkpoints.
+
+Tests atomic snapshot round-trips, newest-checkpoint lookup, interval
+configuration, strategy state capture and results-store offsets.
+"""
+
+import asyncio
+import os
+
+import pandas as pd
+import pytest
+
+from basis_strategy_v1.core.strategies.base_strategy_manager import BaseStrategyManager
+from basis_strategy_v1.infrastructure.persistence import (
+    find_checkpoint,
+    load_checkpoint,
+    save_checkpoint,
+)
+from basis_strategy_v1.infrastructure.persistence.async_results_store import AsyncResultsStore
+from basis_strategy_v1.infrastructure.persistence.backtest_checkpoint import (
+    DEFAULT_CHECKPOINT_EVERY,
+    get_checkpoint_interval,
+)
+
+
+STATE = {
+    "engine": {"current_timestamp": pd.Timestamp("2024-06-03 05:00", tz="UTC")},
+    "position_monitor": {"simulated_positions": {"wallet:BaseToken:USDT": 100000.0}},
+    "completed": False,
+}
+
+
+class TestCheckpointStore:
+    """Test checkpoint files."""
+
+    def test_round_trip_leaves_no_temp_files(self, tmp_path):
+        """Test a saved checkpoint loads back unchanged and is written atomically."""
+        path = save_checkpoint(tmp_path, "req-1", STATE)
+
+        assert path == tmp_path / "checkpoints" / "req-1.ckpt"
+        assert load_checkpoint(path) == STATE
+        assert os.listdir(path.parent) == ["req-1.ckpt"]
+
+    def test_rejects_unknown_format(self, tmp_path):
+        """Test files that are not checkpoints are refused."""
+        import gzip
+        import pickle
+
+        path = tmp_path / "bad.ckpt"
+        with gzip.open(path, "wb") as f:
+            pickle.dump({"version": 999}, f)
+
+        with pytest.raises(ValueError, match="Unsupported checkpoint format"):
+            load_checkpoint(path)
+
+    def test_find_newest_checkpoint(self, tmp_path):
+        """Test lookup prefers known log dirs and otherwise scans the log root."""
+        first_run = tmp_path / "logs" / "corr" / "100"
+        resumed_run = tmp_path / "logs" / "corr" / "200"
+        old = save_checkpoint(first_run, "req-1", STATE)
+        new = save_checkpoint(resumed_run, "req-1", {**STATE, "completed": True})
+        os.utime(old, (1, 1))
+
+        assert find_checkpoint("req-1", base_dir=str(tmp_path / "logs")) == new
+        assert find_checkpoint("req-1", log_dirs=[first_run], base_dir=str(tmp_path / "logs")) == old
+        assert find_checkpoint("req-2", base_dir=str(tmp_path / "logs")) is None
+
+    def test_find_checkpoint_treats_request_id_literally(self, tmp_path):
+        """Test glob characters never match other runs' checkpoints and paths are rejected."""
+        save_checkpoint(tmp_path / "logs" / "corr" / "100", "req-1", STATE)
+
+        for request_id in ["*", "req-?", "req-[0-9]"]:
+            assert find_checkpoint(request_id, base_dir=str(tmp_path / "logs")) is None
+        for request_id in ["", "..", "../corr/100/checkpoints/req-1"]:
+            with pytest.raises(ValueError, match="Invalid backtest request ID"):
+                find_checkpoint(request_id, base_dir=str(tmp_path / "logs"))
+
+    def test_checkpoint_interval_from_env(self, monkeypatch):
+        """Test the interval default, override, disable and validation."""
+        monkeypatch.delenv("BASIS_BACKTEST__CHECKPOINT_EVERY", raising=False)
+        assert get_checkpoint_interval() == DEFAULT_CHECKPOINT_EVERY
+
+        monkeypatch.setenv("BASIS_BACKTEST__CHECKPOINT_EVERY", "0")
+        assert get_checkpoint_interval() == 0
+
+        monkeypatch.setenv("BASIS_BACKTEST__CHECKPOINT_EVERY", "hourly")
+        with pytest.raises(ValueError):
+            get_checkpoint_interval()
+
+
+class _CounterStrategy(BaseStrategyManager):
+    """Minimal strategy with internal state."""
+
+    def __init__(self):
+        self.config = {"mode": "test"}
+        self.position_monitor = object()
+        self.rebalance_count = 3
+        self.last_signal = {"direction": "long", "at": pd.Timestamp("2024-06-03", tz="UTC")}
+
+    def generate_orders(self, *args, **kwargs):
+        return []
+
+    def should_enter_position(self, exposure_data, risk_assessment):
+        return False
+
+    def should_exit_position(self, exposure_data, risk_assessment):
+        return False
+
+    def should_sell_dust(self, exposure_data):
+        return False
+
+
+def test_strategy_checkpoint_captures_plain_state_only():
+    """Test strategy snapshots keep counters/signals but not config or component references."""
+    strategy = _CounterStrategy()
+    state = strategy.get_checkpoint_state()
+
+    assert state == {"rebalance_count": 3, "last_signal": strategy.last_signal}
+
+    restored = _CounterStrategy()
+    restored.rebalance_count = 0
+    restored.restore_checkpoint_state(state)
+    assert restored.rebalance_count == 3
+
+
+def test_results_store_flush_and_offsets(tmp_path):
+    """Test flush writes pending timestep results and offsets count them."""
+
+    async def run():
+        store = AsyncResultsStore(str(tmp_path / "results"), "backtest")
+        await store.start()
+        for hour in range(3):
+            asyncio.create_task(
+                store.save_timestep_result(
+                    "req-1", pd.Timestamp(f"2024-06-03 0{hour}:00", tz="UTC"), {"hour": hour}
+                )
+            )
+        await store.flush()
+        offsets = store.get_offsets("req-1")
+        store.is_running = False
+        store.worker_task.cancel()
+        return offsets
+
+    assert asyncio.run(run()) == {"timesteps_written": 3}
+    assert len(list((tmp_path / "results" / "req-1" / "timesteps").iterdir())) == 3
@@ -0,0 +1,123 @@
+"""
+Unit tests for BacktestRegistry.
+
+Tests summary-only storage, LRU/age eviction and lazy reload of full
+results spilled to the ResultStore.
+"""
+
+import asyncio
+import pytest
+
+from basis_strategy_v1.core.services.backtest_registry import BacktestRegistry
+from basis_strategy_v1.infrastructure.persistence.result_store import ResultStore
+
+
+def _backtest_info(request_id: str, points: int = 100):
+    results = {
+        "performance": {
+            "total_return": 12.5,
+            "final_value": 112.5,
+            "equity_curve": [{"net_value": 100.0 + i} for i in range(points)],
+        },
+        "event_log": [{"event": i} for i in range(points)],
+    }
+    return {
+        "request_id": request_id,
+        "status": "completed",
+        "strategy_engine": object(),
+        "config": {"mode": "pure_lending_usdt"},
+        "log_dir": "logs/abc/123",
+        "results": results,
+    }, results
+
+
+@pytest.fixture
+def result_store(tmp_path):
+    return ResultStore(base_path=str(tmp_path / "results"))
+
+
+class TestBacktestRegistry:
+    """Test bounded completed-backtest registry."""
+
+    def test_stores_summary_only(self, result_store):
+        """Test engine, config and full results are not kept in memory."""
+        registry = BacktestRegistry(max_entries=5, result_store=result_store)
+        info, _ = _backtest_info("req-1")
+        registry["req-1"] = info
+
+        summary = registry["req-1"]
+        assert "strategy_engine" not in summary
+        assert "config" not in summary
+        assert "results" not in summary
+        assert summary["performance"] == {"total_return": 12.5, "final_value": 112.5}
+        assert summary["equity_points"] == 100
+        assert summary["log_dir"] == "logs/abc/123"
+
+    def test_lru_eviction(self, result_store):
+        """Test least recently used summaries are evicted past max_entries."""
+        registry = BacktestRegistry(max_entries=2, result_store=result_store)
+        for request_id in ("a", "b"):
+            registry[request_id] = _backtest_info(request_id)[0]
+
+        registry.get("a")  # touch "a" so "b" is least recently used
+        registry["c"] = _backtest_info("c")[0]
+
+        assert "a" in registry
+        assert "b" not in registry
+        assert "c" in registry
+        assert registry.evictions == 1
+
+    def test_age_eviction(self, result_store):
+        """Test summaries older than max_age_seconds are evicted."""
+        registry = BacktestRegistry(
+            max_entries=5, max_age_seconds=60, result_store=result_store
+        )
+        registry["old"] = _backtest_info("old")[0]
+        summary, registered, size = registry._entries["old"]
+        registry._entries["old"] = (summary, registered - 120, size)
+
+        assert "old" not in registry
+        assert len(registry) == 0
+
+    def test_lazy_reload_from_result_store(self, result_store):
+        """Test full results are reloaded from the spill file and cached."""
+        registry = BacktestRegistry(max_entries=5, result_store=result_store)
+        info, results = _backtest_info("req-1")
+        asyncio.run(
+            result_store.save_result(
+                "req-1",
+                {"strategy_name": "pure_lending_usdt", "share_class": "USDT"},
+                full_results=results,
+            )
+        )
+        registry["req-1"] = info
+
+        reloaded = asyncio.run(registry.get_full_results("req-1"))
+        assert reloaded == results
+        assert registry.reloads == 1
+
+        # Second read is served from the small cache
+        asyncio.run(registry.get_full_results("req-1"))
+        assert registry.reloads == 1
+
+        missing = asyncio.run(registry.get_full_results("unknown"))
+        assert missing is None
+        assert registry.reload_misses == 1
+
+    def test_memory_stats(self, result_store):
+        """Test memory accounting reports entries and approximate bytes."""
+        registry = BacktestRegistry(max_entries=5, result_store=result_store)
+        info, results = _backtest_info("req-1")
+        registry["req-1"] = info
+        registry.cache_full_results("req-1", results)
+
+        stats = registry.memory_stats()
+        assert stats["entries"] == 1
+        assert stats["cached_full_results"] == 1
+        assert stats["cached_full_results_bytes"] > stats["summary_bytes"] > 0
+        assert stats["total_bytes"] == stats["summary_bytes"] + stats["cached_full_results_bytes"]
+
+    def test_invalid_max_entries(self, result_store):
+        """Test max_entries below one fails fast."""
+        with pytest.raises(ValueError, match="max_entries"):
+            BacktestRegistry(max_entries=0, result_store=result_store)
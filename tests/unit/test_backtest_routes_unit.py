@@ -301,6 +301,29 @@ class TestBacktestRoutesUnit:
         # Just check that we get a response
         assert data is not None
     
+    def test_resume_and_extend_require_uuid_request_ids(self):
+        """Test resume/extend reject non-UUID request IDs before any checkpoint lookup."""
+        from fastapi import FastAPI
+        from basis_strategy_v1.api.dependencies import get_backtest_service
+        
+        request_id = "0b7e6f58-2f6c-4c1e-9a3d-5d2f4f0c8a11"
+        service = AsyncMock()
+        service.resume_backtest.return_value = request_id
+        service.get_strategy_name = Mock(return_value="pure_lending_usdt")
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_backtest_service] = lambda: service
+        client = TestClient(app)
+        
+        for path in ["/*/resume", "/*/extend?days=1", "/req-%5B1%5D/resume"]:
+            assert client.post(path).status_code == 422
+        service.resume_backtest.assert_not_called()
+        service.extend_backtest.assert_not_called()
+        
+        response = client.post(f"/{request_id}/resume")
+        assert response.status_code == 200
+        service.resume_backtest.assert_awaited_once_with(request_id)
+    
     def test_backtest_request_model_validation(self):
         """Test BacktestRequest model validation."""
         # Valid request
@@ -0,0 +1,112 @@
+"""
+Unit tests for ColumnarCsvCache.
+
+Tests CSV-equivalent frames, memory-mapped reuse, mtime/hash invalidation
+and copy-on-write frames.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from basis_strategy_v1.infrastructure.data.columnar_cache import ColumnarCsvCache
+
+
+CSV = """# source: test
+timestamp,price,volume,source
+2024-01-01T00:00:00Z,3000.5,10,binance
+2024-01-01T01:00:00Z,3010.0,12,binance
+2024-01-01T02:00:00Z,,7,okx
+"""
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "prices.csv"
+    path.write_text(CSV)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ColumnarCsvCache(cache_root=str(tmp_path / "cache"), enabled=True)
+
+
+def _assert_same_frame(got: pd.DataFrame, expected: pd.DataFrame):
+    assert got.equals(expected)
+    assert list(got.dtypes) == list(expected.dtypes)
+    assert got.index.equals(expected.index)
+    assert got.index.dtype == expected.index.dtype
+
+
+class TestColumnarCsvCache:
+    """Test memory-mapped columnar CSV cache."""
+
+    def test_matches_read_csv(self, csv_file, cache):
+        """Test cached frames equal pd.read_csv for provider and analyzer options."""
+        for options in (
+            {"index_col": 0, "parse_dates": True, "comment": "#"},
+            {"index_col": None, "parse_dates": False, "comment": "#"},
+            {"index_col": None, "parse_dates": ["timestamp"], "comment": "#"},
+        ):
+            expected = pd.read_csv(csv_file, **options)
+            _assert_same_frame(cache.read_csv(csv_file, **options), expected)  # build
+            _assert_same_frame(cache.read_csv(csv_file, **options), expected)  # mapped
+
+        assert cache.get_stats()["builds"] == 3
+        assert cache.get_stats()["hits"] == 3
+
+    def test_value_columns_are_memory_mapped(self, csv_file, cache):
+        """Test numeric columns are read-only views over the mapped files."""
+        cache.read_csv(csv_file, comment="#")
+        df = cache.read_csv(csv_file, comment="#")
+
+        (_, arrays), = cache._mapped.values()
+        assert np.shares_memory(df["price"].to_numpy(), arrays["col0"])
+        with pytest.raises(ValueError, match="read-only"):
+            df.loc[df.index[0], "price"] = 1.0
+
+    def test_writable_frames_do_not_touch_cache(self, csv_file, cache):
+        """Test copy-on-write frames can be modified without affecting the cache."""
+        df = cache.read_csv(csv_file, comment="#", writable=True)
+        df.loc[df.index[0], "price"] = 1.0
+
+        again = cache.read_csv(csv_file, comment="#")
+        assert again["price"].iloc[0] == 3000.5
+
+    def test_rebuilds_when_source_changes(self, csv_file, cache):
+        """Test content changes invalidate the cache."""
+        cache.read_csv(csv_file, comment="#")
+        csv_file.write_text(CSV + "2024-01-01T03:00:00Z,3020.0,9,okx\n")
+
+        df = cache.read_csv(csv_file, comment="#")
+        assert len(df) == 4
+        assert cache.get_stats()["builds"] == 2
+
+    def test_touch_without_content_change_reuses_build(self, csv_file, cache):
+        """Test an mtime-only change is confirmed by hash instead of rebuilding."""
+        cache.read_csv(csv_file, comment="#")
+        stat = csv_file.stat()
+        os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        cache.read_csv(csv_file, comment="#")
+        assert cache.get_stats()["builds"] == 1
+        assert cache.get_stats()["hits"] == 1
+
+    def test_compile_directory(self, tmp_path, csv_file, cache):
+        """Test the compile step builds once and then reports up to date."""
+        assert cache.compile_directory(tmp_path, comment="#") == {
+            "compiled": 1,
+            "up_to_date": 0,
+            "failed": 0,
+        }
+        assert cache.compile_directory(tmp_path, comment="#")["up_to_date"] == 1
+
+    def test_disabled_cache_reads_csv(self, csv_file, tmp_path):
+        """Test the cache can be switched off."""
+        cache = ColumnarCsvCache(cache_root=str(tmp_path / "cache"), enabled=False)
+        expected = pd.read_csv(csv_file, index_col=0, parse_dates=True, comment="#")
+        _assert_same_frame(cache.read_csv(csv_file, comment="#"), expected)
+        assert not (tmp_path / "cache").exists()
@@ -0,0 +1,98 @@
+"""
+Unit tests for the compiled config registry.
+
+Tests hash-keyed compilation, the on-disk cache, hot reload of changed files and
+that failed reloads keep the previous snapshot.
+"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the backend src to the path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend" / "src"))
+
+from basis_strategy_v1.infrastructure.config.config_registry import CompiledConfigRegistry
+
+REPO_CONFIGS = Path(__file__).parent.parent.parent / "configs"
+
+
+@pytest.fixture
+def configs_dir(tmp_path):
+    """Copy of the repository's mode, venue and share class configs."""
+    for kind in ("modes", "venues", "share_classes"):
+        shutil.copytree(REPO_CONFIGS / kind, tmp_path / "configs" / kind)
+    return tmp_path / "configs"
+
+
+def _edit(path: Path, old: str, new: str):
+    """Rewrite a config file and move its mtime so the stat check sees the change."""
+    stat = path.stat()
+    path.write_text(path.read_text().replace(old, new, 1))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestCompiledConfigRegistry:
+    """Test compilation, caching and hot reload."""
+
+    def test_disk_cache_skips_compilation(self, configs_dir):
+        """Test a second process start serves every file from the compiled cache."""
+        first = CompiledConfigRegistry(configs_dir)
+        snapshot = first.load()
+        assert first.compiled == len(snapshot.entries) > 0
+
+        second = CompiledConfigRegistry(configs_dir)
+        cached = second.load()
+        assert second.compiled == 0
+        assert second.cache_hits == len(snapshot.entries)
+        assert cached.fingerprint == snapshot.fingerprint
+        assert cached.configs("modes") == snapshot.configs("modes")
+
+    def test_lookups_are_copies(self, configs_dir):
+        """Test mutating a returned config does not change the snapshot."""
+        snapshot = CompiledConfigRegistry(configs_dir, enabled=False).load()
+
+        config = snapshot.config("modes", "btc_basis")
+        config["share_class"] = "changed"
+
+        assert snapshot.config("modes", "btc_basis")["share_class"] != "changed"
+
+    def test_refresh_recompiles_only_changed_files(self, configs_dir):
+        """Test hot reload recompiles the edited file and reports it."""
+        registry = CompiledConfigRegistry(configs_dir, enabled=False)
+        before = registry.load()
+        compiled = registry.compiled
+        assert registry.refresh() == []
+
+        mode_file = configs_dir / "modes" / "btc_basis.yaml"
+        target_apy = before.config("modes", "btc_basis")["target_apy"]
+        _edit(mode_file, f"target_apy: {target_apy}", "target_apy: 0.42")
+
+        assert registry.refresh() == ["modes/btc_basis.yaml"]
+        assert registry.compiled == compiled + 1
+        assert registry.snapshot.config("modes", "btc_basis")["target_apy"] == 0.42
+        assert registry.snapshot.fingerprint != before.fingerprint
+
+    def test_failed_refresh_keeps_previous_snapshot(self, configs_dir):
+        """Test an invalid edit raises and the last valid snapshot stays current."""
+        registry = CompiledConfigRegistry(configs_dir, enabled=False)
+        before = registry.load()
+
+        _edit(configs_dir / "modes" / "btc_basis.yaml", "mode:", "mode: [")
+
+        with pytest.raises(ValueError, match="Failed to parse mode configuration"):
+            registry.refresh()
+        assert registry.snapshot is before
+
+    def test_removed_file_is_reported(self, configs_dir):
+        """Test deleting a config drops it from the next snapshot."""
+        registry = CompiledConfigRegistry(configs_dir, enabled=False)
+        registry.load()
+
+        (configs_dir / "modes" / "eth_basis.yaml").unlink()
+
+        assert registry.refresh() == ["modes/eth_basis.yaml"]
+        assert "eth_basis" not in registry.snapshot.names("modes")
@@ -0,0 +1,142 @@
+"""
+Unit tests for DataProviderCache.
+
+Tests content-addressed sharing, reference counting, read-only handles and
+memory-budget eviction of historical data providers.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from basis_strategy_v1.infrastructure.data.data_provider_cache import (
+    DataProviderCache,
+    SharedDataProvider,
+)
+
+
+class FakeProvider:
+    """Minimal provider with csv_mappings and a snapshot cache."""
+
+    def __init__(self, config):
+        self.data_dir = config["data_dir"]
+        self.csv_mappings = {"market_data.prices.ETH": "market/eth_*.csv"}
+        self._data_cache = {}
+
+    def get_data(self, timestamp):
+        self._data_cache.setdefault(str(timestamp), {"prices": {"ETH": 3000.0}})
+        return self._data_cache[str(timestamp)]
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    (tmp_path / "market").mkdir()
+    (tmp_path / "market" / "eth_prices.csv").write_text("timestamp,price\n2024-01-01,3000\n")
+    return tmp_path
+
+
+@pytest.fixture
+def fake_factory():
+    with patch(
+        "basis_strategy_v1.infrastructure.data.data_provider_cache.create_data_provider",
+        side_effect=lambda execution_mode, data_type, config: FakeProvider(config),
+    ) as factory:
+        yield factory
+
+
+def _acquire(cache, data_dir, start="2024-01-01", end="2024-01-31", execution_mode="backtest"):
+    return cache.acquire(
+        execution_mode=execution_mode,
+        data_type="defi",
+        config={"data_dir": str(data_dir)},
+        start_date=start,
+        end_date=end,
+    )
+
+
+class TestDataProviderCache:
+    """Test shared data provider cache."""
+
+    def test_same_inputs_share_provider(self, data_dir, fake_factory):
+        """Test identical mappings, files and date range reuse one provider."""
+        cache = DataProviderCache(max_bytes=10**9)
+        first = _acquire(cache, data_dir)
+        second = _acquire(cache, data_dir)
+
+        assert isinstance(first, SharedDataProvider)
+        assert first._provider is second._provider
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+        assert fake_factory.call_count == 1  # The hit never builds a provider
+
+        # Snapshot loaded by one run is served to the other
+        assert second.get_data("2024-01-01") == first.get_data("2024-01-01")
+        assert len(first._provider._data_cache) == 1
+
+    def test_snapshots_are_isolated_between_runs(self, data_dir, fake_factory):
+        """Test mutating a returned snapshot leaves the shared cache untouched."""
+        cache = DataProviderCache(max_bytes=10**9)
+        first = _acquire(cache, data_dir)
+        second = _acquire(cache, data_dir)
+
+        first.get_data("2024-01-01")["prices"]["ETH"] = 0.0
+        assert second.get_data("2024-01-01") == {"prices": {"ETH": 3000.0}}
+
+    def test_date_range_and_file_changes_change_key(self, data_dir, fake_factory):
+        """Test the key covers the date range and data file fingerprints."""
+        cache = DataProviderCache(max_bytes=10**9)
+        base = _acquire(cache, data_dir)
+        other_range = _acquire(cache, data_dir, end="2024-02-28")
+        assert base.cache_key != other_range.cache_key
+
+        (data_dir / "market" / "eth_prices.csv").write_text(
+            "timestamp,price\n2024-01-01,3000\n2024-01-02,3100\n"
+        )
+        changed = _acquire(cache, data_dir)
+        assert changed.cache_key != base.cache_key
+
+    def test_shared_provider_is_read_only(self, data_dir, fake_factory):
+        """Test attribute assignment on a shared handle is rejected."""
+        cache = DataProviderCache(max_bytes=10**9)
+        provider = _acquire(cache, data_dir)
+
+        with pytest.raises(AttributeError, match="read-only"):
+            provider.data_dir = "elsewhere"
+
+    def test_live_providers_are_not_shared(self, data_dir, fake_factory):
+        """Test live mode always returns a fresh, unwrapped provider."""
+        cache = DataProviderCache(max_bytes=10**9)
+        provider = _acquire(cache, data_dir, execution_mode="live")
+
+        assert isinstance(provider, FakeProvider)
+        assert cache.get_stats()["entries"] == 0
+
+    def test_eviction_respects_reference_counts(self, data_dir, fake_factory):
+        """Test only released entries are evicted once over budget."""
+        cache = DataProviderCache(max_bytes=1)
+        first = _acquire(cache, data_dir)
+        second = _acquire(cache, data_dir)
+        first.get_data("2024-01-01")
+
+        cache.release(first)
+        assert cache.get_stats()["entries"] == 1  # still used by second
+
+        cache.release(second)
+        stats = cache.get_stats()
+        assert stats["entries"] == 0
+        assert stats["evictions"] == 1
+
+    def test_within_budget_entries_survive_release(self, data_dir, fake_factory):
+        """Test idle entries stay cached while under the memory budget."""
+        cache = DataProviderCache(max_bytes=10**9)
+        provider = _acquire(cache, data_dir)
+        provider.get_data("2024-01-01")
+        cache.release(provider)
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 1
+        assert stats["active_entries"] == 0
+        assert stats["approx_bytes"] > 0
+
+        # Next run is a cache hit
+        _acquire(cache, data_dir)
+        assert cache.get_stats()["hits"] == 1
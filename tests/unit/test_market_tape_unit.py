@@ -0,0 +1,159 @@
+"""
+Unit tests for the market tape.
+
+Tests snapshot/fetch round trips, segment appends and reopening, as-of replay lookups
+and the recording data provider.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from basis_strategy_v1.infrastructure.data.market_tape import (
+    MarketTape,
+    MarketTapeRecorder,
+    RecordingDataProvider,
+    ReplayDataProvider,
+    get_tape_recorder,
+)
+
+START = 1_717_372_800.0  # 2024-06-03 00:00 UTC
+
+
+def _snapshot(eth, funding=0.0001):
+    return {
+        "timestamp": pd.Timestamp(START, unit="s", tz="UTC"),
+        "market_data": {
+            "prices": {"ETH": eth, "BTC": 67000.0},
+            "funding_rates": {"ETH_binance": funding},
+        },
+        "protocol_data": {"perp_prices": {}, "aave_indexes": {"aUSDT": 1.0712}},
+        "ml_data": {
+            "predictions": {"signal": "long", "confidence": 0.8, "stale": False, "horizon": 5}
+        },
+        "execution_data": {"gas_costs": {"supply": None}},
+    }
+
+
+class TestMarketTape:
+    """Test recording, reopening and reading tapes."""
+
+    def test_snapshot_and_fetch_round_trip(self, tmp_path):
+        """Test nested snapshots (strings, None, empty dicts) and fetches decode as recorded."""
+        recorder = MarketTapeRecorder(str(tmp_path / "tape"))
+        timestamp = pd.Timestamp(START, unit="s", tz="UTC")
+        recorder.record_snapshot(timestamp, _snapshot(3000.5), received_at=START + 0.25)
+        recorder.record_fetch("spot_price:ETH", {"price": 3000.5}, received_at=START + 0.1)
+        recorder.record_snapshot(timestamp, {"market_data": {"series": [1]}}, received_at=START + 1)
+        recorder.close()
+
+        tape = MarketTape(str(tmp_path / "tape"))
+        assert (len(tape), tape.snapshot_count) == (3, 2)
+        assert (tape.start, tape.end) == (START + 0.1, START + 1)
+
+        fetch, snapshot, _ = list(tape.events())
+        assert (fetch.kind, fetch.key, fetch.data, fetch.timestamp) == (
+            "fetch",
+            "spot_price:ETH",
+            {"price": 3000.5},
+            None,
+        )
+        expected = _snapshot(3000.5)
+        del expected["timestamp"]
+        assert snapshot.data == expected
+        assert snapshot.timestamp == timestamp
+        assert isinstance(snapshot.data["ml_data"]["predictions"]["horizon"], int)
+        assert recorder.get_metrics()["skipped_values"] == 1  # The list
+
+    def test_segments_append_across_reopen(self, tmp_path):
+        """Test every flush writes a segment and a reopened recorder appends to the tape."""
+        path = str(tmp_path / "tape")
+        recorder = MarketTapeRecorder(path, flush_events=2)
+        for i in range(5):
+            recorder.record_snapshot(
+                pd.Timestamp(START + i, unit="s", tz="UTC"), _snapshot(3000.0 + i), START + i
+            )
+        assert recorder.get_metrics()["segments_written"] == 2
+        recorder.close()
+
+        reopened = MarketTapeRecorder(path, flush_events=2)
+        reopened.record_snapshot(
+            pd.Timestamp(START + 5, unit="s", tz="UTC"),
+            _snapshot(3005.0, funding=-0.0002),
+            START + 5,
+        )
+        reopened.close()
+
+        tape = MarketTape(path)
+        assert sorted(p.name for p in (tmp_path / "tape").glob("segment-*.npz")) == [
+            "segment-000000.npz",
+            "segment-000001.npz",
+            "segment-000002.npz",
+            "segment-000003.npz",
+        ]
+        prices = [event.data["market_data"]["prices"]["ETH"] for event in tape.events("snapshot")]
+        assert prices == [3000.0, 3001.0, 3002.0, 3003.0, 3004.0, 3005.0]
+        assert len(tape.fields) == len(set(tape.fields))  # Field table reused, not duplicated
+        assert tape.value.dtype == np.float64
+
+    def test_replay_provider_serves_snapshot_as_of_timestamp(self, tmp_path):
+        """Test get_data returns the last snapshot received at or before the timestamp."""
+        recorder = MarketTapeRecorder(str(tmp_path / "tape"))
+        for i, received in enumerate([0.0, 10.0, 20.0]):
+            recorder.record_snapshot(
+                pd.Timestamp(START + received, unit="s", tz="UTC"),
+                _snapshot(3000.0 + i),
+                START + received + 0.5,
+            )
+        recorder.close()
+        provider = ReplayDataProvider(MarketTape(str(tmp_path / "tape")))
+
+        def eth_at(offset):
+            data = provider.get_data(pd.Timestamp(START + offset, unit="s", tz="UTC"))
+            return data["market_data"]["prices"]["ETH"]
+
+        assert [eth_at(offset) for offset in (-5.0, 0.5, 10.4, 10.5, 19.0, 500.0)] == [
+            3000.0,
+            3000.0,
+            3000.0,
+            3001.0,
+            3001.0,
+            3002.0,
+        ]
+        assert provider.misses == 1
+        data = provider.get_data(pd.Timestamp(START + 12, unit="s", tz="UTC"))
+        assert data["timestamp"] == pd.Timestamp(START + 12, unit="s", tz="UTC")
+        assert data["recorded_timestamp"] == pd.Timestamp(START + 10, unit="s", tz="UTC")
+
+    @pytest.mark.asyncio
+    async def test_recording_provider_wraps_sync_and_async_providers(self, tmp_path, monkeypatch):
+        """Test get_data results pass through unchanged and are recorded."""
+
+        class SyncProvider:
+            mode = "btc_basis"
+
+            def get_data(self, timestamp):
+                return _snapshot(3000.0)
+
+        class AsyncProvider:
+            async def get_data(self, timestamp):
+                return _snapshot(3100.0)
+
+        monkeypatch.setenv("BASIS_LIVE__TAPE_DIR", str(tmp_path / "tape"))
+        recorder = get_tape_recorder()
+        assert get_tape_recorder() is recorder
+
+        timestamp = pd.Timestamp(START, unit="s", tz="UTC")
+        sync_provider = RecordingDataProvider(SyncProvider(), recorder)
+        assert sync_provider.get_data(timestamp) == _snapshot(3000.0)
+        assert sync_provider.mode == "btc_basis"
+        assert await RecordingDataProvider(AsyncProvider(), recorder).get_data(timestamp) == (
+            _snapshot(3100.0)
+        )
+        recorder.flush()
+
+        prices = [
+            event.data["market_data"]["prices"]["ETH"]
+            for event in MarketTape(str(tmp_path / "tape")).events("snapshot")
+        ]
+        assert prices == [3000.0, 3100.0]
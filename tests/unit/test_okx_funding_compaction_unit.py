@@ -0,0 +1,139 @@
+"""
+Unit tests for OKX funding rate compaction.
+
+Tests that daily OKX funding files are compacted into sorted, deduplicated
+per-instrument series with append-only incremental updates, and that the
+DeFi provider maps OKX funding rates to the compacted file.
+"""
+
+import importlib.util
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from basis_strategy_v1.infrastructure.data.historical_defi_data_provider import (
+    HistoricalDeFiDataProvider,
+)
+
+PROCESSOR_PATH = (
+    Path(__file__).resolve().parents[2] / "scripts" / "processors" / "okx_data_processor.py"
+)
+
+
+def _load_processor_module():
+    spec = importlib.util.spec_from_file_location("okx_data_processor", PROCESSOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _write_daily(daily_dir: Path, day: str, rows):
+    df = pd.DataFrame(
+        rows,
+        columns=["instrument", "contract_type", "funding_rate", "real_funding_rate", "funding_time", "date"],
+    )
+    df.to_csv(daily_dir / f"okx_funding_rates_{day}.csv", index=False)
+
+
+def _day_rows(day: str, rate: float):
+    return [
+        ["ETH-USDT-SWAP", "SWAP", rate + i, rate, f"{day} {hour:02d}:00:00+00:00", day]
+        for i, hour in enumerate((0, 8, 16))
+    ] + [["BTC-USDT-SWAP", "SWAP", rate, rate, f"{day} 00:00:00+00:00", day]]
+
+
+@pytest.fixture
+def okx(tmp_path):
+    module = _load_processor_module()
+    output_dir = tmp_path / "okx"
+    daily_dir = output_dir / "funding_rates" / "daily"
+    daily_dir.mkdir(parents=True)
+    processor = module.OKXDataProcessor(tmp_path / "zips", output_dir)
+    return processor, daily_dir, output_dir / "funding_rates"
+
+
+class TestOKXFundingCompaction:
+    """Test daily-to-instrument compaction."""
+
+    def test_compacts_sorted_deduplicated_series(self, okx):
+        """Test one sorted, deduplicated file per instrument."""
+        processor, daily_dir, funding_dir = okx
+        rows = _day_rows("2024-05-02", 0.1)
+        rows.append(["ETH-USDT-SWAP", "SWAP", 9.9, 0.1, "2024-05-02 08:00:00+00:00", "2024-05-02"])
+        _write_daily(daily_dir, "2024-05-02", rows)
+        _write_daily(daily_dir, "2024-05-01", _day_rows("2024-05-01", 0.2))
+
+        written = processor.compact_funding_rates(["ETH-USDT-SWAP"])
+
+        assert written == {"ETH-USDT-SWAP": 6}
+        assert not (funding_dir / "okx_BTCUSDT_funding_rates.csv").exists()
+        eth = pd.read_csv(funding_dir / "okx_ETHUSDT_funding_rates.csv")
+        assert list(eth.columns) == [
+            "funding_timestamp", "funding_rate", "real_funding_rate", "symbol", "source"
+        ]
+        assert eth["funding_timestamp"].is_monotonic_increasing
+        assert not eth["funding_timestamp"].duplicated().any()
+        # Last observation wins for duplicated funding times
+        assert eth.loc[eth["funding_timestamp"] == "2024-05-02T08:00:00Z", "funding_rate"].item() == 9.9
+
+    def test_incremental_append_matches_rebuild(self, okx):
+        """Test later runs only append new days and equal a full rebuild."""
+        processor, daily_dir, funding_dir = okx
+        _write_daily(daily_dir, "2024-05-01", _day_rows("2024-05-01", 0.1))
+        processor.compact_funding_rates(["ETH-USDT-SWAP"])
+
+        _write_daily(daily_dir, "2024-05-02", _day_rows("2024-05-02", 0.2))
+        assert processor.compact_funding_rates(["ETH-USDT-SWAP"]) == {"ETH-USDT-SWAP": 3}
+        assert processor.compact_funding_rates(["ETH-USDT-SWAP"]) == {}
+        incremental = (funding_dir / "okx_ETHUSDT_funding_rates.csv").read_text()
+
+        processor.compact_funding_rates(["ETH-USDT-SWAP"], rebuild=True)
+        assert (funding_dir / "okx_ETHUSDT_funding_rates.csv").read_text() == incremental
+
+    def test_state_is_keyed_on_content_not_mtime(self, okx):
+        """Test a touched but unchanged file is skipped and edited content rebuilds."""
+        processor, daily_dir, funding_dir = okx
+        _write_daily(daily_dir, "2024-05-01", _day_rows("2024-05-01", 0.1))
+        processor.compact_funding_rates(["ETH-USDT-SWAP"])
+
+        state = json.loads((funding_dir / "okx_funding_rates_compaction_state.json").read_text())
+        assert set(state["files"]["okx_funding_rates_2024-05-01.csv"]) <= set("0123456789abcdef")
+
+        daily_file = daily_dir / "okx_funding_rates_2024-05-01.csv"
+        os.utime(daily_file, ns=(1, 1))
+        assert processor.compact_funding_rates(["ETH-USDT-SWAP"]) == {}
+
+        _write_daily(daily_dir, "2024-05-01", _day_rows("2024-05-01", 0.5))
+        assert processor.compact_funding_rates(["ETH-USDT-SWAP"]) == {"ETH-USDT-SWAP": 3}
+        eth = pd.read_csv(funding_dir / "okx_ETHUSDT_funding_rates.csv")
+        assert eth["real_funding_rate"].tolist() == [0.5, 0.5, 0.5]
+
+    def test_backfilled_day_is_merged_in_order(self, okx):
+        """Test a day older than the series end is merged, not appended."""
+        processor, daily_dir, funding_dir = okx
+        _write_daily(daily_dir, "2024-05-03", _day_rows("2024-05-03", 0.3))
+        processor.compact_funding_rates(["ETH-USDT-SWAP"])
+
+        _write_daily(daily_dir, "2024-05-01", _day_rows("2024-05-01", 0.1))
+        processor.compact_funding_rates(["ETH-USDT-SWAP"])
+
+        eth = pd.read_csv(funding_dir / "okx_ETHUSDT_funding_rates.csv")
+        assert len(eth) == 6
+        assert eth["funding_timestamp"].is_monotonic_increasing
+
+    def test_defi_provider_maps_okx_funding_to_compacted_file(self):
+        """Test OKX perps read funding from the compacted series."""
+        provider = HistoricalDeFiDataProvider(
+            {
+                "data_dir": "data",
+                "component_config": {
+                    "position_monitor": {"position_subscriptions": ["okx:Perp:ETHUSDT"]}
+                },
+            }
+        )
+        assert provider.csv_mappings["market_data.funding_rates.ETH_okx"] == (
+            "data/market_data/okx/funding_rates/okx_ETHUSDT_funding_rates.csv"
+        )
@@ -757,4 +757,93 @@ class TestPnLMonitorUnit:
         assert "Total P&L:" in summary
         assert "Return:" in summary
         assert "5,000.00" in summary  # Should show the 5000 gain (formatted)
-        assert "5.00%" in summary  # Should show the 5% return
\ No newline at end of file
+        assert "5.00%" in summary  # Should show the 5% return
+
+class FakeUtilityManager:
+    """Prices per hour; counts position conversions."""
+
+    PRICES = {"USDT": 1.0, "aUSDT": 1.0, "ETH": 2000.0, "weETH": 2100.0, "debtWETH": 2000.0}
+
+    def __init__(self):
+        self.conversions = 0
+
+    def get_share_class_from_mode(self, mode):
+        return "USDT"
+
+    def get_instrument_type(self, instrument_key):
+        position_type = instrument_key.split(":")[1]
+        return {"debtToken": "debt", "Perp": "derivative"}.get(position_type, "asset")
+
+    def convert_position_to_share_class(self, instrument_key, amount, share_class, timestamp):
+        self.conversions += 1
+        token = instrument_key.split(":")[2]
+        growth = 1.0 + 0.01 * timestamp.hour if token != "USDT" else 1.0
+        return amount * self.PRICES[token] * growth
+
+
+class FakePositionMonitor:
+    def __init__(self, positions):
+        self.positions = positions
+
+    def get_current_positions(self):
+        return dict(self.positions)
+
+
+class TestPnLEquityLedger:
+    """Equity ledger and incremental attribution."""
+
+    HOURS = list(pd.date_range("2024-06-01", periods=3, freq="h", tz="UTC"))
+
+    def _pnl_monitor(self, mock_config, positions, log_dir):
+        config = TestPnLMonitorUnit()._add_pnl_config(
+            dict(mock_config, component_config=dict(mock_config["component_config"]))
+        )
+        utility_manager = FakeUtilityManager()
+        pnl_monitor = PnLMonitor(
+            config=config,
+            share_class="USDT",
+            initial_capital=10000.0,
+            utility_manager=utility_manager,
+            position_monitor=FakePositionMonitor(positions),
+            log_dir=log_dir,
+        )
+        return pnl_monitor, utility_manager
+
+    def test_each_book_valued_once(self, mock_config, tmp_path):
+        """Test repeated updates and the previous book reuse ledger valuations."""
+        positions = {"wallet:BaseToken:USDT": 6000.0, "aave_v3:aToken:aUSDT": 4000.0}
+        pnl_monitor, utility_manager = self._pnl_monitor(mock_config, positions, tmp_path)
+
+        for timestamp in self.HOURS:
+            pnl_monitor.update_state(timestamp, "full_loop")
+            pnl_monitor.update_state(timestamp, "position_update")
+
+        assert pnl_monitor.equity_valuations == len(self.HOURS)
+        assert utility_manager.conversions == 2 * len(self.HOURS)
+        balance = pnl_monitor.get_latest_pnl()["BALANCE_BASED"]
+        assert balance["PNL_CUMULATIVE"] == pytest.approx(4000.0 * 0.02)
+        assert pnl_monitor.pnl_history[-2]["BALANCE_BASED"]["PNL_HOURLY"] == pytest.approx(40.0)
+
+    def test_attribution_reconciles_per_component(self, mock_config, tmp_path):
+        """Test revaluation and balance changes sum to the balance-based P&L."""
+        positions = {
+            "wallet:BaseToken:USDT": 10000.0,
+            "etherfi:BaseToken:weETH": 0.0,
+            "aave_v3:debtToken:debtWETH": 0.0,
+        }
+        pnl_monitor, _ = self._pnl_monitor(mock_config, positions, tmp_path)
+
+        pnl_monitor.update_state(self.HOURS[0], "full_loop")
+        positions.update({"wallet:BaseToken:USDT": 7900.0, "etherfi:BaseToken:weETH": 1.0})
+        positions["aave_v3:debtToken:debtWETH"] = 0.5
+        pnl_monitor.update_state(self.HOURS[1], "full_loop")
+        pnl_monitor.update_state(self.HOURS[2], "full_loop")
+
+        pnl = pnl_monitor.get_latest_pnl()
+        cumulative = pnl["ATTRIBUTION"]["cumulative"]
+        assert pnl["ATTRIBUTION"]["PNL_CUMULATIVE"] == pytest.approx(
+            pnl["BALANCE_BASED"]["PNL_CUMULATIVE"]
+        )
+        assert cumulative["staking_yield_oracle"] == pytest.approx(21.0)
+        assert cumulative["borrow_cost"] == pytest.approx(-10.0)
+        assert pnl["RECONCILIATION"]["passed"]
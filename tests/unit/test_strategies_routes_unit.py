@@ -10,7 +10,6 @@ from fastapi import HTTPException
 from fastapi.testclient import TestClient
 from fastapi import FastAPI
 from pathlib import Path
-import yaml
 
 # Import the routes module
 import sys
@@ -221,88 +220,73 @@ class TestStrategiesRoutes:
             data = response.json()
             assert "Invalid strategy name" in data["detail"]
 
-    def test_get_mode_config_success(self, client, mock_mode_config):
+    @pytest.fixture
+    def mock_config_manager(self, mock_mode_config):
+        """Config manager serving one mode from memory."""
+        modes = {"pure_lending_usdt": mock_mode_config}
+        config_manager = Mock()
+        config_manager.get_available_strategies.return_value = list(modes)
+
+        def get_mode_config(mode_name):
+            if mode_name not in modes:
+                raise KeyError(f"Mode '{mode_name}' not found")
+            return modes[mode_name]
+
+        config_manager.get_mode_config.side_effect = get_mode_config
+        with patch('basis_strategy_v1.api.routes.strategies.get_config_manager', return_value=config_manager):
+            yield config_manager
+
+    def test_get_mode_config_success(self, client, mock_config_manager):
         """Test successful mode configuration retrieval."""
-        with patch('basis_strategy_v1.api.routes.strategies.Path') as mock_path:
-            mock_config_file = Mock()
-            mock_config_file.exists.return_value = True
-            mock_config_file.open.return_value.__enter__.return_value.read.return_value = yaml.dump(mock_mode_config)
-            mock_path.return_value = mock_config_file
-            
-            response = client.get("/strategies/modes/pure_lending_usdt")
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["success"] is True
-            assert data["data"]["mode"] == "pure_lending_usdt"
-            assert data["data"]["target_apy"] == 0.08
-            assert data["data"]["max_drawdown"] == 0.15
-            assert data["data"]["share_class"] == "USDT"
-            assert data["data"]["risk_level"] == "medium"
+        response = client.get("/strategies/modes/pure_lending_usdt")
 
-    def test_get_mode_config_not_found(self, client):
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["data"]["mode"] == "pure_lending_usdt"
+        assert data["data"]["target_apy"] == 0.08
+        assert data["data"]["max_drawdown"] == 0.15
+        assert data["data"]["share_class"] == "USDT"
+        assert data["data"]["risk_level"] == "medium"
+
+    def test_get_mode_config_not_found(self, client, mock_config_manager):
         """Test mode configuration retrieval for non-existent mode."""
-        with patch('basis_strategy_v1.api.routes.strategies.Path') as mock_path:
-            mock_config_file = Mock()
-            mock_config_file.exists.return_value = False
-            mock_path.return_value = mock_config_file
-            
-            response = client.get("/strategies/modes/nonexistent_mode")
-            
-            assert response.status_code == 404
-            data = response.json()
-            assert "Mode config not found" in data["detail"]
+        response = client.get("/strategies/modes/nonexistent_mode")
+
+        assert response.status_code == 404
+        data = response.json()
+        assert "Mode config not found" in data["detail"]
 
-    def test_list_modes_success(self, client, mock_mode_config):
+    def test_list_modes_success(self, client, mock_config_manager):
         """Test successful modes listing."""
-        with patch('basis_strategy_v1.api.routes.strategies.Path') as mock_path:
-            mock_modes_dir = Mock()
-            mock_modes_dir.exists.return_value = True
-            mock_yaml_file = Mock()
-            mock_yaml_file.stem = "pure_lending_usdt"
-            mock_yaml_file.open.return_value.__enter__.return_value.read.return_value = yaml.dump(mock_mode_config)
-            mock_modes_dir.glob.return_value = [mock_yaml_file]
-            mock_path.return_value = mock_modes_dir
-            
-            response = client.get("/strategies/modes/")
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["success"] is True
-            assert len(data["data"]["modes"]) == 1
-            assert data["data"]["total"] == 1
-            assert data["data"]["modes"][0]["mode"] == "pure_lending_usdt"
+        response = client.get("/strategies/modes/")
 
-    def test_list_modes_with_filter(self, client, mock_mode_config):
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert len(data["data"]["modes"]) == 1
+        assert data["data"]["total"] == 1
+        assert data["data"]["modes"][0]["mode"] == "pure_lending_usdt"
+
+    def test_list_modes_with_filter(self, client, mock_config_manager):
         """Test modes listing with share class filter."""
-        with patch('basis_strategy_v1.api.routes.strategies.Path') as mock_path:
-            mock_modes_dir = Mock()
-            mock_modes_dir.exists.return_value = True
-            mock_yaml_file = Mock()
-            mock_yaml_file.stem = "pure_lending_usdt"
-            mock_yaml_file.open.return_value.__enter__.return_value.read.return_value = yaml.dump(mock_mode_config)
-            mock_modes_dir.glob.return_value = [mock_yaml_file]
-            mock_path.return_value = mock_modes_dir
-            
-            response = client.get("/strategies/modes/?share_class=USDT")
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["success"] is True
-            assert len(data["data"]["modes"]) == 1
-
-    def test_list_modes_directory_not_found(self, client):
-        """Test modes listing when modes directory doesn't exist."""
-        with patch('basis_strategy_v1.api.routes.strategies.Path') as mock_path:
-            mock_modes_dir = Mock()
-            mock_modes_dir.exists.return_value = False
-            mock_path.return_value = mock_modes_dir
-            
-            response = client.get("/strategies/modes/")
-            
-            assert response.status_code == 404
-            data = response.json()
-            assert "Modes directory not found" in data["detail"]
+        response = client.get("/strategies/modes/?share_class=USDT")
+        assert response.status_code == 200
+        assert len(response.json()["data"]["modes"]) == 1
+
+        response = client.get("/strategies/modes/?share_class=ETH")
+        assert response.status_code == 200
+        assert response.json()["data"]["modes"] == []
+
+    def test_list_modes_config_error(self, client, mock_config_manager):
+        """Test modes listing when the configuration cannot be served."""
+        mock_config_manager.get_available_strategies.side_effect = ValueError("Config error")
+
+        response = client.get("/strategies/modes/")
+
+        assert response.status_code == 500
+        data = response.json()
+        assert "Failed to list modes" in data["detail"]
 
     def test_correlation_id_handling(self, client, mock_strategy_config):
         """Test that correlation IDs are properly handled."""